@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Convert fixture events.jsonl into the binary columnar format.
+
+Writes <fixture>/columns/ (memory-mapped NumPy columns + manifest). PaperEngine,
+ReplayEngine and scripts.run_backtest pick it up automatically; runs produce
+the same digests as the JSONL source.
+
+Usage:
+    python -m scripts.convert_fixture_columnar tests/fixtures/sample_day
+    python -m scripts.convert_fixture_columnar tests/fixtures/sample_day --verify
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from grinder.paper import PaperEngine
+from grinder.replay import ColumnarFormatError, FixtureEventSource, convert_fixture_to_columnar
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert fixture events to columnar format")
+    parser.add_argument("fixtures", type=Path, nargs="+", help="Fixture directories")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Run PaperEngine on both formats and compare digests",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for fixture_dir in args.fixtures:
+        try:
+            manifest = convert_fixture_to_columnar(fixture_dir)
+        except (ColumnarFormatError, ValueError) as e:
+            print(f"{fixture_dir}: conversion failed: {e}", file=sys.stderr)
+            failed = True
+            continue
+
+        print(
+            f"{fixture_dir}: {manifest['rows']} events "
+            f"({len(manifest['symbols'])} symbols, {manifest['extra_events']} extra)"
+        )
+
+        if args.verify:
+            columnar_digest = PaperEngine().run(fixture_dir).digest
+            # Force the JSONL path by passing the source events explicitly
+            jsonl_digest = (
+                PaperEngine()
+                .run(fixture_dir, events=FixtureEventSource.from_fixture(fixture_dir))
+                .digest
+            )
+            status = "OK" if columnar_digest == jsonl_digest else "MISMATCH"
+            print(f"  digest jsonl={jsonl_digest} columnar={columnar_digest} {status}")
+            failed = failed or columnar_digest != jsonl_digest
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ Env vars (all optional, safe defaults):
     HTTP_MAX_ATTEMPTS_READ       Max attempts for read ops (default: 1)
     HTTP_MAX_ATTEMPTS_WRITE      Max attempts for write ops (default: 1)
     HTTP_DEADLINE_<OP>_MS        Per-op deadline override (e.g. HTTP_DEADLINE_CANCEL_ORDER_MS=400)
+    HTTP_POOL_MAX_CONNECTIONS    Connection pool size (default: 20)
+    HTTP_POOL_MAX_KEEPALIVE      Idle keep-alive connections kept open (default: 10)
+    HTTP_POOL_KEEPALIVE_EXPIRY_S Close idle connections after N seconds (default: 60)
+    HTTP2_ENABLED                "1" to negotiate HTTP/2 (needs the h2 package)
+    HTTP_WEIGHT_BUDGET_ENABLED   "1" to budget exchange request weight / order counts
+                                 (shared get_weight_budget(); default: off)
 
 When disabled: returns MeasuredSyncHttpClient with enabled=False (pure pass-through).
 """
@@ -16,17 +22,11 @@ from __future__ import annotations
 
 import logging
 import os
-import urllib.parse
-from dataclasses import dataclass, field
-from typing import Any
 
-import httpx
-
-from grinder.connectors.errors import ConnectorNonRetryableError, ConnectorTransientError
-from grinder.execution.binance_port import HttpResponse
-from grinder.execution.port_metrics import get_port_metrics
 from grinder.net.measured_sync import MeasuredSyncHttpClient
+from grinder.net.pooled_client import PooledHttpClient, PooledHttpClientConfig
 from grinder.net.retry_policy import DeadlinePolicy, HttpRetryPolicy
+from grinder.net.weight_budget import get_weight_budget
 from grinder.observability.latency_metrics import get_http_metrics
 
 logger = logging.getLogger(__name__)
@@ -46,61 +46,53 @@ def _parse_int(name: str, value: str, default: int) -> int:
         raise ConfigError(f"Invalid {name}='{value}'. Must be integer.") from None
 
 
-@dataclass
-class RequestsHttpClient:
-    """HTTP client using httpx for real API calls.
+def build_pool_config() -> PooledHttpClientConfig:
+    """Build connection pool config from HTTP_POOL_* / HTTP2_ENABLED env vars.
+
+    Raises:
+        ConfigError: If a numeric env var is not an integer.
+    """
+    defaults = PooledHttpClientConfig()
+    max_connections = _parse_int(
+        "HTTP_POOL_MAX_CONNECTIONS",
+        os.environ.get("HTTP_POOL_MAX_CONNECTIONS", ""),
+        default=defaults.max_connections,
+    )
+    max_keepalive = _parse_int(
+        "HTTP_POOL_MAX_KEEPALIVE",
+        os.environ.get("HTTP_POOL_MAX_KEEPALIVE", ""),
+        default=min(defaults.max_keepalive_connections, max_connections),
+    )
+    keepalive_expiry_s = _parse_int(
+        "HTTP_POOL_KEEPALIVE_EXPIRY_S",
+        os.environ.get("HTTP_POOL_KEEPALIVE_EXPIRY_S", ""),
+        default=int(defaults.keepalive_expiry_s),
+    )
+    try:
+        return PooledHttpClientConfig(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry_s=float(keepalive_expiry_s),
+            http2=os.environ.get("HTTP2_ENABLED", "") == "1",
+        )
+    except ValueError as e:
+        raise ConfigError(f"Invalid HTTP pool config: {e}") from None
+
+
+class RequestsHttpClient(PooledHttpClient):
+    """HTTP client for real API calls.
 
     Implements the HttpClient protocol (binance_port.py).
-    Shared between run_live.py (probe) and run_live_reconcile.py (reconcile).
-    Uses httpx (already a project dependency) instead of requests.
+    Shared between run_live.py (probe), run_live_reconcile.py (reconcile) and
+    run_trading.py (futures port). A PooledHttpClient sized from env vars, so
+    every call reuses keep-alive connections from one pool.
 
-    Attributes:
+    Args:
         port_name: Port identifier for metrics (e.g., "futures"). Empty = no metrics.
     """
 
-    _client: httpx.Client = field(default_factory=httpx.Client, repr=False)
-    port_name: str = ""
-
-    def request(
-        self,
-        method: str,
-        url: str,
-        params: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-        timeout_ms: int = 5000,
-        op: str = "",  # noqa: ARG002 — used by MeasuredSyncHttpClient wrapper
-    ) -> HttpResponse:
-        """Execute HTTP request via httpx."""
-        timeout_s = timeout_ms / 1000.0
-        route = urllib.parse.urlparse(url).path if self.port_name else ""
-
-        try:
-            resp = self._client.request(
-                method,
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout_s,
-            )
-            if self.port_name:
-                get_port_metrics().record_http_request(self.port_name, method, route)
-            return HttpResponse(
-                status_code=resp.status_code,
-                json_data=resp.json() if resp.content else {},
-            )
-
-        except httpx.TimeoutException as e:
-            if self.port_name:
-                get_port_metrics().record_http_request(self.port_name, method, route)
-            raise ConnectorTransientError(f"Request timeout: {e}") from e
-        except httpx.ConnectError as e:
-            if self.port_name:
-                get_port_metrics().record_http_request(self.port_name, method, route)
-            raise ConnectorTransientError(f"Connection error: {e}") from e
-        except httpx.HTTPError as e:
-            if self.port_name:
-                get_port_metrics().record_http_request(self.port_name, method, route)
-            raise ConnectorNonRetryableError(f"Request error: {e}") from e
+    def __init__(self, port_name: str = "") -> None:
+        super().__init__(config=build_pool_config(), port_name=port_name)
 
 
 def build_measured_client(inner: object) -> MeasuredSyncHttpClient:
@@ -108,6 +100,8 @@ def build_measured_client(inner: object) -> MeasuredSyncHttpClient:
 
     When LATENCY_RETRY_ENABLED=1: applies per-op deadlines, retries, records metrics.
     When disabled (default): pure pass-through, zero behavior change.
+    When HTTP_WEIGHT_BUDGET_ENABLED=1: requests wait for (or are rejected by)
+    the shared exchange weight budget, independent of LATENCY_RETRY_ENABLED.
 
     Args:
         inner: Any object conforming to the HttpClient protocol
@@ -159,10 +153,16 @@ def build_measured_client(inner: object) -> MeasuredSyncHttpClient:
     else:
         logger.info("HTTP measured client DISABLED (pass-through)")
 
+    weight_budget = None
+    if os.environ.get("HTTP_WEIGHT_BUDGET_ENABLED", "") == "1":
+        weight_budget = get_weight_budget()
+        logger.info("HTTP weight budget ENABLED: %s", weight_budget.config)
+
     return MeasuredSyncHttpClient(
         inner=inner,  # type: ignore[arg-type]  # protocol-conforming object
         deadline_policy=deadline_policy,
         retry_policy=retry_policy,
         enabled=enabled,
         metrics=get_http_metrics(),
+        weight_budget=weight_budget,
     )
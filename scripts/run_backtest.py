@@ -4,10 +4,18 @@
 This script runs paper trading v1 on all registered fixtures and produces
 a deterministic JSON report with digests, positions, and PnL.
 
+Fixtures converted with scripts.convert_fixture_columnar are read from their
+memory-mapped columns/ directory automatically (same digests, no JSON parsing).
+
 Usage:
     python -m scripts.run_backtest
     python -m scripts.run_backtest --out report.json
     python -m scripts.run_backtest --out report.json --quiet
+    python -m scripts.run_backtest --jobs 4
+
+With --jobs N > 1, fixtures run in a process pool. Each fixture builds its own
+PaperEngine, and results are gathered in registration order, so the report
+and report_digest are identical to a serial run.
 """
 
 from __future__ import annotations
@@ -15,7 +23,9 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -188,11 +198,44 @@ def run_fixture(fixture_path: Path) -> FixtureResult:
     )
 
 
-def run_backtest(fixtures: list[Path] | None = None) -> BacktestReport:
-    """Run backtest on all fixtures and generate report."""
+def resolve_jobs(jobs: int) -> int:
+    """Resolve a --jobs value (0 = one worker per CPU)."""
+    if jobs < 0:
+        raise ValueError(f"jobs must be >= 0, got {jobs}")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_fixtures(fixtures: list[Path], jobs: int = 1) -> list[FixtureResult]:
+    """Run fixtures serially or in a process pool, preserving input order.
+
+    Args:
+        fixtures: Existing fixture directories
+        jobs: Worker processes (1 = in-process serial run)
+
+    Returns:
+        FixtureResults in the same order as fixtures
+    """
+    workers = min(resolve_jobs(jobs), len(fixtures))
+    if workers <= 1:
+        return [run_fixture(p) for p in fixtures]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_fixture, fixtures))
+
+
+def run_backtest(fixtures: list[Path] | None = None, jobs: int = 1) -> BacktestReport:
+    """Run backtest on all fixtures and generate report.
+
+    Args:
+        fixtures: Fixture directories (default: FIXTURES)
+        jobs: Worker processes for fixture runs (1 = serial, 0 = one per CPU)
+    """
     if fixtures is None:
         fixtures = FIXTURES
 
+    fixture_results = iter(run_fixtures([p for p in fixtures if p.exists()], jobs=jobs))
+
     results: list[FixtureResult] = []
     passed = 0
     failed = 0
@@ -223,7 +266,7 @@ def run_backtest(fixtures: list[Path] | None = None) -> BacktestReport:
             failed += 1
             continue
 
-        fixture_result = run_fixture(fixture_path)
+        fixture_result = next(fixture_results)
         results.append(fixture_result)
 
         if fixture_result.digest_match and not fixture_result.errors:
@@ -268,9 +311,16 @@ def main() -> None:
         action="store_true",
         help="Suppress stdout output (only write to --out if specified)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Run fixtures in N worker processes (0 = one per CPU, default: 1)",
+    )
     args = parser.parse_args()
 
-    report = run_backtest()
+    report = run_backtest(jobs=args.jobs)
 
     json_output = report.to_json_pretty()
 
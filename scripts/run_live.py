@@ -23,13 +23,13 @@ import signal
 import sys
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from grinder.ha.leader import LeaderElector, LeaderElectorConfig
 from grinder.ha.role import get_ha_state
 from grinder.observability import (
     build_healthz_body,
-    build_metrics_body,
+    build_metrics_response,
     build_readyz_body,
     set_start_time,
 )
@@ -73,22 +73,25 @@ class HealthHandler(BaseHTTPRequestHandler):
         self.wfile.write(body.encode())
 
     def _send_metrics(self) -> None:
-        """Send Prometheus metrics."""
-        body = build_metrics_body()
+        """Send Prometheus metrics (cached render, gzip if accepted)."""
+        body, encoding = build_metrics_response(self.headers.get("Accept-Encoding"))
         self.send_response(200)
         self.send_header("Content-Type", "text/plain; charset=utf-8")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(body.encode())
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args: object) -> None:
         """Suppress default logging."""
         pass
 
 
-def run_server(port: int) -> HTTPServer:
-    """Start HTTP server in background thread."""
+def run_server(port: int) -> ThreadingHTTPServer:
+    """Start HTTP server in background thread (one daemon thread per request)."""
     set_start_time(time.time())
-    server = HTTPServer(("0.0.0.0", port), HealthHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), HealthHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     return server
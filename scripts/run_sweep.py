@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Run a paper-trading parameter sweep on one fixture.
+
+The fixture is parsed once and shared by every parameter set; points run in
+a process pool with --jobs. Results are ranked by total PnL (then max
+drawdown) and printed as a table.
+
+Parameters are PaperEngine keyword arguments; nested config fields use dotted
+names (adaptive_config.step_alpha, topk_v1_config.k). Fixture config flags
+(controller_enabled, feature_engine_enabled, topk_v1_*) are applied as base
+parameters, as in scripts.run_backtest.
+
+Usage:
+    python -m scripts.run_sweep --fixture tests/fixtures/sample_day \\
+        --param spacing_bps=5,10,20 --param levels=3,5
+    python -m scripts.run_sweep --fixture tests/fixtures/sample_day_controller \\
+        --grid grid.json --jobs 0 --out sweep.json --top 10
+
+grid.json maps parameter names to value lists:
+    {"spacing_bps": [5, 10, 20], "controller_vol_widen_bps": [200, 300]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from grinder.paper import SweepConfigError, expand_grid, run_sweep
+from scripts.run_backtest import load_fixture_config
+
+
+def base_params_from_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Engine flags from a fixture config.json (mirrors run_backtest.run_fixture)."""
+    params: dict[str, Any] = {}
+    if config.get("controller_enabled", False):
+        params["controller_enabled"] = True
+    topk_v1_enabled = config.get("topk_v1_enabled", False)
+    if config.get("feature_engine_enabled", False) or topk_v1_enabled:
+        params["feature_engine_enabled"] = True
+    if topk_v1_enabled:
+        params["topk_v1_enabled"] = True
+        params["topk_v1_config.k"] = config.get("topk_v1_k", 3)
+        params["topk_v1_config.spread_max_bps"] = config.get("topk_v1_spread_max_bps", 100)
+        params["topk_v1_config.thin_l1_min"] = config.get("topk_v1_thin_l1_min", 1.0)
+        params["topk_v1_config.warmup_min"] = config.get("topk_v1_warmup_min", 10)
+    return params
+
+
+def parse_param_arg(arg: str) -> tuple[str, list[Any]]:
+    """Parse ``name=v1,v2,...``; each value is decoded as JSON, else kept as a string."""
+    name, sep, raw_values = arg.partition("=")
+    if not sep or not name or not raw_values:
+        raise SweepConfigError(f"Expected name=v1,v2,... but got {arg!r}")
+    values: list[Any] = []
+    for raw in raw_values.split(","):
+        try:
+            values.append(json.loads(raw))
+        except json.JSONDecodeError:
+            values.append(raw)
+    return name, values
+
+
+def load_grid(grid_path: Path | None, param_args: list[str]) -> dict[str, list[Any]]:
+    """Merge a JSON grid file with --param overrides (--param wins)."""
+    grid: dict[str, list[Any]] = {}
+    if grid_path is not None:
+        with grid_path.open() as f:
+            grid.update(json.load(f))
+    for arg in param_args:
+        name, values = parse_param_arg(arg)
+        grid[name] = values
+    return grid
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Paper-trading parameter sweep on one fixture")
+    parser.add_argument("--fixture", type=Path, required=True, help="Fixture directory")
+    parser.add_argument("--grid", type=Path, help="JSON file: parameter -> list of values")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="Sweep a parameter over comma-separated values (repeatable)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument("--top", type=int, help="Only print the best N rows")
+    parser.add_argument("--out", type=Path, help="Write full ranked report to file (JSON)")
+    args = parser.parse_args()
+
+    if not args.fixture.exists():
+        print(f"Fixture directory not found: {args.fixture}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        grid = load_grid(args.grid, args.param)
+        if not grid:
+            raise SweepConfigError("Nothing to sweep: pass --grid and/or --param")
+        points = expand_grid(grid)
+        base_params = base_params_from_config(load_fixture_config(args.fixture))
+        report = run_sweep(args.fixture, points, base_params=base_params, jobs=args.jobs)
+    except SweepConfigError as e:
+        print(f"Sweep config error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(report.format_table(top=args.top))
+    print(
+        f"\n{len(report.rows)} points, {report.events_loaded} events, digest {report.report_digest}"
+    )
+
+    if args.out:
+        args.out.write_text(json.dumps(report.to_dict(), sort_keys=True, indent=2))
+        print(f"Report written to: {args.out}", file=sys.stderr)
+
+    if any(row.errors for row in report.rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ Rehearsal knobs (safe with NoOpExchangePort):
     --paper-spacing-bps     Override grid spacing in bps (default 10.0, lower = tighter grid)
     --paper-levels          Override grid levels per side (default 5)
     --paper-cooldown-ms     Override per-symbol cooldown in ms (default 100)
+    --exec-queue-size       Max snapshots queued for the engine thread (default 256)
+    --exec-conflate         Keep only the latest queued snapshot per symbol
+    --exec-conflate-bars    With --exec-conflate: still feed skipped snapshots to bar building
 
 Exchange port selection:
     --exchange-port noop        Default, no real orders (NoOpExchangePort)
@@ -35,6 +38,9 @@ Env vars:
     GRINDER_REAL_PORT_ACK       Must be YES_I_REALLY_WANT_MAINNET for --exchange-port futures
     GRINDER_MAX_ORDERS_ACK      Must be YES_I_ACCEPT_MULTI_ORDER for --max-orders-per-run >1
     GRINDER_HA_ENABLED          true|1|yes to enable HA leader election
+    GRINDER_ACCOUNT_STREAM_ENABLED  true|1 to drive account state from the user-data
+                                stream (--exchange-port futures + GRINDER_ACCOUNT_SYNC_ENABLED);
+                                REST sync becomes a drift check
     BINANCE_API_KEY             Required for --exchange-port futures
     BINANCE_API_SECRET          Required for --exchange-port futures
 
@@ -61,12 +67,18 @@ import signal
 import sys
 import threading
 import time
-import urllib.request
 from decimal import Decimal
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from grinder.account.stream_state import StreamAccountState
+from grinder.connectors.binance_user_data_ws import (
+    FuturesUserDataWsConnector,
+    ListenKeyConfig,
+    ListenKeyManager,
+    UserDataWsConfig,
+)
 from grinder.connectors.binance_ws import BINANCE_WS_MAINNET, FakeWsTransport
 from grinder.connectors.live_connector import (
     LiveConnectorConfig,
@@ -89,6 +101,7 @@ from grinder.features.engine import FeatureEngine, FeatureEngineConfig
 from grinder.gating.metrics import get_gating_metrics
 from grinder.ha.leader import LeaderElector, LeaderElectorConfig
 from grinder.ha.role import HARole, get_ha_state
+from grinder.live.async_pipeline import AsyncExecutionPipeline, AsyncPipelineConfig
 from grinder.live.config import LiveEngineConfig
 from grinder.live.cycle_layer import LiveCycleConfig, LiveCycleLayerV1
 from grinder.live.engine import LiveEngineV0
@@ -96,7 +109,7 @@ from grinder.ml.fill_model_loader import load_fill_model_v0
 from grinder.net.fixture_guard import install_fixture_network_guard
 from grinder.observability import (
     build_healthz_body,
-    build_metrics_body,
+    build_metrics_response,
     set_ready_fn,
     set_start_time,
 )
@@ -177,22 +190,25 @@ class TradingHealthHandler(BaseHTTPRequestHandler):
         self.wfile.write(body.encode())
 
     def _send_metrics(self) -> None:
-        """Send Prometheus metrics."""
-        body = build_metrics_body()
+        """Send Prometheus metrics (cached render, gzip if accepted)."""
+        body, encoding = build_metrics_response(self.headers.get("Accept-Encoding"))
         self.send_response(200)
         self.send_header("Content-Type", "text/plain; charset=utf-8")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(body.encode())
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args: object) -> None:
         """Suppress default logging."""
         pass
 
 
-def run_server(port: int) -> HTTPServer:
-    """Start HTTP server in background thread."""
+def run_server(port: int) -> ThreadingHTTPServer:
+    """Start HTTP server in background thread (one daemon thread per request)."""
     set_start_time(time.time())
-    server = HTTPServer(("0.0.0.0", port), TradingHealthHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), TradingHealthHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     return server
@@ -363,11 +379,13 @@ def build_exchange_port(
             max_orders_per_run=max_orders_per_run,
         )
 
-        # Compute clock offset vs Binance server (WSL2 clock drift workaround)
+        # Compute clock offset vs Binance server (WSL2 clock drift workaround).
+        # Goes through the pooled client, so it also opens the keep-alive
+        # connection the first order will reuse.
         ts_offset_ms = 0
         try:
-            resp = urllib.request.urlopen(f"{BINANCE_FUTURES_MAINNET_URL}/fapi/v1/time", timeout=5)
-            server_ts = json.loads(resp.read())["serverTime"]
+            resp = inner.request("GET", f"{BINANCE_FUTURES_MAINNET_URL}/fapi/v1/time")
+            server_ts = resp.json_data["serverTime"]  # type: ignore[call-overload]
             local_ts = int(time.time() * 1000)
             ts_offset_ms = max(0, local_ts - server_ts)
             if ts_offset_ms > 0:
@@ -637,6 +655,7 @@ def build_engine(  # noqa: PLR0915
     paper_cooldown_ms: int | None = None,
     exchange_port: ExchangePort | None = None,
     symbols: list[str] | None = None,
+    account_stream: StreamAccountState | None = None,
 ) -> LiveEngineV0:
     """Build LiveEngineV0 with configurable ExchangePort.
 
@@ -661,6 +680,7 @@ def build_engine(  # noqa: PLR0915
         paper_cooldown_ms: Override PaperEngine per-symbol cooldown (default 100ms).
         exchange_port: ExchangePort to use. Defaults to NoOpExchangePort.
         symbols: Trading symbols for per-symbol planner creation (PR-L2).
+        account_stream: User-data stream account state (seeded by account sync).
 
     Returns:
         Configured LiveEngineV0 instance (gauge set to 1 after init).
@@ -757,7 +777,69 @@ def build_engine(  # noqa: PLR0915
         feature_engine=feature_engine,
         grid_planners=grid_planners,
         cycle_layer=cycle_layer,
+        account_stream=account_stream,
+    )
+
+
+def build_user_data_connector(port_name: str) -> FuturesUserDataWsConnector | None:
+    """Build the futures user-data stream connector if GRINDER_ACCOUNT_STREAM_ENABLED.
+
+    Needs --exchange-port futures (API key for listenKey) and account sync
+    (GRINDER_ACCOUNT_SYNC_ENABLED), which seeds the streamed state over REST.
+    """
+    if not parse_bool("GRINDER_ACCOUNT_STREAM_ENABLED", default=False):
+        return None
+    if port_name != "futures":
+        print("  Account stream requires --exchange-port futures, disabled")
+        return None
+    if not parse_bool("GRINDER_ACCOUNT_SYNC_ENABLED", default=False):
+        print("  Account stream requires GRINDER_ACCOUNT_SYNC_ENABLED (REST seed), disabled")
+        return None
+    api_key = os.environ.get("BINANCE_API_KEY", "").strip()
+    listen_keys = ListenKeyManager(
+        RequestsHttpClient(port_name="futures"),
+        ListenKeyConfig(base_url=BINANCE_FUTURES_MAINNET_URL, api_key=api_key),
     )
+    config = UserDataWsConfig(
+        base_url=BINANCE_FUTURES_MAINNET_URL,
+        api_key=api_key,
+        use_testnet=False,
+    )
+    print("  Account stream enabled (REST sync = drift check)")
+    return FuturesUserDataWsConnector(config, listen_key_manager=listen_keys)
+
+
+async def user_data_loop(
+    ws: FuturesUserDataWsConnector,
+    state: StreamAccountState,
+    shutdown: asyncio.Event,
+) -> None:
+    """Feed user-data stream events into StreamAccountState until shutdown.
+
+    Fail-open: on any stream failure the state is marked disconnected and the
+    engine falls back to regular REST account sync.
+    """
+    try:
+        await ws.connect()
+        state.set_connected(True)
+        print("  Account stream connected")
+        reconnects = ws.stats.reconnects
+        async for event in ws.iter_events():
+            if shutdown.is_set():
+                break
+            if ws.stats.reconnects != reconnects:
+                # Events may have been missed while reconnecting: re-seed from REST
+                reconnects = ws.stats.reconnects
+                state.set_connected(False)
+                state.set_connected(True)
+            state.apply(event)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        print(f"  Account stream failed ({exc}); falling back to REST account sync")
+    finally:
+        state.set_connected(False)
+        await ws.close()
 
 
 async def trading_loop(
@@ -765,8 +847,16 @@ async def trading_loop(
     engine: LiveEngineV0,
     shutdown: asyncio.Event,
     duration_s: int,
+    pipeline_config: AsyncPipelineConfig | None = None,
+    *,
+    user_data: tuple[FuturesUserDataWsConnector, StreamAccountState] | None = None,
 ) -> None:
-    """Run the trading loop: connector -> engine.process_snapshot().
+    """Run the trading loop: connector -> execution pipeline -> engine.process_snapshot().
+
+    Snapshots are handed to an AsyncExecutionPipeline, which runs the engine
+    (and its blocking exchange calls) on a dedicated thread, so WebSocket
+    consumption never waits on order I/O. Per-symbol order is preserved; on
+    overflow the stalest queued snapshot is evicted.
 
     Sets module-level _loop_ready flag after connector.connect() succeeds.
     Resets _loop_ready in finally block.
@@ -778,11 +868,19 @@ async def trading_loop(
         engine: Initialized LiveEngineV0.
         shutdown: Event to signal graceful stop.
         duration_s: Max duration (0 = infinite).
+        pipeline_config: Execution queue config (defaults if None).
+        user_data: Optional (connector, state) pair run as a side task that keeps
+            the engine's streamed account state up to date.
     """
     global _loop_ready  # noqa: PLW0603
     await connector.connect()
     _loop_ready = True
     print("  /readyz now returning 200 (if HA permits)")
+    pipeline = AsyncExecutionPipeline(engine, pipeline_config)
+    pipeline.start()
+    user_data_task: asyncio.Task[None] | None = None
+    if user_data is not None:
+        user_data_task = asyncio.create_task(user_data_loop(*user_data, shutdown))
     start = time.time()
     tick_count = 0
     ha_skip_count = 0
@@ -799,14 +897,27 @@ async def trading_loop(
                 if ha_skip_count % 100 == 1:
                     print(f"  HA: not ACTIVE, skipping snapshot (total skipped: {ha_skip_count})")
                 continue
-            engine.process_snapshot(snapshot)
+            pipeline.submit(snapshot)
             tick_count += 1
             if tick_count % 100 == 0:
-                print(f"  Processed {tick_count} ticks ({snapshot.symbol})")
+                print(
+                    f"  Submitted {tick_count} ticks ({snapshot.symbol}) "
+                    f"queue={pipeline.depth} dropped={pipeline.stats.dropped}"
+                )
     finally:
         _loop_ready = False
-        await connector.close()
-        print(f"  Trading loop stopped. Total ticks: {tick_count}, HA skips: {ha_skip_count}")
+        if user_data_task is not None:
+            user_data_task.cancel()
+            await asyncio.gather(user_data_task, return_exceptions=True)
+        try:
+            await pipeline.stop()
+        finally:
+            await connector.close()
+            stats = pipeline.stats
+            print(
+                f"  Trading loop stopped. Total ticks: {tick_count}, HA skips: {ha_skip_count}, "
+                f"processed: {stats.processed}, dropped: {stats.dropped}"
+            )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -879,6 +990,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override PaperEngine per-symbol cooldown in milliseconds (default 100).",
     )
+    parser.add_argument(
+        "--exec-queue-size",
+        type=int,
+        default=AsyncPipelineConfig.max_queue,
+        help="Max snapshots queued for the engine thread; the stalest is evicted beyond this "
+        f"(default {AsyncPipelineConfig.max_queue}).",
+    )
+    parser.add_argument(
+        "--exec-conflate",
+        action="store_true",
+        help="Conflate the execution queue: a newer snapshot replaces the symbol's waiting one.",
+    )
+    parser.add_argument(
+        "--exec-conflate-bars",
+        action="store_true",
+        help="With --exec-conflate: feed replaced snapshots to FeatureEngine for exact bars.",
+    )
     return parser
 
 
@@ -949,6 +1077,9 @@ def main() -> None:  # noqa: PLR0915
     server = run_server(args.metrics_port)
     print(f"  Health endpoint: http://localhost:{args.metrics_port}/healthz")
 
+    user_data_ws = build_user_data_connector(args.exchange_port)
+    account_stream = StreamAccountState() if user_data_ws is not None else None
+
     engine = build_engine(
         mode,
         armed=args.armed,
@@ -958,6 +1089,7 @@ def main() -> None:  # noqa: PLR0915
         paper_cooldown_ms=args.paper_cooldown_ms,
         exchange_port=port,
         symbols=symbols,
+        account_stream=account_stream,
     )
     print("  Engine initialized: grinder_live_engine_initialized=1")
 
@@ -985,7 +1117,24 @@ def main() -> None:  # noqa: PLR0915
     print("\nGRINDER TRADING LOOP running. Press Ctrl+C to stop.")
     exit_code = 0
     try:
-        loop.run_until_complete(trading_loop(connector, engine, shutdown, args.duration_s))
+        loop.run_until_complete(
+            trading_loop(
+                connector,
+                engine,
+                shutdown,
+                args.duration_s,
+                pipeline_config=AsyncPipelineConfig(
+                    max_queue=args.exec_queue_size,
+                    conflate=args.exec_conflate or args.exec_conflate_bars,
+                    conflate_bars=args.exec_conflate_bars,
+                ),
+                user_data=(
+                    (user_data_ws, account_stream)
+                    if user_data_ws is not None and account_stream is not None
+                    else None
+                ),
+            )
+        )
     except Exception as exc:
         print(f"GRINDER TRADING LOOP FATAL: {exc}")
         exit_code = 2
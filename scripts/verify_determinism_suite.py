@@ -9,6 +9,10 @@ This script is a CI gate that catches silent drift across:
 Usage:
     python -m scripts.verify_determinism_suite
     python -m scripts.verify_determinism_suite --quiet
+    python -m scripts.verify_determinism_suite --jobs 4
+
+--jobs N > 1 checks fixtures (and backtest fixture runs) in a process pool;
+results are reported in discovery order, same as a serial run.
 
 Exit codes:
     0 - All checks pass
@@ -18,8 +22,10 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
@@ -315,12 +321,12 @@ def run_paper(
     return result.digest
 
 
-def run_backtest() -> tuple[str, bool]:
+def run_backtest(jobs: int = 1) -> tuple[str, bool]:
     """Run backtest and return (report_digest, all_fixtures_passed)."""
     # Late import to avoid circular dependency with scripts module
     from scripts.run_backtest import run_backtest as _run_backtest  # noqa: PLC0415
 
-    report = _run_backtest()
+    report = _run_backtest(jobs=jobs)
     return report.report_digest, report.all_digests_match
 
 
@@ -420,7 +426,50 @@ def check_fixture(fixture_path: Path, verbose: bool = False) -> FixtureCheck:
     )
 
 
-def check_backtest(verbose: bool = False) -> BacktestCheck:
+def check_fixtures(
+    fixtures: list[Path], verbose: bool = False, jobs: int = 1
+) -> list[FixtureCheck]:
+    """Check fixtures serially or in a process pool, preserving input order."""
+    # Late import to avoid circular dependency with scripts module
+    from scripts.run_backtest import resolve_jobs  # noqa: PLC0415
+
+    workers = min(resolve_jobs(jobs), len(fixtures))
+    check = functools.partial(check_fixture, verbose=verbose)
+    if workers <= 1:
+        return [check(p) for p in fixtures]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(check, fixtures))
+
+
+def run_fixture_checks(
+    fixtures: list[Path], verbose: bool = False, quiet: bool = False, jobs: int = 1
+) -> list[FixtureCheck]:
+    """Check all fixtures, printing per-fixture progress unless quiet.
+
+    Serial runs print progress as each fixture completes; pooled runs print
+    it once all checks are gathered.
+    """
+    if jobs != 1:
+        fixture_checks = check_fixtures(fixtures, verbose=verbose, jobs=jobs)
+        if not quiet:
+            for check in fixture_checks:
+                print(f"Checking {check.name}...")
+                print(f"  {'PASS' if check.passed else 'FAIL'}")
+        return fixture_checks
+
+    fixture_checks = []
+    for fixture_path in fixtures:
+        if not quiet:
+            print(f"Checking {fixture_path.name}...")
+        check = check_fixture(fixture_path, verbose=verbose)
+        fixture_checks.append(check)
+        if not quiet:
+            status = "PASS" if check.passed else "FAIL"
+            print(f"  {status}")
+    return fixture_checks
+
+
+def check_backtest(verbose: bool = False, jobs: int = 1) -> BacktestCheck:
     """Check backtest for determinism."""
     errors: list[str] = []
 
@@ -428,7 +477,7 @@ def check_backtest(verbose: bool = False) -> BacktestCheck:
         print("  Running backtest (run 1)...")
 
     try:
-        digest_1, all_passed_1 = run_backtest()
+        digest_1, all_passed_1 = run_backtest(jobs=jobs)
     except Exception as e:
         errors.append(f"Backtest run 1 error: {e}")
         digest_1 = ""
@@ -438,7 +487,7 @@ def check_backtest(verbose: bool = False) -> BacktestCheck:
         print("  Running backtest (run 2)...")
 
     try:
-        digest_2, all_passed_2 = run_backtest()
+        digest_2, all_passed_2 = run_backtest(jobs=jobs)
     except Exception as e:
         errors.append(f"Backtest run 2 error: {e}")
         digest_2 = ""
@@ -547,6 +596,13 @@ def main() -> None:
         action="store_true",
         help="Minimal output, only show final verdict",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Check fixtures in N worker processes (0 = one per CPU, default: 1)",
+    )
     args = parser.parse_args()
 
     verbose = args.verbose and not args.quiet
@@ -559,20 +615,12 @@ def main() -> None:
         print(f"Discovered {len(fixtures)} fixtures\n")
 
     # Check each fixture
-    fixture_checks: list[FixtureCheck] = []
-    for fixture_path in fixtures:
-        if not args.quiet:
-            print(f"Checking {fixture_path.name}...")
-        check = check_fixture(fixture_path, verbose=verbose)
-        fixture_checks.append(check)
-        if not args.quiet:
-            status = "PASS" if check.passed else "FAIL"
-            print(f"  {status}")
+    fixture_checks = run_fixture_checks(fixtures, verbose=verbose, quiet=args.quiet, jobs=args.jobs)
 
     # Check backtest
     if not args.quiet:
         print("\nChecking backtest determinism...")
-    backtest_check = check_backtest(verbose=verbose)
+    backtest_check = check_backtest(verbose=verbose, jobs=args.jobs)
     if not args.quiet:
         status = "PASS" if backtest_check.passed else "FAIL"
         print(f"  {status}")
@@ -0,0 +1,90 @@
+"""Per-symbol indexed view of an AccountSnapshot.
+
+AccountSnapshot keeps open orders and positions as flat canonical tuples.
+The live path reads them per symbol on every tick; AccountIndex groups
+them once per sync so each lookup is a dict get:
+
+- orders(symbol):      all open orders for the symbol (canonical order kept)
+- grid_orders(symbol): same, without TP orders (cycle-layer managed)
+- position_qty(symbol)
+
+clientOrderIds are parsed through a shared ParsedOrderIdCache, so the engine,
+the cycle layer and the grid planner parse each order id once while it stays
+open.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from grinder.reconcile.identity import get_order_id_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from grinder.account.contracts import AccountSnapshot, OpenOrderSnap
+    from grinder.reconcile.identity import ParsedOrderIdCache
+
+_NO_ORDERS: tuple[OpenOrderSnap, ...] = ()
+_ZERO = Decimal("0")
+
+
+@dataclass(frozen=True)
+class AccountIndex:
+    """Symbol-keyed lookups over one AccountSnapshot (see module docstring).
+
+    Attributes:
+        snapshot: Indexed snapshot (identity marks which sync this belongs to).
+        orders_by_symbol: symbol -> open orders.
+        grid_orders_by_symbol: symbol -> open orders excluding TP orders.
+        position_qty_by_symbol: symbol -> position qty (first canonical position).
+    """
+
+    snapshot: AccountSnapshot
+    orders_by_symbol: Mapping[str, tuple[OpenOrderSnap, ...]]
+    grid_orders_by_symbol: Mapping[str, tuple[OpenOrderSnap, ...]]
+    position_qty_by_symbol: Mapping[str, Decimal]
+
+    def orders(self, symbol: str) -> tuple[OpenOrderSnap, ...]:
+        """All open orders for symbol."""
+        return self.orders_by_symbol.get(symbol, _NO_ORDERS)
+
+    def grid_orders(self, symbol: str) -> tuple[OpenOrderSnap, ...]:
+        """Open orders for symbol, excluding TP orders."""
+        return self.grid_orders_by_symbol.get(symbol, _NO_ORDERS)
+
+    def position_qty(self, symbol: str) -> Decimal:
+        """Position qty for symbol (0 if no position)."""
+        return self.position_qty_by_symbol.get(symbol, _ZERO)
+
+
+def build_account_index(
+    snapshot: AccountSnapshot,
+    order_id_cache: ParsedOrderIdCache | None = None,
+) -> AccountIndex:
+    """Index snapshot by symbol.
+
+    Args:
+        snapshot: Account snapshot to index.
+        order_id_cache: Parse cache for TP detection (default: shared cache).
+    """
+    cache = order_id_cache if order_id_cache is not None else get_order_id_cache()
+    orders: dict[str, list[OpenOrderSnap]] = {}
+    grid_orders: dict[str, list[OpenOrderSnap]] = {}
+    for o in snapshot.open_orders:
+        orders.setdefault(o.symbol, []).append(o)
+        if not cache.is_tp(o.order_id):
+            grid_orders.setdefault(o.symbol, []).append(o)
+
+    position_qty: dict[str, Decimal] = {}
+    for p in snapshot.positions:
+        position_qty.setdefault(p.symbol, p.qty)
+
+    return AccountIndex(
+        snapshot=snapshot,
+        orders_by_symbol={s: tuple(os_) for s, os_ in orders.items()},
+        grid_orders_by_symbol={s: tuple(os_) for s, os_ in grid_orders.items()},
+        position_qty_by_symbol=position_qty,
+    )
@@ -0,0 +1,318 @@
+"""Event-sourced AccountSnapshot maintained from the user-data stream.
+
+Applies ORDER_TRADE_UPDATE / ACCOUNT_UPDATE events (UserDataEvent) to an
+in-memory copy of positions + open orders, so the engine sees fills as
+soon as the stream delivers them instead of on the next REST poll.
+
+REST (AccountSyncer) stays the source of truth:
+- seed(): first REST snapshot initializes the state
+- check_drift(): periodic REST snapshot is diffed against stream state;
+  any difference is reported and the state is re-seeded from REST
+- set_connected(False): stream dropped, events may be lost, so the seed is
+  discarded and the state is not live until the next REST snapshot
+
+A REST snapshot can be older than stream events that arrive while the
+request is in flight. Events received before the first seed, or between
+begin_sync() and seed()/check_drift(), are buffered and replayed on top of
+the REST snapshot (subject to the per-entry out-of-order guard), so the seed
+never reverts fills the stream already delivered.
+
+Design:
+- Same contracts as REST sync (PositionSnap / OpenOrderSnap, canonical order),
+  so consumers of AccountSnapshot do not care where it came from.
+- Order key: clientOrderId (falls back to numeric orderId), as in
+  BinanceFuturesPort.fetch_account_snapshot().
+- Out-of-order guard: an event older than the stored entry is ignored.
+- Thread-safe: events arrive on the asyncio loop while the engine reads
+  snapshot() from its execution thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from grinder.account.contracts import (
+    AccountSnapshot,
+    OpenOrderSnap,
+    PositionSnap,
+    build_account_snapshot,
+)
+from grinder.core import OrderState
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from grinder.execution.futures_events import (
+        FuturesOrderEvent,
+        FuturesPositionEvent,
+        UserDataEvent,
+    )
+
+logger = logging.getLogger(__name__)
+
+# OrderState -> Binance status string for orders that stay open
+_OPEN_STATUS: dict[OrderState, str] = {
+    OrderState.OPEN: "NEW",
+    OrderState.PARTIALLY_FILLED: "PARTIALLY_FILLED",
+}
+
+# Max events buffered while waiting for a REST snapshot (oldest dropped first)
+MAX_PENDING_EVENTS = 10_000
+
+
+class StreamAccountState:
+    """AccountSnapshot maintained from user-data stream events.
+
+    Live (usable instead of REST polling) only while the stream is connected
+    and the state is seeded from a REST snapshot. Before seeding, snapshot()
+    returns None and events are buffered until the seed (see module docstring).
+
+    Thread safety: all public methods are safe to call from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._positions: dict[tuple[str, str], PositionSnap] = {}
+        self._orders: dict[str, OpenOrderSnap] = {}
+        self._seeded = False
+        self._connected = False
+        self._version = 0
+        self._cached: AccountSnapshot | None = None
+        self._cached_version = -1
+        self._events_applied = 0
+        self._events_dropped = 0
+        self._sync_pending = False
+        self._pending: deque[tuple[Callable[[Any], bool], Any]] = deque()
+
+    @property
+    def seeded(self) -> bool:
+        """True once seed() was called with a REST snapshot."""
+        return self._seeded
+
+    @property
+    def live(self) -> bool:
+        """True if connected and seeded: snapshot() tracks the exchange."""
+        return self._seeded and self._connected
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every state change."""
+        return self._version
+
+    @property
+    def events_applied(self) -> int:
+        """Events that changed state."""
+        return self._events_applied
+
+    @property
+    def events_dropped(self) -> int:
+        """Events ignored (stale, irrelevant, or evicted from a full buffer)."""
+        return self._events_dropped
+
+    @property
+    def events_pending(self) -> int:
+        """Events buffered for replay on the next seed."""
+        return len(self._pending)
+
+    def begin_sync(self) -> None:
+        """Mark a REST snapshot request as in flight.
+
+        Events applied from now on are also buffered and replayed by the
+        following seed()/check_drift(). Call abort_sync() if the request fails.
+        """
+        with self._lock:
+            if self._seeded:
+                self._pending.clear()
+            self._sync_pending = True
+
+    def abort_sync(self) -> None:
+        """The REST request started by begin_sync() failed; stop buffering."""
+        with self._lock:
+            self._sync_pending = False
+            if self._seeded:
+                self._pending.clear()
+
+    def seed(self, snapshot: AccountSnapshot) -> None:
+        """Replace stream state with a REST snapshot, then replay buffered events."""
+        with self._lock:
+            self._seed_locked(snapshot)
+
+    def set_connected(self, connected: bool) -> None:
+        """Report stream connectivity. Disconnect drops the seed (events may be missed)."""
+        with self._lock:
+            self._connected = connected
+            if not connected:
+                self._pending.clear()
+                if self._seeded:
+                    self._seeded = False
+                    self._version += 1
+
+    def snapshot(self) -> AccountSnapshot | None:
+        """Current state as AccountSnapshot (source="stream"), None if not seeded.
+
+        Rebuilt only when state changed since the previous call.
+        """
+        with self._lock:
+            if not self._seeded:
+                return None
+            if self._cached_version != self._version:
+                self._cached = build_account_snapshot(
+                    list(self._positions.values()),
+                    list(self._orders.values()),
+                    source="stream",
+                )
+                self._cached_version = self._version
+            return self._cached
+
+    def apply(self, event: UserDataEvent) -> bool:
+        """Apply one user-data event. Returns True if state changed."""
+        changed = False
+        if event.order_event is not None:
+            changed = self.apply_order_event(event.order_event)
+        elif event.position_events:
+            for pos_event in event.position_events:
+                changed = self.apply_position_event(pos_event) or changed
+        elif event.position_event is not None and event.position_event.symbol:
+            changed = self.apply_position_event(event.position_event)
+        else:
+            self._events_dropped += 1
+        return changed
+
+    def apply_order_event(self, event: FuturesOrderEvent) -> bool:
+        """Upsert an open order or remove it on a terminal status."""
+        with self._lock:
+            if not self._buffer(self._apply_order, event):
+                return False
+            return self._apply_order(event)
+
+    def apply_position_event(self, event: FuturesPositionEvent) -> bool:
+        """Upsert a position from ACCOUNT_UPDATE, removing it when flat.
+
+        The stream carries no mark price or leverage: both are kept from the
+        previous entry (REST seed), mark falls back to entry price.
+        """
+        with self._lock:
+            if not self._buffer(self._apply_position, event):
+                return False
+            return self._apply_position(event)
+
+    def check_drift(self, rest_snapshot: AccountSnapshot) -> list[str]:
+        """Diff stream state against a REST snapshot, then re-seed from REST.
+
+        Compares position quantities by (symbol, side) and open order IDs of
+        the stream state with the re-seeded state (REST plus buffered events
+        since begin_sync()), so in-flight fills are not reported as drift.
+
+        Returns:
+            Human-readable differences (empty = stream state matched REST).
+        """
+        with self._lock:
+            stream_pos = {k: p.qty for k, p in self._positions.items()}
+            stream_orders = set(self._orders)
+            seeded = self._seeded
+            self._seed_locked(rest_snapshot)
+            rest_pos = {k: p.qty for k, p in self._positions.items()}
+            rest_orders = set(self._orders)
+
+        diffs: list[str] = []
+        if seeded:
+            for key in sorted(stream_pos.keys() | rest_pos.keys()):
+                s_qty = stream_pos.get(key, Decimal(0))
+                r_qty = rest_pos.get(key, Decimal(0))
+                if s_qty != r_qty:
+                    diffs.append(f"position {key[0]}/{key[1]} stream={s_qty} rest={r_qty}")
+            for oid in sorted(stream_orders - rest_orders):
+                diffs.append(f"order {oid} open in stream, not on exchange")
+            for oid in sorted(rest_orders - stream_orders):
+                diffs.append(f"order {oid} open on exchange, not in stream")
+        return diffs
+
+    def _seed_locked(self, snapshot: AccountSnapshot) -> None:
+        """Replace state with a REST snapshot and replay buffered events (caller holds the lock)."""
+        self._positions = {p.sort_key(): p for p in snapshot.positions}
+        self._orders = {o.order_id: o for o in snapshot.open_orders}
+        self._seeded = True
+        self._sync_pending = False
+        self._version += 1
+        pending, self._pending = self._pending, deque()
+        for apply, event in pending:
+            apply(event)
+
+    def _buffer(self, apply: Callable[[Any], bool], event: Any) -> bool:
+        """Keep an event for replay while awaiting REST (caller holds the lock).
+
+        Returns:
+            True if the event should also be applied now (state is seeded).
+        """
+        if self._sync_pending or not self._seeded:
+            if len(self._pending) >= MAX_PENDING_EVENTS:
+                self._pending.popleft()
+                self._events_dropped += 1
+            self._pending.append((apply, event))
+        return self._seeded
+
+    def _apply_order(self, event: FuturesOrderEvent) -> bool:
+        """Apply an order event to seeded state (caller holds the lock)."""
+        order_id = event.client_order_id or str(event.order_id)
+        existing = self._orders.get(order_id)
+        if existing is not None and event.ts < existing.ts:
+            self._events_dropped += 1
+            return False
+
+        status = _OPEN_STATUS.get(event.status)
+        if status is None:
+            # Terminal status: filled, cancelled, rejected or expired
+            if self._orders.pop(order_id, None) is None:
+                self._events_dropped += 1
+                return False
+        else:
+            self._orders[order_id] = OpenOrderSnap(
+                order_id=order_id,
+                symbol=event.symbol,
+                side=event.side.value,
+                order_type=event.order_type,
+                price=event.price,
+                qty=event.qty,
+                filled_qty=event.executed_qty,
+                reduce_only=event.reduce_only,
+                status=status,
+                ts=event.ts,
+            )
+        self._bump()
+        return True
+
+    def _apply_position(self, event: FuturesPositionEvent) -> bool:
+        """Apply a position event to seeded state (caller holds the lock)."""
+        key = (event.symbol, event.position_side)
+        existing = self._positions.get(key)
+        if existing is not None and event.ts < existing.ts:
+            self._events_dropped += 1
+            return False
+
+        qty = abs(event.position_amt)
+        if qty == 0:
+            if self._positions.pop(key, None) is None:
+                self._events_dropped += 1
+                return False
+        else:
+            self._positions[key] = PositionSnap(
+                symbol=event.symbol,
+                side=event.position_side,
+                qty=qty,
+                entry_price=event.entry_price,
+                mark_price=existing.mark_price if existing is not None else event.entry_price,
+                unrealized_pnl=event.unrealized_pnl,
+                leverage=existing.leverage if existing is not None else 1,
+                ts=event.ts,
+            )
+        self._bump()
+        return True
+
+    def _bump(self) -> None:
+        """Record a state change (caller holds the lock)."""
+        self._version += 1
+        self._events_applied += 1
@@ -80,7 +80,10 @@ def _cmd_replay(args: argparse.Namespace) -> None:
 
 def _cmd_paper(args: argparse.Namespace) -> None:
     """Run paper trading command."""
-    from grinder.paper import PaperEngine  # noqa: PLC0415 - lazy import for fast CLI startup
+    from grinder.paper import (  # noqa: PLC0415 - lazy import for fast CLI startup
+        JsonlSink,
+        PaperEngine,
+    )
 
     fixture_dir = Path(args.fixture)
 
@@ -93,7 +96,14 @@ def _cmd_paper(args: argparse.Namespace) -> None:
         print("Paper trading mode: NO REAL ORDERS")
 
     engine = PaperEngine()
-    result = engine.run(fixture_dir)
+    if args.stream_out:
+        # Per-tick outputs streamed to JSONL, not kept in memory
+        with JsonlSink(Path(args.stream_out)) as sink:
+            result = engine.run(fixture_dir, sink=sink)
+        if args.verbose:
+            print(f"Outputs streamed to: {args.stream_out} ({sink.count} lines)")
+    else:
+        result = engine.run(fixture_dir)
 
     if args.verbose:
         print(f"Events processed: {result.events_processed}")
@@ -140,6 +150,10 @@ def build_parser() -> argparse.ArgumentParser:
     p_paper = sub.add_parser("paper", help="Run paper trading with gating (no real orders)")
     p_paper.add_argument("--fixture", required=True, help="Path to fixture directory")
     p_paper.add_argument("--out", help="Output path for paper trading JSON (optional)")
+    p_paper.add_argument(
+        "--stream-out",
+        help="Stream per-tick outputs to JSONL (.gz = gzip) instead of keeping them in memory",
+    )
     p_paper.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     sub.add_parser(
@@ -0,0 +1,425 @@
+"""Binance Futures depth diff stream connector (local L2 order book).
+
+This module provides:
+- BinanceDepthSnapshotFetcher: REST depth snapshot (GET /fapi/v1/depth)
+- BinanceDepthWsConnector: ``<symbol>@depth@<speed>ms`` stream maintaining
+  one L2OrderBook per symbol
+
+Sync procedure per symbol (see grinder.features.l2_book):
+- Diffs arriving while the book is not synced are buffered
+- A REST snapshot is fetched, applied, and buffered diffs are replayed
+- A resync that fails (or leaves the book unsynced) backs off per symbol
+  (DepthWsConfig.resync_retry); diffs keep buffering until the next attempt
+- A sequence gap (pu != previous u) marks the book out of sync; the next
+  diff triggers a resync
+- Reconnect invalidates every book (diffs were missed while disconnected)
+
+Usage:
+    fetcher = BinanceDepthSnapshotFetcher(http_client)
+    async with BinanceDepthWsConnector(DepthWsConfig(symbols=["BTCUSDT"]), fetcher) as ws:
+        async for book in ws.iter_books():
+            features = book.feature_snapshot(depth=10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from grinder.connectors.binance_user_data_ws import (
+    BINANCE_FUTURES_MAINNET_URL,
+    BINANCE_FUTURES_WS_MAINNET,
+    BINANCE_FUTURES_WS_TESTNET,
+)
+from grinder.connectors.binance_ws import WebsocketsTransport, WsTransport
+from grinder.connectors.data_connector import ConnectorState, RetryConfig, TimeoutConfig
+from grinder.connectors.errors import (
+    ConnectorClosedError,
+    ConnectorTimeoutError,
+    ConnectorTransientError,
+)
+from grinder.features.l2_book import DepthDiff, DepthSnapshot, DiffResult, L2OrderBook
+from grinder.net.retry_policy import OP_GET_DEPTH
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from grinder.execution.binance_port import HttpClient
+
+logger = logging.getLogger(__name__)
+
+# Depth snapshot sizes accepted by GET /fapi/v1/depth
+DEPTH_SNAPSHOT_LIMITS = (5, 10, 20, 50, 100, 500, 1000)
+
+
+class BinanceDepthSnapshotFetcher:
+    """Fetches REST depth snapshots for resync (public endpoint, no signing)."""
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        base_url: str = BINANCE_FUTURES_MAINNET_URL,
+        limit: int = 100,
+        timeout_ms: int = 5000,
+    ) -> None:
+        if limit not in DEPTH_SNAPSHOT_LIMITS:
+            raise ValueError(f"limit must be one of {DEPTH_SNAPSHOT_LIMITS}, got {limit}")
+        self._http_client = http_client
+        self._base_url = base_url
+        self._limit = limit
+        self._timeout_ms = timeout_ms
+
+    def __call__(self, symbol: str) -> DepthSnapshot:
+        """GET /fapi/v1/depth for symbol.
+
+        Raises:
+            ConnectorTransientError: On non-200 response (resync is retried)
+        """
+        response = self._http_client.request(
+            method="GET",
+            url=f"{self._base_url}/fapi/v1/depth",
+            params={"symbol": symbol, "limit": self._limit},
+            timeout_ms=self._timeout_ms,
+            op=OP_GET_DEPTH,
+        )
+        if response.status_code != 200 or not isinstance(response.json_data, dict):
+            raise ConnectorTransientError(
+                f"Depth snapshot failed for {symbol}: HTTP {response.status_code}"
+            )
+        return DepthSnapshot.from_binance(symbol, response.json_data)
+
+
+@dataclass
+class DepthWsConfig:
+    """Configuration for BinanceDepthWsConnector.
+
+    Attributes:
+        symbols: Symbols to subscribe to
+        use_testnet: Use testnet endpoint (default True for safety)
+        speed_ms: Diff stream update speed (100, 250 or 500)
+        max_buffered_diffs: Per-symbol buffer cap while waiting for a snapshot
+        timeout: Timeout configuration
+        retry: Retry configuration
+        resync_retry: Per-symbol backoff between failed resyncs (delays only;
+            resync is retried for as long as diffs arrive)
+    """
+
+    symbols: list[str] = field(default_factory=list)
+    use_testnet: bool = True
+    speed_ms: int = 100
+    max_buffered_diffs: int = 1000
+    timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
+    retry: RetryConfig = field(default_factory=RetryConfig)
+    resync_retry: RetryConfig = field(
+        default_factory=lambda: RetryConfig(base_delay_ms=500, max_delay_ms=10_000)
+    )
+
+    @property
+    def ws_url(self) -> str:
+        """Get WebSocket URL."""
+        return BINANCE_FUTURES_WS_TESTNET if self.use_testnet else BINANCE_FUTURES_WS_MAINNET
+
+    def get_subscribe_message(self) -> str:
+        """Get subscription message for depth diff streams."""
+        streams = [f"{s.lower()}@depth@{self.speed_ms}ms" for s in self.symbols]
+        return json.dumps({"method": "SUBSCRIBE", "params": streams, "id": 1})
+
+
+@dataclass
+class DepthWsStats:
+    """Statistics for depth WebSocket connector."""
+
+    messages_received: int = 0
+    diffs_applied: int = 0
+    diffs_stale: int = 0
+    diffs_dropped: int = 0
+    gaps: int = 0
+    resyncs: int = 0
+    resyncs_throttled: int = 0
+    reconnects: int = 0
+    errors: int = 0
+    last_message_ts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "messages_received": self.messages_received,
+            "diffs_applied": self.diffs_applied,
+            "diffs_stale": self.diffs_stale,
+            "diffs_dropped": self.diffs_dropped,
+            "gaps": self.gaps,
+            "resyncs": self.resyncs,
+            "resyncs_throttled": self.resyncs_throttled,
+            "reconnects": self.reconnects,
+            "errors": self.errors,
+            "last_message_ts": self.last_message_ts,
+        }
+
+
+class BinanceDepthWsConnector:
+    """WebSocket connector maintaining local L2 order books from depth diffs.
+
+    Features:
+    - One L2OrderBook per subscribed symbol
+    - Snapshot + buffered-diff sync, gap detection and resync
+    - Auto-reconnect with exponential backoff (books invalidated)
+    - Testable via transport/fetcher/clock injection (FakeWsTransport)
+    """
+
+    def __init__(
+        self,
+        config: DepthWsConfig,
+        snapshot_fetcher: Callable[[str], DepthSnapshot],
+        transport: WsTransport | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize connector.
+
+        Args:
+            config: Connector configuration
+            snapshot_fetcher: Returns a REST depth snapshot for a symbol
+                (BinanceDepthSnapshotFetcher; called in a worker thread)
+            transport: WebSocket transport (injectable for testing)
+            clock: Clock function for stats timestamps and resync backoff
+                (injectable for testing)
+        """
+        self._config = config
+        self._fetch_snapshot = snapshot_fetcher
+        self._transport = transport or WebsocketsTransport()
+        self._clock = clock or time.time
+        self._state = ConnectorState.DISCONNECTED
+        self._closed = False
+        self._stats = DepthWsStats()
+        self._books = {s: L2OrderBook(s) for s in config.symbols}
+        self._buffers: dict[str, list[DepthDiff]] = {s: [] for s in config.symbols}
+        self._resync_failures = dict.fromkeys(config.symbols, 0)
+        self._next_resync_at = dict.fromkeys(config.symbols, 0.0)
+
+    @property
+    def state(self) -> ConnectorState:
+        """Get current connector state."""
+        return self._state
+
+    @property
+    def stats(self) -> DepthWsStats:
+        """Get connector statistics."""
+        return self._stats
+
+    def book(self, symbol: str) -> L2OrderBook | None:
+        """Local order book for symbol (None if not subscribed)."""
+        return self._books.get(symbol)
+
+    async def connect(self) -> None:
+        """Connect and subscribe to depth diff streams."""
+        if self._closed:
+            raise ConnectorClosedError("Connector is closed")
+
+        self._state = ConnectorState.CONNECTING
+        try:
+            await asyncio.wait_for(
+                self._transport.connect(self._config.ws_url),
+                timeout=self._config.timeout.connect_timeout_ms / 1000.0,
+            )
+            await self._transport.send(self._config.get_subscribe_message())
+        except TimeoutError as e:
+            self._state = ConnectorState.DISCONNECTED
+            raise ConnectorTimeoutError(
+                op="connect",
+                timeout_ms=self._config.timeout.connect_timeout_ms,
+                message=str(e),
+            ) from e
+        except Exception as e:
+            self._state = ConnectorState.DISCONNECTED
+            self._stats.errors += 1
+            raise ConnectorTransientError(str(e)) from e
+
+        self._state = ConnectorState.CONNECTED
+        logger.info("DEPTH_WS_CONNECTED symbols=%s", self._config.symbols)
+
+    async def close(self) -> None:
+        """Close WebSocket connection."""
+        self._closed = True
+        self._state = ConnectorState.CLOSED
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                self._transport.close(),
+                timeout=self._config.timeout.close_timeout_ms / 1000.0,
+            )
+        logger.info("DEPTH_WS_CLOSED")
+
+    async def reconnect(self) -> None:
+        """Reconnect after failure; all books must resync."""
+        if self._closed:
+            raise ConnectorClosedError("Connector is closed")
+
+        self._state = ConnectorState.RECONNECTING
+        self._stats.reconnects += 1
+        for book in self._books.values():
+            book.invalidate()
+        for buffer in self._buffers.values():
+            buffer.clear()
+
+        for attempt in range(self._config.retry.max_retries):
+            try:
+                await self._transport.close()
+                await self.connect()
+                return
+            except Exception as e:
+                delay_ms = self._config.retry.get_delay_ms(attempt)
+                logger.warning(
+                    "DEPTH_WS_RECONNECT_FAILED attempt=%d/%d error=%s delay_ms=%d",
+                    attempt + 1,
+                    self._config.retry.max_retries,
+                    e,
+                    delay_ms,
+                )
+                await asyncio.sleep(delay_ms / 1000.0)
+
+        self._state = ConnectorState.DISCONNECTED
+        raise ConnectorTransientError(
+            f"Max reconnect attempts ({self._config.retry.max_retries}) exceeded"
+        )
+
+    async def iter_books(self) -> AsyncIterator[L2OrderBook]:
+        """Apply incoming diffs; yield the symbol's book after each change.
+
+        Only synced books are yielded.
+
+        Raises:
+            ConnectorClosedError: If connector is not connected
+        """
+        if self._state != ConnectorState.CONNECTED:
+            raise ConnectorClosedError(f"Not connected (state={self._state.value})")
+
+        while not self._closed:
+            try:
+                raw_msg = await asyncio.wait_for(
+                    self._transport.recv(),
+                    timeout=self._config.timeout.read_timeout_ms / 1000.0,
+                )
+                self._stats.messages_received += 1
+                self._stats.last_message_ts = int(self._clock() * 1000)
+
+                diff = self._parse_diff(raw_msg)
+                if diff is None:
+                    continue
+                book = self._books.get(diff.symbol)
+                if book is None:
+                    continue
+                if await self._handle_diff(book, diff):
+                    yield book
+
+            except (TimeoutError, ConnectorTransientError):
+                logger.warning("DEPTH_WS_TRANSIENT_ERROR, reconnecting")
+                try:
+                    await self.reconnect()
+                except ConnectorTransientError:
+                    logger.error("DEPTH_WS_RECONNECT_EXHAUSTED")
+                    break
+            except ConnectorClosedError:
+                break
+
+    async def _handle_diff(self, book: L2OrderBook, diff: DepthDiff) -> bool:
+        """Apply diff (resyncing if needed). Returns True if the book changed."""
+        result = book.apply_diff(diff)
+        if result == DiffResult.APPLIED:
+            self._stats.diffs_applied += 1
+            return True
+        if result == DiffResult.STALE:
+            self._stats.diffs_stale += 1
+            return False
+        if result == DiffResult.GAP:
+            self._stats.gaps += 1
+            logger.warning(
+                "DEPTH_GAP symbol=%s last_update_id=%d pu=%s U=%d",
+                book.symbol,
+                book.last_update_id,
+                diff.prev_final_update_id,
+                diff.first_update_id,
+            )
+
+        buffer = self._buffers[book.symbol]
+        buffer.append(diff)
+        if len(buffer) > self._config.max_buffered_diffs:
+            del buffer[0]
+            self._stats.diffs_dropped += 1
+        if self._clock() < self._next_resync_at[book.symbol]:
+            self._stats.resyncs_throttled += 1
+            return False
+        return await self._resync(book)
+
+    def _defer_resync(self, symbol: str) -> int:
+        """Back off the next resync of symbol. Returns the delay in ms."""
+        failures = self._resync_failures[symbol]
+        self._resync_failures[symbol] = failures + 1
+        delay_ms = self._config.resync_retry.get_delay_ms(failures)
+        self._next_resync_at[symbol] = self._clock() + delay_ms / 1000.0
+        return delay_ms
+
+    async def _resync(self, book: L2OrderBook) -> bool:
+        """Fetch snapshot, apply it and replay buffered diffs."""
+        try:
+            snapshot = await asyncio.to_thread(self._fetch_snapshot, book.symbol)
+        except Exception as e:
+            self._stats.errors += 1
+            delay_ms = self._defer_resync(book.symbol)
+            logger.warning(
+                "DEPTH_RESYNC_FAILED symbol=%s error=%s retry_in_ms=%d", book.symbol, e, delay_ms
+            )
+            return False
+
+        self._stats.resyncs += 1
+        book.apply_snapshot(snapshot)
+        buffer = self._buffers[book.symbol]
+        for diff in buffer:
+            result = book.apply_diff(diff)
+            if result == DiffResult.APPLIED:
+                self._stats.diffs_applied += 1
+            elif result == DiffResult.STALE:
+                self._stats.diffs_stale += 1
+            else:
+                # Snapshot older than buffered diffs: retry after backoff
+                self._stats.gaps += 1
+                break
+        buffer.clear()
+        if book.synced:
+            self._resync_failures[book.symbol] = 0
+            self._next_resync_at[book.symbol] = 0.0
+        else:
+            self._defer_resync(book.symbol)
+        logger.info(
+            "DEPTH_RESYNC symbol=%s last_update_id=%d synced=%s",
+            book.symbol,
+            book.last_update_id,
+            book.synced,
+        )
+        return book.synced
+
+    def _parse_diff(self, raw_msg: str) -> DepthDiff | None:
+        """Parse raw message to DepthDiff (None for non-depth messages)."""
+        try:
+            data = json.loads(raw_msg)
+            # Combined stream wrapper: {"stream": ..., "data": {...}}
+            if isinstance(data, dict) and "data" in data:
+                data = data["data"]
+            if not isinstance(data, dict) or data.get("e") != "depthUpdate":
+                return None
+            return DepthDiff.from_binance(data)
+        except (json.JSONDecodeError, KeyError, ValueError, ArithmeticError) as e:
+            logger.warning("Failed to parse depth message: %s - %s", raw_msg[:100], e)
+            self._stats.errors += 1
+            return None
+
+    async def __aenter__(self) -> BinanceDepthWsConnector:
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
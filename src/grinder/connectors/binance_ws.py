@@ -44,6 +44,8 @@ from grinder.contracts import Snapshot
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable
 
+    from grinder.observability.stage_latency import LatencyTracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -287,6 +289,7 @@ class BinanceWsConnector(DataConnector):
         config: BinanceWsConfig,
         transport: WsTransport | None = None,
         clock: Callable[[], float] | None = None,
+        latency_tracer: LatencyTracer | None = None,
     ) -> None:
         """Initialize connector.
 
@@ -294,10 +297,19 @@ class BinanceWsConnector(DataConnector):
             config: Connector configuration
             transport: WebSocket transport (injectable for testing)
             clock: Clock function for timestamps (injectable for testing)
+            latency_tracer: Stage latency tracer (default: global tracer)
         """
         self._config = config
         self._transport = transport or WebsocketsTransport()
         self._clock = clock or time.time
+        if latency_tracer is None:
+            # Lazy: grinder.observability imports grinder.connectors (metrics)
+            from grinder.observability.stage_latency import (  # noqa: PLC0415
+                get_latency_tracer,
+            )
+
+            latency_tracer = get_latency_tracer()
+        self._latency_tracer = latency_tracer
         self._state = ConnectorState.DISCONNECTED
         self._last_seen_ts: int | None = None
         self._stats = BinanceWsStats()
@@ -472,6 +484,8 @@ class BinanceWsConnector(DataConnector):
         Returns:
             Snapshot if valid bookTicker message, None otherwise
         """
+        # Receipt mark for tick-to-order tracing (None when tracing is off)
+        recv_ns = self._latency_tracer.receipt_ns()
         try:
             data = json.loads(raw_msg)
 
@@ -493,7 +507,7 @@ class BinanceWsConnector(DataConnector):
             ask_price = Decimal(data["a"])
             mid_price = (bid_price + ask_price) / 2
 
-            return Snapshot(
+            snapshot = Snapshot(
                 ts=recv_ts,
                 symbol=data["s"],
                 bid_price=bid_price,
@@ -502,7 +516,10 @@ class BinanceWsConnector(DataConnector):
                 ask_qty=Decimal(data["A"]),
                 last_price=mid_price,  # Approximation
                 last_qty=Decimal("0"),  # Not available in bookTicker
+                recv_ns=recv_ns,
+                parsed_ns=self._latency_tracer.on_received(recv_ns),
             )
+            return snapshot
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning("Failed to parse message: %s - %s", raw_msg[:100], str(e))
@@ -59,6 +59,10 @@ class Snapshot:
     ask_qty: Decimal
     last_price: Decimal
     last_qty: Decimal
+    # Live receipt marks for stage latency tracing (perf_counter ns, None when
+    # not traced). Not part of equality, hashing or to_dict().
+    recv_ns: int | None = field(default=None, compare=False, repr=False)
+    parsed_ns: int | None = field(default=None, compare=False, repr=False)
 
     @property
     def mid_price(self) -> Decimal:
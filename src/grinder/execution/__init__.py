@@ -5,6 +5,7 @@ This module provides:
 - NoOpExchangePort: Stub for replay/paper mode (no real exchange writes)
 - ExecutionEngine: Grid order reconciliation and management
 - ExecutionState: State tracking for orders
+- OrderStore: Order records with live-order index and compaction
 - ExecutionMetrics: Metrics collection
 
 See: docs/09_EXECUTION_SPEC.md
@@ -33,18 +34,30 @@ from grinder.execution.engine import (
 )
 from grinder.execution.idempotent_port import IdempotentExchangePort, IdempotentPortStats
 from grinder.execution.metrics import ExecutionMetrics, get_metrics, reset_metrics
-from grinder.execution.port import ExchangePort, NoOpExchangePort
+from grinder.execution.port import (
+    BatchAmendRequest,
+    BatchExchangePort,
+    BatchOrderResult,
+    BatchPlaceRequest,
+    ExchangePort,
+    NoOpExchangePort,
+)
 from grinder.execution.types import (
     ActionType,
     ExecutionAction,
     ExecutionEvent,
     ExecutionState,
     OrderRecord,
+    OrderStore,
 )
 
 __all__ = [
     "BINANCE_SPOT_TESTNET_URL",
     "ActionType",
+    "BatchAmendRequest",
+    "BatchExchangePort",
+    "BatchOrderResult",
+    "BatchPlaceRequest",
     "BinanceExchangePort",
     "BinanceExchangePortConfig",
     "ConstraintProvider",
@@ -65,6 +78,7 @@ __all__ = [
     "NoOpExchangePort",
     "NoopHttpClient",
     "OrderRecord",
+    "OrderStore",
     "SymbolConstraints",
     "get_metrics",
     "load_constraints_from_file",
@@ -9,6 +9,8 @@ Key design decisions (see ADR-040):
 - Injectable HttpClient for integration testing
 - Symbol whitelist enforcement
 - Error mapping: Binance errors → Connector*Error types
+- Batch place/cancel via /fapi/v1/batchOrders (per-order results, no raise)
+- replace_order amends in place (PUT /fapi/v1/order), cancel+place only on reject
 
 Futures-specific safety (LC-08b-F, ADR-040):
 - leverage enforcement (default: 1x)
@@ -40,9 +42,9 @@ See: ADR-040 for design decisions
 
 from __future__ import annotations
 
-import contextlib
 import hashlib
 import hmac
+import json
 import logging
 import os
 import time
@@ -57,25 +59,35 @@ from grinder.account.contracts import (
     PositionSnap,
     build_account_snapshot,
 )
-from grinder.connectors.errors import ConnectorNonRetryableError, ConnectorTransientError
+from grinder.connectors.errors import (
+    ConnectorError,
+    ConnectorNonRetryableError,
+    ConnectorTransientError,
+)
 from grinder.connectors.live_connector import SafeMode
 from grinder.core import OrderSide, OrderState
 from grinder.env_parse import parse_bool
 from grinder.execution.binance_port import HttpClient, map_binance_error
+from grinder.execution.port import BatchAmendRequest, BatchOrderResult, BatchPlaceRequest
 from grinder.execution.port_metrics import get_port_metrics
 from grinder.execution.types import OrderRecord
 from grinder.net.retry_policy import (
+    OP_AMEND_BATCH,
+    OP_AMEND_ORDER,
     OP_CANCEL_ALL,
+    OP_CANCEL_BATCH,
     OP_CANCEL_ORDER,
     OP_GET_ACCOUNT,
     OP_GET_OPEN_ORDERS,
     OP_GET_ORDER_STATUS,
     OP_GET_POSITIONS,
     OP_GET_USER_TRADES,
+    OP_PLACE_BATCH,
     OP_PLACE_ORDER,
 )
 from grinder.reconcile.identity import (
     OrderIdentityConfig,
+    ParsedOrderId,
     generate_client_order_id,
     get_default_identity_config,
     parse_client_order_id,
@@ -88,6 +100,19 @@ logger = logging.getLogger(__name__)
 BINANCE_FUTURES_TESTNET_URL = "https://testnet.binancefuture.com"
 BINANCE_FUTURES_MAINNET_URL = "https://fapi.binance.com"
 
+# /fapi/v1/batchOrders limits (per request)
+BATCH_PLACE_MAX_ORDERS = 5
+BATCH_CANCEL_MAX_ORDERS = 10
+
+# Max clientOrderId -> side entries kept for amend (oldest dropped first)
+_MAX_TRACKED_ORDER_SIDES = 10_000
+
+# PUT /fapi/v1/order reject codes
+_AMEND_NO_CHANGE_CODE = -5027  # "No need to modify the order." (already at target)
+# Order cannot be amended in place -> cancel + place.
+# -5025: only LIMIT orders can be modified, -5026: max modify count reached
+_AMEND_UNSUPPORTED_CODES = frozenset({-5025, -5026})
+
 
 def _parse_reduce_only(val: Any) -> bool:
     """Parse reduceOnly from Binance (may be bool or string ``"false"``)."""
@@ -98,6 +123,20 @@ def _parse_reduce_only(val: Any) -> bool:
     return bool(val)
 
 
+def _batch_item_error(status_code: int, item: Any) -> ConnectorError:
+    """Map one failed batchOrders item (``{"code": ..., "msg": ...}``) to an error."""
+    try:
+        map_binance_error(status_code if status_code >= 400 else 400, item)
+    except ConnectorError as e:
+        return e
+    return ConnectorNonRetryableError(f"Binance batch item error: {item}")  # pragma: no cover
+
+
+def _chunks(items: list[Any], size: int) -> list[list[Any]]:
+    """Split items into consecutive chunks of at most ``size``."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 @dataclass
 class BinanceFuturesPortConfig:
     """Configuration for BinanceFuturesPort (USDT-M).
@@ -233,6 +272,8 @@ class BinanceFuturesPort:
     _position_mode: str | None = field(default=None, repr=False)
     _leverage_set: dict[str, int] = field(default_factory=dict, repr=False)
     _ts_offset_ms: int = field(default=0, repr=False)
+    # clientOrderId -> side of orders placed via this port (needed by amend)
+    _order_sides: dict[str, OrderSide] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Read debug flags once at init."""
@@ -672,6 +713,7 @@ class BinanceFuturesPort:
 
         # DRY-RUN: Return synthetic order_id WITHOUT calling http_client
         if self.config.dry_run:
+            self._track_side(client_order_id, side)
             return client_order_id
 
         params: dict[str, Any] = {
@@ -706,7 +748,8 @@ class BinanceFuturesPort:
 
         if isinstance(response.json_data, dict):
             # Return clientOrderId (our ID) for internal tracking, not orderId (Binance numeric)
-            return str(response.json_data.get("clientOrderId", client_order_id))
+            client_order_id = str(response.json_data.get("clientOrderId", client_order_id))
+        self._track_side(client_order_id, side)
         return client_order_id
 
     def place_market_order(
@@ -836,6 +879,7 @@ class BinanceFuturesPort:
         if isinstance(response.json_data, dict):
             canceled = response.json_data.get("status") == "CANCELED"
             if canceled:
+                self._order_sides.pop(order_id, None)
                 get_port_metrics().record_cancel_ok(self._PORT_NAME)
                 if self._debug_open_orders:
                     logger.warning("CANCEL_OK order_id=%s", order_id)
@@ -917,6 +961,194 @@ class BinanceFuturesPort:
             return 1 if response.json_data.get("code", 0) == 200 else 0
         return 0
 
+    def place_orders_batch(self, orders: list[BatchPlaceRequest]) -> list[BatchOrderResult]:
+        """Place limit orders via POST /fapi/v1/batchOrders (5 orders per request).
+
+        Each order goes through the same validation as place_order(); an order
+        that fails validation gets an error result and is not sent. A failed
+        request chunk marks all of its orders with the mapped error.
+
+        Args:
+            orders: Orders to place
+
+        Returns:
+            One BatchOrderResult per input order, in input order
+            (order_id = clientOrderId on success)
+
+        Raises:
+            ConnectorNonRetryableError: If mode is not LIVE_TRADE
+        """
+        self._validate_mode("place_orders_batch")
+        results: list[BatchOrderResult | None] = [None] * len(orders)
+        pending: list[tuple[int, dict[str, Any]]] = []
+
+        for i, order in enumerate(orders):
+            get_port_metrics().record_order_attempt(self._PORT_NAME, "place")
+            try:
+                self._validate_symbol(order.symbol)
+                self._validate_notional(order.price, order.quantity)
+                self._validate_order_count()
+            except ConnectorNonRetryableError as e:
+                results[i] = BatchOrderResult(error=e)
+                continue
+
+            self._order_counter += 1
+            client_order_id = order.client_order_id
+            if client_order_id is None:
+                identity = self.config.identity_config or get_default_identity_config()
+                client_order_id = generate_client_order_id(
+                    config=identity,
+                    symbol=order.symbol,
+                    level_id=order.level_id,
+                    ts=order.ts,
+                    seq=self._order_counter,
+                )
+            object.__setattr__(self.config, "_orders_this_run", self.config._orders_this_run + 1)
+
+            if self.config.dry_run:
+                self._track_side(client_order_id, order.side)
+                results[i] = BatchOrderResult(
+                    order_id=client_order_id, client_order_id=client_order_id
+                )
+                continue
+
+            item: dict[str, Any] = {
+                "symbol": order.symbol,
+                "side": order.side.value.upper(),
+                "type": "LIMIT",
+                "timeInForce": "GTC",
+                "price": str(order.price),
+                "quantity": str(order.quantity),
+                "newClientOrderId": client_order_id,
+            }
+            if order.reduce_only:
+                item["reduceOnly"] = "true"
+            pending.append((i, item))
+
+        for chunk in _chunks(pending, BATCH_PLACE_MAX_ORDERS):
+            params = self._sign_request(
+                {"batchOrders": json.dumps([item for _, item in chunk], separators=(",", ":"))}
+            )
+            chunk_results = self._send_batch("POST", params, len(chunk), op=OP_PLACE_BATCH)
+            for (i, item), (data, error) in zip(chunk, chunk_results, strict=True):
+                if error is not None:
+                    results[i] = BatchOrderResult(
+                        error=error, client_order_id=item["newClientOrderId"]
+                    )
+                else:
+                    cid = str(data.get("clientOrderId", item["newClientOrderId"]))
+                    self._track_side(cid, orders[i].side)
+                    results[i] = BatchOrderResult(order_id=cid, client_order_id=cid)
+
+        return [r if r is not None else BatchOrderResult() for r in results]
+
+    def cancel_orders_batch(self, order_ids: list[str]) -> list[BatchOrderResult]:
+        """Cancel orders via DELETE /fapi/v1/batchOrders (10 orders per request).
+
+        Orders are grouped by the symbol parsed from their clientOrderId (the
+        endpoint is per-symbol). Unparseable or non-whitelisted IDs get an
+        error result and are not sent.
+
+        Args:
+            order_ids: Client order IDs placed via this port
+
+        Returns:
+            One BatchOrderResult per input ID, in input order
+            (order_id set only if the exchange reports CANCELED)
+
+        Raises:
+            ConnectorNonRetryableError: If mode is not LIVE_TRADE
+        """
+        self._validate_mode("cancel_orders_batch")
+        results: list[BatchOrderResult | None] = [None] * len(order_ids)
+        by_symbol: dict[str, list[int]] = {}
+
+        for i, order_id in enumerate(order_ids):
+            get_port_metrics().record_order_attempt(self._PORT_NAME, "cancel")
+            parsed = parse_client_order_id(order_id)
+            if parsed is None:
+                results[i] = BatchOrderResult(
+                    error=ConnectorNonRetryableError(
+                        f"Cannot parse order_id '{order_id}'. "
+                        "In v0.1, only orders placed via BinanceFuturesPort can be cancelled."
+                    )
+                )
+                continue
+            try:
+                self._validate_symbol(parsed.symbol)
+            except ConnectorNonRetryableError as e:
+                results[i] = BatchOrderResult(error=e)
+                continue
+            if self.config.dry_run:
+                results[i] = BatchOrderResult(order_id=order_id)
+                continue
+            by_symbol.setdefault(parsed.symbol, []).append(i)
+
+        for symbol, indices in by_symbol.items():
+            for chunk in _chunks(indices, BATCH_CANCEL_MAX_ORDERS):
+                ids = [order_ids[i] for i in chunk]
+                params = self._sign_request(
+                    {
+                        "symbol": symbol,
+                        "origClientOrderIdList": json.dumps(ids, separators=(",", ":")),
+                    }
+                )
+                chunk_results = self._send_batch("DELETE", params, len(chunk), op=OP_CANCEL_BATCH)
+                for i, (data, error) in zip(chunk, chunk_results, strict=True):
+                    if error is not None:
+                        if data.get("code") == -2011:
+                            get_port_metrics().record_cancel_unknown(self._PORT_NAME)
+                        results[i] = BatchOrderResult(error=error)
+                    elif data.get("status") == "CANCELED":
+                        self._order_sides.pop(order_ids[i], None)
+                        get_port_metrics().record_cancel_ok(self._PORT_NAME)
+                        results[i] = BatchOrderResult(order_id=order_ids[i])
+                    else:
+                        results[i] = BatchOrderResult()
+
+        return [r if r is not None else BatchOrderResult() for r in results]
+
+    def _send_batch(
+        self, method: str, params: dict[str, Any], size: int, *, op: str
+    ) -> list[tuple[dict[str, Any], ConnectorError | None]]:
+        """Send one /fapi/v1/batchOrders request and split its response per order.
+
+        Transport and whole-request errors are not raised: they are returned
+        as the error of every order in the chunk (with an empty item). A
+        per-order error keeps its raw item (``{"code": ..., "msg": ...}``).
+        """
+        url = f"{self.config.base_url}/fapi/v1/batchOrders"
+        try:
+            response = self.http_client.request(
+                method=method,
+                url=url,
+                params=params,
+                headers=self._get_headers(),
+                timeout_ms=self.config.timeout_ms,
+                op=op,  # op=OP_PLACE_BATCH / OP_AMEND_BATCH / OP_CANCEL_BATCH from caller
+            )
+            if response.status_code != 200:
+                map_binance_error(response.status_code, response.json_data)
+        except ConnectorError as e:
+            return [({}, e)] * size
+
+        items = response.json_data if isinstance(response.json_data, list) else []
+        if len(items) != size:
+            error = ConnectorNonRetryableError(
+                f"Binance batchOrders returned {len(items)} results for {size} orders"
+            )
+            return [({}, error)] * size
+
+        out: list[tuple[dict[str, Any], ConnectorError | None]] = []
+        for item in items:
+            if not isinstance(item, dict):
+                out.append(({}, ConnectorNonRetryableError(f"Bad batch item: {item}")))
+            elif "code" in item and "orderId" not in item:
+                out.append((item, _batch_item_error(response.status_code, item)))
+            else:
+                out.append((item, None))
+        return out
+
     def replace_order(
         self,
         order_id: str,
@@ -924,33 +1156,217 @@ class BinanceFuturesPort:
         new_quantity: Decimal,
         ts: int,
     ) -> str:
-        """Replace an order (cancel + new)."""
+        """Replace an order's price/quantity, amending it in place when possible.
+
+        Sends PUT /fapi/v1/order (one round trip, keeps clientOrderId and queue
+        priority when only quantity shrinks). Reject handling:
+
+        - -5027 (no need to modify): order already matches, treated as success
+        - -5025/-5026 (order cannot be amended): cancel + new place; the new
+          order is placed only if the cancel is confirmed (a filled or unknown
+          order is never re-placed)
+        - any other reject (e.g. -2013 order filled/gone) is raised
+        - transient errors are raised for the caller's retry policy
+
+        The side comes from orders placed via this port; unknown orders are
+        looked up with GET /fapi/v1/order.
+
+        Returns:
+            order_id: Same clientOrderId if amended, new one after fallback
+
+        Raises:
+            ConnectorNonRetryableError: Unparseable order_id, side unknown,
+                amend rejected, or cancel not confirmed in the fallback
+        """
         get_port_metrics().record_order_attempt(self._PORT_NAME, "replace")
         self._validate_mode("replace_order")
 
-        parts = order_id.split("_")
-        if len(parts) < 3 or parts[0] != "grinder":
+        parsed = parse_client_order_id(order_id)
+        if parsed is None:
             raise ConnectorNonRetryableError(
                 f"Cannot parse order_id '{order_id}'. "
                 "In v0.1, only orders placed via BinanceFuturesPort can be replaced."
             )
+        symbol = parsed.symbol
+        self._validate_symbol(symbol)
+        self._validate_notional(new_price, new_quantity)
+
+        # DRY-RUN: Amend is a no-op on the synthetic order, 0 http_client calls
+        if self.config.dry_run:
+            return order_id
+
+        side = self._resolve_side(symbol, order_id)
+
+        params = self._sign_request(
+            {
+                "symbol": symbol,
+                "origClientOrderId": order_id,
+                "side": side.value.upper(),
+                "price": str(new_price),
+                "quantity": str(new_quantity),
+            }
+        )
+        url = f"{self.config.base_url}/fapi/v1/order"
+        response = self.http_client.request(
+            method="PUT",
+            url=url,
+            params=params,
+            headers=self._get_headers(),
+            timeout_ms=self.config.timeout_ms,
+            op=OP_AMEND_ORDER,
+        )
+        if response.status_code == 200:
+            if isinstance(response.json_data, dict):
+                return str(response.json_data.get("clientOrderId", order_id))
+            return order_id
+
+        error_code = None
+        if isinstance(response.json_data, dict):
+            error_code = response.json_data.get("code")
+        if error_code == _AMEND_NO_CHANGE_CODE:
+            return order_id
+        if error_code not in _AMEND_UNSUPPORTED_CODES:
+            map_binance_error(response.status_code, response.json_data)
+            return order_id  # pragma: no cover - map_binance_error always raises on non-200
+
+        logger.warning(
+            "AMEND_REJECTED order_id=%s code=%s — falling back to cancel+place",
+            order_id,
+            error_code,
+        )
+        return self._cancel_and_place(
+            parsed=parsed,
+            order_id=order_id,
+            side=side,
+            new_price=new_price,
+            new_quantity=new_quantity,
+            ts=ts,
+        )
+
+    def amend_orders_batch(self, amends: list[BatchAmendRequest]) -> list[BatchOrderResult]:
+        """Amend orders in place via PUT /fapi/v1/batchOrders (5 orders per request).
+
+        Batch form of replace_order's amend step. Rejected amends are returned
+        as per-order errors (no cancel+place fallback here); callers can retry
+        those through replace_order().
+
+        Returns:
+            One BatchOrderResult per input amend, in input order
+
+        Raises:
+            ConnectorNonRetryableError: If mode is not LIVE_TRADE
+        """
+        self._validate_mode("amend_orders_batch")
+        results: list[BatchOrderResult | None] = [None] * len(amends)
+        pending: list[tuple[int, dict[str, Any]]] = []
+
+        for i, amend in enumerate(amends):
+            get_port_metrics().record_order_attempt(self._PORT_NAME, "replace")
+            parsed = parse_client_order_id(amend.order_id)
+            try:
+                if parsed is None:
+                    raise ConnectorNonRetryableError(
+                        f"Cannot parse order_id '{amend.order_id}'. "
+                        "In v0.1, only orders placed via BinanceFuturesPort can be replaced."
+                    )
+                self._validate_symbol(parsed.symbol)
+                self._validate_notional(amend.new_price, amend.new_quantity)
+                if self.config.dry_run:
+                    results[i] = BatchOrderResult(order_id=amend.order_id)
+                    continue
+                side = self._resolve_side(parsed.symbol, amend.order_id)
+            except ConnectorError as e:
+                results[i] = BatchOrderResult(error=e)
+                continue
+
+            pending.append(
+                (
+                    i,
+                    {
+                        "symbol": parsed.symbol,
+                        "origClientOrderId": amend.order_id,
+                        "side": side.value.upper(),
+                        "price": str(amend.new_price),
+                        "quantity": str(amend.new_quantity),
+                    },
+                )
+            )
 
-        symbol = parts[1]
-        level_id = int(parts[2])
-        side = OrderSide.BUY  # v0.1 limitation
+        for chunk in _chunks(pending, BATCH_PLACE_MAX_ORDERS):
+            params = self._sign_request(
+                {"batchOrders": json.dumps([item for _, item in chunk], separators=(",", ":"))}
+            )
+            chunk_results = self._send_batch("PUT", params, len(chunk), op=OP_AMEND_BATCH)
+            for (i, item), (data, error) in zip(chunk, chunk_results, strict=True):
+                if error is not None:
+                    results[i] = BatchOrderResult(error=error)
+                else:
+                    cid = data.get("clientOrderId", item["origClientOrderId"])
+                    results[i] = BatchOrderResult(order_id=str(cid))
+
+        return [r if r is not None else BatchOrderResult() for r in results]
+
+    def _cancel_and_place(
+        self,
+        *,
+        parsed: ParsedOrderId,
+        order_id: str,
+        side: OrderSide,
+        new_price: Decimal,
+        new_quantity: Decimal,
+        ts: int,
+    ) -> str:
+        """Fallback replace: cancel the old order, then place a new one.
 
-        with contextlib.suppress(ConnectorNonRetryableError):
-            self.cancel_order(order_id)
+        The new order is placed only after the exchange confirms CANCELED. A
+        cancel reject (-2011: already filled or unknown) or unconfirmed cancel
+        raises instead, so a filled order is not followed by a second one.
+        """
+        try:
+            canceled = self.cancel_order(order_id)
+        except ConnectorNonRetryableError as e:
+            raise ConnectorNonRetryableError(
+                f"Replace of '{order_id}' aborted: cancel rejected ({e}); order not re-placed"
+            ) from e
+        if not canceled:
+            raise ConnectorNonRetryableError(
+                f"Replace of '{order_id}' aborted: cancel not confirmed; order not re-placed"
+            )
 
         return self.place_order(
-            symbol=symbol,
+            symbol=parsed.symbol,
             side=side,
             price=new_price,
             quantity=new_quantity,
-            level_id=level_id,
+            level_id=int(parsed.level_id) if parsed.level_id.isdigit() else 0,
             ts=ts,
         )
 
+    def _track_side(self, client_order_id: str, side: OrderSide) -> None:
+        """Remember the side of an order placed via this port (bounded)."""
+        self._order_sides[client_order_id] = side
+        if len(self._order_sides) > _MAX_TRACKED_ORDER_SIDES:
+            self._order_sides.pop(next(iter(self._order_sides)))
+
+    def _resolve_side(self, symbol: str, order_id: str) -> OrderSide:
+        """Side of an order: tracked state first, else GET /fapi/v1/order.
+
+        Raises:
+            ConnectorNonRetryableError: If the side cannot be determined
+        """
+        side = self._order_sides.get(order_id)
+        if side is not None:
+            return side
+        status = self.debug_get_order_status(symbol=symbol, client_order_id=order_id)
+        if status is not None and status.get("side") in ("BUY", "SELL"):
+            side = OrderSide.BUY if status["side"] == "BUY" else OrderSide.SELL
+            self._track_side(order_id, side)
+            return side
+        raise ConnectorNonRetryableError(
+            f"Cannot replace order_id '{order_id}': side unknown "
+            "(not placed via this port and not found on exchange)."
+        )
+
     def fetch_open_orders_raw(self, symbol: str) -> list[dict[str, Any]]:
         """Fetch all open orders for a symbol as raw Binance response.
 
@@ -1191,4 +1607,5 @@ class BinanceFuturesPort:
         self._order_counter = 0
         self._position_mode = None
         self._leverage_set.clear()
+        self._order_sides.clear()
         object.__setattr__(self.config, "_orders_this_run", 0)
@@ -123,6 +123,7 @@ class HttpResponse:
 
     status_code: int
     json_data: dict[str, Any] | list[dict[str, Any]]
+    headers: dict[str, str] = field(default_factory=dict)
 
 
 # --- Noop HTTP Client (for testing) ---
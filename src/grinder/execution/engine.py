@@ -6,6 +6,11 @@ The ExecutionEngine:
 - Reconciles with current open orders
 - Generates execution actions (place/cancel)
 - Maintains deterministic state for replay
+
+Plans repeat on most ticks. The digest and grid levels are memoized per
+symbol (keyed by the plan's structural fields and the price tick), and a tick
+whose plan and live orders are unchanged since a no-action reconcile skips
+reconciliation entirely. Output is identical to the uncached path.
 """
 
 from __future__ import annotations
@@ -14,7 +19,7 @@ import hashlib
 import json
 from dataclasses import dataclass
 from decimal import ROUND_DOWN, Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from grinder.core import GridMode, OrderSide, OrderState, ResetAction
 from grinder.execution.types import (
@@ -108,6 +113,31 @@ class GridLevel:
         return f"{self.side.value}:{self.level_id}"
 
 
+# (side, level_id) - reconciliation key of a level / live order
+_LevelKey = tuple[OrderSide, int]
+
+
+@dataclass
+class _PlanCacheEntry:
+    """Memoized per-symbol plan evaluation (see module docstring).
+
+    Attributes:
+        key: Plan structural fields + price tick the entry was built from.
+        digest: Plan digest.
+        levels: Grid levels (shared across ticks, never mutated).
+        levels_by_key: (side, level_id) -> level.
+        quiet_orders: Live orders for which reconciliation produced no actions
+            under this plan. Identity-compared: OrderStore replaces records on
+            every change, so identical objects mean an unchanged order set.
+    """
+
+    key: tuple[Any, ...]
+    digest: str
+    levels: tuple[GridLevel, ...]
+    levels_by_key: dict[_LevelKey, GridLevel]
+    quiet_orders: tuple[OrderRecord, ...] | None = None
+
+
 @dataclass
 class ExecutionResult:
     """Result of execution engine evaluation."""
@@ -161,6 +191,7 @@ class ExecutionEngine:
         self._symbol_constraints: dict[str, SymbolConstraints] | None = symbol_constraints
         self._constraints_loaded = symbol_constraints is not None
         self._l2_features: dict[str, L2FeatureSnapshot] | None = l2_features
+        self._plan_cache: dict[str, _PlanCacheEntry] = {}
 
     def _get_symbol_constraints(self) -> dict[str, SymbolConstraints]:
         """Get symbol constraints, loading from provider if needed (M7-07).
@@ -182,12 +213,19 @@ class ExecutionEngine:
         self._constraints_loaded = True
         return self._symbol_constraints
 
-    def _round_price(self, price: Decimal, symbol: str = "") -> Decimal:
-        """Round price to tick_size if available, else to configured precision."""
+    def _price_tick(self, symbol: str) -> Decimal | None:
+        """tick_size used for price rounding, or None for configured precision."""
         if symbol and self._config.constraints_enabled:
             sc = self._get_symbol_constraints().get(symbol)
             if sc is not None and sc.tick_size > 0:
-                return floor_to_step(price, sc.tick_size)
+                return sc.tick_size
+        return None
+
+    def _round_price(self, price: Decimal, symbol: str = "") -> Decimal:
+        """Round price to tick_size if available, else to configured precision."""
+        tick = self._price_tick(symbol)
+        if tick is not None:
+            return floor_to_step(price, tick)
         quantize_str = "0." + "0" * self._price_precision
         return price.quantize(Decimal(quantize_str), rounding=ROUND_DOWN)
 
@@ -311,6 +349,39 @@ class ExecutionEngine:
         content = json.dumps(plan_dict, sort_keys=True, separators=(",", ":"))
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    def _plan_entry(self, plan: GridPlan, symbol: str) -> _PlanCacheEntry:
+        """Digest and grid levels for plan, reused while the plan repeats.
+
+        The key holds exactly what the digest and levels depend on: the digest
+        fields (Decimals as str, floats as repr, so 0.0/-0.0 or 1.0/1.00 never
+        collide) and the price tick. Precisions are fixed per engine.
+        """
+        tick = self._price_tick(symbol)
+        key = (
+            plan.mode,
+            str(plan.center_price),
+            repr(plan.spacing_bps),
+            plan.levels_up,
+            plan.levels_down,
+            tuple(str(s) for s in plan.size_schedule),
+            repr(plan.skew_bps),
+            plan.reset_action,
+            str(tick) if tick is not None else None,
+        )
+        entry = self._plan_cache.get(symbol)
+        if entry is not None and entry.key == key:
+            return entry
+
+        levels = tuple(self._compute_grid_levels(plan, symbol))
+        entry = _PlanCacheEntry(
+            key=key,
+            digest=self._compute_plan_digest(plan),
+            levels=levels,
+            levels_by_key={(lv.side, lv.level_id): lv for lv in levels},
+        )
+        self._plan_cache[symbol] = entry
+        return entry
+
     def _compute_grid_levels(self, plan: GridPlan, symbol: str) -> list[GridLevel]:
         """Compute grid levels from plan.
 
@@ -338,12 +409,12 @@ class ExecutionEngine:
         # Generate SELL levels (above center) if not UNI_LONG mode
         # Price formula: center * (1 + spacing_bps/10000)^i
         if plan.mode not in (GridMode.UNI_LONG,):
+            # Running product: same multiplication sequence as recomputing the power
+            raw_price = skewed_center
             for i in range(1, plan.levels_up + 1):
-                price = skewed_center
-                for _ in range(i):
-                    price = price * spacing_factor
+                raw_price = raw_price * spacing_factor
 
-                price = self._round_price(price, symbol)
+                price = self._round_price(raw_price, symbol)
                 size_idx = min(i - 1, len(plan.size_schedule) - 1)
                 quantity = self._round_quantity(plan.size_schedule[size_idx])
 
@@ -359,12 +430,11 @@ class ExecutionEngine:
         # Generate BUY levels (below center) if not UNI_SHORT mode
         # Price formula: center * (1 - spacing_bps/10000)^i
         if plan.mode not in (GridMode.UNI_SHORT,):
+            raw_price = skewed_center
             for i in range(1, plan.levels_down + 1):
-                price = skewed_center
-                for _ in range(i):
-                    price = price * spacing_factor_down
+                raw_price = raw_price * spacing_factor_down
 
-                price = self._round_price(price, symbol)
+                price = self._round_price(raw_price, symbol)
                 size_idx = min(i - 1, len(plan.size_schedule) - 1)
                 quantity = self._round_quantity(plan.size_schedule[size_idx])
 
@@ -415,16 +485,12 @@ class ExecutionEngine:
         actions: list[ExecutionAction] = []
         events: list[ExecutionEvent] = []
 
-        # Compute plan digest
-        plan_digest = self._compute_plan_digest(plan)
+        # Plan digest and levels (memoized while the plan repeats)
+        entry = self._plan_entry(plan, symbol)
+        plan_digest = entry.digest
 
-        # Get current open orders for symbol
-        current_orders = [
-            order
-            for order in state.open_orders.values()
-            if order.symbol == symbol
-            and order.state in (OrderState.OPEN, OrderState.PARTIALLY_FILLED)
-        ]
+        # Get current open orders for symbol (live index, no history scan)
+        current_orders = state.orders.live_orders(symbol)
 
         # Handle PAUSE/EMERGENCY mode - cancel all
         if plan.mode in (GridMode.PAUSE, GridMode.EMERGENCY):
@@ -461,7 +527,7 @@ class ExecutionEngine:
                 )
 
             # Compute new grid levels and place orders
-            levels = self._compute_grid_levels(plan, symbol)
+            levels = entry.levels
             for level in levels:
                 actions.append(
                     ExecutionAction(
@@ -489,16 +555,24 @@ class ExecutionEngine:
             return self._apply_actions(actions, events, state, plan_digest, ts)
 
         # Handle SOFT reset or NONE - reconcile
-        levels = self._compute_grid_levels(plan, symbol)
+        # Unchanged plan and live orders since a no-action reconcile: nothing to do
+        quiet = entry.quiet_orders
+        if (
+            quiet is not None
+            and len(quiet) == len(current_orders)
+            and all(a is b for a, b in zip(quiet, current_orders, strict=True))
+        ):
+            events.append(self._reconcile_event(plan, symbol, ts, 0, 0))
+            return self._apply_actions(actions, events, state, plan_digest, ts)
 
-        # Build sets for reconciliation
-        level_keys = {level.key() for level in levels}
-        order_keys = {f"{o.side.value}:{o.level_id}" for o in current_orders}
+        levels = entry.levels
+        levels_by_key = entry.levels_by_key
+        order_keys = {(o.side, o.level_id) for o in current_orders}
 
         # Cancel orders that don't match any level
         for order in current_orders:
-            order_key = f"{order.side.value}:{order.level_id}"
-            if order_key not in level_keys:
+            matching_level = levels_by_key.get((order.side, order.level_id))
+            if matching_level is None:
                 actions.append(
                     ExecutionAction(
                         action_type=ActionType.CANCEL,
@@ -507,38 +581,35 @@ class ExecutionEngine:
                         reason="RECONCILE_REMOVE",
                     )
                 )
-            else:
-                # Check if order needs update (SOFT reset or price/qty mismatch)
-                matching_level = next((lv for lv in levels if lv.key() == order_key), None)
-                if (
-                    matching_level
-                    and not self._orders_match(matching_level, order)
-                    and plan.reset_action == ResetAction.SOFT
-                ):
-                    # Cancel and replace
-                    actions.append(
-                        ExecutionAction(
-                            action_type=ActionType.CANCEL,
-                            order_id=order.order_id,
-                            symbol=symbol,
-                            reason="SOFT_RESET_REPLACE",
-                        )
+            # Check if order needs update (SOFT reset or price/qty mismatch)
+            elif (
+                not self._orders_match(matching_level, order)
+                and plan.reset_action == ResetAction.SOFT
+            ):
+                # Cancel and replace
+                actions.append(
+                    ExecutionAction(
+                        action_type=ActionType.CANCEL,
+                        order_id=order.order_id,
+                        symbol=symbol,
+                        reason="SOFT_RESET_REPLACE",
                     )
-                    actions.append(
-                        ExecutionAction(
-                            action_type=ActionType.PLACE,
-                            symbol=symbol,
-                            side=matching_level.side,
-                            price=matching_level.price,
-                            quantity=matching_level.quantity,
-                            level_id=matching_level.level_id,
-                            reason="SOFT_RESET_REPLACE",
-                        )
+                )
+                actions.append(
+                    ExecutionAction(
+                        action_type=ActionType.PLACE,
+                        symbol=symbol,
+                        side=matching_level.side,
+                        price=matching_level.price,
+                        quantity=matching_level.quantity,
+                        level_id=matching_level.level_id,
+                        reason="SOFT_RESET_REPLACE",
                     )
+                )
 
         # Place orders for missing levels
         for level in levels:
-            if level.key() not in order_keys:
+            if (level.side, level.level_id) not in order_keys:
                 actions.append(
                     ExecutionAction(
                         action_type=ActionType.PLACE,
@@ -554,21 +625,33 @@ class ExecutionEngine:
         # Record reconcile event
         placed_count = sum(1 for a in actions if a.action_type == ActionType.PLACE)
         cancelled_count = sum(1 for a in actions if a.action_type == ActionType.CANCEL)
-        events.append(
-            ExecutionEvent(
-                ts=ts,
-                event_type="RECONCILE",
-                symbol=symbol,
-                details={
-                    "placed_count": placed_count,
-                    "cancelled_count": cancelled_count,
-                    "reset_action": plan.reset_action.value,
-                },
-            )
-        )
+        events.append(self._reconcile_event(plan, symbol, ts, placed_count, cancelled_count))
+
+        # No actions: live orders stay as-is, so the next identical tick can skip
+        entry.quiet_orders = tuple(current_orders) if not actions else None
 
         return self._apply_actions(actions, events, state, plan_digest, ts)
 
+    def _reconcile_event(
+        self,
+        plan: GridPlan,
+        symbol: str,
+        ts: int,
+        placed_count: int,
+        cancelled_count: int,
+    ) -> ExecutionEvent:
+        """RECONCILE event for a SOFT/NONE evaluation."""
+        return ExecutionEvent(
+            ts=ts,
+            event_type="RECONCILE",
+            symbol=symbol,
+            details={
+                "placed_count": placed_count,
+                "cancelled_count": cancelled_count,
+                "reset_action": plan.reset_action.value,
+            },
+        )
+
     def _apply_actions(
         self,
         actions: list[ExecutionAction],
@@ -577,25 +660,19 @@ class ExecutionEngine:
         plan_digest: str,
         ts: int,
     ) -> ExecutionResult:
-        """Apply actions to state and port."""
-        new_orders = dict(state.open_orders)
+        """Apply actions to state and port.
+
+        Orders that reached a terminal state on earlier ticks are compacted
+        away; the ones cancelled on this tick stay visible in the new state.
+        """
+        new_orders = state.orders.copy()
+        new_orders.compact()
         tick = state.tick_counter + 1
 
         for action in actions:
             if action.action_type == ActionType.CANCEL and action.order_id:
                 # Update order state to cancelled
-                if action.order_id in new_orders:
-                    old_order = new_orders[action.order_id]
-                    new_orders[action.order_id] = OrderRecord(
-                        order_id=old_order.order_id,
-                        symbol=old_order.symbol,
-                        side=old_order.side,
-                        price=old_order.price,
-                        quantity=old_order.quantity,
-                        state=OrderState.CANCELLED,
-                        level_id=old_order.level_id,
-                        created_ts=old_order.created_ts,
-                    )
+                new_orders.transition(action.order_id, OrderState.CANCELLED)
                 self._port.cancel_order(action.order_id)
 
             elif action.action_type == ActionType.PLACE:
@@ -58,6 +58,8 @@ class FuturesOrderEvent:
         qty: Original order quantity
         executed_qty: Filled quantity so far
         avg_price: Average fill price
+        order_type: Binance order type (LIMIT, MARKET, ...)
+        reduce_only: Whether the order is reduce-only
     """
 
     ts: int
@@ -70,6 +72,8 @@ class FuturesOrderEvent:
     qty: Decimal
     executed_qty: Decimal
     avg_price: Decimal
+    order_type: str = "LIMIT"
+    reduce_only: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
@@ -84,6 +88,8 @@ class FuturesOrderEvent:
             "qty": str(self.qty),
             "executed_qty": str(self.executed_qty),
             "avg_price": str(self.avg_price),
+            "order_type": self.order_type,
+            "reduce_only": self.reduce_only,
         }
 
     def to_json(self) -> str:
@@ -104,6 +110,8 @@ class FuturesOrderEvent:
             qty=Decimal(d["qty"]),
             executed_qty=Decimal(d["executed_qty"]),
             avg_price=Decimal(d["avg_price"]),
+            order_type=d.get("order_type", "LIMIT"),
+            reduce_only=d.get("reduce_only", False),
         )
 
     @classmethod
@@ -126,6 +134,7 @@ class FuturesOrderEvent:
             "q": "0.001",      # Quantity
             "z": "0",          # Executed qty
             "ap": "0",         # Average price
+            "R": false,        # Reduce only
             ...
           }
         }
@@ -145,6 +154,8 @@ class FuturesOrderEvent:
             qty=Decimal(o.get("q", "0")),
             executed_qty=Decimal(o.get("z", "0")),
             avg_price=Decimal(o.get("ap", "0")),
+            order_type=o.get("o", "LIMIT"),
+            reduce_only=bool(o.get("R", False)),
         )
 
 
@@ -158,6 +169,7 @@ class FuturesPositionEvent:
         position_amt: Position size (positive=long, negative=short, 0=flat)
         entry_price: Average entry price
         unrealized_pnl: Current unrealized profit/loss
+        position_side: BOTH (one-way mode) or LONG/SHORT (hedge mode)
     """
 
     ts: int
@@ -165,6 +177,7 @@ class FuturesPositionEvent:
     position_amt: Decimal
     entry_price: Decimal
     unrealized_pnl: Decimal
+    position_side: str = "BOTH"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
@@ -174,6 +187,7 @@ class FuturesPositionEvent:
             "position_amt": str(self.position_amt),
             "entry_price": str(self.entry_price),
             "unrealized_pnl": str(self.unrealized_pnl),
+            "position_side": self.position_side,
         }
 
     def to_json(self) -> str:
@@ -189,6 +203,7 @@ class FuturesPositionEvent:
             position_amt=Decimal(d["position_amt"]),
             entry_price=Decimal(d["entry_price"]),
             unrealized_pnl=Decimal(d["unrealized_pnl"]),
+            position_side=d.get("position_side", "BOTH"),
         )
 
     @classmethod
@@ -209,6 +224,7 @@ class FuturesPositionEvent:
                 "pa": "0.001",   # Position amount
                 "ep": "50000",   # Entry price
                 "up": "0.5",     # Unrealized PnL
+                "ps": "BOTH",    # Position side
                 ...
               }
             ]
@@ -234,6 +250,7 @@ class FuturesPositionEvent:
                     position_amt=Decimal(pos.get("pa", "0")),
                     entry_price=Decimal(pos.get("ep", "0")),
                     unrealized_pnl=Decimal(pos.get("up", "0")),
+                    position_side=pos.get("ps", "BOTH"),
                 )
 
         # Symbol not in positions - return zero position
@@ -270,6 +287,7 @@ class FuturesPositionEvent:
                         position_amt=Decimal(pos.get("pa", "0")),
                         entry_price=Decimal(pos.get("ep", "0")),
                         unrealized_pnl=Decimal(pos.get("up", "0")),
+                        position_side=pos.get("ps", "BOTH"),
                     )
                 )
         return result
@@ -286,12 +304,15 @@ class UserDataEvent:
         order_event: FuturesOrderEvent if event_type is ORDER_TRADE_UPDATE
         position_event: FuturesPositionEvent if event_type is ACCOUNT_UPDATE
         raw_data: Raw message dict for UNKNOWN events (for debugging)
+        position_events: Every position in an ACCOUNT_UPDATE (position_event
+            is only the first / filtered one)
     """
 
     event_type: UserDataEventType
     order_event: FuturesOrderEvent | None = None
     position_event: FuturesPositionEvent | None = None
     raw_data: dict[str, Any] | None = field(default=None, hash=False)
+    position_events: tuple[FuturesPositionEvent, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
@@ -304,6 +325,8 @@ class UserDataEvent:
             result["position_event"] = self.position_event.to_dict()
         if self.raw_data is not None:
             result["raw_data"] = self.raw_data
+        if self.position_events:
+            result["position_events"] = [p.to_dict() for p in self.position_events]
         return result
 
     def to_json(self) -> str:
@@ -328,6 +351,9 @@ class UserDataEvent:
             order_event=order_event,
             position_event=position_event,
             raw_data=raw_data,
+            position_events=tuple(
+                FuturesPositionEvent.from_dict(p) for p in d.get("position_events", [])
+            ),
         )
 
     @classmethod
@@ -372,9 +398,15 @@ class UserDataEvent:
                     unrealized_pnl=Decimal("0"),
                 )
 
+            position_events = tuple(
+                p
+                for p in FuturesPositionEvent.all_from_binance(data)
+                if not symbol_filter or p.symbol == symbol_filter
+            )
             return cls(
                 event_type=UserDataEventType.ACCOUNT_UPDATE,
                 position_event=position_event,
+                position_events=position_events,
             )
 
         # Unknown event type - log but don't crash
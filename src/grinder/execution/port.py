@@ -6,10 +6,12 @@ NoOpExchangePort is a stub that tracks orders in memory without exchange writes.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from decimal import Decimal  # noqa: TC003 - used at runtime in Protocol impl
 from typing import Protocol
 
 from grinder.account.contracts import AccountSnapshot, PositionSnap
+from grinder.connectors.errors import ConnectorError  # noqa: TC001 - dataclass field type
 from grinder.core import OrderSide, OrderState
 from grinder.execution.port_metrics import get_port_metrics
 from grinder.execution.types import OrderRecord
@@ -120,6 +122,71 @@ class ExchangePort(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class BatchPlaceRequest:
+    """One limit order in a batch placement (same fields as place_order)."""
+
+    symbol: str
+    side: OrderSide
+    price: Decimal
+    quantity: Decimal
+    level_id: int
+    ts: int
+    reduce_only: bool = False
+    client_order_id: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchAmendRequest:
+    """One in-place price/quantity amend in a batch (same fields as replace_order)."""
+
+    order_id: str
+    new_price: Decimal
+    new_quantity: Decimal
+
+
+@dataclass(frozen=True)
+class BatchOrderResult:
+    """Per-order outcome of a batch place/cancel call.
+
+    Attributes:
+        order_id: Placed/cancelled order ID (None if the order failed or was not cancelled)
+        error: Mapped exchange error for this order (None on success)
+        client_order_id: clientOrderId sent for a placement, also on failure
+            (a retry must reuse it so a placement that did land is not doubled)
+    """
+
+    order_id: str | None = None
+    error: ConnectorError | None = None
+    client_order_id: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the exchange accepted this order."""
+        return self.error is None
+
+
+class BatchExchangePort(Protocol):
+    """Optional batch capability of an ExchangePort.
+
+    Results are aligned with the input list. A failure of one order (or of
+    one whole request chunk) is reported in its BatchOrderResult instead of
+    being raised, so the caller can fall back per order.
+    """
+
+    def place_orders_batch(self, orders: list[BatchPlaceRequest]) -> list[BatchOrderResult]:
+        """Place several limit orders with as few requests as possible."""
+        ...
+
+    def cancel_orders_batch(self, order_ids: list[str]) -> list[BatchOrderResult]:
+        """Cancel several orders with as few requests as possible."""
+        ...
+
+    def amend_orders_batch(self, amends: list[BatchAmendRequest]) -> list[BatchOrderResult]:
+        """Amend price/quantity of several open orders in place."""
+        ...
+
+
 class NoOpExchangePort:
     """Stub exchange port that tracks orders in memory.
 
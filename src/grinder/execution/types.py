@@ -7,7 +7,8 @@ External contracts (OrderIntent, Decision) are in grinder.contracts.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
 from enum import Enum
 from typing import Any
@@ -155,17 +156,137 @@ class ExecutionEvent:
         return json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
 
 
+# Order states the execution engine reconciles against the plan
+LIVE_ORDER_STATES = frozenset({OrderState.OPEN, OrderState.PARTIALLY_FILLED})
+# Order states that never change again (dropped by OrderStore.compact)
+TERMINAL_ORDER_STATES = frozenset(
+    {OrderState.FILLED, OrderState.CANCELLED, OrderState.REJECTED, OrderState.EXPIRED}
+)
+
+
+class OrderStore(MutableMapping[str, OrderRecord]):
+    """Order records keyed by order_id, with a live-order index.
+
+    Behaves like the plain ``dict[str, OrderRecord]`` it replaces (same
+    insertion-order iteration), plus:
+    - index of live (OPEN / PARTIALLY_FILLED) orders per symbol, in placement
+      order, maintained on every write, so finding live orders does not scan
+      history (rewriting a live order, e.g. a partial fill, keeps its position)
+    - O(1) state transitions via transition()
+    - compaction: records that reached a terminal state (FILLED, CANCELLED, ...)
+      stay visible until the next compact() and are then dropped
+
+    Without compaction, cancelled/filled records would accumulate for the
+    whole run and every tick would copy and scan them.
+    """
+
+    def __init__(self, orders: Mapping[str, OrderRecord] | None = None) -> None:
+        self._orders: dict[str, OrderRecord] = {}
+        self._live: dict[str, dict[str, None]] = {}
+        self._terminal: list[str] = []
+        if orders:
+            for order_id, order in orders.items():
+                self[order_id] = order
+
+    def __getitem__(self, order_id: str) -> OrderRecord:
+        return self._orders[order_id]
+
+    def __setitem__(self, order_id: str, order: OrderRecord) -> None:
+        previous = self._orders.get(order_id)
+        self._orders[order_id] = order
+        if previous is not None:
+            if (
+                previous.state in LIVE_ORDER_STATES
+                and order.state in LIVE_ORDER_STATES
+                and previous.symbol == order.symbol
+            ):
+                return  # Still live: keep its place in the index
+            self._unindex(order_id, previous)
+        if order.state in LIVE_ORDER_STATES:
+            self._live.setdefault(order.symbol, {})[order_id] = None
+        elif order.state in TERMINAL_ORDER_STATES:
+            self._terminal.append(order_id)
+
+    def __delitem__(self, order_id: str) -> None:
+        order = self._orders.pop(order_id)
+        self._unindex(order_id, order)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._orders)
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __repr__(self) -> str:
+        return f"OrderStore({self._orders!r})"
+
+    def live_orders(self, symbol: str) -> list[OrderRecord]:
+        """Live orders for symbol, in placement order."""
+        ids = self._live.get(symbol)
+        if not ids:
+            return []
+        return [self._orders[order_id] for order_id in ids]
+
+    def transition(self, order_id: str, state: OrderState) -> OrderRecord | None:
+        """Set order state, returning the updated record (None if unknown)."""
+        order = self._orders.get(order_id)
+        if order is None:
+            return None
+        updated = replace(order, state=state)
+        self[order_id] = updated
+        return updated
+
+    def compact(self) -> int:
+        """Drop records that are in a terminal state. Returns number dropped."""
+        dropped = 0
+        for order_id in self._terminal:
+            order = self._orders.get(order_id)
+            if order is not None and order.state in TERMINAL_ORDER_STATES:
+                del self._orders[order_id]
+                dropped += 1
+        self._terminal = []
+        return dropped
+
+    def copy(self) -> OrderStore:
+        """Shallow copy (records are shared, indexes are copied)."""
+        store = OrderStore()
+        store._orders = dict(self._orders)
+        store._live = {sym: dict(ids) for sym, ids in self._live.items()}
+        store._terminal = list(self._terminal)
+        return store
+
+    def _unindex(self, order_id: str, order: OrderRecord) -> None:
+        ids = self._live.get(order.symbol)
+        if ids is not None and order_id in ids:
+            del ids[order_id]
+            if not ids:
+                del self._live[order.symbol]
+
+
 @dataclass
 class ExecutionState:
     """State maintained by execution engine.
 
     Tracks open orders and last plan digest for reconciliation.
+
+    ``open_orders`` accepts any mapping and is stored as an OrderStore;
+    terminal records stay visible for one tick, then the engine compacts them.
     """
 
-    open_orders: dict[str, OrderRecord] = field(default_factory=dict)
+    open_orders: Mapping[str, OrderRecord] = field(default_factory=OrderStore)
     last_plan_digest: str = ""
     tick_counter: int = 0  # For deterministic order ID generation
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.open_orders, OrderStore):
+            self.open_orders = OrderStore(self.open_orders)
+
+    @property
+    def orders(self) -> OrderStore:
+        """open_orders as OrderStore (live index, transitions, compaction)."""
+        assert isinstance(self.open_orders, OrderStore)
+        return self.open_orders
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
         return {
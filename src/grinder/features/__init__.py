@@ -4,7 +4,10 @@ Provides:
 - FeatureEngine: Orchestrates bar building and feature computation (v1)
 - FeatureEngineConfig: Configuration for the feature engine
 - FeatureSnapshot: Computed features at a point in time (v1)
+- PolicyFeatures: Policy input view over a FeatureSnapshot (no dict copy)
+- IncrementalIndicators: Rolling per-bar ATR/NATR and range/trend state
 - L2FeatureSnapshot: L2 order book features (v2)
+- L2OrderBook: Local order book maintained from depth diffs (snapshot + resync)
 - MidBar: OHLC bar built from mid-price ticks
 - BarBuilder: Builds bars from tick stream
 - BarBuilderConfig: Configuration for bar building
@@ -16,6 +19,7 @@ See:
 
 from grinder.features.bar import BarBuilder, BarBuilderConfig, MidBar
 from grinder.features.engine import FeatureEngine, FeatureEngineConfig
+from grinder.features.incremental import IncrementalIndicators
 from grinder.features.indicators import (
     compute_atr,
     compute_imbalance_l1_bps,
@@ -24,6 +28,7 @@ from grinder.features.indicators import (
     compute_thin_l1,
     compute_true_range,
 )
+from grinder.features.l2_book import DepthDiff, DepthSnapshot, DiffResult, L2OrderBook
 from grinder.features.l2_indicators import (
     compute_depth_imbalance_bps,
     compute_depth_totals,
@@ -32,16 +37,22 @@ from grinder.features.l2_indicators import (
     compute_wall_score_x1000,
 )
 from grinder.features.l2_types import L2FeatureSnapshot
-from grinder.features.types import FeatureSnapshot
+from grinder.features.types import FeatureSnapshot, PolicyFeatures
 
 __all__ = [
     "BarBuilder",
     "BarBuilderConfig",
+    "DepthDiff",
+    "DepthSnapshot",
+    "DiffResult",
     "FeatureEngine",
     "FeatureEngineConfig",
     "FeatureSnapshot",
+    "IncrementalIndicators",
     "L2FeatureSnapshot",
+    "L2OrderBook",
     "MidBar",
+    "PolicyFeatures",
     "compute_atr",
     "compute_depth_imbalance_bps",
     "compute_depth_totals",
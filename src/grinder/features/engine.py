@@ -13,13 +13,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from grinder.features.bar import BarBuilder, BarBuilderConfig, MidBar
-from grinder.features.indicators import (
-    compute_atr,
-    compute_imbalance_l1_bps,
-    compute_natr_bps,
-    compute_range_trend,
-    compute_thin_l1,
-)
+from grinder.features.incremental import IncrementalIndicators
+from grinder.features.indicators import compute_imbalance_l1_bps, compute_thin_l1
 from grinder.features.types import FeatureSnapshot
 
 if TYPE_CHECKING:
@@ -59,6 +54,8 @@ class FeatureEngine:
     """Engine for computing market features from snapshot stream.
 
     Maintains per-symbol bar builders and computes features on each snapshot.
+    Bar-based indicators (ATR/NATR, range/trend) are updated incrementally
+    when a bar completes and served from cache on intra-bar ticks.
     All computations are deterministic for replay.
 
     Usage:
@@ -76,6 +73,7 @@ class FeatureEngine:
     # Per-symbol state
     _bar_builders: dict[str, BarBuilder] = field(default_factory=dict, repr=False)
     _bars: dict[str, deque[MidBar]] = field(default_factory=dict, repr=False)
+    _indicators: dict[str, IncrementalIndicators] = field(default_factory=dict, repr=False)
     # Cache of latest FeatureSnapshot per symbol (for Top-K v1 selection)
     _latest_snapshots: dict[str, FeatureSnapshot] = field(default_factory=dict, repr=False)
 
@@ -95,11 +93,22 @@ class FeatureEngine:
             self._bars[symbol] = deque(maxlen=self.config.max_bars)
         return self._bars[symbol]
 
+    def _get_indicators(self, symbol: str) -> IncrementalIndicators:
+        """Get or create incremental indicator state for symbol."""
+        if symbol not in self._indicators:
+            self._indicators[symbol] = IncrementalIndicators(
+                atr_period=self.config.atr_period,
+                range_horizon=self.config.range_horizon,
+                max_bars=self.config.max_bars,
+            )
+        return self._indicators[symbol]
+
     def process_snapshot(self, snapshot: Snapshot) -> FeatureSnapshot:
         """Process a snapshot and compute features.
 
-        Feeds the bar builder with the snapshot's mid price, then computes
-        all features from the current bar history.
+        Feeds the bar builder with the snapshot's mid price. Bar-based
+        indicators are refreshed only when a bar completes; L1 features are
+        computed from the snapshot itself.
 
         Args:
             snapshot: Market data snapshot
@@ -114,25 +123,20 @@ class FeatureEngine:
         bar_builder = self._get_bar_builder(symbol)
         completed_bar = bar_builder.process_tick(snapshot.ts, mid_price)
 
-        # Store completed bar if any
+        # Store completed bar and fold it into the rolling indicators
         bars_deque = self._get_bars(symbol)
+        indicators = self._get_indicators(symbol)
         if completed_bar is not None:
             bars_deque.append(completed_bar)
-
-        # Get bar list for indicator computation
-        bars = list(bars_deque)
+            indicators.update(completed_bar)
 
         # Compute L1 features
         spread_bps = int(snapshot.spread_bps)
         imbalance_l1_bps = compute_imbalance_l1_bps(snapshot.bid_qty, snapshot.ask_qty)
         thin_l1 = compute_thin_l1(snapshot.bid_qty, snapshot.ask_qty)
 
-        # Compute volatility features
-        atr = compute_atr(bars, self.config.atr_period)
-        natr_bps = compute_natr_bps(bars, self.config.atr_period)
-
-        # Compute range/trend features
-        sum_abs_bps, net_ret_bps, range_score = compute_range_trend(bars, self.config.range_horizon)
+        # Volatility and range/trend features (cached between bar closes)
+        sum_abs_bps, net_ret_bps, range_score = indicators.range_trend
 
         feature_snapshot = FeatureSnapshot(
             ts=snapshot.ts,
@@ -141,12 +145,12 @@ class FeatureEngine:
             spread_bps=spread_bps,
             imbalance_l1_bps=imbalance_l1_bps,
             thin_l1=thin_l1,
-            natr_bps=natr_bps,
-            atr=atr,
+            natr_bps=indicators.natr_bps,
+            atr=indicators.atr,
             sum_abs_returns_bps=sum_abs_bps,
             net_return_bps=net_ret_bps,
             range_score=range_score,
-            warmup_bars=len(bars),
+            warmup_bars=len(bars_deque),
         )
 
         # Cache latest snapshot for Top-K v1 selection
@@ -183,6 +187,7 @@ class FeatureEngine:
         """Reset all state."""
         self._bar_builders.clear()
         self._bars.clear()
+        self._indicators.clear()
         self._latest_snapshots.clear()
 
     def reset_symbol(self, symbol: str) -> None:
@@ -191,5 +196,7 @@ class FeatureEngine:
             del self._bar_builders[symbol]
         if symbol in self._bars:
             del self._bars[symbol]
+        if symbol in self._indicators:
+            del self._indicators[symbol]
         if symbol in self._latest_snapshots:
             del self._latest_snapshots[symbol]
@@ -0,0 +1,144 @@
+"""Incremental indicator state for the feature engine.
+
+Keeps per-symbol rolling windows of True Ranges, closes and absolute returns
+so ATR/NATR and range/trend features are updated once per completed bar and
+served from cache on every other tick.
+
+Window sums are re-accumulated in the same order as the batch functions in
+indicators.py (compute_atr, compute_natr_bps, compute_range_trend), so the
+Decimal results are bit-identical to a full-history recompute. A running
+add/subtract sum is deliberately avoided: Decimal division results carry 28
+significant digits and would drift from the batch math.
+
+See: docs/17_ADAPTIVE_SMART_GRID_V1.md §17.5.2, §17.5.5
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from grinder.features.indicators import compute_true_range
+
+if TYPE_CHECKING:
+    from grinder.features.bar import MidBar
+
+
+@dataclass
+class IncrementalIndicators:
+    """Rolling ATR/NATR and range/trend state for a single symbol.
+
+    Call update() with each completed bar (oldest first). Cached values match
+    the batch indicator functions applied to the last `max_bars` bars.
+
+    Attributes:
+        atr_period: Period for ATR/NATR calculation
+        range_horizon: Horizon for range/trend calculation
+        max_bars: Bar history cap (mirrors FeatureEngineConfig.max_bars)
+    """
+
+    atr_period: int = 14
+    range_horizon: int = 14
+    max_bars: int = 1000
+
+    # Rolling windows
+    _bar_count: int = field(default=0, repr=False)
+    _prev_close: Decimal | None = field(default=None, repr=False)
+    _trs: deque[Decimal] = field(init=False, repr=False)
+    _closes: deque[Decimal] = field(init=False, repr=False)
+    _abs_returns: deque[Decimal | None] = field(init=False, repr=False)
+
+    # Cached outputs (recomputed once per completed bar)
+    _atr: Decimal | None = field(default=None, repr=False)
+    _natr_bps: int = field(default=0, repr=False)
+    _range_trend: tuple[int, int, int] = field(default=(0, 0, 0), repr=False)
+
+    def __post_init__(self) -> None:
+        """Initialize window deques."""
+        self._trs = deque(maxlen=self.atr_period)
+        self._closes = deque(maxlen=self.range_horizon + 1)
+        self._abs_returns = deque(maxlen=self.range_horizon)
+
+    @property
+    def bar_count(self) -> int:
+        """Number of bars in history (capped at max_bars)."""
+        return self._bar_count
+
+    @property
+    def atr(self) -> Decimal | None:
+        """ATR over the last atr_period bars, None during warmup."""
+        return self._atr
+
+    @property
+    def natr_bps(self) -> int:
+        """NATR in integer bps, 0 during warmup."""
+        return self._natr_bps
+
+    @property
+    def range_trend(self) -> tuple[int, int, int]:
+        """(sum_abs_returns_bps, net_return_bps, range_score)."""
+        return self._range_trend
+
+    def update(self, bar: MidBar) -> None:
+        """Fold a completed bar into the rolling windows and refresh caches.
+
+        Args:
+            bar: Newly completed bar (must be newer than all previous bars)
+        """
+        close = bar.close
+        prev_close = self._prev_close
+
+        if prev_close is not None:
+            self._trs.append(compute_true_range(bar, prev_close))
+            if prev_close > 0:
+                self._abs_returns.append(abs((close - prev_close) / prev_close))
+            else:
+                self._abs_returns.append(None)
+
+        self._closes.append(close)
+        self._prev_close = close
+        self._bar_count = min(self._bar_count + 1, self.max_bars)
+
+        self._refresh_volatility(close)
+        self._refresh_range_trend()
+
+    def _refresh_volatility(self, close: Decimal) -> None:
+        """Recompute ATR/NATR from the TR window (see compute_atr)."""
+        if self._bar_count < self.atr_period + 1:
+            self._atr = None
+            self._natr_bps = 0
+            return
+
+        atr = sum(self._trs) / Decimal(self.atr_period)
+        self._atr = atr
+
+        if close == 0:
+            self._natr_bps = 0
+            return
+        natr = atr / close
+        self._natr_bps = int((natr * Decimal("10000")).quantize(Decimal("1")))
+
+    def _refresh_range_trend(self) -> None:
+        """Recompute range/trend from the close window (see compute_range_trend)."""
+        if self._bar_count < self.range_horizon + 1:
+            self._range_trend = (0, 0, 0)
+            return
+
+        sum_abs = Decimal("0")
+        for ret in self._abs_returns:
+            if ret is not None:
+                sum_abs += ret
+
+        start_close = self._closes[0]
+        end_close = self._closes[-1]
+        net_ret = Decimal("0")
+        if start_close > 0:
+            net_ret = abs((end_close / start_close) - 1)
+
+        sum_abs_bps = int((sum_abs * Decimal("10000")).quantize(Decimal("1")))
+        net_ret_bps = int((net_ret * Decimal("10000")).quantize(Decimal("1")))
+        range_score = sum_abs_bps // (net_ret_bps + 1)
+
+        self._range_trend = (sum_abs_bps, net_ret_bps, range_score)
@@ -0,0 +1,302 @@
+"""Local incremental L2 order book maintained from depth diff streams.
+
+Applies Binance ``depthUpdate`` diffs on top of a REST depth snapshot,
+following the exchange's "manage a local order book" procedure:
+
+1. Buffer diffs, fetch a REST snapshot (lastUpdateId = L)
+2. Drop diffs with final update id u < L
+3. The first applied diff must straddle L (U <= L + 1 <= u + 1)
+4. Every following diff must continue the sequence: pu == previous u
+   (futures streams) or U == previous u + 1 (spot streams)
+5. Any gap marks the book out of sync until the next snapshot (resync)
+
+Design:
+- Each side keeps a dict price -> BookLevel plus a sorted key list (bisect),
+  so an update costs O(log n) search + list insert/delete, and best-N reads
+  touch only the N levels returned.
+- Bids are keyed by negated price, so index 0 is the best level on both sides.
+- Features (L2FeatureSnapshot) are computed on demand from the top-N levels
+  with the same l2_indicators functions used for replayed L2 snapshots; no
+  frozen snapshot tuples are rebuilt per update.
+
+See: docs/smart_grid/SPEC_V2_0.md Addendum B
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from grinder.features.l2_types import L2FeatureSnapshot
+from grinder.replay.l2_snapshot import QTY_REF_BASELINE, BookLevel, L2Snapshot
+
+# (price, qty) pairs as received from the exchange
+PriceQty = tuple[Decimal, Decimal]
+
+
+def _parse_levels(raw: list[list[str]]) -> tuple[PriceQty, ...]:
+    return tuple((Decimal(p), Decimal(q)) for p, q, *_ in raw)
+
+
+@dataclass(frozen=True)
+class DepthSnapshot:
+    """REST depth snapshot (GET /fapi/v1/depth)."""
+
+    symbol: str
+    last_update_id: int
+    bids: tuple[PriceQty, ...]
+    asks: tuple[PriceQty, ...]
+    ts_ms: int = 0
+
+    @classmethod
+    def from_binance(cls, symbol: str, data: dict[str, Any]) -> DepthSnapshot:
+        """Parse REST depth response."""
+        return cls(
+            symbol=symbol,
+            last_update_id=int(data["lastUpdateId"]),
+            bids=_parse_levels(data.get("bids", [])),
+            asks=_parse_levels(data.get("asks", [])),
+            ts_ms=int(data.get("E", data.get("T", 0))),
+        )
+
+
+@dataclass(frozen=True)
+class DepthDiff:
+    """Depth diff event (``depthUpdate``).
+
+    Attributes:
+        symbol: Trading pair
+        ts_ms: Event time (E)
+        first_update_id: First update id in event (U)
+        final_update_id: Final update id in event (u)
+        prev_final_update_id: Final update id of previous event (pu, futures only)
+        bids: Changed bid levels (qty 0 = remove level)
+        asks: Changed ask levels (qty 0 = remove level)
+    """
+
+    symbol: str
+    ts_ms: int
+    first_update_id: int
+    final_update_id: int
+    prev_final_update_id: int | None
+    bids: tuple[PriceQty, ...]
+    asks: tuple[PriceQty, ...]
+
+    @classmethod
+    def from_binance(cls, data: dict[str, Any]) -> DepthDiff:
+        """Parse depthUpdate payload."""
+        return cls(
+            symbol=data["s"],
+            ts_ms=int(data.get("E", 0)),
+            first_update_id=int(data["U"]),
+            final_update_id=int(data["u"]),
+            prev_final_update_id=int(data["pu"]) if "pu" in data else None,
+            bids=_parse_levels(data.get("b", [])),
+            asks=_parse_levels(data.get("a", [])),
+        )
+
+
+class DiffResult(Enum):
+    """Outcome of L2OrderBook.apply_diff()."""
+
+    APPLIED = "APPLIED"
+    STALE = "STALE"  # Already covered by the snapshot, dropped
+    NOT_SYNCED = "NOT_SYNCED"  # No snapshot yet (or after gap): buffer and resync
+    GAP = "GAP"  # Sequence gap: book is now out of sync, resync required
+
+
+class _BookSide:
+    """One side of the book: price -> BookLevel with sorted keys."""
+
+    __slots__ = ("_keys", "_levels", "_sign")
+
+    def __init__(self, descending: bool) -> None:
+        self._sign = Decimal(-1) if descending else Decimal(1)
+        self._keys: list[Decimal] = []
+        self._levels: dict[Decimal, BookLevel] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._levels.clear()
+
+    def set(self, price: Decimal, qty: Decimal) -> None:
+        """Set level qty; qty 0 removes the level."""
+        key = price * self._sign
+        if qty == 0:
+            if self._levels.pop(key, None) is not None:
+                del self._keys[bisect.bisect_left(self._keys, key)]
+            return
+        if key not in self._levels:
+            bisect.insort(self._keys, key)
+        self._levels[key] = BookLevel(price=price, qty=qty)
+
+    def best(self) -> BookLevel | None:
+        return self._levels[self._keys[0]] if self._keys else None
+
+    def top(self, n: int) -> list[BookLevel]:
+        levels = self._levels
+        return [levels[k] for k in self._keys[:n]]
+
+
+class L2OrderBook:
+    """Local order book for one symbol, maintained from depth diffs.
+
+    Usage:
+        book = L2OrderBook("BTCUSDT")
+        book.apply_snapshot(DepthSnapshot.from_binance("BTCUSDT", rest_json))
+        result = book.apply_diff(DepthDiff.from_binance(ws_msg))
+        if result == DiffResult.GAP:
+            ...  # fetch a new snapshot
+        features = book.feature_snapshot(depth=10)
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        venue: str = "binance_futures_usdtm",
+    ) -> None:
+        self.symbol = symbol
+        self.venue = venue
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide(descending=False)
+        self._synced = False
+        self._awaiting_first_diff = False
+        self._last_update_id = 0
+        self._ts_ms = 0
+        self._version = 0
+        self._features_cache: tuple[int, int, Decimal, L2FeatureSnapshot] | None = None
+
+    @property
+    def synced(self) -> bool:
+        """True if the book is consistent with the exchange (snapshot + contiguous diffs)."""
+        return self._synced
+
+    @property
+    def last_update_id(self) -> int:
+        """Last applied update id (snapshot lastUpdateId or diff u)."""
+        return self._last_update_id
+
+    @property
+    def ts_ms(self) -> int:
+        """Timestamp of the last applied snapshot/diff."""
+        return self._ts_ms
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every applied snapshot/diff."""
+        return self._version
+
+    def apply_snapshot(self, snapshot: DepthSnapshot) -> None:
+        """Replace book contents with a REST snapshot and mark it synced."""
+        self._bids.clear()
+        self._asks.clear()
+        for price, qty in snapshot.bids:
+            self._bids.set(price, qty)
+        for price, qty in snapshot.asks:
+            self._asks.set(price, qty)
+        self._last_update_id = snapshot.last_update_id
+        self._ts_ms = snapshot.ts_ms
+        self._synced = True
+        self._awaiting_first_diff = True
+        self._version += 1
+
+    def invalidate(self) -> None:
+        """Mark the book out of sync (e.g. stream reconnect: diffs were missed)."""
+        self._synced = False
+
+    def apply_diff(self, diff: DepthDiff) -> DiffResult:
+        """Apply a depth diff, checking update id continuity."""
+        if not self._synced:
+            return DiffResult.NOT_SYNCED
+        if diff.final_update_id < self._last_update_id or (
+            not self._awaiting_first_diff and diff.final_update_id == self._last_update_id
+        ):
+            return DiffResult.STALE
+
+        if self._awaiting_first_diff:
+            contiguous = diff.first_update_id <= self._last_update_id + 1
+        elif diff.prev_final_update_id is not None:
+            contiguous = diff.prev_final_update_id == self._last_update_id
+        else:
+            contiguous = diff.first_update_id == self._last_update_id + 1
+        if not contiguous:
+            self._synced = False
+            return DiffResult.GAP
+
+        for price, qty in diff.bids:
+            self._bids.set(price, qty)
+        for price, qty in diff.asks:
+            self._asks.set(price, qty)
+        self._last_update_id = diff.final_update_id
+        self._ts_ms = diff.ts_ms
+        self._awaiting_first_diff = False
+        self._version += 1
+        return DiffResult.APPLIED
+
+    def best_bid(self) -> BookLevel | None:
+        """Best (highest) bid level."""
+        return self._bids.best()
+
+    def best_ask(self) -> BookLevel | None:
+        """Best (lowest) ask level."""
+        return self._asks.best()
+
+    def bids(self, n: int) -> list[BookLevel]:
+        """Top-n bid levels, descending by price."""
+        return self._bids.top(n)
+
+    def asks(self, n: int) -> list[BookLevel]:
+        """Top-n ask levels, ascending by price."""
+        return self._asks.top(n)
+
+    def level_counts(self) -> tuple[int, int]:
+        """(bid levels, ask levels) held in the book."""
+        return len(self._bids), len(self._asks)
+
+    def feature_snapshot(
+        self,
+        depth: int = 10,
+        qty_ref: Decimal = QTY_REF_BASELINE,
+    ) -> L2FeatureSnapshot:
+        """L2 features over the top-`depth` levels (cached until the book changes)."""
+        cached = self._features_cache
+        if (
+            cached is not None
+            and cached[0] == self._version
+            and cached[1] == depth
+            and cached[2] == qty_ref
+        ):
+            return cached[3]
+        features = L2FeatureSnapshot.from_levels(
+            ts_ms=self._ts_ms,
+            symbol=self.symbol,
+            venue=self.venue,
+            depth=depth,
+            bids=self._bids.top(depth),
+            asks=self._asks.top(depth),
+            qty_ref=qty_ref,
+        )
+        self._features_cache = (self._version, depth, qty_ref, features)
+        return features
+
+    def to_l2_snapshot(self, depth: int) -> L2Snapshot:
+        """Frozen L2Snapshot of the top levels (for recording/replay).
+
+        Depth is capped at the thinner side so len(bids) == len(asks) == depth
+        (L2Snapshot invariant).
+        """
+        depth = min(depth, len(self._bids), len(self._asks))
+        return L2Snapshot(
+            ts_ms=self._ts_ms,
+            symbol=self.symbol,
+            venue=self.venue,
+            depth=depth,
+            bids=tuple(self._bids.top(depth)),
+            asks=tuple(self._asks.top(depth)),
+        )
@@ -6,6 +6,8 @@ Implements SPEC_V2_0.md §B formulas:
 - Depth imbalance
 
 All calculations use Decimal for precision, output as integer for determinism.
+Levels are any sequence of PriceLevel (L2Snapshot tuples, RawLevel tuples from
+parse_l2_levels_dict, or top-N lists from L2OrderBook).
 
 See: docs/smart_grid/SPEC_V2_0.md Addendum B
 """
@@ -18,12 +20,14 @@ from typing import TYPE_CHECKING
 from grinder.replay.l2_snapshot import IMPACT_INSUFFICIENT_DEPTH_BPS, QTY_REF_BASELINE
 
 if TYPE_CHECKING:
-    from grinder.replay.l2_snapshot import BookLevel
+    from collections.abc import Sequence
+
+    from grinder.replay.l2_snapshot import PriceLevel
 
 
 def compute_depth_totals(
-    bids: tuple[BookLevel, ...],
-    asks: tuple[BookLevel, ...],
+    bids: Sequence[PriceLevel],
+    asks: Sequence[PriceLevel],
 ) -> tuple[Decimal, Decimal]:
     """Compute total depth on bid and ask sides.
 
@@ -40,8 +44,8 @@ def compute_depth_totals(
 
 
 def compute_depth_imbalance_bps(
-    bids: tuple[BookLevel, ...],
-    asks: tuple[BookLevel, ...],
+    bids: Sequence[PriceLevel],
+    asks: Sequence[PriceLevel],
 ) -> int:
     """Compute depth imbalance in integer basis points.
 
@@ -65,7 +69,7 @@ def compute_depth_imbalance_bps(
 
 
 def compute_impact_buy_bps(
-    asks: tuple[BookLevel, ...],
+    asks: Sequence[PriceLevel],
     qty_ref: Decimal = QTY_REF_BASELINE,
 ) -> int:
     """Compute buy-side VWAP slippage in bps from best ask.
@@ -104,7 +108,7 @@ def compute_impact_buy_bps(
 
 
 def compute_impact_sell_bps(
-    bids: tuple[BookLevel, ...],
+    bids: Sequence[PriceLevel],
     qty_ref: Decimal = QTY_REF_BASELINE,
 ) -> int:
     """Compute sell-side VWAP slippage in bps from best bid.
@@ -142,7 +146,7 @@ def compute_impact_sell_bps(
     return round(slippage_bps)
 
 
-def compute_wall_score_x1000(levels: tuple[BookLevel, ...]) -> int:
+def compute_wall_score_x1000(levels: Sequence[PriceLevel]) -> int:
     """Compute wall score as max_qty / median_qty, stored as x1000 integer.
 
     Wall score detects unusually large orders relative to the book.
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from grinder.features.l2_indicators import (
     compute_depth_imbalance_bps,
@@ -25,8 +25,14 @@ from grinder.replay.l2_snapshot import (
     IMPACT_INSUFFICIENT_DEPTH_BPS,
     QTY_REF_BASELINE,
     L2Snapshot,
+    parse_l2_levels_dict,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from grinder.replay.l2_snapshot import PriceLevel
+
 
 @dataclass(frozen=True)
 class L2FeatureSnapshot:
@@ -134,32 +140,102 @@ class L2FeatureSnapshot:
             snapshot: L2 order book snapshot
             qty_ref: Reference quantity for impact calculation
 
+        Returns:
+            L2FeatureSnapshot with all features computed
+        """
+        return cls.from_levels(
+            ts_ms=snapshot.ts_ms,
+            symbol=snapshot.symbol,
+            venue=snapshot.venue,
+            depth=snapshot.depth,
+            bids=snapshot.bids,
+            asks=snapshot.asks,
+            qty_ref=qty_ref,
+        )
+
+    @classmethod
+    def from_l2_dict(
+        cls,
+        data: dict[str, Any],
+        qty_ref: Decimal = QTY_REF_BASELINE,
+    ) -> L2FeatureSnapshot:
+        """Compute L2 features from a decoded l2_snapshot record.
+
+        Fast path for replay: validates like parse_l2_snapshot_dict but
+        computes features from RawLevel tuples without building BookLevel /
+        L2Snapshot objects. Result equals from_l2_snapshot on the parsed
+        snapshot.
+
+        Args:
+            data: Decoded JSONL v0 l2_snapshot record
+            qty_ref: Reference quantity for impact calculation
+
+        Returns:
+            L2FeatureSnapshot with all features computed
+
+        Raises:
+            L2ParseError: If the record fails validation
+        """
+        bids, asks = parse_l2_levels_dict(data)
+        return cls.from_levels(
+            ts_ms=data["ts_ms"],
+            symbol=data["symbol"],
+            venue=data["venue"],
+            depth=data["depth"],
+            bids=bids,
+            asks=asks,
+            qty_ref=qty_ref,
+        )
+
+    @classmethod
+    def from_levels(
+        cls,
+        *,
+        ts_ms: int,
+        symbol: str,
+        venue: str,
+        depth: int,
+        bids: Sequence[PriceLevel],
+        asks: Sequence[PriceLevel],
+        qty_ref: Decimal = QTY_REF_BASELINE,
+    ) -> L2FeatureSnapshot:
+        """Compute L2 features from top-N book levels.
+
+        Args:
+            ts_ms: Timestamp in milliseconds
+            symbol: Trading pair
+            venue: Exchange identifier
+            depth: Number of levels per side the features describe
+            bids: Bid levels sorted descending by price
+            asks: Ask levels sorted ascending by price
+            qty_ref: Reference quantity for impact calculation
+
         Returns:
             L2FeatureSnapshot with all features computed
         """
         # Depth totals
-        depth_bid_qty, depth_ask_qty = compute_depth_totals(snapshot.bids, snapshot.asks)
+        depth_bid_qty, depth_ask_qty = compute_depth_totals(bids, asks)
 
         # Depth imbalance
-        depth_imbalance_bps = compute_depth_imbalance_bps(snapshot.bids, snapshot.asks)
+        depth_imbalance_bps = compute_depth_imbalance_bps(bids, asks)
 
         # Impact
-        impact_buy_bps = compute_impact_buy_bps(snapshot.asks, qty_ref)
-        impact_sell_bps = compute_impact_sell_bps(snapshot.bids, qty_ref)
+        impact_buy_bps = compute_impact_buy_bps(asks, qty_ref)
+        impact_sell_bps = compute_impact_sell_bps(bids, qty_ref)
 
         # Insufficient depth flags
         impact_buy_insufficient = 1 if impact_buy_bps == IMPACT_INSUFFICIENT_DEPTH_BPS else 0
         impact_sell_insufficient = 1 if impact_sell_bps == IMPACT_INSUFFICIENT_DEPTH_BPS else 0
 
         # Wall scores
-        wall_bid_score = compute_wall_score_x1000(snapshot.bids)
-        wall_ask_score = compute_wall_score_x1000(snapshot.asks)
+        wall_bid_score = compute_wall_score_x1000(bids)
+        wall_ask_score = compute_wall_score_x1000(asks)
 
         return cls(
-            ts_ms=snapshot.ts_ms,
-            symbol=snapshot.symbol,
-            venue=snapshot.venue,
-            depth=snapshot.depth,
+            ts_ms=ts_ms,
+            symbol=symbol,
+            venue=venue,
+            depth=depth,
             depth_bid_qty_topN=depth_bid_qty,
             depth_ask_qty_topN=depth_ask_qty,
             depth_imbalance_topN_bps=depth_imbalance_bps,
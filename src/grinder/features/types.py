@@ -1,19 +1,36 @@
 """Feature types for the feature engine.
 
-Provides FeatureSnapshot - a frozen dataclass containing all computed features
-for a symbol at a point in time.
+Provides:
+- FeatureSnapshot: frozen, slotted dataclass with all computed features for a
+  symbol at a point in time
+- PolicyFeatures: policy input view over a FeatureSnapshot (no dict copy)
 
 See: docs/17_ADAPTIVE_SMART_GRID_V1.md §17.5
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
 
-
-@dataclass(frozen=True)
+# FeatureSnapshot fields exposed to policies (to_policy_features() keys besides mid_price)
+_POLICY_FIELDS: tuple[str, ...] = (
+    "spread_bps",
+    "imbalance_l1_bps",
+    "thin_l1",
+    "natr_bps",
+    "sum_abs_returns_bps",
+    "net_return_bps",
+    "range_score",
+    "warmup_bars",
+)
+_POLICY_FIELD_SET = frozenset(_POLICY_FIELDS)
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
 class FeatureSnapshot:
     """Computed features for a symbol at a point in time.
 
@@ -124,3 +141,77 @@ class FeatureSnapshot:
         Returns True if we have at least 15 bars (ATR(14) + 1).
         """
         return self.warmup_bars >= 15
+
+
+class PolicyFeatures(MutableMapping[str, Any]):
+    """Policy input: FeatureSnapshot fields plus extra keys, without a dict copy.
+
+    Reads like ``{"mid_price": ..., **snapshot.to_policy_features(), **extra}``
+    so dict-based policies and vectorize() work unchanged; ``.snapshot`` keeps
+    the typed record for callers that need ts/symbol.
+
+    Writes (e.g. ML signal features) go to an overlay dict and shadow snapshot
+    fields; only overlay keys can be deleted.
+    """
+
+    __slots__ = ("_extra", "mid_price", "snapshot")
+
+    def __init__(self, mid_price: Decimal, snapshot: FeatureSnapshot | None = None) -> None:
+        """Initialize view.
+
+        Args:
+            mid_price: Tick mid price (replaced by snapshot.mid_price if snapshot given)
+            snapshot: FeatureEngine output (None when the engine is disabled)
+        """
+        self.snapshot = snapshot
+        self.mid_price = snapshot.mid_price if snapshot is not None else mid_price
+        self._extra: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value for key, or default (fast path, no KeyError)."""
+        value = self._extra.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key == "mid_price":
+            return self.mid_price
+        if self.snapshot is not None and key in _POLICY_FIELD_SET:
+            return getattr(self.snapshot, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            key in self._extra
+            or key == "mid_price"
+            or (self.snapshot is not None and key in _POLICY_FIELD_SET)
+        )
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._extra[key]
+
+    def _base_keys(self) -> tuple[str, ...]:
+        return ("mid_price", *_POLICY_FIELDS) if self.snapshot is not None else ("mid_price",)
+
+    def __iter__(self) -> Iterator[str]:
+        base = self._base_keys()
+        yield from base
+        yield from (k for k in self._extra if k not in base)
+
+    def __len__(self) -> int:
+        base = self._base_keys()
+        return len(base) + sum(1 for k in self._extra if k not in base)
+
+    def copy(self) -> dict[str, Any]:
+        """Materialize as a plain dict (dict-compatible snapshot of the view)."""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return f"PolicyFeatures({dict(self)!r})"
@@ -4,6 +4,7 @@ Provides:
 - LiveEngineV0 for live write-path wiring (ADR-036)
 - LiveFeed for read-only data pipeline (ADR-037)
 - ReconcileLoop for periodic reconciliation (ADR-048)
+- AsyncExecutionPipeline to run LiveEngineV0 off the asyncio loop
 
 Write-path (LiveEngineV0):
 - PaperEngine → ExchangePort integration
@@ -21,6 +22,11 @@ Reconciliation (ReconcileLoop):
 - Default detect-only mode
 """
 
+from grinder.live.async_pipeline import (
+    AsyncExecutionPipeline,
+    AsyncPipelineConfig,
+    AsyncPipelineStats,
+)
 from grinder.live.config import LiveEngineConfig
 from grinder.live.engine import (
     BlockReason,
@@ -44,6 +50,10 @@ from grinder.live.types import (
 )
 
 __all__ = [
+    # Async execution pipeline
+    "AsyncExecutionPipeline",
+    "AsyncPipelineConfig",
+    "AsyncPipelineStats",
     # Write-path (LC-05)
     "BlockReason",
     # Read-path (LC-06)
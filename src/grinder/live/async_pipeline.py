@@ -0,0 +1,276 @@
+"""Async execution pipeline: keeps exchange I/O off the market-data loop.
+
+LiveEngineV0.process_snapshot() runs the whole write path synchronously,
+including blocking REST calls and retry backoff in the exchange port. Called
+directly from ``async for snapshot in connector.iter_snapshots()``, a slow
+place_order stalls WebSocket consumption and the engine trades on stale
+prices.
+
+AsyncExecutionPipeline decouples the two:
+
+- submit() is non-blocking: it appends the snapshot to a bounded FIFO queue
+- A worker task drains the queue and runs process_snapshot() on a dedicated
+  single-thread executor, so the event loop keeps reading the socket
+- When the queue is full, the oldest queued snapshot is evicted (its price is
+  the stalest) and counted in grinder_live_exec_dropped_total{sym}
+- Optional conflation (conflate=True): while a symbol already has a snapshot
+  waiting, a newer one replaces it in place (same queue position) and is
+  counted in grinder_live_exec_conflated_total{sym}. The engine then skips
+  obsolete prices, so decision latency stays bounded under bursts. With
+  conflate_bars=True the superseded snapshots are still fed to the engine's
+  FeatureEngine (LiveEngineV0.observe_superseded) so bars keep exact OHLC.
+
+Ordering: LiveEngineV0 is not thread-safe and keeps cross-symbol state
+(account sync, FSM, order budget), so all snapshots go through one engine
+thread in arrival order. Per-symbol order is therefore always preserved;
+eviction only removes snapshots, never reorders them.
+
+Failure: an exception from process_snapshot stops the worker and is re-raised
+by the next submit() or by stop(), matching the fail-closed behaviour of the
+former synchronous loop.
+
+See: ADR-036 for the write-path design
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from grinder.live.live_metrics import get_live_engine_metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from grinder.contracts import Snapshot
+    from grinder.live.engine import LiveEngineV0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AsyncPipelineConfig:
+    """Configuration for AsyncExecutionPipeline.
+
+    Attributes:
+        max_queue: Max snapshots waiting for the engine thread (oldest evicted beyond this)
+        drain_timeout_s: How long stop() waits for queued snapshots before giving up
+        conflate: Keep only the latest waiting snapshot per symbol
+        conflate_bars: Feed superseded snapshots to the engine's FeatureEngine before
+            the latest one (exact bar OHLC; requires conflate). At most max_queue
+            superseded snapshots are kept per symbol.
+    """
+
+    max_queue: int = 256
+    drain_timeout_s: float = 5.0
+    conflate: bool = False
+    conflate_bars: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.max_queue < 1:
+            raise ValueError(f"max_queue must be >= 1, got {self.max_queue}")
+        if self.drain_timeout_s < 0:
+            raise ValueError(f"drain_timeout_s must be >= 0, got {self.drain_timeout_s}")
+        if self.conflate_bars and not self.conflate:
+            raise ValueError("conflate_bars requires conflate")
+
+
+@dataclass
+class AsyncPipelineStats:
+    """Counters for one pipeline instance (the Prometheus view is process-wide)."""
+
+    submitted: int = 0
+    processed: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    max_depth: int = 0
+
+
+@dataclass
+class _QueuedSnapshot:
+    """Queue slot: latest snapshot plus, when conflating, what it replaced."""
+
+    snapshot: Snapshot
+    enqueued_at: float
+    first_enqueued_at: float
+    superseded: deque[Snapshot] | None = None
+
+
+class AsyncExecutionPipeline:
+    """Bounded snapshot queue drained by a single engine thread.
+
+    Usage:
+        pipeline = AsyncExecutionPipeline(engine)
+        pipeline.start()
+        async for snapshot in connector.iter_snapshots():
+            pipeline.submit(snapshot)  # never blocks on exchange I/O
+        await pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        engine: LiveEngineV0,
+        config: AsyncPipelineConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize pipeline.
+
+        Args:
+            engine: Engine whose process_snapshot() runs on the worker thread
+            config: Queue configuration (defaults if None)
+            clock: Monotonic clock in seconds (injectable for testing)
+        """
+        self._engine = engine
+        self._config = config or AsyncPipelineConfig()
+        self._clock = clock
+        self._queue: deque[_QueuedSnapshot] = deque()
+        # Conflation: symbol -> its waiting slot (also in _queue)
+        self._waiting: dict[str, _QueuedSnapshot] = {}
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stats = AsyncPipelineStats()
+
+    @property
+    def stats(self) -> AsyncPipelineStats:
+        """Pipeline counters."""
+        return self._stats
+
+    @property
+    def depth(self) -> int:
+        """Snapshots currently waiting in the queue."""
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the engine thread and the drain task (requires a running loop)."""
+        if self._task is not None:
+            raise RuntimeError("AsyncExecutionPipeline already started")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grinder-engine")
+        self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    def submit(self, snapshot: Snapshot) -> None:
+        """Queue a snapshot for the engine without waiting for it.
+
+        Raises:
+            RuntimeError: If the pipeline is not running
+            Exception: The engine's exception, if the worker has failed
+        """
+        if self._task is None or self._closing:
+            raise RuntimeError("AsyncExecutionPipeline is not running")
+        if self._task.done():
+            # Surface the engine failure to the market-data loop (fail-closed)
+            self._task.result()
+            raise RuntimeError("AsyncExecutionPipeline worker exited")
+
+        metrics = get_live_engine_metrics()
+        now = self._clock()
+        if self._config.conflate and self._conflate(snapshot, now):
+            self._stats.submitted += 1
+            metrics.record_exec_submitted(len(self._queue))
+            return
+
+        if len(self._queue) >= self._config.max_queue:
+            evicted = self._queue.popleft().snapshot
+            self._waiting.pop(evicted.symbol, None)
+            self._stats.dropped += 1
+            metrics.record_exec_dropped(evicted.symbol)
+            logger.warning(
+                "EXEC_QUEUE_FULL evicted stale snapshot symbol=%s ts=%d depth=%d",
+                evicted.symbol,
+                evicted.ts,
+                len(self._queue),
+            )
+
+        slot = _QueuedSnapshot(snapshot=snapshot, enqueued_at=now, first_enqueued_at=now)
+        if self._config.conflate:
+            if self._config.conflate_bars:
+                slot.superseded = deque(maxlen=self._config.max_queue)
+            self._waiting[snapshot.symbol] = slot
+        self._queue.append(slot)
+        depth = len(self._queue)
+        self._stats.submitted += 1
+        self._stats.max_depth = max(self._stats.max_depth, depth)
+        metrics.record_exec_submitted(depth)
+        self._wakeup.set()
+
+    def _conflate(self, snapshot: Snapshot, now: float) -> bool:
+        """Replace the symbol's waiting snapshot in place; False if none is waiting."""
+        slot = self._waiting.get(snapshot.symbol)
+        if slot is None:
+            return False
+        if slot.superseded is not None:
+            slot.superseded.append(slot.snapshot)
+        slot.snapshot = snapshot
+        slot.enqueued_at = now
+        self._stats.conflated += 1
+        get_live_engine_metrics().record_exec_conflated(snapshot.symbol)
+        return True
+
+    async def stop(self) -> None:
+        """Drain queued snapshots (bounded by drain_timeout_s) and stop.
+
+        Raises:
+            Exception: The engine's exception, if the worker failed
+        """
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), self._config.drain_timeout_s)
+        except TimeoutError:
+            logger.warning(
+                "EXEC_DRAIN_TIMEOUT discarding %d queued snapshots after %.1fs",
+                len(self._queue),
+                self._config.drain_timeout_s,
+            )
+            self._queue.clear()
+            self._waiting.clear()
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        finally:
+            get_live_engine_metrics().set_exec_queue_depth(len(self._queue))
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+        if not self._task.cancelled():
+            self._task.result()
+
+    async def _drain(self) -> None:
+        """Worker task: run queued snapshots through the engine in FIFO order."""
+        loop = asyncio.get_running_loop()
+        metrics = get_live_engine_metrics()
+        while True:
+            if not self._queue:
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            slot = self._queue.popleft()
+            if self._config.conflate:
+                # Newer snapshots for this symbol now queue behind the running one
+                self._waiting.pop(slot.snapshot.symbol, None)
+            metrics.set_exec_queue_depth(len(self._queue))
+            started = self._clock()
+            await loop.run_in_executor(self._executor, self._process_slot, slot)
+            finished = self._clock()
+            self._stats.processed += 1
+            metrics.record_exec_processed(
+                wait_ms=(started - slot.enqueued_at) * 1000.0,
+                process_ms=(finished - started) * 1000.0,
+                age_ms=(started - slot.first_enqueued_at) * 1000.0,
+            )
+
+    def _process_slot(self, slot: _QueuedSnapshot) -> None:
+        """Engine thread: superseded snapshots (bars only), then the latest one."""
+        if slot.superseded:
+            self._engine.observe_superseded(list(slot.superseded))
+        self._engine.process_snapshot(slot.snapshot)
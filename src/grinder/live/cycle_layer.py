@@ -45,12 +45,12 @@ from grinder.reconcile.identity import (
     TP_STRATEGY_ID,
     OrderIdentityConfig,
     generate_client_order_id,
-    is_tp_order,
-    parse_client_order_id,
+    get_order_id_cache,
 )
 
 if TYPE_CHECKING:
     from grinder.account.contracts import OpenOrderSnap
+    from grinder.reconcile.identity import ParsedOrderIdCache
 
 logger = logging.getLogger(__name__)
 
@@ -104,8 +104,14 @@ class LiveCycleLayerV1:
     TP generation: opposite side, reduce_only=True, grinder_tp_ namespace.
     """
 
-    def __init__(self, config: LiveCycleConfig) -> None:
+    def __init__(
+        self,
+        config: LiveCycleConfig,
+        order_id_cache: ParsedOrderIdCache | None = None,
+    ) -> None:
         self._config = config
+        # clientOrderId parses shared with the engine and grid planner
+        self._order_ids = order_id_cache if order_id_cache is not None else get_order_id_cache()
         self._prev_orders: dict[str, OpenOrderSnap] = {}
         # TTL-based pending cancels: order_id -> ts_ms when registered
         self._pending_cancels: dict[str, int] = {}
@@ -200,7 +206,7 @@ class LiveCycleLayerV1:
         for o in open_orders:
             if o.symbol != symbol:
                 continue
-            parsed = parse_client_order_id(o.order_id)
+            parsed = self._order_ids.parse(o.order_id)
             if parsed is not None:
                 current[o.order_id] = o
 
@@ -222,7 +228,7 @@ class LiveCycleLayerV1:
                 continue
 
             # Skip TP orders (TP disappearance = filled/expired, no action)
-            if is_tp_order(oid):
+            if self._order_ids.is_tp(oid):
                 # PR-INV-3b: Clean up tp_created_ts when TP disappears
                 self._tp_created_ts.pop(oid, None)
                 self._tp_source_price.pop(oid, None)
@@ -237,7 +243,7 @@ class LiveCycleLayerV1:
 
             # Parse source order for level_id
             # Contract (P1-2): non-numeric level_id (e.g., "cleanup") -> TP level_id=0
-            parsed = parse_client_order_id(oid)
+            parsed = self._order_ids.parse(oid)
             raw_level_id = parsed.level_id if parsed else ""
             source_level_id: int = int(raw_level_id) if raw_level_id.isdigit() else 0
 
@@ -305,7 +311,7 @@ class LiveCycleLayerV1:
                     continue
                 if o.order_id in claimed_for_takeover:
                     continue
-                po = parse_client_order_id(o.order_id)
+                po = self._order_ids.parse(o.order_id)
                 if po is None or po.strategy_id != DEFAULT_STRATEGY_ID:
                     continue
                 same_side_grid.append(o)
@@ -359,7 +365,7 @@ class LiveCycleLayerV1:
 
         # --- Phase 5: Update tp_active gauge ---
         has_position = pos_qty is not None and pos_qty != 0
-        has_tp = any(is_tp_order(oid) for oid in current)
+        has_tp = any(self._order_ids.is_tp(oid) for oid in current)
         self._metrics.set_tp_active(symbol, has_position and has_tp)
 
         self._prev_orders = current
@@ -395,14 +401,14 @@ class LiveCycleLayerV1:
         tp_sum_qty = Decimal("0")
         if renew_enabled:
             for _oid, _snap in current.items():
-                if _snap.symbol == symbol and is_tp_order(_oid):
+                if _snap.symbol == symbol and self._order_ids.is_tp(_oid):
                     tp_sum_qty += _snap.qty
 
         actions: list[ExecutionAction] = []
         for oid, snap in current.items():
             if snap.symbol != symbol:
                 continue
-            if not is_tp_order(oid):
+            if not self._order_ids.is_tp(oid):
                 continue
             created_ts = self._tp_created_ts.get(oid)
             if created_ts is None:
@@ -546,7 +552,7 @@ class LiveCycleLayerV1:
         tp_price = self._compute_tp_price(fill_price, fill_side)
         self._tp_seq += 1
         # Parse old TP for level_id
-        parsed = parse_client_order_id(old_tp_id)
+        parsed = self._order_ids.parse(old_tp_id)
         level_id = int(parsed.level_id) if parsed and parsed.level_id.isdigit() else 0
         new_tp_id = generate_client_order_id(
             config=self._tp_identity,
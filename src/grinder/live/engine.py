@@ -34,13 +34,15 @@ import os
 import re
 import time
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from decimal import ROUND_DOWN, Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from grinder.account.evidence import write_evidence_bundle
-from grinder.account.syncer import AccountSyncer
+from grinder.account.index import build_account_index
+from grinder.account.metrics import get_account_sync_metrics
+from grinder.account.syncer import AccountSyncer, SyncResult
 from grinder.connectors.errors import (
     CircuitOpenError,
     ConnectorError,
@@ -57,6 +59,7 @@ from grinder.execution.fill_prob_gate import (
     FillProbVerdict,
     check_fill_prob,
 )
+from grinder.execution.port import BatchOrderResult, BatchPlaceRequest
 from grinder.execution.smart_order_router import (
     ExchangeFilters,
     MarketSnapshot,
@@ -76,12 +79,12 @@ from grinder.ml.threshold_resolver import (
     resolve_threshold_result,
     write_threshold_resolution_evidence,
 )
+from grinder.observability.stage_latency import Stage, get_latency_tracer
 from grinder.reconcile.identity import (
     DEFAULT_PREFIX,
     DEFAULT_STRATEGY_ID,
     OrderIdentityConfig,
     generate_client_order_id,
-    is_tp_order,
     parse_client_order_id,
 )
 from grinder.risk.drawdown_guard_v1 import DrawdownGuardV1
@@ -90,7 +93,11 @@ from grinder.risk.emergency_exit import EmergencyExitExecutor
 from grinder.risk.emergency_exit_metrics import get_emergency_exit_metrics
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from grinder.account.contracts import AccountSnapshot
+    from grinder.account.index import AccountIndex
+    from grinder.account.stream_state import StreamAccountState
     from grinder.contracts import Snapshot
     from grinder.execution.port import ExchangePort
     from grinder.features.engine import FeatureEngine
@@ -101,6 +108,7 @@ if TYPE_CHECKING:
     from grinder.live.fsm_driver import FsmDriver
     from grinder.live.grid_planner import LiveGridPlannerV1
     from grinder.ml.fill_model_v0 import FillModelV0
+    from grinder.observability.stage_latency import TickTrace
     from grinder.paper.engine import PaperEngine
 
 logger = logging.getLogger(__name__)
@@ -116,6 +124,9 @@ _TP_CLOSE_RETRYABLE_CODES = frozenset({-4118})
 _TP_CLOSE_MAX_RETRIES = 3  # 3 retry attempts AFTER initial failure
 _TP_CLOSE_RETRY_COOLDOWN_MS = 10_000  # 10s between retry attempts
 
+# Reasons whose actions are never batch-coalesced (atomic TP pairs, see _is_batchable)
+_BATCH_EXCLUDED_REASONS = frozenset({"TP_CLOSE", "TP_RENEW", "TP_SLOT_TAKEOVER"})
+
 
 def _extract_binance_error_code(error: str | None) -> int | None:
     """Extract numeric error code from Binance error message.
@@ -327,6 +338,7 @@ class LiveEngineV0:
         feature_engine: FeatureEngine | None = None,
         grid_planners: dict[str, LiveGridPlannerV1] | None = None,
         cycle_layer: LiveCycleLayerV1 | None = None,
+        account_stream: StreamAccountState | None = None,
     ) -> None:
         """Initialize LiveEngineV0.
 
@@ -344,6 +356,9 @@ class LiveEngineV0:
             feature_engine: Optional FeatureEngine for NATR/volatility features (PR-L0)
             grid_planners: Per-symbol grid planners for live mode (PR-L2). None = disabled.
             cycle_layer: Optional LiveCycleLayerV1 for TP generation (PR-INV-3). None = disabled.
+            account_stream: Optional user-data stream account state. Requires account
+                sync (seed + drift check); while the stream is live, REST sync runs only
+                every GRINDER_ACCOUNT_STREAM_DRIFT_CHECK_MS. None = REST polling only.
         """
         self._paper_engine = paper_engine
         self._exchange_port = exchange_port
@@ -358,9 +373,27 @@ class LiveEngineV0:
         self._feature_engine = feature_engine
         self._last_feature_snapshot: FeatureSnapshot | None = None
         self._last_snapshot: Snapshot | None = None
+        # Tick-to-order stage tracing (GRINDER_LATENCY_TRACE_SAMPLE); set while a
+        # sampled tick is in process_snapshot()
+        self._latency_tracer = get_latency_tracer()
+        self._tick_trace: TickTrace | None = None
         self._grid_planners = grid_planners
         self._cycle_layer = cycle_layer
         self._last_account_snapshot: AccountSnapshot | None = None
+        # Per-symbol view of _last_account_snapshot, rebuilt when the snapshot changes
+        self._account_index: AccountIndex | None = None
+        # User-data stream account state: fed by on_user_data_event(), REST is drift check
+        self._account_stream = account_stream
+        self._account_stream_version = -1
+        self._account_stream_drift_check_ms = (
+            parse_int(
+                "GRINDER_ACCOUNT_STREAM_DRIFT_CHECK_MS",
+                default=60_000,
+                min_value=1_000,
+                strict=False,
+            )
+            or 60_000
+        )
         # Read GRINDER_LIVE_PLANNER_ENABLED once at init (PR-L2)
         self._live_planner_env_override = parse_bool(
             "GRINDER_LIVE_PLANNER_ENABLED", default=False, strict=False
@@ -467,6 +500,19 @@ class LiveEngineV0:
         )
         # Order budget exhaustion latch: suppress planner when port is dead
         self._order_budget_exhausted = False
+        # Batch coalescing: same-symbol PLACE/CANCEL per tick via batchOrders (opt-in)
+        self._batch_orders_enabled = parse_bool(
+            "GRINDER_LIVE_BATCH_ORDERS", default=False, strict=False
+        )
+        if self._batch_orders_enabled and not (
+            hasattr(self._exchange_port, "place_orders_batch")
+            and hasattr(self._exchange_port, "cancel_orders_batch")
+        ):
+            logger.warning(
+                "GRINDER_LIVE_BATCH_ORDERS=1 but port lacks "
+                "place_orders_batch/cancel_orders_batch — batching disabled"
+            )
+            self._batch_orders_enabled = False
         # PR-P0-TP-CLOSE-ATOMIC: retry queue for failed TP_CLOSE PLACEs
         # key: correlation_id, value: (action, retry_count, last_attempt_ts_ms)
         # retry_count 0 = enqueued (not yet retried), exhausted at >= _TP_CLOSE_MAX_RETRIES
@@ -479,8 +525,21 @@ class LiveEngineV0:
                 and hasattr(port, "place_market_order")
                 and hasattr(port, "get_positions")
             ):
-                self._emergency_exit_executor = EmergencyExitExecutor(port)  # type: ignore[arg-type]
-                logger.info("RISK-EE-1: EmergencyExitExecutor enabled")
+                # Per-symbol cancel/flatten/verify fan-out (1 = serial phases)
+                ee_workers = (
+                    parse_int(
+                        "GRINDER_EMERGENCY_EXIT_WORKERS",
+                        default=1,
+                        min_value=1,
+                        strict=False,
+                    )
+                    or 1
+                )
+                self._emergency_exit_executor = EmergencyExitExecutor(
+                    port,  # type: ignore[arg-type]
+                    max_workers=ee_workers,
+                )
+                logger.info("RISK-EE-1: EmergencyExitExecutor enabled (workers=%d)", ee_workers)
             else:
                 logger.warning(
                     "RISK-EE-1: GRINDER_EMERGENCY_EXIT_ENABLED=1 but port lacks "
@@ -577,7 +636,33 @@ class LiveEngineV0:
         """Update configuration (e.g., arm/disarm, change mode)."""
         self._config = config
 
-    def process_snapshot(self, snapshot: Snapshot) -> LiveEngineOutput:  # noqa: PLR0912, PLR0915
+    def process_snapshot(self, snapshot: Snapshot) -> LiveEngineOutput:
+        """Process snapshot through paper engine and execute on live exchange.
+
+        Sampled ticks are traced stage by stage (see stage_latency).
+        """
+        trace = self._latency_tracer.begin_tick(snapshot.recv_ns, snapshot.parsed_ns)
+        if trace is None:
+            return self._process_snapshot(snapshot)
+        self._tick_trace = trace
+        try:
+            return self._process_snapshot(snapshot)
+        finally:
+            trace.finish()
+            self._tick_trace = None
+
+    def observe_superseded(self, snapshots: Sequence[Snapshot]) -> None:
+        """Feed conflated-away snapshots to FeatureEngine only (exact bar OHLC).
+
+        Called by AsyncExecutionPipeline (conflate_bars) before process_snapshot()
+        of the snapshot that replaced them. No planning, gating or orders.
+        """
+        if self._feature_engine is None:
+            return
+        for snapshot in snapshots:
+            self._feature_engine.process_snapshot(snapshot)
+
+    def _process_snapshot(self, snapshot: Snapshot) -> LiveEngineOutput:  # noqa: PLR0912, PLR0915
         """Process snapshot through paper engine and execute on live exchange.
 
         Flow:
@@ -601,6 +686,8 @@ class LiveEngineV0:
         # PR-L0: Feed FeatureEngine (must run every tick for bar building, even in FSM defer)
         if self._feature_engine is not None:
             self._last_feature_snapshot = self._feature_engine.process_snapshot(snapshot)
+            if self._tick_trace is not None:
+                self._tick_trace.lap(Stage.FEATURES)
 
         # Record price for toxicity gate (needs history before check, PR-A1)
         if self._toxicity_gate is not None:
@@ -665,12 +752,13 @@ class LiveEngineV0:
             )
         else:
             paper_output = self._paper_engine.process_snapshot(snapshot)
+        if self._tick_trace is not None:
+            self._tick_trace.lap(Stage.PLAN)
 
         # PR-INV-3: Cycle layer — detect fills, generate TP actions
-        if self._is_cycle_layer_enabled() and self._last_account_snapshot is not None:
-            symbol_orders = tuple(
-                o for o in self._last_account_snapshot.open_orders if o.symbol == snapshot.symbol
-            )
+        account = self._account_view()
+        if self._is_cycle_layer_enabled() and account is not None:
+            symbol_orders = account.orders(snapshot.symbol)
             # PR-TP-RENEW: pass position qty for auto-renew decision
             pos_qty = self._get_position_qty(snapshot.symbol)
             self._cycle_layer.register_cancels(raw_actions, ts_ms=snapshot.ts)  # type: ignore[union-attr]
@@ -692,7 +780,7 @@ class LiveEngineV0:
                 )
 
         # Replenish-on-TP-fill: detect position decrease → add BUY below + SELL above
-        if self._is_cycle_layer_enabled() and self._last_account_snapshot is not None:
+        if self._is_cycle_layer_enabled() and account is not None:
             pos_qty_for_anchor = self._get_position_qty(snapshot.symbol)
             self._update_grid_anchors(snapshot.symbol, pos_qty_for_anchor)
             tp_fill_event = self._detect_tp_fill_event(snapshot.symbol, pos_qty_for_anchor)
@@ -725,12 +813,22 @@ class LiveEngineV0:
             self._execute_emergency_exit(snapshot.ts)
 
         # Account sync: read-only fetch + mismatch detection (Launch-15)
-        # Throttled: at most once per _account_sync_interval_ms to avoid REST rate-limits
+        # Throttled: at most once per _account_sync_interval_ms to avoid REST rate-limits.
+        # With a seeded user-data stream, state comes from events and REST is only
+        # a slow drift check.
+        stream_live = self._refresh_account_from_stream()
         if self._is_account_sync_enabled() and snapshot.ts > 0:
+            interval_ms = (
+                self._account_stream_drift_check_ms
+                if stream_live
+                else self._account_sync_interval_ms
+            )
             elapsed = snapshot.ts - self._account_sync_last_attempt_ms
-            if elapsed >= self._account_sync_interval_ms:
+            if elapsed >= interval_ms:
                 self._account_sync_last_attempt_ms = snapshot.ts
                 self._tick_account_sync()
+        if self._tick_trace is not None:
+            self._tick_trace.lap(Stage.SYNC)
 
         # Step 2: Process actions
         live_actions: list[LiveAction] = []
@@ -748,6 +846,11 @@ class LiveEngineV0:
         # If PLACE failed, skip paired TP_SLOT_TAKEOVER CANCEL (same correlation_id).
         tp_close_place_ok: dict[str, bool] = {}
 
+        # Batch coalescing: gated PLACE/CANCEL actions waiting for one batch flush.
+        # Entries are (slot in live_actions, action, intent); flushed before any
+        # action that is not batchable and at the end of the tick.
+        pending_batch: list[tuple[int, ExecutionAction, RiskIntent]] = []
+
         for raw_action in raw_actions:
             # PaperOutput.actions is list[dict], but tests may pass ExecutionAction directly
             if isinstance(raw_action, dict):
@@ -755,6 +858,19 @@ class LiveEngineV0:
             else:
                 action = raw_action
 
+            if self._batch_orders_enabled:
+                if self._is_batchable(action):
+                    blocked, intent = self._traced_gate_action(action, snapshot.ts)
+                    if blocked is not None:
+                        live_actions.append(blocked)
+                    else:
+                        pending_batch.append((len(live_actions), action, intent))
+                        live_actions.append(
+                            LiveAction(action=action, status=LiveActionStatus.SKIPPED)
+                        )
+                    continue
+                self._flush_batch(pending_batch, live_actions, snapshot.ts)
+
             # Guard: skip TP_SLOT_TAKEOVER CANCEL if paired TP_CLOSE PLACE failed
             if (
                 action.action_type == ActionType.CANCEL
@@ -829,6 +945,8 @@ class LiveEngineV0:
                     live_action.status == LiveActionStatus.EXECUTED
                 )
 
+        self._flush_batch(pending_batch, live_actions, snapshot.ts)
+
         # Step 3: Build output
         return LiveEngineOutput(
             paper_output=paper_output,
@@ -929,11 +1047,12 @@ class LiveEngineV0:
         get_emergency_exit_metrics().record_exit(result)
 
         logger.critical(
-            "EMERGENCY EXIT %s: cancelled=%d market=%d remaining=%d",
+            "EMERGENCY EXIT %s: cancelled=%d market=%d remaining=%d duration=%.0fms",
             "SUCCESS" if result.success else "PARTIAL",
             result.orders_cancelled,
             result.market_orders_placed,
             result.positions_remaining,
+            result.duration_ms,
         )
 
     def _is_account_sync_enabled(self) -> bool:
@@ -992,7 +1111,8 @@ class LiveEngineV0:
             logger.debug("No grid planner for %s, skipping", snapshot.symbol)
             return []
 
-        if self._last_account_snapshot is None:
+        account = self._account_view()
+        if account is None:
             logger.debug("No account snapshot yet, planner returns 0 actions (safe startup)")
             return []
 
@@ -1000,11 +1120,7 @@ class LiveEngineV0:
         # PR-INV-3: Exclude TP orders from planner diff (managed by cycle layer).
         # TP orders (grinder_tp_...) parse as valid grinder orders and would be
         # matched/cancelled by the planner without this filter.
-        open_orders = tuple(
-            o
-            for o in self._last_account_snapshot.open_orders
-            if o.symbol == snapshot.symbol and not is_tp_order(o.order_id)
-        )
+        open_orders = account.grid_orders(snapshot.symbol)
 
         # Extract NATR from FeatureEngine (PR-L0)
         features = self._last_feature_snapshot
@@ -1051,6 +1167,57 @@ class LiveEngineV0:
 
         return plan_result.actions
 
+    def _refresh_account_from_stream(self) -> bool:
+        """Pick up stream-applied changes before this tick's decisions.
+
+        The stream itself is fed outside the engine (user-data WS task calling
+        StreamAccountState.apply()); this only reads its current snapshot.
+
+        Returns:
+            True if the streamed account state is live, else False.
+        """
+        stream = self._account_stream
+        if stream is None or not stream.live:
+            return False
+        if stream.version != self._account_stream_version:
+            snap = stream.snapshot()
+            if snap is not None:
+                self._last_account_snapshot = snap
+                self._position_notional_usd = AccountSyncer.compute_position_notional(snap)
+            self._account_stream_version = stream.version
+        return True
+
+    def _run_account_sync(self, syncer: AccountSyncer) -> SyncResult:
+        """One REST sync; stream events arriving meanwhile are replayed on the seed."""
+        stream = self._account_stream
+        if stream is not None:
+            stream.begin_sync()
+        result = syncer.sync()
+        if stream is not None and result.snapshot is None:
+            stream.abort_sync()
+        return result
+
+    def _reseed_account_stream(self, stream: StreamAccountState, rest: AccountSnapshot) -> None:
+        """Seed / drift-check the stream from REST and adopt the merged state.
+
+        The merged state (REST + events buffered during the sync) replaces the
+        raw REST snapshot while the stream is live. The version is read before
+        the snapshot, so an event applied in between is picked up next tick.
+        """
+        was_seeded = stream.seeded
+        drift = stream.check_drift(rest)
+        if not was_seeded:
+            logger.info("ACCOUNT_STREAM_SEEDED from REST snapshot ts=%d", rest.ts)
+        for detail in drift:
+            get_account_sync_metrics().record_mismatch("stream_drift")
+            logger.warning("ACCOUNT_STREAM_DRIFT %s", detail)
+        version = stream.version
+        merged = stream.snapshot() if stream.live else None
+        if merged is not None:
+            self._last_account_snapshot = merged
+            self._position_notional_usd = AccountSyncer.compute_position_notional(merged)
+        self._account_stream_version = version
+
     def _tick_account_sync(self) -> None:  # noqa: PLR0912
         """Run one account sync cycle (read-only).
 
@@ -1060,7 +1227,7 @@ class LiveEngineV0:
         """
         assert self._account_syncer is not None  # caller guards
 
-        result = self._account_syncer.sync()
+        result = self._run_account_sync(self._account_syncer)
 
         if result.error is not None:
             logger.warning("Account sync failed: %s", result.error)
@@ -1080,6 +1247,10 @@ class LiveEngineV0:
             # PR-L2: Store full snapshot for LiveGridPlannerV1 (open_orders as exchange truth)
             self._last_account_snapshot = result.snapshot
 
+        # User-data stream: first REST snapshot seeds it, later ones are drift checks
+        if result.snapshot is not None and self._account_stream is not None:
+            self._reseed_account_stream(self._account_stream, result.snapshot)
+
         # Evidence writing (env-gated, safe-by-default)
         if result.snapshot is not None:
             evidence_dir = write_evidence_bundle(result.snapshot, result.mismatches)
@@ -1252,19 +1423,29 @@ class LiveEngineV0:
             return False
         return any(p.qty > 0 for p in snap.positions if p.symbol == symbol)
 
+    def _account_view(self) -> AccountIndex | None:
+        """Per-symbol index of the last account snapshot (None if never synced).
+
+        Built once per snapshot; rebuilt when _last_account_snapshot is replaced.
+        """
+        snap = self._last_account_snapshot
+        if snap is None:
+            return None
+        index = self._account_index
+        if index is None or index.snapshot is not snap:
+            index = self._account_index = build_account_index(snap)
+        return index
+
     def _get_position_qty(self, symbol: str) -> Decimal | None:
         """Get absolute position quantity for symbol (PR-TP-RENEW).
 
         Returns:
             Decimal quantity (>= 0) if position found, None if no snapshot.
         """
-        snap = self._last_account_snapshot
-        if snap is None:
+        account = self._account_view()
+        if account is None:
             return None
-        for p in snap.positions:
-            if p.symbol == symbol:
-                return p.qty
-        return Decimal("0")
+        return account.position_qty(symbol)
 
     def _detect_tp_fill_event(self, symbol: str, pos_qty: Decimal | None) -> bool:
         """Detect TP fill event: position magnitude decreased.
@@ -1291,16 +1472,12 @@ class LiveEngineV0:
         """
         if pos_qty is None or pos_qty != 0:
             return
-        snap = self._last_account_snapshot
-        if snap is None:
+        account = self._account_view()
+        if account is None:
             return
         buy_prices: list[Decimal] = []
         sell_prices: list[Decimal] = []
-        for o in snap.open_orders:
-            if o.symbol != symbol:
-                continue
-            if is_tp_order(o.order_id):
-                continue
+        for o in account.grid_orders(symbol):
             if o.side.upper() == "BUY":
                 buy_prices.append(o.price)
             elif o.side.upper() == "SELL":
@@ -1328,8 +1505,8 @@ class LiveEngineV0:
         if pos_qty is None or pos_qty == 0:
             return []
 
-        snap = self._last_account_snapshot
-        if snap is None:
+        account = self._account_view()
+        if account is None:
             return []
 
         # Get grid planner config for spacing/tick/qty
@@ -1350,11 +1527,7 @@ class LiveEngineV0:
         # Collect current grid orders (exclude TPs)
         buy_prices: list[Decimal] = []
         sell_prices: list[Decimal] = []
-        for o in snap.open_orders:
-            if o.symbol != symbol:
-                continue
-            if is_tp_order(o.order_id):
-                continue
+        for o in account.grid_orders(symbol):
             if o.side.upper() == "BUY":
                 buy_prices.append(o.price)
             elif o.side.upper() == "SELL":
@@ -1563,7 +1736,7 @@ class LiveEngineV0:
         self._grid_anchor_mid[symbol] = mid_price
         return actions
 
-    def _process_action(self, action: ExecutionAction, ts: int) -> LiveAction:  # noqa: PLR0911
+    def _process_action(self, action: ExecutionAction, ts: int) -> LiveAction:
         """Process single action through safety gates and execute.
 
         Args:
@@ -1573,6 +1746,45 @@ class LiveEngineV0:
         Returns:
             LiveAction with execution result
         """
+        blocked, intent = self._traced_gate_action(action, ts)
+        if blocked is not None:
+            return blocked
+        # All gates passed - execute action
+        trace = self._tick_trace
+        if trace is None:
+            return self._execute_action(action, ts, intent)
+        start_ns = trace.now_ns()
+        live_action = self._execute_action(action, ts, intent)
+        trace.span(Stage.EXECUTE, start_ns)
+        if live_action.status == LiveActionStatus.EXECUTED:
+            trace.ack()
+        return live_action
+
+    def _traced_gate_action(
+        self, action: ExecutionAction, ts: int
+    ) -> tuple[LiveAction | None, RiskIntent]:
+        """_gate_action() timed as the gate stage when the tick is traced."""
+        trace = self._tick_trace
+        if trace is None:
+            return self._gate_action(action, ts)
+        start_ns = trace.now_ns()
+        result = self._gate_action(action, ts)
+        trace.span(Stage.GATE, start_ns)
+        return result
+
+    def _gate_action(  # noqa: PLR0911
+        self, action: ExecutionAction, ts: int
+    ) -> tuple[LiveAction | None, RiskIntent]:
+        """Run safety gates for an action without executing it.
+
+        Args:
+            action: ExecutionAction from PaperEngine or LiveGridPlanner
+            ts: Current timestamp
+
+        Returns:
+            (LiveAction, intent) if a gate blocked/skipped the action,
+            (None, intent) if it may be executed.
+        """
         # PR-INV-1: position-aware intent classification
         pos_sign = self._get_position_sign(action.symbol) if action.symbol else None
 
@@ -1589,7 +1801,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.NOT_ARMED,
                 intent=intent,
-            )
+            ), intent
 
         # Gate 2: Mode check
         if self._config.mode != SafeMode.LIVE_TRADE:
@@ -1603,7 +1815,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.MODE_NOT_LIVE_TRADE,
                 intent=intent,
-            )
+            ), intent
 
         # Gate 3: Kill-switch (blocks PLACE/REPLACE, allows CANCEL)
         if self._config.kill_switch_active and intent != RiskIntent.CANCEL:
@@ -1617,7 +1829,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.KILL_SWITCH_ACTIVE,
                 intent=intent,
-            )
+            ), intent
         # Note: CANCEL allowed even with kill-switch active
 
         # Gate 4: Symbol whitelist
@@ -1631,7 +1843,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.SYMBOL_NOT_WHITELISTED,
                 intent=intent,
-            )
+            ), intent
 
         # Gate 5: Max position cap (PR-INV-1)
         if (
@@ -1655,7 +1867,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.MAX_POSITION_EXCEEDED,
                 intent=intent,
-            )
+            ), intent
 
         # Gate 6: DrawdownGuardV1 (if configured)
         if self._drawdown_guard is not None:
@@ -1671,7 +1883,7 @@ class LiveEngineV0:
                     status=LiveActionStatus.BLOCKED,
                     block_reason=BlockReason.DRAWDOWN_BLOCKED,
                     intent=intent,
-                )
+                ), intent
 
         # Gate 7: FSM state permission (Launch-13)
         # PR-P0-REDUCEONLY-INTENT: reduce_only bypasses FSM gate — TP must
@@ -1686,7 +1898,7 @@ class LiveEngineV0:
                 status=LiveActionStatus.BLOCKED,
                 block_reason=BlockReason.FSM_STATE_BLOCKED,
                 intent=intent,
-            )
+            ), intent
 
         # Gate 8: Fill probability gate (PR-C5, PLACE/REPLACE only)
         if self._fill_model is not None and action.action_type in (
@@ -1695,7 +1907,7 @@ class LiveEngineV0:
         ):
             fill_result = self._check_fill_prob(action, intent)
             if fill_result is not None:
-                return fill_result
+                return fill_result, intent
 
         # SOR routing (Launch-14 PR2): after all safety gates, before execution
         if self._is_sor_enabled() and action.action_type in (
@@ -1704,10 +1916,9 @@ class LiveEngineV0:
         ):
             sor_result = self._apply_sor(action, ts, intent)
             if sor_result is not None:
-                return sor_result
+                return sor_result, intent
 
-        # All gates passed - execute action
-        return self._execute_action(action, ts, intent)
+        return None, intent
 
     def _is_sor_enabled(self) -> bool:
         """Check if SOR routing is active.
@@ -1958,13 +2169,220 @@ class LiveEngineV0:
         self._tp_close_retries.update(to_update)
         return results
 
-    def _execute_action(self, action: ExecutionAction, ts: int, intent: RiskIntent) -> LiveAction:  # noqa: PLR0912
+    # --- Batch coalescing (GRINDER_LIVE_BATCH_ORDERS) ---
+
+    @staticmethod
+    def _is_batchable(action: ExecutionAction) -> bool:
+        """Check if action may be coalesced into a batch request.
+
+        Only plain PLACE/CANCEL qualify. TP pairs (TP_CLOSE, TP_RENEW,
+        TP_SLOT_TAKEOVER) stay sequential: their CANCEL is skipped when the
+        paired PLACE fails, which needs the PLACE result first.
+        """
+        if action.action_type not in (ActionType.PLACE, ActionType.CANCEL):
+            return False
+        return action.reason not in _BATCH_EXCLUDED_REASONS
+
+    def _flush_batch(
+        self,
+        pending: list[tuple[int, ExecutionAction, RiskIntent]],
+        live_actions: list[LiveAction],
+        ts: int,
+    ) -> None:
+        """Execute pending batchable actions and store results in their slots.
+
+        CANCELs go first, then PLACEs (cancel-before-place keeps open-order
+        count and margin within limits), each grouped per symbol. Groups of one
+        use the single-order path. Orders that fail with a retryable error are
+        re-executed through _execute_action, with the batch counted as attempt 1
+        and PLACEs reusing the clientOrderId the batch sent.
+        """
+        if not pending:
+            return
+        trace = self._tick_trace
+        if trace is None:
+            self._flush_batch_groups(pending, live_actions, ts)
+            return
+        slots = [slot for slot, _, _ in pending]
+        start_ns = trace.now_ns()
+        self._flush_batch_groups(pending, live_actions, ts)
+        trace.span(Stage.EXECUTE, start_ns)
+        if any(live_actions[slot].status == LiveActionStatus.EXECUTED for slot in slots):
+            trace.ack()
+
+    def _flush_batch_groups(
+        self,
+        pending: list[tuple[int, ExecutionAction, RiskIntent]],
+        live_actions: list[LiveAction],
+        ts: int,
+    ) -> None:
+        """Group pending actions per (type, symbol) and execute them (see _flush_batch)."""
+        groups: dict[tuple[ActionType, str], list[tuple[int, ExecutionAction, RiskIntent]]] = {}
+        for entry in pending:
+            action = entry[1]
+            groups.setdefault((action.action_type, action.symbol), []).append(entry)
+        pending.clear()
+
+        ordered = sorted(groups.items(), key=lambda kv: kv[0][0] != ActionType.CANCEL)
+        for (action_type, symbol), entries in ordered:
+            if len(entries) == 1:
+                slot, action, intent = entries[0]
+                live_actions[slot] = self._execute_action(action, ts, intent)
+                continue
+
+            port: Any = self._exchange_port
+            results: list[BatchOrderResult]
+            try:
+                if action_type == ActionType.CANCEL:
+                    results = port.cancel_orders_batch([a.order_id for _, a, _ in entries])
+                else:
+                    results = port.place_orders_batch(
+                        [self._to_batch_place(a, ts) for _, a, _ in entries]
+                    )
+            except ConnectorError as e:
+                logger.warning(
+                    "BATCH_FALLBACK symbol=%s type=%s n=%d error=%s",
+                    symbol,
+                    action_type.value,
+                    len(entries),
+                    e,
+                )
+                results = [BatchOrderResult(error=e)] * len(entries)
+            else:
+                logger.info(
+                    "BATCH_%s symbol=%s n=%d ok=%d",
+                    action_type.value,
+                    symbol,
+                    len(entries),
+                    sum(1 for r in results if r.ok),
+                )
+
+            retries: list[tuple[int, ExecutionAction, RiskIntent]] = []
+            for (slot, action, intent), result in zip(entries, results, strict=True):
+                live_action = self._batch_result_to_live_action(action, intent, result)
+                if live_action is not None:
+                    live_actions[slot] = live_action
+                    continue
+                retry = action
+                if action.client_order_id is None and result.client_order_id is not None:
+                    # Same id as the batch: a duplicate is rejected instead of double-placed
+                    retry = replace(action, client_order_id=result.client_order_id)
+                retries.append((slot, retry, intent))
+            if retries:
+                self._retry_batch_items(retries, live_actions, ts)
+
+    def _retry_batch_items(
+        self,
+        retries: list[tuple[int, ExecutionAction, RiskIntent]],
+        live_actions: list[LiveAction],
+        ts: int,
+    ) -> None:
+        """Retry transient batch failures one by one; the batch was attempt 1."""
+        delay_ms = self._retry_policy.compute_delay_ms(1)
+        logger.warning(
+            "BATCH_RETRY n=%d attempt=2/%d retrying in %dms",
+            len(retries),
+            self._retry_policy.max_attempts,
+            delay_ms,
+        )
+        time.sleep(delay_ms / 1000.0)
+        for slot, action, intent in retries:
+            live_actions[slot] = self._execute_action(action, ts, intent, first_attempt=2)
+
+    @staticmethod
+    def _to_batch_place(action: ExecutionAction, ts: int) -> BatchPlaceRequest:
+        """Build a batch placement request from a PLACE action."""
+        assert action.side is not None, "PLACE requires side"
+        assert action.price is not None, "PLACE requires price"
+        assert action.quantity is not None, "PLACE requires quantity"
+        return BatchPlaceRequest(
+            symbol=action.symbol,
+            side=action.side,
+            price=action.price,
+            quantity=action.quantity,
+            level_id=action.level_id,
+            ts=ts,
+            reduce_only=action.reduce_only,
+            client_order_id=action.client_order_id,
+        )
+
+    def _batch_result_to_live_action(
+        self,
+        action: ExecutionAction,
+        intent: RiskIntent,
+        result: BatchOrderResult,
+    ) -> LiveAction | None:
+        """Convert one batch item result to a LiveAction (same semantics as _execute_action).
+
+        Returns:
+            None if the item failed with a retryable error and attempts remain
+            (caller retries it, see _retry_batch_items)
+        """
+        if result.error is None:
+            if action.action_type == ActionType.PLACE:
+                cid_sent = action.client_order_id or result.order_id or ""
+                self._recent_places.append((cid_sent, int(time.time() * 1000), action.symbol))
+            return LiveAction(
+                action=action,
+                status=LiveActionStatus.EXECUTED,
+                order_id=result.order_id,
+                attempts=1,
+                intent=intent,
+            )
+        if isinstance(result.error, CircuitOpenError):
+            logger.warning(
+                "Circuit breaker OPEN for %s: %s", action.action_type.value, result.error
+            )
+            return LiveAction(
+                action=action,
+                status=LiveActionStatus.FAILED,
+                block_reason=BlockReason.CIRCUIT_BREAKER_OPEN,
+                error=str(result.error),
+                attempts=1,
+                intent=intent,
+            )
+        if is_retryable(result.error, self._retry_policy):
+            if self._retry_policy.max_attempts > 1:
+                return None
+            logger.error("Max retries exceeded for %s: %s", action.action_type.value, result.error)
+            return LiveAction(
+                action=action,
+                status=LiveActionStatus.FAILED,
+                block_reason=BlockReason.MAX_RETRIES_EXCEEDED,
+                error=str(result.error),
+                attempts=1,
+                intent=intent,
+            )
+
+        error_msg = str(result.error)
+        logger.error("Non-retryable error on %s: %s", action.action_type.value, error_msg)
+        if "Order count limit reached" in error_msg and not self._order_budget_exhausted:
+            self._order_budget_exhausted = True
+            logger.warning("ORDER_BUDGET_LATCH activated — planner suppressed for remaining run")
+        return LiveAction(
+            action=action,
+            status=LiveActionStatus.FAILED,
+            block_reason=BlockReason.NON_RETRYABLE_ERROR,
+            error=error_msg,
+            attempts=1,
+            intent=intent,
+        )
+
+    def _execute_action(  # noqa: PLR0912
+        self,
+        action: ExecutionAction,
+        ts: int,
+        intent: RiskIntent,
+        *,
+        first_attempt: int = 1,
+    ) -> LiveAction:
         """Execute action on exchange port with retries.
 
         Args:
             action: ExecutionAction to execute
             ts: Current timestamp
             intent: Risk intent classification
+            first_attempt: Attempt number to start at (2 after a failed batch)
 
         Returns:
             LiveAction with execution result
@@ -2002,7 +2420,7 @@ class LiveEngineV0:
         max_attempts = self._retry_policy.max_attempts
         last_error: Exception | None = None
 
-        for attempt in range(1, max_attempts + 1):
+        for attempt in range(first_attempt, max_attempts + 1):
             try:
                 order_id = self._execute_single(action, ts)
                 live_action = LiveAction(
@@ -27,10 +27,11 @@ from grinder.controller.regime import Regime
 from grinder.core import OrderSide
 from grinder.execution.types import ActionType, ExecutionAction
 from grinder.policies.grid.adaptive import AdaptiveGridConfig, compute_step_bps
-from grinder.reconcile.identity import DEFAULT_PREFIX, parse_client_order_id
+from grinder.reconcile.identity import DEFAULT_PREFIX, get_order_id_cache
 
 if TYPE_CHECKING:
     from grinder.account.contracts import OpenOrderSnap
+    from grinder.reconcile.identity import ParsedOrderIdCache
 
 logger = logging.getLogger(__name__)
 
@@ -129,8 +130,14 @@ class LiveGridPlannerV1:
     Never calls exchange directly — actions go through LiveEngine pipeline.
     """
 
-    def __init__(self, config: LiveGridConfig) -> None:
+    def __init__(
+        self,
+        config: LiveGridConfig,
+        order_id_cache: ParsedOrderIdCache | None = None,
+    ) -> None:
         self._config = config
+        # clientOrderId parses shared with the engine and cycle layer
+        self._order_ids = order_id_cache if order_id_cache is not None else get_order_id_cache()
         # Hysteresis cache: per-symbol last plan center + timestamp
         self._last_plan_center: dict[str, Decimal] = {}
         self._last_plan_ts_ms: dict[str, int] = {}
@@ -258,7 +265,7 @@ class LiveGridPlannerV1:
 
         for order in open_orders:
             # Step C: Filter foreign orders (I6)
-            parsed = parse_client_order_id(order.order_id)
+            parsed = self._order_ids.parse(order.order_id)
             if parsed is None or not parsed.prefix.startswith(DEFAULT_PREFIX.rstrip("_")):
                 continue
 
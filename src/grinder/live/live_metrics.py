@@ -1,10 +1,19 @@
 """Live engine metrics for Prometheus /metrics endpoint (PR-ROLL-1).
 
-Tracks reduce_only enforcement events when position is open.
+Tracks reduce_only enforcement events when position is open, and queue
+back-pressure of the async execution pipeline (async_pipeline.py).
 Same singleton pattern as cycle_metrics.py / fsm_metrics.py.
 
 Metric names:
 - grinder_live_reduce_only_enforced_total{sym,side,reason}
+- grinder_live_exec_queue_depth (gauge)
+- grinder_live_exec_queue_depth_max (gauge, high-water mark)
+- grinder_live_exec_submitted_total (counter)
+- grinder_live_exec_dropped_total{sym} (counter, stale snapshots evicted when full)
+- grinder_live_exec_conflated_total{sym} (counter, queued snapshots replaced by a newer one)
+- grinder_live_exec_queue_wait_ms (gauge, last snapshot's time in queue)
+- grinder_live_exec_snapshot_age_ms (gauge, last symbol's oldest pending update -> processing)
+- grinder_live_exec_process_ms (gauge, last process_snapshot duration)
 """
 
 from __future__ import annotations
@@ -13,6 +22,14 @@ from dataclasses import dataclass, field
 
 # Metric names (stable contract)
 METRIC_REDUCE_ONLY_ENFORCED = "grinder_live_reduce_only_enforced_total"
+METRIC_EXEC_QUEUE_DEPTH = "grinder_live_exec_queue_depth"
+METRIC_EXEC_QUEUE_DEPTH_MAX = "grinder_live_exec_queue_depth_max"
+METRIC_EXEC_SUBMITTED = "grinder_live_exec_submitted_total"
+METRIC_EXEC_DROPPED = "grinder_live_exec_dropped_total"
+METRIC_EXEC_CONFLATED = "grinder_live_exec_conflated_total"
+METRIC_EXEC_QUEUE_WAIT_MS = "grinder_live_exec_queue_wait_ms"
+METRIC_EXEC_SNAPSHOT_AGE_MS = "grinder_live_exec_snapshot_age_ms"
+METRIC_EXEC_PROCESS_MS = "grinder_live_exec_process_ms"
 
 
 @dataclass
@@ -23,9 +40,26 @@ class LiveEngineMetrics:
 
     Attributes:
         reduce_only_enforced: {(sym, side, reason): count} — enforcement events.
+        exec_queue_depth: Snapshots waiting in the async execution queue.
+        exec_queue_depth_max: Highest queue depth seen.
+        exec_submitted: Snapshots submitted to the async execution queue.
+        exec_dropped: {sym: count} — stale snapshots evicted on overflow.
+        exec_conflated: {sym: count} — queued snapshots replaced by a newer one.
+        exec_queue_wait_ms: Queue wait of the last processed snapshot.
+        exec_snapshot_age_ms: Time from the symbol's first pending update to processing
+            (equals the queue wait unless the snapshot was conflated).
+        exec_process_ms: process_snapshot duration of the last snapshot.
     """
 
     reduce_only_enforced: dict[tuple[str, str, str], int] = field(default_factory=dict)
+    exec_queue_depth: int = 0
+    exec_queue_depth_max: int = 0
+    exec_submitted: int = 0
+    exec_dropped: dict[str, int] = field(default_factory=dict)
+    exec_conflated: dict[str, int] = field(default_factory=dict)
+    exec_queue_wait_ms: float = 0.0
+    exec_snapshot_age_ms: float = 0.0
+    exec_process_ms: float = 0.0
 
     def record_reduce_only_enforced(self, symbol: str, side: str, reason: str) -> None:
         """Record a reduce_only enforcement event.
@@ -38,6 +72,34 @@ class LiveEngineMetrics:
         key = (symbol, side, reason)
         self.reduce_only_enforced[key] = self.reduce_only_enforced.get(key, 0) + 1
 
+    def record_exec_submitted(self, depth: int) -> None:
+        """Record a snapshot entering the async execution queue.
+
+        Args:
+            depth: Queue depth after the submit.
+        """
+        self.exec_submitted += 1
+        self.set_exec_queue_depth(depth)
+
+    def record_exec_dropped(self, symbol: str) -> None:
+        """Record a queued snapshot evicted because the queue was full."""
+        self.exec_dropped[symbol] = self.exec_dropped.get(symbol, 0) + 1
+
+    def record_exec_conflated(self, symbol: str) -> None:
+        """Record a queued snapshot replaced by a newer one for the same symbol."""
+        self.exec_conflated[symbol] = self.exec_conflated.get(symbol, 0) + 1
+
+    def set_exec_queue_depth(self, depth: int) -> None:
+        """Set current queue depth and update the high-water mark."""
+        self.exec_queue_depth = depth
+        self.exec_queue_depth_max = max(self.exec_queue_depth_max, depth)
+
+    def record_exec_processed(self, wait_ms: float, process_ms: float, age_ms: float) -> None:
+        """Record queue wait, processing time and pending age of a drained snapshot."""
+        self.exec_queue_wait_ms = wait_ms
+        self.exec_process_ms = process_ms
+        self.exec_snapshot_age_ms = age_ms
+
     def format_metrics(self) -> list[str]:
         """Format metrics as Prometheus text exposition lines."""
         lines: list[str] = []
@@ -57,6 +119,58 @@ class LiveEngineMetrics:
         else:
             lines.append(f'{METRIC_REDUCE_ONLY_ENFORCED}{{sym="none",side="none",reason="none"}} 0')
 
+        # Async execution pipeline back-pressure
+        lines.append(f"# HELP {METRIC_EXEC_QUEUE_DEPTH} Snapshots waiting for the engine thread")
+        lines.append(f"# TYPE {METRIC_EXEC_QUEUE_DEPTH} gauge")
+        lines.append(f"{METRIC_EXEC_QUEUE_DEPTH} {self.exec_queue_depth}")
+
+        lines.append(f"# HELP {METRIC_EXEC_QUEUE_DEPTH_MAX} Highest execution queue depth seen")
+        lines.append(f"# TYPE {METRIC_EXEC_QUEUE_DEPTH_MAX} gauge")
+        lines.append(f"{METRIC_EXEC_QUEUE_DEPTH_MAX} {self.exec_queue_depth_max}")
+
+        lines.append(f"# HELP {METRIC_EXEC_SUBMITTED} Snapshots submitted to the execution queue")
+        lines.append(f"# TYPE {METRIC_EXEC_SUBMITTED} counter")
+        lines.append(f"{METRIC_EXEC_SUBMITTED} {self.exec_submitted}")
+
+        lines.append(
+            f"# HELP {METRIC_EXEC_DROPPED} Stale snapshots evicted from a full execution queue"
+        )
+        lines.append(f"# TYPE {METRIC_EXEC_DROPPED} counter")
+        if self.exec_dropped:
+            for sym, count in sorted(self.exec_dropped.items()):
+                lines.append(f'{METRIC_EXEC_DROPPED}{{sym="{sym}"}} {count}')
+        else:
+            lines.append(f'{METRIC_EXEC_DROPPED}{{sym="none"}} 0')
+
+        lines.append(
+            f"# HELP {METRIC_EXEC_CONFLATED} Queued snapshots replaced by a newer one (conflation)"
+        )
+        lines.append(f"# TYPE {METRIC_EXEC_CONFLATED} counter")
+        if self.exec_conflated:
+            for sym, count in sorted(self.exec_conflated.items()):
+                lines.append(f'{METRIC_EXEC_CONFLATED}{{sym="{sym}"}} {count}')
+        else:
+            lines.append(f'{METRIC_EXEC_CONFLATED}{{sym="none"}} 0')
+
+        lines.append(
+            f"# HELP {METRIC_EXEC_QUEUE_WAIT_MS} Queue wait of the last processed snapshot (ms)"
+        )
+        lines.append(f"# TYPE {METRIC_EXEC_QUEUE_WAIT_MS} gauge")
+        lines.append(f"{METRIC_EXEC_QUEUE_WAIT_MS} {self.exec_queue_wait_ms:.3f}")
+
+        lines.append(
+            f"# HELP {METRIC_EXEC_SNAPSHOT_AGE_MS}"
+            " First pending update to processing for the last processed symbol (ms)"
+        )
+        lines.append(f"# TYPE {METRIC_EXEC_SNAPSHOT_AGE_MS} gauge")
+        lines.append(f"{METRIC_EXEC_SNAPSHOT_AGE_MS} {self.exec_snapshot_age_ms:.3f}")
+
+        lines.append(
+            f"# HELP {METRIC_EXEC_PROCESS_MS} process_snapshot duration of the last snapshot (ms)"
+        )
+        lines.append(f"# TYPE {METRIC_EXEC_PROCESS_MS} gauge")
+        lines.append(f"{METRIC_EXEC_PROCESS_MS} {self.exec_process_ms:.3f}")
+
         return lines
 
 
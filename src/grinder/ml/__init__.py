@@ -1,15 +1,20 @@
 """ML models for parameter calibration.
 
 M8-01: MlSignalSnapshot contract for regime-based signal injection.
+MlSignalSeries: time-indexed per-symbol signal lookup for replay.
 
 See: docs/ROADMAP.md M8-ML_POLICY milestone
 """
 
 from __future__ import annotations
 
+import bisect
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 # Valid regime keys
 VALID_REGIMES = frozenset({"LOW", "MID", "HIGH"})
@@ -165,9 +170,48 @@ class MlSignalSnapshot:
         }
 
 
+class MlSignalSeries:
+    """Time-indexed ML signals for one symbol.
+
+    M8-01b SSOT selection rule: ``at(ts_ms)`` returns the signal with
+    max(signal.ts_ms) where signal.ts_ms <= ts_ms, or None.
+
+    Timestamps are kept in a parallel list built once. Lookups advance a
+    forward cursor, so a monotone replay costs O(1) amortized per call;
+    a query earlier than the previous one falls back to bisect.
+    """
+
+    __slots__ = ("_cursor", "_last_query", "_signals", "_ts")
+
+    def __init__(self, signals: Sequence[MlSignalSnapshot]) -> None:
+        """Create series from signals sorted by ts_ms ascending."""
+        self._signals = tuple(signals)
+        self._ts = [s.ts_ms for s in self._signals]
+        self._cursor = -1  # Index of the last selected signal (-1 = none)
+        self._last_query: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._signals)
+
+    def at(self, ts_ms: int) -> MlSignalSnapshot | None:
+        """Latest signal with signal.ts_ms <= ts_ms, or None."""
+        ts = self._ts
+        if self._last_query is None or ts_ms < self._last_query:
+            self._cursor = bisect.bisect_right(ts, ts_ms) - 1
+        else:
+            cursor = self._cursor
+            last = len(ts) - 1
+            while cursor < last and ts[cursor + 1] <= ts_ms:
+                cursor += 1
+            self._cursor = cursor
+        self._last_query = ts_ms
+        return self._signals[self._cursor] if self._cursor >= 0 else None
+
+
 __all__ = [
     "PROBS_SUM_BPS",
     "VALID_REGIMES",
+    "MlSignalSeries",
     "MlSignalSnapshot",
     "MlSignalValidationError",
 ]
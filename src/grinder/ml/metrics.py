@@ -4,6 +4,7 @@ Provides:
 - Reason codes for ACTIVE mode blocking (SSOT constants)
 - ML active gauge state (per-snapshot 0/1)
 - Latency histogram for inference SLO tracking (M8-02d)
+- Off-thread inference service: queue depth, drops, signal staleness
 - Prometheus metrics export
 
 Reason code priority (first match wins):
@@ -42,6 +43,13 @@ class MlInferenceMode(StrEnum):
 LATENCY_BUCKETS_MS: tuple[float, ...] = (1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0)
 
 
+class MlDropReason(StrEnum):
+    """Why the off-thread inference service dropped a request."""
+
+    QUEUE_FULL = "queue_full"  # Oldest request evicted by a newer one
+    DEADLINE = "deadline"  # Request waited longer than its deadline
+
+
 class MlBlockReason(StrEnum):
     """Reason codes for ACTIVE mode blocking (ADR-065).
 
@@ -74,6 +82,10 @@ class MlMetricsState:
         latency_samples: Histogram samples by mode {mode: [latency_ms, ...]}
         latency_sum: Sum of latency samples by mode {mode: total_ms}
         latency_count: Count of latency samples by mode {mode: count}
+        inference_queue_depth: Requests waiting in the inference service queue
+        inference_drops: Dropped requests by reason {reason: count}
+        signal_staleness_ms: Age of the last prediction used by ACTIVE (ms)
+        signal_stale_count: ACTIVE lookups with no prediction within budget
     """
 
     ml_active_on: int = 0
@@ -85,6 +97,11 @@ class MlMetricsState:
     latency_buckets: dict[str, dict[float, int]] = field(default_factory=dict)
     latency_sum: dict[str, float] = field(default_factory=dict)
     latency_count: dict[str, int] = field(default_factory=dict)
+    # Off-thread inference service
+    inference_queue_depth: int = 0
+    inference_drops: dict[str, int] = field(default_factory=dict)
+    signal_staleness_ms: int = 0
+    signal_stale_count: int = 0
 
 
 # Module-level state for ML metrics (updated per-snapshot)
@@ -157,6 +174,31 @@ def record_ml_inference_latency(latency_ms: float, mode: MlInferenceMode) -> Non
     state.latency_count[mode_key] += 1
 
 
+def set_ml_inference_queue_depth(depth: int) -> None:
+    """Update inference service queue depth gauge."""
+    get_ml_metrics_state().inference_queue_depth = depth
+
+
+def record_ml_inference_drop(reason: MlDropReason) -> None:
+    """Record a request dropped by the inference service."""
+    state = get_ml_metrics_state()
+    state.inference_drops[reason.value] = state.inference_drops.get(reason.value, 0) + 1
+
+
+def record_ml_signal_staleness(staleness_ms: int | None) -> None:
+    """Record the age of the prediction used by ACTIVE mode.
+
+    Args:
+        staleness_ms: Snapshot ts minus prediction ts, or None if no
+            prediction was within the staleness budget (fail-closed).
+    """
+    state = get_ml_metrics_state()
+    if staleness_ms is None:
+        state.signal_stale_count += 1
+    else:
+        state.signal_staleness_ms = staleness_ms
+
+
 def reset_ml_metrics_state() -> None:
     """Reset ML metrics state (for testing)."""
     _ml_state[0] = None
@@ -194,6 +236,30 @@ def ml_metrics_to_prometheus_lines() -> list[str]:
         ]
     )
 
+    # Off-thread inference service
+    lines.extend(
+        [
+            "# HELP grinder_ml_inference_queue_depth Requests waiting for off-thread inference",
+            "# TYPE grinder_ml_inference_queue_depth gauge",
+            f"grinder_ml_inference_queue_depth {state.inference_queue_depth}",
+            "# HELP grinder_ml_inference_dropped_total Inference requests dropped by reason",
+            "# TYPE grinder_ml_inference_dropped_total counter",
+        ]
+    )
+    for drop_reason in MlDropReason:
+        count = state.inference_drops.get(drop_reason.value, 0)
+        lines.append(f'grinder_ml_inference_dropped_total{{reason="{drop_reason.value}"}} {count}')
+    lines.extend(
+        [
+            "# HELP grinder_ml_signal_staleness_ms Age of the last prediction used by ACTIVE mode",
+            "# TYPE grinder_ml_signal_staleness_ms gauge",
+            f"grinder_ml_signal_staleness_ms {state.signal_staleness_ms}",
+            "# HELP grinder_ml_signal_stale_total ACTIVE lookups with no prediction within budget",
+            "# TYPE grinder_ml_signal_stale_total counter",
+            f"grinder_ml_signal_stale_total {state.signal_stale_count}",
+        ]
+    )
+
     # Latency histogram (M8-02d)
     lines.extend(
         [
@@ -6,7 +6,8 @@ M8-02b: Shadow mode inference.
 This module provides:
 - OnnxArtifactManifest: Manifest schema for ONNX artifacts
 - OnnxArtifact: Loaded and validated artifact
-- OnnxMlModel: ONNX model for regime prediction
+- OnnxMlModel: ONNX model for regime prediction (single-row and batched)
+- MlInferenceService: off-thread inference with bounded queue and deadlines
 - load_artifact(): Main entry point for loading artifacts
 - ONNX_AVAILABLE: Whether onnxruntime is installed
 - Error types for specific failure modes
@@ -15,8 +16,9 @@ This module provides:
 from __future__ import annotations
 
 from .artifact import load_artifact, load_manifest, validate_checksums
-from .features import FEATURE_ORDER, vectorize
-from .model import OnnxMlModel, OnnxModelError
+from .features import FEATURE_ORDER, vectorize, vectorize_batch
+from .inference_service import MlInferenceService
+from .model import MlInferenceRequest, OnnxMlModel, OnnxModelError
 from .runtime import ONNX_AVAILABLE, OnnxRuntimeError, OnnxSession
 from .types import (
     ARTIFACT_SCHEMA_VERSION,
@@ -34,6 +36,8 @@ __all__ = [
     "ARTIFACT_SCHEMA_VERSIONS",
     "FEATURE_ORDER",
     "ONNX_AVAILABLE",
+    "MlInferenceRequest",
+    "MlInferenceService",
     "OnnxArtifact",
     "OnnxArtifactError",
     "OnnxArtifactManifest",
@@ -48,4 +52,5 @@ __all__ = [
     "load_manifest",
     "validate_checksums",
     "vectorize",
+    "vectorize_batch",
 ]
@@ -1,6 +1,6 @@
 """Feature vectorization for ONNX models.
 
-M8-02b: Convert policy_features dict to fixed-order numpy array.
+M8-02b: Convert policy_features (dict or PolicyFeatures view) to fixed-order numpy array.
 
 SSOT: FEATURE_ORDER defines the exact order of features expected by models.
 Missing features are filled with 0.0.
@@ -8,10 +8,13 @@ Missing features are filled with 0.0.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 # SSOT: Feature order for ONNX model input
 # This must match the order used during model training
 FEATURE_ORDER: tuple[str, ...] = (
@@ -39,11 +42,19 @@ FEATURE_ORDER: tuple[str, ...] = (
 )
 
 
-def vectorize(policy_features: dict[str, Any]) -> np.ndarray:
-    """Convert policy_features dict to fixed-order float array.
+def _as_float(value: Any) -> float:
+    """Numeric feature value as float; anything else (None, Decimal, str) -> 0.0."""
+    # Convert to float, handling various numeric types
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+    return 0.0
+
+
+def vectorize(policy_features: Mapping[str, Any]) -> np.ndarray:
+    """Convert policy_features mapping to fixed-order float array.
 
     Args:
-        policy_features: Dict of feature name -> value.
+        policy_features: Feature name -> value (dict or PolicyFeatures).
 
     Returns:
         1D numpy array of shape (len(FEATURE_ORDER),) with float32 values.
@@ -55,16 +66,26 @@ def vectorize(policy_features: dict[str, Any]) -> np.ndarray:
         >>> vec.shape
         (15,)
     """
-    result = np.zeros(len(FEATURE_ORDER), dtype=np.float32)
+    get = policy_features.get
+    return np.array([_as_float(get(name)) for name in FEATURE_ORDER], dtype=np.float32)
+
 
-    for i, name in enumerate(FEATURE_ORDER):
-        if name in policy_features:
-            value = policy_features[name]
-            # Convert to float, handling various numeric types
-            if isinstance(value, (int, float, np.number)):
-                result[i] = float(value)
+def vectorize_batch(rows: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """Convert several policy_features dicts to one float matrix.
 
-    return result
+    Args:
+        rows: Policy feature dicts, one per model input row.
+
+    Returns:
+        2D numpy array of shape (len(rows), len(FEATURE_ORDER)) with float32
+        values; row i equals vectorize(rows[i]).
+    """
+    if not rows:
+        return np.zeros((0, len(FEATURE_ORDER)), dtype=np.float32)
+    return np.array(
+        [[_as_float(row.get(name)) for name in FEATURE_ORDER] for row in rows],
+        dtype=np.float32,
+    )
 
 
 def unvectorize(arr: np.ndarray) -> dict[str, float]:
@@ -85,4 +106,5 @@ __all__ = [
     "FEATURE_ORDER",
     "unvectorize",
     "vectorize",
+    "vectorize_batch",
 ]
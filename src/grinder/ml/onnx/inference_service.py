@@ -0,0 +1,238 @@
+"""Off-thread ML inference service.
+
+Moves ONNX inference off the trading path: callers submit requests to a
+bounded queue and read the freshest completed prediction; they never wait
+on the model.
+
+Design:
+- One daemon worker thread drains the queue and runs each drain as a
+  single predict_batch() call (see OnnxMlModel.predict_batch)
+- Bounded queue: when full, the oldest request is evicted (drop reason
+  queue_full), so the newest market state always gets inferred
+- Per-request deadline: requests that waited longer than deadline_ms
+  before the worker picked them up are dropped (drop reason deadline)
+- Results: latest prediction per symbol (highest ts_ms wins); freshest()
+  applies a staleness budget in the snapshot time domain
+
+Thread-safety: queue and results are guarded by a single Condition.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Protocol
+
+from grinder.ml.metrics import (
+    MlDropReason,
+    MlInferenceMode,
+    record_ml_inference_drop,
+    record_ml_inference_latency,
+    set_ml_inference_queue_depth,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from grinder.ml import MlSignalSnapshot
+
+    from .model import MlInferenceRequest
+
+    # Called on the worker thread per completed row: (request, result, batch latency ms)
+    ResultCallback = Callable[[MlInferenceRequest, MlSignalSnapshot | None, float], None]
+
+logger = logging.getLogger(__name__)
+
+
+class BatchPredictor(Protocol):
+    """Model interface used by the service (OnnxMlModel)."""
+
+    def predict_batch(
+        self, requests: Sequence[MlInferenceRequest]
+    ) -> list[MlSignalSnapshot | None]: ...
+
+
+class MlInferenceService:
+    """Bounded-queue inference worker with freshest-result lookup.
+
+    Usage:
+        service = MlInferenceService(model, mode=MlInferenceMode.ACTIVE)
+        service.start()
+        service.submit(MlInferenceRequest(ts, symbol, features))   # never blocks
+        signal = service.freshest(symbol, ts, max_staleness_ms=1000)  # None = fail closed
+        service.stop()
+    """
+
+    def __init__(
+        self,
+        model: BatchPredictor,
+        *,
+        mode: MlInferenceMode,
+        max_queue: int = 64,
+        deadline_ms: int = 50,
+        max_batch: int = 32,
+        on_result: ResultCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize service (call start() to launch the worker).
+
+        Args:
+            model: Predictor with predict_batch()
+            mode: Latency histogram label for record_ml_inference_latency
+            max_queue: Max queued requests before the oldest is evicted
+            deadline_ms: Max wait in queue before a request is dropped
+            max_batch: Max rows per predict_batch() call
+            on_result: Optional per-row callback (runs on the worker thread)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if max_queue < 1 or max_batch < 1:
+            raise ValueError("max_queue and max_batch must be >= 1")
+        self._model = model
+        self._mode = mode
+        self._max_queue = max_queue
+        self._deadline_s = deadline_ms / 1000.0
+        self._max_batch = max_batch
+        self._on_result = on_result
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        self._queue: deque[tuple[MlInferenceRequest, float]] = deque()
+        self._latest: dict[str, MlSignalSnapshot] = {}
+        self._busy = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)."""
+        if self.is_running:
+            return
+        with self._cond:
+            self._stopping = False
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            name="ml-inference",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        """Stop the worker; queued requests are discarded (idempotent)."""
+        with self._cond:
+            self._stopping = True
+            self._queue.clear()
+            set_ml_inference_queue_depth(0)
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout_s)
+            if self._thread.is_alive():
+                logger.warning("ML inference worker did not stop within timeout")
+            self._thread = None
+
+    def submit(self, request: MlInferenceRequest) -> None:
+        """Queue a request without blocking; evicts the oldest if full."""
+        with self._cond:
+            if len(self._queue) >= self._max_queue:
+                dropped, _ = self._queue.popleft()
+                record_ml_inference_drop(MlDropReason.QUEUE_FULL)
+                logger.debug(
+                    "ML_INFER_DROP: ts=%d symbol=%s reason=%s",
+                    dropped.ts_ms,
+                    dropped.symbol,
+                    MlDropReason.QUEUE_FULL.value,
+                )
+            self._queue.append((request, self._clock()))
+            set_ml_inference_queue_depth(len(self._queue))
+            self._cond.notify()
+
+    def latest(self, symbol: str) -> MlSignalSnapshot | None:
+        """Latest completed prediction for symbol (highest ts_ms)."""
+        with self._cond:
+            return self._latest.get(symbol)
+
+    def freshest(self, symbol: str, ts_ms: int, max_staleness_ms: int) -> MlSignalSnapshot | None:
+        """Latest prediction usable at ts_ms, or None (caller fails closed).
+
+        Usable means 0 <= ts_ms - prediction.ts_ms <= max_staleness_ms.
+        """
+        signal = self.latest(symbol)
+        if signal is None:
+            return None
+        age_ms = ts_ms - signal.ts_ms
+        if age_ms < 0 or age_ms > max_staleness_ms:
+            return None
+        return signal
+
+    def wait_idle(self, timeout_s: float = 5.0) -> bool:
+        """Block until the queue is drained and no batch is running.
+
+        For tests and shutdown only; the trading path must not call this.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: (not self._queue and not self._busy) or self._stopping,
+                timeout=timeout_s,
+            )
+
+    def _take_batch(self) -> list[MlInferenceRequest] | None:
+        """Wait for work; return live requests (None when stopping)."""
+        with self._cond:
+            self._busy = False
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: bool(self._queue) or self._stopping)
+            if self._stopping:
+                return None
+            now = self._clock()
+            batch: list[MlInferenceRequest] = []
+            while self._queue and len(batch) < self._max_batch:
+                request, submitted_at = self._queue.popleft()
+                if now - submitted_at > self._deadline_s:
+                    record_ml_inference_drop(MlDropReason.DEADLINE)
+                    logger.debug(
+                        "ML_INFER_DROP: ts=%d symbol=%s reason=%s",
+                        request.ts_ms,
+                        request.symbol,
+                        MlDropReason.DEADLINE.value,
+                    )
+                    continue
+                batch.append(request)
+            set_ml_inference_queue_depth(len(self._queue))
+            self._busy = bool(batch)
+            return batch
+
+    def _worker_loop(self) -> None:
+        """Drain queue and run batched inference until stopped."""
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            if not batch:
+                continue
+            try:
+                self._run_batch(batch)
+            except Exception:
+                logger.exception("ML inference worker error (batch rows=%d)", len(batch))
+
+    def _run_batch(self, batch: list[MlInferenceRequest]) -> None:
+        start_time = time.perf_counter()
+        results = self._model.predict_batch(batch)
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        record_ml_inference_latency(latency_ms, self._mode)
+
+        with self._cond:
+            for signal in results:
+                if signal is None:
+                    continue
+                current = self._latest.get(signal.symbol)
+                if current is None or signal.ts_ms >= current.ts_ms:
+                    self._latest[signal.symbol] = signal
+
+        if self._on_result is not None:
+            for request, signal in zip(batch, results, strict=True):
+                self._on_result(request, signal, latency_ms)
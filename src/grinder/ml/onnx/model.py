@@ -2,8 +2,15 @@
 
 M8-02b: OnnxMlModel produces MlSignalSnapshot from policy features.
 
+predict() runs one row; predict_batch() runs many rows (e.g. all symbols
+updated within a tick window) as one (n_rows, n_features) session call.
+
 Soft-fail behavior:
-- Errors during predict() return None (not raise)
+- Errors during predict() / predict_batch() return None (not raise),
+  per row for predict_batch()
+- Models with a fixed batch dimension run predict_batch() row by row
+  (checked up front from the session input shape; a failed multi-row
+  session call also falls back to one call per row)
 - Errors are logged and counted in metrics
 - This ensures the trading loop continues even if ML fails
 """
@@ -13,17 +20,19 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import numpy as np
 
 from grinder.ml import PROBS_SUM_BPS, MlSignalSnapshot
 
 from .artifact import load_artifact
-from .features import vectorize
+from .features import vectorize, vectorize_batch
 from .runtime import ONNX_AVAILABLE, OnnxRuntimeError, OnnxSession
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from .types import OnnxArtifact
 
 logger = logging.getLogger(__name__)
@@ -35,17 +44,28 @@ class OnnxModelError(Exception):
     pass
 
 
+class MlInferenceRequest(NamedTuple):
+    """One row of a batched inference call."""
+
+    ts_ms: int
+    symbol: str
+    policy_features: dict[str, Any]
+
+
 class OnnxMlModel:
     """ONNX-based ML model for regime prediction.
 
     Produces MlSignalSnapshot from policy_features dict.
 
     Model contract:
-    - Input: 1D float array of shape (len(FEATURE_ORDER),)
+    - Input: float array of shape (n_rows, len(FEATURE_ORDER))
     - Output: Dict with:
       - "regime_probs": array of shape (3,) for [LOW, MID, HIGH] probabilities
       - "spacing_multiplier": scalar spacing adjustment
 
+    Outputs carry the batch dimension first. Models exported with a fixed
+    batch size still work with predict_batch() (row-by-row fallback).
+
     Probabilities are normalized to sum to 10000 bps.
     Spacing is scaled by 1000 (1.0 -> 1000).
     """
@@ -61,6 +81,10 @@ class OnnxMlModel:
         """
         self._artifact = artifact
         self._session = session
+        # Fixed input batch size (None = dynamic); sessions without the
+        # attribute are treated as dynamic
+        batch_size = getattr(session, "batch_size", None)
+        self._fixed_batch_size = batch_size if isinstance(batch_size, int) else None
 
         # Stats for logging/metrics
         self._predict_count = 0
@@ -111,7 +135,7 @@ class OnnxMlModel:
         self,
         ts_ms: int,
         symbol: str,
-        policy_features: dict[str, Any],
+        policy_features: Mapping[str, Any],
     ) -> MlSignalSnapshot | None:
         """Run inference and return MlSignalSnapshot.
 
@@ -120,13 +144,96 @@ class OnnxMlModel:
         Args:
             ts_ms: Timestamp in milliseconds.
             symbol: Trading symbol.
-            policy_features: Dict of feature name -> value.
+            policy_features: Feature name -> value (dict or PolicyFeatures).
 
         Returns:
             MlSignalSnapshot or None if inference fails.
         """
-        start_time = time.perf_counter()
         self._predict_count += 1
+        return self._predict_one(ts_ms, symbol, policy_features)
+
+    def predict_batch(
+        self,
+        requests: Sequence[MlInferenceRequest],
+    ) -> list[MlSignalSnapshot | None]:
+        """Run one inference over all rows and fan results back out.
+
+        Soft-fail per row: a row whose outputs fail to parse yields None.
+        If the model's batch dimension is fixed, or the multi-row session
+        call fails, rows are run one by one (a row that also fails yields None).
+
+        Args:
+            requests: Rows to predict (typically one per symbol).
+
+        Returns:
+            One MlSignalSnapshot or None per request, in request order.
+        """
+        n_rows = len(requests)
+        if n_rows == 0:
+            return []
+
+        start_time = time.perf_counter()
+        self._predict_count += n_rows
+
+        if self._fixed_batch_size is not None and self._fixed_batch_size != n_rows:
+            return [self._predict_one(*request) for request in requests]
+
+        try:
+            input_array = vectorize_batch([r.policy_features for r in requests])
+            outputs = self._session.run({"input": input_array})
+        except Exception as e:
+            if n_rows > 1:
+                # e.g. INVALID_ARGUMENT from a model without a dynamic batch dim
+                logger.warning(
+                    "ONNX batch prediction failed: rows=%d error=%s, running row-by-row",
+                    n_rows,
+                    str(e),
+                )
+                return [self._predict_one(*request) for request in requests]
+            self._predict_errors += n_rows
+            logger.warning(
+                "ONNX batch prediction failed: rows=%d error=%s latency_ms=%.2f",
+                n_rows,
+                str(e),
+                (time.perf_counter() - start_time) * 1000,
+            )
+            return [None] * n_rows
+
+        row_outputs = _split_rows(outputs, n_rows)
+        if row_outputs is None:
+            # Model without a dynamic batch dimension: one call per row
+            logger.debug("ONNX outputs not batched (rows=%d), running row-by-row", n_rows)
+            return [self._predict_one(*request) for request in requests]
+
+        results: list[MlSignalSnapshot | None] = []
+        for request, row in zip(requests, row_outputs, strict=True):
+            try:
+                results.append(self._parse_outputs(request.ts_ms, request.symbol, row))
+            except Exception as e:
+                self._predict_errors += 1
+                logger.warning(
+                    "ONNX prediction failed: symbol=%s error=%s (batch rows=%d)",
+                    request.symbol,
+                    str(e),
+                    n_rows,
+                )
+                results.append(None)
+
+        logger.debug(
+            "ONNX batch prediction: rows=%d latency_ms=%.2f",
+            n_rows,
+            (time.perf_counter() - start_time) * 1000,
+        )
+        return results
+
+    def _predict_one(
+        self,
+        ts_ms: int,
+        symbol: str,
+        policy_features: Mapping[str, Any],
+    ) -> MlSignalSnapshot | None:
+        """Single-row inference (soft-fail); caller counts the prediction."""
+        start_time = time.perf_counter()
 
         try:
             # Vectorize features
@@ -234,7 +341,20 @@ class OnnxMlModel:
         )
 
 
+def _split_rows(outputs: dict[str, Any], n_rows: int) -> list[dict[str, Any]] | None:
+    """Split batched outputs into per-row output dicts.
+
+    Returns None if any output lacks a leading batch dimension of n_rows.
+    """
+    arrays = {name: np.asarray(value) for name, value in outputs.items()}
+    for arr in arrays.values():
+        if arr.ndim == 0 or arr.shape[0] != n_rows:
+            return None
+    return [{name: arr[i] for name, arr in arrays.items()} for i in range(n_rows)]
+
+
 __all__ = [
+    "MlInferenceRequest",
     "OnnxMlModel",
     "OnnxModelError",
 ]
@@ -71,8 +71,12 @@ class OnnxSession:
             )
 
             # Cache input/output metadata
-            self._input_names = [inp.name for inp in self._session.get_inputs()]
+            inputs = self._session.get_inputs()
+            self._input_names = [inp.name for inp in inputs]
             self._output_names = [out.name for out in self._session.get_outputs()]
+            # Symbolic/None leading dim = dynamic batch; int = fixed batch size
+            batch_dim = inputs[0].shape[0] if inputs and inputs[0].shape else None
+            self._batch_size = batch_dim if isinstance(batch_dim, int) else None
 
             logger.info(
                 "ONNX session loaded: %s (inputs=%s, outputs=%s)",
@@ -94,6 +98,11 @@ class OnnxSession:
         """Get output tensor names."""
         return self._output_names
 
+    @property
+    def batch_size(self) -> int | None:
+        """Fixed batch dimension of the first input (None if dynamic)."""
+        return self._batch_size
+
     def run(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Run inference with given inputs.
 
@@ -5,6 +5,7 @@ Wraps httpx.AsyncClient with:
 - Optional retries (disabled by default; enabled via ``LATENCY_RETRY_ENABLED=1``)
 - Structured result with telemetry (attempts, elapsed_ms, reason)
 - Metrics recording via latency_metrics module
+- Optional exchange weight budget (net.weight_budget), applied per attempt
 
 Design:
 - No behavior change by default (``enabled=False`` → pass-through).
@@ -35,6 +36,8 @@ if TYPE_CHECKING:
 
     import httpx
 
+    from grinder.net.weight_budget import WeightBudget
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,6 +119,7 @@ class MeasuredHttpClient:
         clock: Callable[[], float] | None = None,
         sleep_func: Callable[[float], Awaitable[None]] | None = None,
         metrics_recorder: Callable[[str, str, int, int], None] | None = None,
+        weight_budget: WeightBudget | None = None,
     ) -> None:
         """Initialize measured HTTP client.
 
@@ -128,6 +132,7 @@ class MeasuredHttpClient:
             sleep_func: Sleep function for retry delays (injectable for tests).
             metrics_recorder: Callback(op, status_class, attempts, elapsed_ms)
                               for recording metrics. Injected to avoid circular imports.
+            weight_budget: Shared exchange weight budget (None = no budgeting).
         """
         self._inner = inner
         self._deadline = deadline_policy or DeadlinePolicy.defaults()
@@ -136,6 +141,7 @@ class MeasuredHttpClient:
         self._clock = clock or time.monotonic
         self._sleep = sleep_func or asyncio.sleep
         self._record = metrics_recorder
+        self._weight_budget = weight_budget
 
     async def request(
         self,
@@ -161,7 +167,8 @@ class MeasuredHttpClient:
             HttpResult with response data and telemetry.
 
         Raises:
-            HttpClientError: If all retries exhausted or non-retryable error.
+            HttpClientError: If all retries exhausted or non-retryable error
+                (including weight budget rejection).
         """
         start = self._clock()
         timeout_s = self._deadline.get_deadline_s(op) if self._enabled else None
@@ -171,6 +178,9 @@ class MeasuredHttpClient:
 
         for attempt in range(max_attempts):
             try:
+                if self._weight_budget is not None:
+                    while (wait_s := self._weight_budget.admit(op, params)) > 0:
+                        await self._sleep(wait_s)
                 response = await self._inner.request(
                     method,
                     url,
@@ -179,6 +189,10 @@ class MeasuredHttpClient:
                     json=json_body,
                     timeout=timeout_s,
                 )
+                if self._weight_budget is not None:
+                    self._weight_budget.observe_response(
+                        response.status_code, dict(response.headers)
+                    )
                 elapsed_ms = int((self._clock() - start) * 1000)
                 status_class = self._status_class(response.status_code)
 
@@ -4,6 +4,8 @@ Wraps any ``HttpClient`` (from binance_port.py) with:
 - Per-op timeout from DeadlinePolicy (overrides ``timeout_ms``)
 - Optional retries with exponential backoff
 - Metrics recording via latency_metrics module
+- Optional exchange weight budget (net.weight_budget), applied per attempt
+  whenever ``op`` is set, independent of ``enabled``
 
 Design:
 - When ``enabled=False`` (default): pure pass-through, byte-for-byte same behavior.
@@ -32,6 +34,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from grinder.execution.binance_port import HttpClient, HttpResponse
+    from grinder.net.weight_budget import WeightBudget
     from grinder.observability.latency_metrics import HttpMetrics
 
 logger = logging.getLogger(__name__)
@@ -56,6 +59,7 @@ class MeasuredSyncHttpClient:
         clock: Clock function for timing (injectable for tests).
         sleep_func: Sleep function for retry delays (injectable for tests).
         metrics: HttpMetrics instance for recording.
+        weight_budget: Shared exchange weight budget (None = no budgeting).
     """
 
     def __init__(
@@ -68,6 +72,7 @@ class MeasuredSyncHttpClient:
         clock: Callable[[], float] | None = None,
         sleep_func: Callable[[float], None] | None = None,
         metrics: HttpMetrics | None = None,
+        weight_budget: WeightBudget | None = None,
     ) -> None:
         self._inner = inner
         self._deadline = deadline_policy or DeadlinePolicy.defaults()
@@ -76,6 +81,7 @@ class MeasuredSyncHttpClient:
         self._clock = clock or time.monotonic
         self._sleep = sleep_func or time.sleep
         self._metrics = metrics
+        self._weight_budget = weight_budget
 
     def request(
         self,
@@ -95,6 +101,27 @@ class MeasuredSyncHttpClient:
         with per-op deadline, retries on transient failures, records metrics.
         """
         if not self._enabled or not op:
+            return self._send(method, url, params, headers, timeout_ms=timeout_ms, op=op)
+
+        return self._measured_request(method, url, params, headers, op)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        *,
+        timeout_ms: int,
+        op: str,
+    ) -> HttpResponse:
+        """Send one attempt, waiting for weight budget admission first (if set).
+
+        Raises:
+            WeightBudgetExceededError: Budget exhausted beyond max_wait_ms
+        """
+        budget = self._weight_budget
+        if budget is None or not op:
             return self._inner.request(
                 method=method,
                 url=url,
@@ -103,8 +130,18 @@ class MeasuredSyncHttpClient:
                 timeout_ms=timeout_ms,
                 op=op,
             )
-
-        return self._measured_request(method, url, params, headers, op)
+        while (wait_s := budget.admit(op, params)) > 0:
+            self._sleep(wait_s)
+        response = self._inner.request(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            timeout_ms=timeout_ms,
+            op=op,
+        )
+        budget.observe_response(response.status_code, response.headers)
+        return response
 
     def _measured_request(
         self,
@@ -121,14 +158,7 @@ class MeasuredSyncHttpClient:
 
         for attempt in range(max_attempts):
             try:
-                response = self._inner.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    headers=headers,
-                    timeout_ms=deadline_ms,
-                    op=op,
-                )
+                response = self._send(method, url, params, headers, timeout_ms=deadline_ms, op=op)
                 elapsed_ms = int((self._clock() - start) * 1000)
                 status_class = self._status_class(response.status_code)
 
@@ -0,0 +1,200 @@
+"""Pooled keep-alive HTTP client for exchange REST calls.
+
+Implements the ``HttpClient`` Protocol from execution/binance_port.py on top
+of one long-lived ``httpx.Client``:
+
+- Connection pool with explicit sizing (max connections / keep-alive slots)
+- HTTP keep-alive with a configurable idle expiry, so orders, cancels and
+  account syncs reuse an established TCP+TLS connection instead of paying a
+  fresh handshake per call
+- Optional HTTP/2 (multiplexes concurrent requests over one connection);
+  needs the ``h2`` package and falls back to HTTP/1.1 when it is missing
+- warm_up() to open the first connection before the first order
+
+Wraps cleanly with ``build_measured_client`` (scripts/http_measured_client.py)
+or MeasuredSyncHttpClient for per-op deadlines, retries and metrics.
+
+Thread safety: httpx.Client and its pool are thread-safe, so one instance can
+be shared by the engine thread and the account syncer.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import urllib.parse
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from grinder.connectors.errors import ConnectorNonRetryableError, ConnectorTransientError
+from grinder.execution.binance_port import HttpResponse
+from grinder.execution.port_metrics import get_port_metrics
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 support is optional (pip install httpx[http2])
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PooledHttpClientConfig:
+    """Connection pool configuration.
+
+    Attributes:
+        max_connections: Max concurrent connections across all hosts
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry_s: Close idle connections after this many seconds
+        http2: Negotiate HTTP/2 when the server supports it (requires h2)
+        connect_timeout_ms: TCP+TLS connect timeout; None = use the per-request timeout_ms
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 60.0
+    http2: bool = False
+    connect_timeout_ms: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {self.max_connections}")
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ValueError(
+                "max_keepalive_connections must be between 0 and max_connections, "
+                f"got {self.max_keepalive_connections}"
+            )
+        if self.keepalive_expiry_s < 0:
+            raise ValueError(f"keepalive_expiry_s must be >= 0, got {self.keepalive_expiry_s}")
+
+
+class PooledHttpClient:
+    """HttpClient backed by a persistent, sized httpx connection pool.
+
+    Usage:
+        client = PooledHttpClient(PooledHttpClientConfig(http2=True), port_name="futures")
+        client.warm_up(f"{base_url}/fapi/v1/ping")
+        port = BinanceFuturesPort(http_client=build_measured_client(client), config=...)
+    """
+
+    def __init__(
+        self,
+        config: PooledHttpClientConfig | None = None,
+        port_name: str = "",
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        """Initialize pooled client.
+
+        Args:
+            config: Pool configuration (defaults if None)
+            port_name: Port identifier for port metrics (e.g. "futures"). Empty = no metrics.
+            transport: Custom httpx transport (testing); bypasses pool settings
+        """
+        self._config = config or PooledHttpClientConfig()
+        self.port_name = port_name
+
+        http2 = self._config.http2
+        if http2 and not H2_AVAILABLE:
+            logger.warning("HTTP2_UNAVAILABLE h2 package not installed, using HTTP/1.1")
+            http2 = False
+        self._http2 = http2
+
+        self._client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self._config.max_connections,
+                max_keepalive_connections=self._config.max_keepalive_connections,
+                keepalive_expiry=self._config.keepalive_expiry_s,
+            ),
+            transport=transport,
+        )
+
+    @property
+    def config(self) -> PooledHttpClientConfig:
+        """Pool configuration."""
+        return self._config
+
+    @property
+    def http2_enabled(self) -> bool:
+        """True if HTTP/2 was requested and is available."""
+        return self._http2
+
+    def _timeout(self, timeout_ms: int) -> httpx.Timeout:
+        timeout_s = timeout_ms / 1000.0
+        connect_ms = self._config.connect_timeout_ms
+        connect_s = connect_ms / 1000.0 if connect_ms is not None else timeout_s
+        return httpx.Timeout(timeout_s, connect=connect_s)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_ms: int = 5000,
+        op: str = "",  # noqa: ARG002 — used by MeasuredSyncHttpClient wrapper
+    ) -> HttpResponse:
+        """Execute HTTP request on a pooled connection.
+
+        Raises:
+            ConnectorTransientError: Timeout or connection failure (retryable)
+            ConnectorNonRetryableError: Any other transport/protocol error
+        """
+        route = urllib.parse.urlparse(url).path if self.port_name else ""
+        try:
+            resp = self._client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=self._timeout(timeout_ms),
+            )
+            return HttpResponse(
+                status_code=resp.status_code,
+                json_data=resp.json() if resp.content else {},
+                headers=dict(resp.headers),
+            )
+        except httpx.TimeoutException as e:
+            raise ConnectorTransientError(f"Request timeout: {e}") from e
+        except httpx.ConnectError as e:
+            raise ConnectorTransientError(f"Connection error: {e}") from e
+        except httpx.HTTPError as e:
+            raise ConnectorNonRetryableError(f"Request error: {e}") from e
+        finally:
+            if self.port_name:
+                get_port_metrics().record_http_request(self.port_name, method, route)
+
+    def warm_up(self, url: str, timeout_ms: int = 5000) -> bool:
+        """Open a pooled connection ahead of the first real request.
+
+        Issues a GET (e.g. /fapi/v1/ping) so the TCP+TLS handshake is paid at
+        startup rather than on the first order. Failures are logged, not raised.
+
+        Returns:
+            True if the request completed with a 2xx status
+        """
+        try:
+            resp = self._client.get(url, timeout=self._timeout(timeout_ms))
+        except httpx.HTTPError as e:
+            logger.warning("HTTP_WARM_UP_FAILED url=%s error=%s", url, e)
+            return False
+        return resp.is_success
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> PooledHttpClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
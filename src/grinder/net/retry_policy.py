@@ -62,6 +62,10 @@ _RETRYABLE_WRITE: frozenset[str] = frozenset(
 OP_PLACE_ORDER = "place_order"
 OP_CANCEL_ORDER = "cancel_order"
 OP_CANCEL_ALL = "cancel_all"
+OP_AMEND_ORDER = "amend_order"
+OP_PLACE_BATCH = "place_batch"
+OP_CANCEL_BATCH = "cancel_batch"
+OP_AMEND_BATCH = "amend_batch"
 OP_GET_OPEN_ORDERS = "get_open_orders"
 OP_GET_POSITIONS = "get_positions"
 OP_GET_ACCOUNT = "get_account"
@@ -69,12 +73,17 @@ OP_EXCHANGE_INFO = "exchange_info"
 OP_PING_TIME = "ping_time"
 OP_GET_USER_TRADES = "get_user_trades"
 OP_GET_ORDER_STATUS = "get_order_status"
+OP_GET_DEPTH = "get_depth"
 
 WRITE_OPS: frozenset[str] = frozenset(
     {
         OP_PLACE_ORDER,
         OP_CANCEL_ORDER,
         OP_CANCEL_ALL,
+        OP_AMEND_ORDER,
+        OP_PLACE_BATCH,
+        OP_CANCEL_BATCH,
+        OP_AMEND_BATCH,
     }
 )
 
@@ -86,6 +95,7 @@ READ_OPS: frozenset[str] = frozenset(
         OP_EXCHANGE_INFO,
         OP_PING_TIME,
         OP_GET_USER_TRADES,
+        OP_GET_DEPTH,
     }
 )
 
@@ -164,12 +174,17 @@ _DEFAULT_DEADLINES: dict[str, int] = {
     OP_PLACE_ORDER: 1500,
     OP_CANCEL_ORDER: 600,
     OP_CANCEL_ALL: 1200,  # heavier than single cancel; may need tuning with many open orders
+    OP_AMEND_ORDER: 1500,
+    OP_PLACE_BATCH: 2000,  # up to 5 orders per request
+    OP_CANCEL_BATCH: 1200,  # up to 10 cancels per request
+    OP_AMEND_BATCH: 2000,  # up to 5 amends per request
     OP_GET_OPEN_ORDERS: 2000,
     OP_GET_POSITIONS: 2500,
     OP_GET_ACCOUNT: 2500,
     OP_EXCHANGE_INFO: 5000,
     OP_PING_TIME: 800,
     OP_GET_USER_TRADES: 2500,
+    OP_GET_DEPTH: 2000,
 }
 
 
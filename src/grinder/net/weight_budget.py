@@ -0,0 +1,436 @@
+"""Exchange request-weight budget driven by Binance usage headers.
+
+Binance charges every REST call a request weight (per IP, per minute) and
+counts orders per account (per 10s and per minute). Exceeding either limit
+returns 429; continuing after a 429 escalates to a 418 IP ban. The order
+rate limiter in gating/ only counts our own orders, so this module tracks
+what the exchange actually charges:
+
+- Per-op weight table (Binance USD-M futures weights, overridable)
+- Used weight / order counts taken from ``X-MBX-USED-WEIGHT-<interval>`` and
+  ``X-MBX-ORDER-COUNT-<interval>`` response headers; local bookings cover
+  requests sent since the last header
+- Priority headroom: new placements (LOW) stop at 80% of a limit, reads and
+  amends (NORMAL) at 90%, cancels and reduce-only orders (CRITICAL) may use
+  the whole budget, so risk reduction is never starved by new orders
+- 429 / 418: every request waits out ``Retry-After`` (default 60s)
+
+Usage (MeasuredSyncHttpClient / MeasuredHttpClient call this per attempt):
+    while (wait_s := budget.admit(op, params)) > 0:
+        sleep(wait_s)                    # window reset within max_wait_ms
+    response = send()
+    budget.observe_response(response.status_code, response.headers)
+
+admit() raises WeightBudgetExceededError (non-retryable, does not trip the
+circuit breaker) when the wait would exceed max_wait_ms.
+
+Thread-safety: all state is guarded by one lock; one instance is shared by
+every client talking to the same exchange (get_weight_budget()).
+No ``symbol=`` labels.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from grinder.connectors.errors import ConnectorNonRetryableError
+from grinder.net.retry_policy import (
+    OP_AMEND_BATCH,
+    OP_AMEND_ORDER,
+    OP_CANCEL_ALL,
+    OP_CANCEL_BATCH,
+    OP_CANCEL_ORDER,
+    OP_EXCHANGE_INFO,
+    OP_GET_ACCOUNT,
+    OP_GET_DEPTH,
+    OP_GET_OPEN_ORDERS,
+    OP_GET_ORDER_STATUS,
+    OP_GET_POSITIONS,
+    OP_GET_USER_TRADES,
+    OP_PING_TIME,
+    OP_PLACE_BATCH,
+    OP_PLACE_ORDER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Metric names
+METRIC_WEIGHT_USED = "grinder_exchange_weight_used"
+METRIC_ORDER_COUNT = "grinder_exchange_order_count"
+METRIC_BUDGET_THROTTLED = "grinder_weight_budget_throttled_total"
+METRIC_BUDGET_REJECTED = "grinder_weight_budget_rejected_total"
+METRIC_RATE_LIMITED = "grinder_exchange_rate_limited_total"
+
+_WEIGHT_HEADER_PREFIX = "x-mbx-used-weight-"
+_ORDER_HEADER_PREFIX = "x-mbx-order-count-"
+_INTERVAL_UNIT_S = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Binance USD-M futures request weights per op
+_DEFAULT_OP_WEIGHTS: dict[str, int] = {
+    OP_PLACE_ORDER: 1,
+    OP_CANCEL_ORDER: 1,
+    OP_CANCEL_ALL: 1,
+    OP_AMEND_ORDER: 1,
+    OP_PLACE_BATCH: 5,
+    OP_CANCEL_BATCH: 1,
+    OP_AMEND_BATCH: 5,
+    OP_GET_OPEN_ORDERS: 1,  # 40 without symbol (see WeightBudget.weight_of)
+    OP_GET_POSITIONS: 5,
+    OP_GET_ACCOUNT: 5,
+    OP_EXCHANGE_INFO: 1,
+    OP_PING_TIME: 1,
+    OP_GET_USER_TRADES: 5,
+    OP_GET_ORDER_STATUS: 1,
+    OP_GET_DEPTH: 5,  # by limit (see WeightBudget.weight_of)
+}
+_OPEN_ORDERS_ALL_SYMBOLS_WEIGHT = 40
+# /fapi/v1/depth: (max limit, weight)
+_DEPTH_WEIGHTS: tuple[tuple[int, int], ...] = ((50, 2), (100, 5), (500, 10), (1000, 20))
+
+_CANCEL_OPS: frozenset[str] = frozenset({OP_CANCEL_ORDER, OP_CANCEL_ALL, OP_CANCEL_BATCH})
+_NEW_ORDER_OPS: frozenset[str] = frozenset({OP_PLACE_ORDER, OP_PLACE_BATCH})
+_ORDER_COUNT_OPS: frozenset[str] = frozenset(
+    {OP_PLACE_ORDER, OP_PLACE_BATCH, OP_AMEND_ORDER, OP_AMEND_BATCH}
+)
+_BATCH_PARAM = {OP_PLACE_BATCH: "batchOrders", OP_AMEND_BATCH: "batchOrders"}
+
+
+class RequestPriority(IntEnum):
+    """Admission priority (lower value = more budget)."""
+
+    CRITICAL = 0  # Cancels, reduce-only / close-position orders
+    NORMAL = 1  # Reads, amends
+    LOW = 2  # New placements (add risk)
+
+
+class WeightBudgetExceededError(ConnectorNonRetryableError):
+    """Request not sent: budget exhausted for longer than max_wait_ms.
+
+    Non-retryable on purpose: retrying would only spend more weight, and the
+    default circuit-breaker trip_on ignores it.
+
+    Attributes:
+        op: Operation name
+        priority: Admission priority of the request
+        wait_ms: How long the request would have had to wait
+    """
+
+    def __init__(self, op: str, priority: RequestPriority, wait_ms: int) -> None:
+        self.op = op
+        self.priority = priority
+        self.wait_ms = wait_ms
+        super().__init__(
+            f"Weight budget exhausted for {op} (priority={priority.name}, wait={wait_ms}ms)"
+        )
+
+
+@dataclass(frozen=True)
+class WeightBudgetConfig:
+    """Limits and admission policy.
+
+    Attributes:
+        weight_limits: Request weight limit per header interval (futures: 2400/1m)
+        order_limits: Order count limit per header interval (futures: 300/10s, 1200/1m)
+        reserve_normal_pct: Share of each limit NORMAL requests leave unused
+        reserve_low_pct: Share of each limit LOW requests leave unused
+        max_wait_ms: Longest admit() wait before rejecting the request
+        default_retry_after_s: Backoff after 429/418 without a Retry-After header
+        op_weights: Per-op weight overrides (merged over the futures defaults)
+    """
+
+    weight_limits: Mapping[str, int] = field(default_factory=lambda: {"1m": 2400})
+    order_limits: Mapping[str, int] = field(default_factory=lambda: {"10s": 300, "1m": 1200})
+    reserve_normal_pct: int = 10
+    reserve_low_pct: int = 20
+    max_wait_ms: int = 1000
+    default_retry_after_s: int = 60
+    op_weights: Mapping[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if not 0 <= self.reserve_normal_pct <= self.reserve_low_pct < 100:
+            raise ValueError(
+                "need 0 <= reserve_normal_pct <= reserve_low_pct < 100, got "
+                f"{self.reserve_normal_pct}/{self.reserve_low_pct}"
+            )
+        if self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {self.max_wait_ms}")
+        for interval in (*self.weight_limits, *self.order_limits):
+            _interval_s(interval)
+
+    def reserve_pct(self, priority: RequestPriority) -> int:
+        """Share of each limit that requests of this priority leave unused."""
+        if priority == RequestPriority.LOW:
+            return self.reserve_low_pct
+        if priority == RequestPriority.NORMAL:
+            return self.reserve_normal_pct
+        return 0
+
+
+def _interval_s(interval: str) -> int:
+    """Parse a Binance header interval ("10s", "1m", "1d") to seconds."""
+    unit = _INTERVAL_UNIT_S.get(interval[-1:].lower())
+    if unit is None or not interval[:-1].isdigit():
+        raise ValueError(f"Invalid rate-limit interval: {interval!r}")
+    return int(interval[:-1]) * unit
+
+
+class _Window:
+    """Usage counter for one fixed interval (aligned like Binance's windows)."""
+
+    __slots__ = ("interval_s", "limit", "used", "window_id")
+
+    def __init__(self, interval_s: int, limit: int) -> None:
+        self.interval_s = interval_s
+        self.limit = limit
+        self.used = 0
+        self.window_id = 0
+
+    def roll(self, now: float) -> None:
+        window_id = int(now // self.interval_s)
+        if window_id != self.window_id:
+            self.window_id = window_id
+            self.used = 0
+
+    def wait_s(self, now: float, amount: int, reserve_pct: int) -> float:
+        """0 if amount fits under the priority cap, else time to the next window."""
+        cap = self.limit * (100 - reserve_pct) // 100
+        if self.used + amount <= cap:
+            return 0.0
+        return (self.window_id + 1) * self.interval_s - now
+
+
+class WeightBudget:
+    """Shared request-weight / order-count budget (see module docstring)."""
+
+    def __init__(
+        self,
+        config: WeightBudgetConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize budget.
+
+        Args:
+            config: Limits and admission policy (defaults if None)
+            clock: Wall clock in seconds; windows align to exchange time
+        """
+        self._config = config or WeightBudgetConfig()
+        self._clock = clock
+        self._weights = {**_DEFAULT_OP_WEIGHTS, **self._config.op_weights}
+        self._weight_windows = {
+            interval: _Window(_interval_s(interval), limit)
+            for interval, limit in self._config.weight_limits.items()
+        }
+        self._order_windows = {
+            interval: _Window(_interval_s(interval), limit)
+            for interval, limit in self._config.order_limits.items()
+        }
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._throttled: dict[RequestPriority, int] = {}
+        self._rejected: dict[RequestPriority, int] = {}
+        self._rate_limited: dict[int, int] = {}
+
+    @property
+    def config(self) -> WeightBudgetConfig:
+        """Budget configuration."""
+        return self._config
+
+    def weight_of(self, op: str, params: Mapping[str, Any] | None = None) -> int:
+        """Request weight of op (unknown ops weigh 1)."""
+        if op == OP_GET_OPEN_ORDERS and not (params and params.get("symbol")):
+            return _OPEN_ORDERS_ALL_SYMBOLS_WEIGHT
+        if op == OP_GET_DEPTH and params and "limit" in params:
+            limit = int(params["limit"])
+            for max_limit, weight in _DEPTH_WEIGHTS:
+                if limit <= max_limit:
+                    return weight
+            return _DEPTH_WEIGHTS[-1][1]
+        return self._weights.get(op, 1)
+
+    @staticmethod
+    def order_count_of(op: str, params: Mapping[str, Any] | None = None) -> int:
+        """Orders counted against the order-rate limits (batch = per item)."""
+        if op not in _ORDER_COUNT_OPS:
+            return 0
+        param = _BATCH_PARAM.get(op)
+        if param is None:
+            return 1
+        raw = (params or {}).get(param)
+        if not isinstance(raw, str):
+            return 1
+        try:
+            return max(1, len(json.loads(raw)))
+        except (ValueError, TypeError):
+            return 1
+
+    @staticmethod
+    def priority_of(op: str, params: Mapping[str, Any] | None = None) -> RequestPriority:
+        """Cancels and reduce-only orders first, new placements last."""
+        if op in _CANCEL_OPS:
+            return RequestPriority.CRITICAL
+        if op in _NEW_ORDER_OPS:
+            if params and (
+                str(params.get("reduceOnly", "")).lower() == "true"
+                or str(params.get("closePosition", "")).lower() == "true"
+            ):
+                return RequestPriority.CRITICAL
+            return RequestPriority.LOW
+        return RequestPriority.NORMAL
+
+    def admit(self, op: str, params: Mapping[str, Any] | None = None) -> float:
+        """Book the request if it fits, else return seconds to wait before retrying admit().
+
+        Returns:
+            0.0 when admitted (weight and orders booked), else wait in seconds
+
+        Raises:
+            WeightBudgetExceededError: If the wait exceeds max_wait_ms
+        """
+        priority = self.priority_of(op, params)
+        weight = self.weight_of(op, params)
+        orders = self.order_count_of(op, params)
+        reserve = self._config.reserve_pct(priority)
+
+        with self._lock:
+            now = self._clock()
+            wait_s = max(0.0, self._blocked_until - now)
+            for window in self._weight_windows.values():
+                window.roll(now)
+                wait_s = max(wait_s, window.wait_s(now, weight, reserve))
+            if orders:
+                for window in self._order_windows.values():
+                    window.roll(now)
+                    wait_s = max(wait_s, window.wait_s(now, orders, reserve))
+
+            if wait_s <= 0:
+                for window in self._weight_windows.values():
+                    window.used += weight
+                if orders:
+                    for window in self._order_windows.values():
+                        window.used += orders
+                return 0.0
+
+            wait_ms = int(wait_s * 1000)
+            if wait_ms > self._config.max_wait_ms:
+                self._rejected[priority] = self._rejected.get(priority, 0) + 1
+                logger.warning(
+                    "WEIGHT_BUDGET_REJECT op=%s priority=%s wait_ms=%d",
+                    op,
+                    priority.name,
+                    wait_ms,
+                )
+                raise WeightBudgetExceededError(op, priority, wait_ms)
+            self._throttled[priority] = self._throttled.get(priority, 0) + 1
+            return wait_s
+
+    def observe_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Sync usage from response headers; back off on 429 / 418."""
+        with self._lock:
+            now = self._clock()
+            for name, value in headers.items():
+                key = name.lower()
+                if key.startswith(_WEIGHT_HEADER_PREFIX):
+                    window = self._weight_windows.get(key[len(_WEIGHT_HEADER_PREFIX) :])
+                elif key.startswith(_ORDER_HEADER_PREFIX):
+                    window = self._order_windows.get(key[len(_ORDER_HEADER_PREFIX) :])
+                else:
+                    continue
+                if window is None or not value.isdigit():
+                    continue
+                window.roll(now)
+                # Exchange count is authoritative; local bookings cover in-flight requests
+                window.used = max(window.used, int(value))
+
+            if status_code in (418, 429):
+                self._rate_limited[status_code] = self._rate_limited.get(status_code, 0) + 1
+                retry_after = next(
+                    (v for k, v in headers.items() if k.lower() == "retry-after"), ""
+                )
+                backoff_s = (
+                    int(retry_after)
+                    if retry_after.isdigit()
+                    else self._config.default_retry_after_s
+                )
+                self._blocked_until = max(self._blocked_until, now + backoff_s)
+                logger.warning(
+                    "WEIGHT_BUDGET_BACKOFF status=%d retry_after_s=%d", status_code, backoff_s
+                )
+
+    def used(self, interval: str = "1m") -> int:
+        """Used request weight in the current window of interval."""
+        with self._lock:
+            window = self._weight_windows[interval]
+            window.roll(self._clock())
+            return window.used
+
+    def order_count(self, interval: str) -> int:
+        """Orders counted in the current window of interval."""
+        with self._lock:
+            window = self._order_windows[interval]
+            window.roll(self._clock())
+            return window.used
+
+    def to_prometheus_lines(self) -> list[str]:
+        """Render Prometheus text-format lines."""
+        with self._lock:
+            now = self._clock()
+            for window in (*self._weight_windows.values(), *self._order_windows.values()):
+                window.roll(now)
+            lines: list[str] = [
+                f"# HELP {METRIC_WEIGHT_USED} Exchange request weight used in the current window",
+                f"# TYPE {METRIC_WEIGHT_USED} gauge",
+            ]
+            for interval, window in sorted(self._weight_windows.items()):
+                lines.append(f'{METRIC_WEIGHT_USED}{{interval="{interval}"}} {window.used}')
+            lines.append(f"# HELP {METRIC_ORDER_COUNT} Exchange order count in the current window")
+            lines.append(f"# TYPE {METRIC_ORDER_COUNT} gauge")
+            for interval, window in sorted(self._order_windows.items()):
+                lines.append(f'{METRIC_ORDER_COUNT}{{interval="{interval}"}} {window.used}')
+
+            for metric, help_text, counts in (
+                (METRIC_BUDGET_THROTTLED, "Requests delayed by the weight budget", self._throttled),
+                (METRIC_BUDGET_REJECTED, "Requests rejected by the weight budget", self._rejected),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for priority in RequestPriority:
+                    lines.append(
+                        f'{metric}{{priority="{priority.name.lower()}"}} {counts.get(priority, 0)}'
+                    )
+
+            lines.append(f"# HELP {METRIC_RATE_LIMITED} Exchange 429/418 responses")
+            lines.append(f"# TYPE {METRIC_RATE_LIMITED} counter")
+            for status in (418, 429):
+                lines.append(
+                    f'{METRIC_RATE_LIMITED}{{status="{status}"}} {self._rate_limited.get(status, 0)}'
+                )
+            return lines
+
+
+# Global singleton
+_budget: WeightBudget | None = None
+
+
+def get_weight_budget() -> WeightBudget:
+    """Get or create the process-wide weight budget."""
+    global _budget  # noqa: PLW0603
+    if _budget is None:
+        _budget = WeightBudget()
+    return _budget
+
+
+def reset_weight_budget() -> None:
+    """Reset weight budget (for testing)."""
+    global _budget  # noqa: PLW0603
+    _budget = None
@@ -6,6 +6,7 @@ Provides:
 - build_healthz_body: Pure function for /healthz response
 - build_readyz_body: Pure function for /readyz response (HA-aware)
 - build_metrics_body: Pure function for /metrics response
+- build_metrics_response: Cached (optionally gzip) /metrics bytes for servers
 - RiskMetricsState: State container for risk metrics (kill-switch, drawdown)
 """
 
@@ -14,6 +15,7 @@ Provides:
 from grinder.observability.live_contract import (
     build_healthz_body,
     build_metrics_body,
+    build_metrics_response,
     build_readyz_body,
     get_start_time,
     reset_start_time,
@@ -49,6 +51,7 @@ __all__ = [
     "build_healthz_body",
     "build_metrics_body",
     "build_metrics_output",
+    "build_metrics_response",
     "build_readyz_body",
     "get_consecutive_loss_metrics",
     "get_risk_metrics_state",
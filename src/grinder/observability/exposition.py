@@ -0,0 +1,148 @@
+"""Cached /metrics rendering for the HTTP servers.
+
+MetricsBuilder.build() re-renders every registry on each call. Scrapes run on
+the server thread of the trading process, so render cost is taken from the
+tick loop (GIL). MetricsExposition renders the same body with:
+
+- Per-section fragment cache: a section backed by a registry that exposes
+  ``metrics_version`` (see MetricsSection.source) is re-rendered only when
+  the registry instance or its version changed. Other sections render on
+  every scrape, so output is never stale.
+- Bytes-level assembly: cached fragments are kept encoded and joined once.
+- Optional gzip (fast level, fixed mtime) when the scraper accepts it.
+- Render time exported as grinder_metrics_render_ms{encoding}.
+
+The body is byte-identical to build_metrics_output().encode().
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from grinder.observability.exposition_metrics import get_exposition_metrics
+from grinder.observability.metrics_builder import get_metrics_builder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from grinder.observability.metrics_builder import MetricsBuilder
+
+DEFAULT_GZIP_LEVEL = 1
+
+
+@dataclass(frozen=True)
+class _Fragment:
+    """Rendered section text and the registry state it was rendered from."""
+
+    source: Any
+    version: int
+    data: bytes
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """True if an Accept-Encoding header value allows gzip (q > 0)."""
+    if not accept_encoding:
+        return False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class MetricsExposition:
+    """Renders /metrics bodies with cached section fragments (see module docstring).
+
+    Thread-safety: render() holds a lock, so concurrent scrapes
+    (ThreadingHTTPServer) share the cache and never render in parallel.
+    """
+
+    def __init__(
+        self,
+        builder: MetricsBuilder | None = None,
+        *,
+        gzip_level: int = DEFAULT_GZIP_LEVEL,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize exposition.
+
+        Args:
+            builder: Section source (default: global metrics builder at render time)
+            gzip_level: zlib compression level for gzip responses (1-9)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if not 1 <= gzip_level <= 9:
+            raise ValueError("gzip_level must be in 1..9")
+        self._builder = builder
+        self._gzip_level = gzip_level
+        self._clock = clock
+        self._fragments: dict[str, _Fragment] = {}
+        self._lock = threading.Lock()
+
+    def render(self, *, use_gzip: bool = False) -> bytes:
+        """Render the /metrics body (gzip-compressed if use_gzip)."""
+        builder = self._builder if self._builder is not None else get_metrics_builder()
+        with self._lock:
+            start = self._clock()
+            parts: list[bytes] = []
+            reused = 0
+            rendered = 0
+            for section in builder.sections():
+                if section.source is None:
+                    data = "\n".join(section.render()).encode()
+                    rendered += 1
+                else:
+                    source = section.source()
+                    version = source.metrics_version
+                    cached = self._fragments.get(section.name)
+                    if cached is not None and cached.source is source and cached.version == version:
+                        data = cached.data
+                        reused += 1
+                    else:
+                        data = "\n".join(section.render()).encode()
+                        self._fragments[section.name] = _Fragment(source, version, data)
+                        rendered += 1
+                if data:
+                    parts.append(data)
+
+            body = b"\n".join(parts)
+            if use_gzip:
+                body = gzip.compress(body, compresslevel=self._gzip_level, mtime=0)
+
+            render_ms = (self._clock() - start) * 1000
+            get_exposition_metrics().record_render(
+                "gzip" if use_gzip else "identity",
+                render_ms,
+                reused=reused,
+                rendered=rendered,
+            )
+        return body
+
+
+# Global singleton
+_exposition: MetricsExposition | None = None
+
+
+def get_metrics_exposition() -> MetricsExposition:
+    """Get or create global metrics exposition."""
+    global _exposition  # noqa: PLW0603
+    if _exposition is None:
+        _exposition = MetricsExposition()
+    return _exposition
+
+
+def reset_metrics_exposition() -> None:
+    """Reset metrics exposition (for testing)."""
+    global _exposition  # noqa: PLW0603
+    _exposition = None
@@ -0,0 +1,101 @@
+"""/metrics render-time metrics.
+
+Provides Prometheus-format histogram and counters for MetricsExposition:
+- grinder_metrics_render_ms histogram {encoding,le} + _sum + _count
+- grinder_metrics_fragments_total{result}  (reused | rendered sections)
+
+encoding is ``identity`` or ``gzip``; both series are always present.
+Render time covers building the body (and compressing it for gzip), not the
+socket write.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+# Metric names (stable contract — do not rename without updating metrics_contract.py)
+METRIC_RENDER_MS = "grinder_metrics_render_ms"
+METRIC_FRAGMENTS = "grinder_metrics_fragments_total"
+
+ENCODINGS: tuple[str, ...] = ("identity", "gzip")
+
+# Fixed histogram buckets (ms); target is < 1 ms per scrape
+RENDER_BUCKETS_MS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0)
+
+
+def _empty_buckets() -> dict[str, list[int]]:
+    # Last slot = +Inf overflow
+    return {enc: [0] * (len(RENDER_BUCKETS_MS) + 1) for enc in ENCODINGS}
+
+
+@dataclass
+class ExpositionMetrics:
+    """Render-time histogram and fragment cache counters.
+
+    Thread-safe via simple list/dict operations (GIL protection).
+    """
+
+    render_buckets: dict[str, list[int]] = field(default_factory=_empty_buckets)
+    render_sum_ms: dict[str, float] = field(default_factory=lambda: dict.fromkeys(ENCODINGS, 0.0))
+    render_count: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ENCODINGS, 0))
+    fragments_reused: int = 0
+    fragments_rendered: int = 0
+
+    def record_render(self, encoding: str, render_ms: float, *, reused: int, rendered: int) -> None:
+        """Record one /metrics render.
+
+        Args:
+            encoding: "identity" or "gzip"
+            render_ms: Time to build (and compress) the body
+            reused: Sections served from the fragment cache
+            rendered: Sections rendered on this scrape
+        """
+        self.render_buckets[encoding][bisect_left(RENDER_BUCKETS_MS, render_ms)] += 1
+        self.render_sum_ms[encoding] += render_ms
+        self.render_count[encoding] += 1
+        self.fragments_reused += reused
+        self.fragments_rendered += rendered
+
+    def to_prometheus_lines(self) -> list[str]:
+        """Render Prometheus text-format lines."""
+        lines: list[str] = [
+            f"# HELP {METRIC_RENDER_MS} /metrics render time in milliseconds",
+            f"# TYPE {METRIC_RENDER_MS} histogram",
+        ]
+        for enc in ENCODINGS:
+            counts = self.render_buckets[enc]
+            cumulative = 0
+            for bucket, count in zip(RENDER_BUCKETS_MS, counts, strict=False):
+                cumulative += count
+                lines.append(
+                    f'{METRIC_RENDER_MS}_bucket{{encoding="{enc}",le="{bucket}"}} {cumulative}'
+                )
+            total = self.render_count[enc]
+            lines.append(f'{METRIC_RENDER_MS}_bucket{{encoding="{enc}",le="+Inf"}} {total}')
+            lines.append(f'{METRIC_RENDER_MS}_sum{{encoding="{enc}"}} {self.render_sum_ms[enc]}')
+            lines.append(f'{METRIC_RENDER_MS}_count{{encoding="{enc}"}} {total}')
+
+        lines.append(f"# HELP {METRIC_FRAGMENTS} /metrics sections by cache result")
+        lines.append(f"# TYPE {METRIC_FRAGMENTS} counter")
+        lines.append(f'{METRIC_FRAGMENTS}{{result="reused"}} {self.fragments_reused}')
+        lines.append(f'{METRIC_FRAGMENTS}{{result="rendered"}} {self.fragments_rendered}')
+        return lines
+
+
+# Global singleton
+_metrics: ExpositionMetrics | None = None
+
+
+def get_exposition_metrics() -> ExpositionMetrics:
+    """Get or create global exposition metrics."""
+    global _metrics  # noqa: PLW0603
+    if _metrics is None:
+        _metrics = ExpositionMetrics()
+    return _metrics
+
+
+def reset_exposition_metrics() -> None:
+    """Reset exposition metrics (for testing)."""
+    global _metrics  # noqa: PLW0603
+    _metrics = None
@@ -41,6 +41,8 @@ class HttpMetrics:
     """Prometheus counters and histogram for HTTP operations.
 
     Thread-safe via simple dict operations (GIL protection).
+    metrics_version changes on every update (cached rendering, see
+    observability/exposition.py).
     """
 
     requests: dict[tuple[str, str], int] = field(default_factory=dict)
@@ -49,21 +51,25 @@ class HttpMetrics:
     latency_buckets: dict[str, dict[float, int]] = field(default_factory=dict)
     latency_sum: dict[str, float] = field(default_factory=dict)
     latency_count: dict[str, int] = field(default_factory=dict)
+    metrics_version: int = field(default=0, repr=False, compare=False)
 
     def record_request(self, op: str, status_class: str) -> None:
         """Record an HTTP request completion."""
         key = (op, status_class)
         self.requests[key] = self.requests.get(key, 0) + 1
+        self.metrics_version += 1
 
     def record_retry(self, op: str, reason: str) -> None:
         """Record an HTTP retry event."""
         key = (op, reason)
         self.retries[key] = self.retries.get(key, 0) + 1
+        self.metrics_version += 1
 
     def record_fail(self, op: str, reason: str) -> None:
         """Record an HTTP request failure (all retries exhausted)."""
         key = (op, reason)
         self.fails[key] = self.fails.get(key, 0) + 1
+        self.metrics_version += 1
 
     def record_latency(self, op: str, latency_ms: float) -> None:
         """Record an HTTP request latency observation."""
@@ -78,6 +84,7 @@ class HttpMetrics:
 
         self.latency_sum[op] += latency_ms
         self.latency_count[op] += 1
+        self.metrics_version += 1
 
     def _histogram_lines(self) -> list[str]:
         """Render latency histogram lines."""
@@ -151,6 +158,7 @@ class HttpMetrics:
         self.latency_buckets.clear()
         self.latency_sum.clear()
         self.latency_count.clear()
+        self.metrics_version += 1
 
 
 # Global singleton
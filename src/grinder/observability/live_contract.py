@@ -19,6 +19,8 @@ GET /readyz:
 GET /metrics:
     - Status: 200
     - Content-Type: text/plain; charset=utf-8
+    - Content-Encoding: gzip if the request's Accept-Encoding allows it
+      (build_metrics_response; body is the same text, cached per section)
     - Body: Prometheus text format with required metrics:
         - grinder_up (gauge)
         - grinder_uptime_seconds (gauge)
@@ -64,6 +66,7 @@ import json
 import time
 
 from grinder.ha.role import HARole, get_ha_state
+from grinder.observability.exposition import accepts_gzip, get_metrics_exposition
 from grinder.observability.metrics_builder import build_metrics_output
 
 # Re-export from SSOT module for backward compatibility
@@ -83,6 +86,7 @@ __all__ = [
     # Functions
     "build_healthz_body",
     "build_metrics_body",
+    "build_metrics_response",
     "build_readyz_body",
     "get_start_time",
     "reset_start_time",
@@ -156,3 +160,17 @@ def build_metrics_body() -> str:
         Prometheus text format metrics.
     """
     return build_metrics_output()
+
+
+def build_metrics_response(accept_encoding: str | None = None) -> tuple[bytes, str | None]:
+    """Build /metrics response for an HTTP server.
+
+    Args:
+        accept_encoding: Request Accept-Encoding header value.
+
+    Returns:
+        Tuple of (body bytes, Content-Encoding value or None for identity).
+    """
+    use_gzip = accepts_gzip(accept_encoding)
+    body = get_metrics_exposition().render(use_gzip=use_gzip)
+    return body, "gzip" if use_gzip else None
@@ -7,6 +7,12 @@ Consolidates all metrics into a single Prometheus-compatible text output:
 - HA metrics (role)
 - Connector metrics (retries, idempotency, circuit breaker) - H5
 - HTTP latency/retry metrics (Launch-05)
+- Tick-to-order stage latency (stage_latency)
+- /metrics render time (exposition_metrics)
+
+build() renders every section on each call. The /metrics servers go through
+MetricsExposition (observability/exposition.py), which caches the text of
+sections whose registry has not changed since the previous scrape.
 """
 
 from __future__ import annotations
@@ -14,7 +20,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -31,8 +37,11 @@ from grinder.live.fsm_metrics import get_fsm_metrics
 from grinder.live.live_metrics import get_live_engine_metrics
 from grinder.ml.fill_model_loader import fill_model_metrics_to_prometheus_lines
 from grinder.ml.metrics import ml_metrics_to_prometheus_lines
+from grinder.net.weight_budget import get_weight_budget
+from grinder.observability.exposition_metrics import get_exposition_metrics
 from grinder.observability.fill_metrics import get_fill_metrics
 from grinder.observability.latency_metrics import get_http_metrics
+from grinder.observability.stage_latency import get_latency_tracer
 from grinder.reconcile.metrics import get_reconcile_metrics
 from grinder.risk.emergency_exit_metrics import get_emergency_exit_metrics
 
@@ -107,6 +116,23 @@ def reset_ready_fn() -> None:
     _ready_fn[0] = None
 
 
+@dataclass(frozen=True)
+class MetricsSection:
+    """One block of the /metrics output.
+
+    Attributes:
+        name: Section name (fragment cache key in MetricsExposition).
+        render: Renders the section's Prometheus lines.
+        source: Returns the backing registry when it exposes ``metrics_version``
+            (rendered output changes only when the version does).
+            None = section is rendered on every scrape.
+    """
+
+    name: str
+    render: Callable[[], list[str]]
+    source: Callable[[], Any] | None = None
+
+
 @dataclass
 class MetricsBuilder:
     """Builds consolidated Prometheus metrics output.
@@ -117,6 +143,55 @@ class MetricsBuilder:
 
     start_time: float = field(default_factory=time.time)
 
+    def sections(self) -> list[MetricsSection]:
+        """Output sections in exposition order."""
+        return [
+            # System metrics
+            MetricsSection("system", self._build_system_metrics),
+            # Readyz gauges (PR-ALERTS-0)
+            MetricsSection("readyz", self._build_readyz_metrics),
+            # Gating metrics
+            MetricsSection("gating", self._build_gating_metrics),
+            # Risk metrics (if available)
+            MetricsSection("risk", self._build_risk_metrics),
+            # HA metrics
+            MetricsSection("ha", self._build_ha_metrics),
+            # Connector metrics (H2/H3/H4)
+            MetricsSection("connector", self._build_connector_metrics),
+            # Reconcile metrics (LC-09b/LC-10/LC-11/LC-15b)
+            MetricsSection("reconcile", self._build_reconcile_metrics, get_reconcile_metrics),
+            # ML metrics (M8-02c-2)
+            MetricsSection("ml", self._build_ml_metrics),
+            # Data quality metrics (Launch-03)
+            MetricsSection("data_quality", self._build_data_quality_metrics),
+            # HTTP latency/retry metrics (Launch-05)
+            MetricsSection("http", self._build_http_metrics, get_http_metrics),
+            # Tick-to-order stage latency
+            MetricsSection("stage_latency", self._build_stage_latency_metrics, get_latency_tracer),
+            # Exchange request-weight budget
+            MetricsSection("weight_budget", self._build_weight_budget_metrics),
+            # Fill tracking metrics (Launch-06)
+            MetricsSection("fill", self._build_fill_metrics),
+            # FSM metrics (Launch-13)
+            MetricsSection("fsm", self._build_fsm_metrics),
+            # SOR metrics (Launch-14)
+            MetricsSection("sor", self._build_sor_metrics),
+            # Port order attempt metrics (PR-FUT-1)
+            MetricsSection("port", self._build_port_metrics),
+            # Account sync metrics (Launch-15)
+            MetricsSection("account_sync", self._build_account_sync_metrics),
+            # Fill model shadow metrics (PR-C4a)
+            MetricsSection("fill_model", self._build_fill_model_metrics),
+            # Emergency exit metrics (RISK-EE-1)
+            MetricsSection("emergency_exit", self._build_emergency_exit_metrics),
+            # Cycle layer metrics (PR-INV-3b)
+            MetricsSection("cycle", self._build_cycle_metrics),
+            # Live engine metrics (PR-ROLL-1)
+            MetricsSection("live_engine", self._build_live_engine_metrics),
+            # /metrics render time
+            MetricsSection("exposition", self._build_exposition_metrics),
+        ]
+
     def build(self) -> str:
         """Build complete metrics output in Prometheus text format.
 
@@ -124,64 +199,8 @@ class MetricsBuilder:
             Prometheus-compatible metrics text.
         """
         lines: list[str] = []
-
-        # System metrics
-        lines.extend(self._build_system_metrics())
-
-        # Readyz gauges (PR-ALERTS-0)
-        lines.extend(self._build_readyz_metrics())
-
-        # Gating metrics
-        lines.extend(self._build_gating_metrics())
-
-        # Risk metrics (if available)
-        lines.extend(self._build_risk_metrics())
-
-        # HA metrics
-        lines.extend(self._build_ha_metrics())
-
-        # Connector metrics (H2/H3/H4)
-        lines.extend(self._build_connector_metrics())
-
-        # Reconcile metrics (LC-09b/LC-10/LC-11/LC-15b)
-        lines.extend(self._build_reconcile_metrics())
-
-        # ML metrics (M8-02c-2)
-        lines.extend(self._build_ml_metrics())
-
-        # Data quality metrics (Launch-03)
-        lines.extend(self._build_data_quality_metrics())
-
-        # HTTP latency/retry metrics (Launch-05)
-        lines.extend(self._build_http_metrics())
-
-        # Fill tracking metrics (Launch-06)
-        lines.extend(self._build_fill_metrics())
-
-        # FSM metrics (Launch-13)
-        lines.extend(self._build_fsm_metrics())
-
-        # SOR metrics (Launch-14)
-        lines.extend(self._build_sor_metrics())
-
-        # Port order attempt metrics (PR-FUT-1)
-        lines.extend(self._build_port_metrics())
-
-        # Account sync metrics (Launch-15)
-        lines.extend(self._build_account_sync_metrics())
-
-        # Fill model shadow metrics (PR-C4a)
-        lines.extend(self._build_fill_model_metrics())
-
-        # Emergency exit metrics (RISK-EE-1)
-        lines.extend(self._build_emergency_exit_metrics())
-
-        # Cycle layer metrics (PR-INV-3b)
-        lines.extend(self._build_cycle_metrics())
-
-        # Live engine metrics (PR-ROLL-1)
-        lines.extend(self._build_live_engine_metrics())
-
+        for section in self.sections():
+            lines.extend(section.render())
         return "\n".join(lines)
 
     def _build_system_metrics(self) -> list[str]:
@@ -336,6 +355,14 @@ class MetricsBuilder:
         http_metrics = get_http_metrics()
         return http_metrics.to_prometheus_lines()
 
+    def _build_stage_latency_metrics(self) -> list[str]:
+        """Build tick-to-order stage latency histogram."""
+        return get_latency_tracer().to_prometheus_lines()
+
+    def _build_weight_budget_metrics(self) -> list[str]:
+        """Build exchange weight / order-count usage and budget counters."""
+        return get_weight_budget().to_prometheus_lines()
+
     def _build_fill_metrics(self) -> list[str]:
         """Build fill tracking metrics (Launch-06)."""
         fill_metrics = get_fill_metrics()
@@ -378,6 +405,10 @@ class MetricsBuilder:
         """Build live engine metrics (PR-ROLL-1)."""
         return get_live_engine_metrics().format_metrics()
 
+    def _build_exposition_metrics(self) -> list[str]:
+        """Build /metrics render-time histogram."""
+        return get_exposition_metrics().to_prometheus_lines()
+
 
 class _BuilderHolder:
     """Holder for global metrics builder instance."""
@@ -156,6 +156,34 @@ REQUIRED_METRICS_PATTERNS = [
     "grinder_http_fail_total{op=",
     "# HELP grinder_http_latency_ms",
     "# TYPE grinder_http_latency_ms",
+    # Tick-to-order stage latency tracing (all stages always emitted)
+    "# HELP grinder_latency_trace_sample_every",
+    "# TYPE grinder_latency_trace_sample_every",
+    "grinder_latency_trace_sample_every",
+    "# HELP grinder_latency_stage_ms",
+    "# TYPE grinder_latency_stage_ms",
+    'grinder_latency_stage_ms_bucket{stage="tick_to_ack",le="+Inf"}',
+    # Exchange request-weight budget
+    "# HELP grinder_exchange_weight_used",
+    "# TYPE grinder_exchange_weight_used",
+    'grinder_exchange_weight_used{interval="1m"}',
+    "# HELP grinder_exchange_order_count",
+    "# TYPE grinder_exchange_order_count",
+    "# HELP grinder_weight_budget_throttled_total",
+    "# TYPE grinder_weight_budget_throttled_total",
+    'grinder_weight_budget_throttled_total{priority="critical"}',
+    "# HELP grinder_weight_budget_rejected_total",
+    "# TYPE grinder_weight_budget_rejected_total",
+    "# HELP grinder_exchange_rate_limited_total",
+    "# TYPE grinder_exchange_rate_limited_total",
+    'grinder_exchange_rate_limited_total{status="418"}',
+    # /metrics render time
+    "# HELP grinder_metrics_render_ms",
+    "# TYPE grinder_metrics_render_ms",
+    'grinder_metrics_render_ms_bucket{encoding="gzip",le="+Inf"}',
+    "# HELP grinder_metrics_fragments_total",
+    "# TYPE grinder_metrics_fragments_total",
+    'grinder_metrics_fragments_total{result="reused"}',
     # Launch-06: Fill tracking metrics
     "# HELP grinder_fills_total",
     "# TYPE grinder_fills_total",
@@ -0,0 +1,289 @@
+"""Tick-to-order stage latency tracing.
+
+Measures where the live path spends its budget, from WS message receipt to
+the exchange ack:
+
+    ws_parse    BinanceWsConnector._parse_message (raw message -> Snapshot)
+    queue       Snapshot built -> LiveEngineV0.process_snapshot() entry
+    features    FeatureEngine.process_snapshot()
+    plan        LiveGridPlannerV1 or PaperEngine (policy + ExecutionEngine)
+    sync        Cycle layer, FSM tick, emergency exit, account sync
+    gate        Safety gates per action (_gate_action)
+    execute     Exchange call per action or batch, until the port returns
+    tick        Whole process_snapshot() call
+    tick_to_ack WS receipt -> first executed action of the tick
+
+Exported as one histogram:
+- grinder_latency_stage_ms{stage,le} + _sum + _count
+
+Design (hot path):
+- Monotonic time.perf_counter_ns(); no float math until render
+- Per-stage bucket counters preallocated at init; one bisect per observation
+- Sampling: trace every Nth tick (GRINDER_LATENCY_TRACE_SAMPLE, 0 = off).
+  Unsampled ticks cost one counter increment.
+- Receipt marks travel on the Snapshot (recv_ns / parsed_ns), so queue and
+  tick_to_ack are measured against the tick's own message even when the
+  engine runs behind the feed.
+
+Labels use ``stage`` only. No ``symbol=`` or other high-cardinality labels.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from grinder.env_parse import parse_int
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Metric names (stable contract — do not rename without updating metrics_contract.py)
+METRIC_STAGE_LATENCY = "grinder_latency_stage_ms"
+METRIC_TRACE_SAMPLE_EVERY = "grinder_latency_trace_sample_every"
+
+# Fixed histogram buckets (ms). Stages are sub-ms to tens of ms; execute and
+# tick_to_ack include the exchange round trip.
+STAGE_BUCKETS_MS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+)
+_BUCKETS_NS: tuple[int, ...] = tuple(int(b * 1_000_000) for b in STAGE_BUCKETS_MS)
+
+
+class Stage(StrEnum):
+    """Traced stage of the tick-to-order path."""
+
+    WS_PARSE = "ws_parse"
+    QUEUE = "queue"
+    FEATURES = "features"
+    PLAN = "plan"
+    SYNC = "sync"
+    GATE = "gate"
+    EXECUTE = "execute"
+    TICK = "tick"
+    TICK_TO_ACK = "tick_to_ack"
+
+
+class _StageHistogram:
+    """Preallocated bucket counters for one stage (last slot = +Inf overflow)."""
+
+    __slots__ = ("count", "counts", "sum_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKETS_NS) + 1)
+        self.sum_ns = 0
+        self.count = 0
+
+    def observe(self, dur_ns: int) -> None:
+        self.counts[bisect_left(_BUCKETS_NS, dur_ns)] += 1
+        self.sum_ns += dur_ns
+        self.count += 1
+
+
+class TickTrace:
+    """Stage laps for one sampled tick.
+
+    lap() closes the stage that started at the previous lap; span() times a
+    stage without moving the lap mark (gate/execute run interleaved per action).
+    """
+
+    __slots__ = ("_acked", "_clock_ns", "_last_ns", "_recv_ns", "_start_ns", "_tracer")
+
+    def __init__(self, tracer: LatencyTracer, recv_ns: int | None, start_ns: int) -> None:
+        self._tracer = tracer
+        self._clock_ns = tracer.clock_ns
+        self._recv_ns = recv_ns
+        self._start_ns = start_ns
+        self._last_ns = start_ns
+        self._acked = False
+
+    def lap(self, stage: Stage) -> None:
+        """Record stage as the time since the previous lap (or tick start)."""
+        now = self._clock_ns()
+        self._tracer.observe_ns(stage, now - self._last_ns)
+        self._last_ns = now
+
+    def span(self, stage: Stage, start_ns: int) -> None:
+        """Record stage as the time since start_ns (from now_ns())."""
+        self._tracer.observe_ns(stage, self._clock_ns() - start_ns)
+
+    def now_ns(self) -> int:
+        """Current monotonic time in ns (start mark for span())."""
+        return self._clock_ns()
+
+    def ack(self) -> None:
+        """Mark an exchange ack; only the first ack of the tick is recorded."""
+        if self._acked or self._recv_ns is None:
+            return
+        self._acked = True
+        self._tracer.observe_ns(Stage.TICK_TO_ACK, self._clock_ns() - self._recv_ns)
+
+    def finish(self) -> None:
+        """Record the whole tick."""
+        self._tracer.observe_ns(Stage.TICK, self._clock_ns() - self._start_ns)
+
+
+class LatencyTracer:
+    """Sampling stage timer with preallocated per-stage histograms.
+
+    Usage (one tracer per process, see get_latency_tracer()):
+        recv_ns = tracer.receipt_ns()                    # None when disabled
+        ... parse ...
+        parsed_ns = tracer.on_received(recv_ns)          # ws_parse
+        snapshot = Snapshot(..., recv_ns=recv_ns, parsed_ns=parsed_ns)
+        ...
+        trace = tracer.begin_tick(snapshot.recv_ns, snapshot.parsed_ns)  # None when not sampled
+        if trace is not None:
+            trace.lap(Stage.FEATURES)
+            trace.finish()
+
+    Thread-safety: counters use plain int updates (GIL protection), matching
+    the other metrics modules.
+    """
+
+    def __init__(
+        self,
+        sample_every: int | None = None,
+        *,
+        clock_ns: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        """Initialize tracer.
+
+        Args:
+            sample_every: Trace every Nth tick (1 = all, 0 = off).
+                None = GRINDER_LATENCY_TRACE_SAMPLE (default 0).
+            clock_ns: Monotonic clock in ns (injectable for tests)
+        """
+        if sample_every is None:
+            sample_every = (
+                parse_int("GRINDER_LATENCY_TRACE_SAMPLE", default=0, min_value=0, strict=False) or 0
+            )
+        if sample_every < 0:
+            raise ValueError("sample_every must be >= 0")
+        self.sample_every = sample_every
+        self.clock_ns = clock_ns
+        self._histograms = {stage: _StageHistogram() for stage in Stage}
+        self._tick_seq = 0
+        self._parse_seq = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True when tracing is on (sample_every > 0)."""
+        return self.sample_every > 0
+
+    def observe_ns(self, stage: Stage, dur_ns: int) -> None:
+        """Record one stage duration in ns."""
+        self._histograms[stage].observe(dur_ns)
+
+    def receipt_ns(self) -> int | None:
+        """Receipt mark for an incoming WS message (None when disabled)."""
+        return self.clock_ns() if self.sample_every > 0 else None
+
+    def on_received(self, recv_ns: int | None) -> int | None:
+        """Message parsed: record ws_parse (sampled) and return the parsed mark.
+
+        Returns:
+            Parsed mark for Snapshot.parsed_ns (None if recv_ns is None)
+        """
+        if recv_ns is None:
+            return None
+        now = self.clock_ns()
+        self._parse_seq += 1
+        if self._parse_seq >= self.sample_every:
+            self._parse_seq = 0
+            self.observe_ns(Stage.WS_PARSE, now - recv_ns)
+        return now
+
+    def begin_tick(
+        self, recv_ns: int | None = None, parsed_ns: int | None = None
+    ) -> TickTrace | None:
+        """Start tracing a tick, or None if disabled / not sampled.
+
+        Args:
+            recv_ns: Snapshot.recv_ns of the tick's message
+            parsed_ns: Snapshot.parsed_ns of the tick's message
+
+        Without marks (e.g. replayed snapshots) queue and tick_to_ack are
+        not recorded.
+        """
+        if self.sample_every <= 0:
+            return None
+        self._tick_seq += 1
+        if self._tick_seq < self.sample_every:
+            return None
+        self._tick_seq = 0
+        start_ns = self.clock_ns()
+        if parsed_ns is not None:
+            self.observe_ns(Stage.QUEUE, start_ns - parsed_ns)
+        return TickTrace(self, recv_ns, start_ns)
+
+    @property
+    def metrics_version(self) -> int:
+        """Total observations; changes whenever rendered output does (sample_every is fixed)."""
+        return sum(hist.count for hist in self._histograms.values())
+
+    def stage_count(self, stage: Stage) -> int:
+        """Number of observations for stage."""
+        return self._histograms[stage].count
+
+    def to_prometheus_lines(self) -> list[str]:
+        """Render Prometheus text-format lines (all stages, always present)."""
+        lines: list[str] = [
+            f"# HELP {METRIC_TRACE_SAMPLE_EVERY} Stage latency tracing samples every Nth tick"
+            " (0 = off)",
+            f"# TYPE {METRIC_TRACE_SAMPLE_EVERY} gauge",
+            f"{METRIC_TRACE_SAMPLE_EVERY} {self.sample_every}",
+            f"# HELP {METRIC_STAGE_LATENCY} Tick-to-order stage latency in milliseconds",
+            f"# TYPE {METRIC_STAGE_LATENCY} histogram",
+        ]
+        for stage in Stage:
+            hist = self._histograms[stage]
+            cumulative = 0
+            for bucket, count in zip(STAGE_BUCKETS_MS, hist.counts, strict=False):
+                cumulative += count
+                lines.append(
+                    f'{METRIC_STAGE_LATENCY}_bucket{{stage="{stage.value}",le="{bucket}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(
+                f'{METRIC_STAGE_LATENCY}_bucket{{stage="{stage.value}",le="+Inf"}} {hist.count}'
+            )
+            lines.append(
+                f'{METRIC_STAGE_LATENCY}_sum{{stage="{stage.value}"}} {hist.sum_ns / 1_000_000}'
+            )
+            lines.append(f'{METRIC_STAGE_LATENCY}_count{{stage="{stage.value}"}} {hist.count}')
+        return lines
+
+
+# Global singleton
+_tracer: LatencyTracer | None = None
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """Get or create global latency tracer (sampling from env on creation)."""
+    global _tracer  # noqa: PLW0603
+    if _tracer is None:
+        _tracer = LatencyTracer()
+    return _tracer
+
+
+def reset_latency_tracer() -> None:
+    """Reset latency tracer (for testing)."""
+    global _tracer  # noqa: PLW0603
+    _tracer = None
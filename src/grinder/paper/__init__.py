@@ -11,6 +11,8 @@ Provides:
 - CycleEngine: Fill → TP + replenishment for grid cycles
 - CycleIntent: Intent to place TP or replenishment order
 - CycleResult: Result from CycleEngine processing
+- run_sweep / expand_grid: Parameter sweep over one fixture (ranked SweepReport)
+- DiscardSink / JsonlSink / StreamingDigest: Streaming outputs for PaperEngine.run
 - SCHEMA_VERSION: Current output schema version
 """
 
@@ -23,18 +25,37 @@ from grinder.paper.engine import (
 )
 from grinder.paper.fills import Fill, simulate_fills
 from grinder.paper.ledger import Ledger, PnLSnapshot, PositionState
+from grinder.paper.output_sink import DiscardSink, JsonlSink, OutputSink, StreamingDigest
+from grinder.paper.sweep import (
+    SweepConfigError,
+    SweepPoint,
+    SweepReport,
+    SweepRow,
+    expand_grid,
+    run_sweep,
+)
 
 __all__ = [
     "SCHEMA_VERSION",
     "CycleEngine",
     "CycleIntent",
     "CycleResult",
+    "DiscardSink",
     "Fill",
+    "JsonlSink",
     "Ledger",
+    "OutputSink",
     "PaperEngine",
     "PaperOutput",
     "PaperResult",
     "PnLSnapshot",
     "PositionState",
+    "StreamingDigest",
+    "SweepConfigError",
+    "SweepPoint",
+    "SweepReport",
+    "SweepRow",
+    "expand_grid",
+    "run_sweep",
     "simulate_fills",
 ]
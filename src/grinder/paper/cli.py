@@ -25,7 +25,7 @@ def _load_fixture_config(fixture_dir: Path) -> dict[str, object]:
 
 def _run_fixture_mode(args: argparse.Namespace) -> None:
     """Run paper trading on fixture data."""
-    from grinder.paper import PaperEngine  # noqa: PLC0415 - lazy import
+    from grinder.paper import JsonlSink, PaperEngine  # noqa: PLC0415 - lazy import
 
     fixture_dir = Path(args.fixture)
 
@@ -43,7 +43,14 @@ def _run_fixture_mode(args: argparse.Namespace) -> None:
             print("Controller: ENABLED")
 
     engine = PaperEngine(controller_enabled=controller_enabled)
-    result = engine.run(fixture_dir)
+    if args.stream_out:
+        # Per-tick outputs streamed to JSONL, not kept in memory
+        with JsonlSink(Path(args.stream_out)) as sink:
+            result = engine.run(fixture_dir, sink=sink)
+        if args.verbose:
+            print(f"Outputs streamed to: {args.stream_out} ({sink.count} lines)")
+    else:
+        result = engine.run(fixture_dir)
 
     if args.verbose:
         print(f"Events processed: {result.events_processed}")
@@ -108,6 +115,10 @@ def main() -> None:
 
     # Fixture mode options
     parser.add_argument("--out", help="Output path for paper trading JSON (optional)")
+    parser.add_argument(
+        "--stream-out",
+        help="Stream per-tick outputs to JSONL (.gz = gzip) instead of keeping them in memory",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     # Live mode options
@@ -1,7 +1,7 @@
 """Paper trading engine with gating controls.
 
 This module provides a paper trading loop that:
-1. Loads fixture events (Snapshots)
+1. Streams fixture events (Snapshots)
 2. Applies prefilter gates
 3. Applies gating controls (rate limit, risk limits)
 4. Evaluates policy to get GridPlan
@@ -14,8 +14,6 @@ See: docs/10_RISK_SPEC.md for gating limits
 
 from __future__ import annotations
 
-import bisect
-import hashlib
 import json
 import logging
 import os
@@ -23,7 +21,7 @@ import time
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from grinder.contracts import Snapshot
 from grinder.controller import AdaptiveController, ControllerMode
@@ -35,30 +33,42 @@ from grinder.execution import (
     ExecutionEngineConfig,
     ExecutionState,
     NoOpExchangePort,
-    OrderRecord,
     SymbolConstraints,
 )
-from grinder.features import FeatureEngine, FeatureEngineConfig, L2FeatureSnapshot
+from grinder.features import (
+    FeatureEngine,
+    FeatureEngineConfig,
+    FeatureSnapshot,
+    L2FeatureSnapshot,
+    PolicyFeatures,
+)
 from grinder.gating import GateReason, GatingResult, RateLimiter, RiskGate, ToxicityGate
-from grinder.ml import MlSignalSnapshot
+from grinder.ml import MlSignalSeries, MlSignalSnapshot
 from grinder.ml.metrics import (
     MlBlockReason,
     MlInferenceMode,
     record_ml_inference_error,
     record_ml_inference_latency,
     record_ml_inference_success,
+    record_ml_signal_staleness,
     set_ml_active_on,
 )
-from grinder.ml.onnx import ONNX_AVAILABLE, OnnxMlModel
+from grinder.ml.onnx import (
+    ONNX_AVAILABLE,
+    MlInferenceRequest,
+    MlInferenceService,
+    OnnxMlModel,
+)
 from grinder.ml.onnx.registry import ModelRegistry, RegistryError, Stage
 from grinder.paper.cycle_engine import CycleEngine
 from grinder.paper.fills import Fill, check_pending_fills, simulate_fills
 from grinder.paper.ledger import Ledger
+from grinder.paper.output_sink import StreamingDigest
 from grinder.policies.base import GridPlan  # noqa: TC001 - used at runtime
 from grinder.policies.grid.adaptive import AdaptiveGridConfig, AdaptiveGridPolicy
 from grinder.policies.grid.static import StaticGridPolicy
 from grinder.prefilter import TopKSelector, hard_filter
-from grinder.replay import parse_l2_snapshot_line
+from grinder.replay import event_ts, open_fixture_events
 from grinder.risk import (
     DrawdownGuard,
     DrawdownGuardV1,
@@ -69,6 +79,12 @@ from grinder.risk import (
 )
 from grinder.selection import SelectionCandidate, SelectionResult, TopKConfigV1, select_topk_v1
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, MutableMapping
+
+    from grinder.paper.output_sink import OutputSink
+    from grinder.replay import FixtureEvent
+
 logger = logging.getLogger(__name__)
 
 # Output schema version for contract stability
@@ -325,6 +341,11 @@ class PaperEngine:
         ml_active_ack: str | None = None,
         ml_kill_switch: bool = False,
         ml_active_allowed_envs: list[str] | None = None,
+        ml_shadow_batch_window_ms: int = 0,
+        ml_async_inference: bool = False,
+        ml_inference_queue_size: int = 64,
+        ml_inference_deadline_ms: int = 50,
+        ml_signal_max_staleness_ms: int = 1000,
     ) -> None:
         """Initialize paper trading engine.
 
@@ -386,6 +407,14 @@ class PaperEngine:
             ml_active_ack: Explicit acknowledgment for ACTIVE mode
             ml_kill_switch: Kill-switch to disable ML inference (config)
             ml_active_allowed_envs: Environment allowlist for ACTIVE mode
+            ml_shadow_batch_window_ms: Batch shadow inference across symbols updated
+                within this window (one session call per batch; 0 = per snapshot)
+            ml_async_inference: Run ONNX inference on a worker thread (MlInferenceService);
+                process_snapshot never waits on the model
+            ml_inference_queue_size: Max queued inference requests (oldest evicted)
+            ml_inference_deadline_ms: Max queue wait before a request is dropped
+            ml_signal_max_staleness_ms: ACTIVE uses the freshest completed prediction
+                at most this old (snapshot ts domain); none -> fail closed
         """
         # Policy and execution
         self._policy = StaticGridPolicy(
@@ -528,12 +557,24 @@ class PaperEngine:
         self._ml_enabled = ml_enabled
         # M8-01b: Time-indexed signal storage: symbol -> sorted list of signals
         self._ml_signals: dict[str, list[MlSignalSnapshot]] = {}
+        # Lookup index over _ml_signals (timestamps + forward cursor per symbol)
+        self._ml_signal_index: dict[str, MlSignalSeries] = {}
 
         # M8-02a/b: ONNX artifact plumbing and shadow mode
         self._ml_shadow_mode = ml_shadow_mode
         self._ml_infer_enabled = ml_infer_enabled
         self._onnx_artifact_dir = onnx_artifact_dir
         self._onnx_model: OnnxMlModel | None = None
+        # Shadow inference batching: rows queued until the tick window closes
+        self._ml_shadow_batch_window_ms = ml_shadow_batch_window_ms
+        self._ml_shadow_pending: list[MlInferenceRequest] = []
+        self._ml_shadow_pending_symbols: set[str] = set()
+        # Off-thread inference (created with the model when ml_async_inference=True)
+        self._ml_async_inference = ml_async_inference
+        self._ml_inference_queue_size = ml_inference_queue_size
+        self._ml_inference_deadline_ms = ml_inference_deadline_ms
+        self._ml_signal_max_staleness_ms = ml_signal_max_staleness_ms
+        self._ml_inference_service: MlInferenceService | None = None
 
         # M8-03c-2: ML registry config
         self._ml_registry_path = ml_registry_path
@@ -807,6 +848,8 @@ class PaperEngine:
                 self._onnx_artifact_dir,
                 self._onnx_artifact_source,
             )
+            if self._ml_async_inference:
+                self._start_inference_service(self._onnx_model)
         except Exception as e:
             if self._ml_active_enabled:
                 # G7: ACTIVE fail-closed - raise ConfigError
@@ -826,7 +869,109 @@ class PaperEngine:
             )
             self._onnx_model = None
 
-    def _run_shadow_inference(self, ts: int, symbol: str, policy_features: dict[str, Any]) -> None:
+    def _start_inference_service(self, model: OnnxMlModel) -> None:
+        """Start off-thread inference for the loaded model (replaces a running worker)."""
+        self.stop_ml_inference()
+        self._ml_inference_service = MlInferenceService(
+            model,
+            mode=MlInferenceMode.ACTIVE if self._ml_active_enabled else MlInferenceMode.SHADOW,
+            max_queue=self._ml_inference_queue_size,
+            deadline_ms=self._ml_inference_deadline_ms,
+            on_result=self._on_async_inference_result,
+        )
+        self._ml_inference_service.start()
+        logger.info(
+            "ML_ASYNC_INFERENCE_ON: queue=%d deadline_ms=%d max_staleness_ms=%d",
+            self._ml_inference_queue_size,
+            self._ml_inference_deadline_ms,
+            self._ml_signal_max_staleness_ms,
+        )
+
+    def stop_ml_inference(self) -> None:
+        """Stop the off-thread inference worker, if running (idempotent)."""
+        if self._ml_inference_service is not None:
+            self._ml_inference_service.stop()
+            self._ml_inference_service = None
+
+    def _finish_ml_inference(self) -> None:
+        """Drain queued inference rows, then stop the worker (end of run)."""
+        if self._ml_inference_service is not None:
+            self._ml_inference_service.wait_idle()
+            self.stop_ml_inference()
+
+    def _on_async_inference_result(
+        self,
+        request: MlInferenceRequest,
+        prediction: MlSignalSnapshot | None,
+        latency_ms: float,
+    ) -> None:
+        """Log a completed off-thread prediction (runs on the worker thread)."""
+        if prediction is None:
+            if self._ml_active_enabled:
+                record_ml_inference_error()
+            logger.debug(
+                "ML_ASYNC_PREDICTION: ts=%d symbol=%s result=None latency_ms=%.2f",
+                request.ts_ms,
+                request.symbol,
+                latency_ms,
+            )
+            return
+        logger.info(
+            "ML_ASYNC_PREDICTION: ts=%d symbol=%s regime=%s probs_bps=%s "
+            "spacing_x1000=%d latency_ms=%.2f",
+            request.ts_ms,
+            request.symbol,
+            prediction.predicted_regime,
+            prediction.regime_probs_bps,
+            prediction.spacing_multiplier_x1000,
+            latency_ms,
+        )
+
+    def _run_async_active_inference(
+        self,
+        service: MlInferenceService,
+        ts: int,
+        symbol: str,
+        policy_features: MutableMapping[str, Any],
+    ) -> bool:
+        """ACTIVE mode with off-thread inference.
+
+        Submits this snapshot for inference and injects the freshest
+        completed prediction within ml_signal_max_staleness_ms. Fail-closed:
+        no usable prediction -> policy_features unchanged.
+        """
+        service.submit(MlInferenceRequest(ts, symbol, dict(policy_features)))
+        prediction = service.freshest(symbol, ts, self._ml_signal_max_staleness_ms)
+        if prediction is None:
+            record_ml_signal_staleness(None)
+            logger.warning(
+                "ML_ACTIVE_BLOCKED: ts=%d symbol=%s reason=PREDICTION_STALE max_staleness_ms=%d",
+                ts,
+                symbol,
+                self._ml_signal_max_staleness_ms,
+            )
+            return False
+
+        staleness_ms = ts - prediction.ts_ms
+        record_ml_signal_staleness(staleness_ms)
+        policy_features.update(prediction.to_policy_features())
+        record_ml_inference_success()
+        logger.info(
+            "ML_INFER_OK: ts=%d symbol=%s regime=%s probs_bps=%s spacing_x1000=%d "
+            "staleness_ms=%d artifact_dir=%s",
+            ts,
+            symbol,
+            prediction.predicted_regime,
+            prediction.regime_probs_bps,
+            prediction.spacing_multiplier_x1000,
+            staleness_ms,
+            self._onnx_artifact_dir,
+        )
+        return True
+
+    def _run_shadow_inference(
+        self, ts: int, symbol: str, policy_features: Mapping[str, Any]
+    ) -> None:
         """Run ONNX inference in shadow mode (M8-02b).
 
         This runs inference and logs the prediction, but does NOT modify
@@ -882,7 +1027,69 @@ class PaperEngine:
                 latency_ms,
             )
 
-    def _run_active_inference(self, ts: int, symbol: str, policy_features: dict[str, Any]) -> bool:
+    def _queue_shadow_inference(
+        self, ts: int, symbol: str, policy_features: Mapping[str, Any]
+    ) -> None:
+        """Queue a shadow inference row for the current tick window.
+
+        The pending batch is flushed first if the window has elapsed or the
+        symbol already has a row in it (one row per symbol per batch).
+        """
+        pending = self._ml_shadow_pending
+        if pending and (
+            symbol in self._ml_shadow_pending_symbols
+            or ts - pending[0].ts_ms >= self._ml_shadow_batch_window_ms
+        ):
+            self._flush_shadow_batch()
+        self._ml_shadow_pending.append(MlInferenceRequest(ts, symbol, dict(policy_features)))
+        self._ml_shadow_pending_symbols.add(symbol)
+
+    def _flush_shadow_batch(self) -> None:
+        """Run queued shadow inference rows as one batched call.
+
+        Latency of the single session call is recorded once per batch.
+        Like per-snapshot shadow inference, results are logged only.
+        """
+        pending = self._ml_shadow_pending
+        if not pending:
+            return
+        self._ml_shadow_pending = []
+        self._ml_shadow_pending_symbols = set()
+        if self._onnx_model is None:
+            return
+
+        start_time = time.perf_counter()
+        predictions = self._onnx_model.predict_batch(pending)
+        latency_ms = (time.perf_counter() - start_time) * 1000
+
+        # M8-02d: Record batched latency in histogram
+        record_ml_inference_latency(latency_ms, MlInferenceMode.SHADOW)
+
+        for request, prediction in zip(pending, predictions, strict=True):
+            if prediction is not None:
+                logger.info(
+                    "ML_SHADOW_PREDICTION: ts=%d symbol=%s regime=%s "
+                    "probs_bps=%s spacing_x1000=%d latency_ms=%.2f batch=%d",
+                    request.ts_ms,
+                    request.symbol,
+                    prediction.predicted_regime,
+                    prediction.regime_probs_bps,
+                    prediction.spacing_multiplier_x1000,
+                    latency_ms,
+                    len(pending),
+                )
+            else:
+                logger.debug(
+                    "ML_SHADOW_PREDICTION: ts=%d symbol=%s result=None latency_ms=%.2f batch=%d",
+                    request.ts_ms,
+                    request.symbol,
+                    latency_ms,
+                    len(pending),
+                )
+
+    def _run_active_inference(
+        self, ts: int, symbol: str, policy_features: MutableMapping[str, Any]
+    ) -> bool:
         """Run ONNX inference in ACTIVE mode (M8-02c).
 
         ACTIVE mode is fail-closed: if inference errors, policy_features
@@ -904,6 +1111,11 @@ class PaperEngine:
             )
             return False
 
+        if self._ml_inference_service is not None:
+            return self._run_async_active_inference(
+                self._ml_inference_service, ts, symbol, policy_features
+            )
+
         start_time = time.perf_counter()
 
         try:
@@ -976,25 +1188,12 @@ class PaperEngine:
             return
 
         state = self._states[symbol]
-        new_orders = dict(state.open_orders)
+        new_orders = state.orders.copy()
 
         for order_id in filled_order_ids:
-            if order_id in new_orders:
-                old_order = new_orders[order_id]
-                # Create new OrderRecord with FILLED state
-                new_orders[order_id] = OrderRecord(
-                    order_id=old_order.order_id,
-                    symbol=old_order.symbol,
-                    side=old_order.side,
-                    price=old_order.price,
-                    quantity=old_order.quantity,
-                    state=OrderState.FILLED,
-                    level_id=old_order.level_id,
-                    created_ts=old_order.created_ts,
-                    placed_tick=old_order.placed_tick,
-                )
+            new_orders.transition(order_id, OrderState.FILLED)
 
-        # Update state with new orders dict
+        # Update state with new orders store
         self._states[symbol] = ExecutionState(
             open_orders=new_orders,
             last_plan_digest=state.last_plan_digest,
@@ -1131,11 +1330,10 @@ class PaperEngine:
         # Step 0.5: Compute features (ADR-019)
         # Always compute features to build bar history, even if blocked later
         features_dict: dict[str, Any] | None = None
-        policy_feature_inputs: dict[str, Any] | None = None
+        feature_snapshot: FeatureSnapshot | None = None
         if self._feature_engine_enabled and self._feature_engine is not None:
             feature_snapshot = self._feature_engine.process_snapshot(snapshot)
-            features_dict = feature_snapshot.to_dict()
-            policy_feature_inputs = feature_snapshot.to_policy_features()
+            features_dict = feature_snapshot.to_dict()  # Output only
 
         # Step 1: Prefilter
         features = {
@@ -1215,14 +1413,9 @@ class PaperEngine:
             effective_spacing_bps = self._base_spacing_bps * controller_decision.spacing_multiplier
 
         # Policy evaluation with effective spacing
-        # Base features always include mid_price
-        policy_features: dict[str, Any] = {
-            "mid_price": snapshot.mid_price,
-        }
-        # Merge FeatureEngine features when enabled (ADR-020)
-        # StaticGridPolicy ignores extra keys; AdaptiveGridPolicy uses them
-        if policy_feature_inputs is not None:
-            policy_features.update(policy_feature_inputs)
+        # Typed view: mid_price + FeatureEngine features when enabled (ADR-020), no dict copy.
+        # Same keys as the former dict (no ts/symbol); StaticGridPolicy ignores extra keys
+        policy_features = PolicyFeatures(snapshot.mid_price, feature_snapshot)
 
         # M8-01b: Inject ML signal features using time-indexed lookup
         # SSOT rule: select signal with max(ts_ms) where ts_ms <= snapshot.ts
@@ -1285,7 +1478,15 @@ class PaperEngine:
             and not ml_active_applied
             and self._onnx_model is not None
         ):
-            self._run_shadow_inference(ts, symbol, policy_features)
+            if self._ml_inference_service is not None:
+                # Off-thread: result logged by the worker, never awaited here
+                self._ml_inference_service.submit(
+                    MlInferenceRequest(ts, symbol, dict(policy_features))
+                )
+            elif self._ml_shadow_batch_window_ms > 0:
+                self._queue_shadow_inference(ts, symbol, policy_features)
+            else:
+                self._run_shadow_inference(ts, symbol, policy_features)
 
         # Determine which policy to use
         if self._adaptive_policy_enabled and self._adaptive_policy is not None:
@@ -1427,8 +1628,8 @@ class PaperEngine:
             # Collect OPEN orders for this symbol
             open_orders = [
                 order
-                for order in state.open_orders.values()
-                if order.symbol == symbol and order.state == OrderState.OPEN
+                for order in state.orders.live_orders(symbol)
+                if order.state == OrderState.OPEN
             ]
 
             # Check which orders are fill-eligible
@@ -1519,18 +1720,32 @@ class PaperEngine:
             features=features_dict,
         )
 
-    def run(self, fixture_path: Path) -> PaperResult:
+    def run(
+        self,
+        fixture_path: Path,
+        events: Iterable[FixtureEvent] | None = None,
+        *,
+        sink: OutputSink | None = None,
+    ) -> PaperResult:
         """Run paper trading loop on fixture.
 
+        Events are streamed from the fixture (columnar or JSONL, see
+        open_fixture_events) and re-read for each pass rather than held in
+        memory.
+
+        Outputs are collected in ``result.outputs`` unless a sink is given:
+        then each output goes to the sink and is not retained. The digest is
+        computed incrementally over the same bytes either way.
+
         Pipeline (v0 - volatility-based):
-        1. Load all events from fixture
+        1. Open event stream for fixture
         2. First pass: scan events to populate TopKSelector with prices
         3. Select Top-K symbols by volatility score
-        4. Filter events to only include selected symbols
-        5. Process filtered events through prefilter -> gating -> policy -> execution
+        4. Second pass: skip snapshots of non-selected symbols
+        5. Process remaining events through prefilter -> gating -> policy -> execution
 
         Pipeline (v1 - feature-based, when topk_v1_enabled):
-        1. Load all events from fixture
+        1. Open event stream for fixture
         2. First pass: feed all events to FeatureEngine for warmup + record prices for toxicity
         3. Build candidates from cached features + toxicity state
         4. Select Top-K symbols using feature-based scoring (range + liquidity - toxicity - trend)
@@ -1538,15 +1753,41 @@ class PaperEngine:
 
         Args:
             fixture_path: Path to fixture directory
+            events: Re-iterable event source to use instead of the fixture's
+                own event files (default: open_fixture_events(fixture_path))
+            sink: Output sink (see grinder.paper.output_sink); None keeps
+                outputs in result.outputs
 
         Returns:
             PaperResult with all outputs and digest
         """
+        try:
+            return self._run_fixture(fixture_path, events, sink=sink)
+        finally:
+            # The inference worker lives for one run (started by _load_onnx_model)
+            self._finish_ml_inference()
+
+    def _run_fixture(
+        self,
+        fixture_path: Path,
+        events: Iterable[FixtureEvent] | None,
+        *,
+        sink: OutputSink | None,
+    ) -> PaperResult:
+        """Body of run() (see run() for the pipeline)."""
         result = PaperResult(fixture_path=str(fixture_path))
+        digest = StreamingDigest()
+
+        def emit(output: PaperOutput) -> None:
+            digest.update(output.to_digest_dict())
+            if sink is None:
+                result.outputs.append(output)
+            else:
+                sink.write(output)
 
-        # Load events
-        events = self._load_fixture(fixture_path)
-        result.events_processed = len(events)
+        # Stream events in ts order (re-iterated per pass, bounded memory)
+        if events is None:
+            events = open_fixture_events(fixture_path)
 
         # M8: Load ML signals if enabled
         if self._ml_enabled:
@@ -1556,19 +1797,18 @@ class PaperEngine:
         if self._ml_shadow_mode and self._onnx_artifact_dir:
             self._load_onnx_model()
 
-        if not events:
-            result.errors.append("No events found in fixture")
-            result.digest = self._compute_digest([])
-            return result
-
-        # Top-K v1 selection (feature-based)
-        if (
+        use_topk_v1 = (
             self._topk_v1_enabled
             and self._feature_engine_enabled
             and self._feature_engine is not None
-        ):
-            # First pass: feed all events to FeatureEngine for warmup
+        )
+
+        # First pass: warm up selection state and count events
+        if use_topk_v1:
+            assert self._feature_engine is not None
+            # Top-K v1: feed all events to FeatureEngine for warmup
             for event in events:
+                result.events_processed += 1
                 # M7: Process L2 events to update L2 features
                 self._process_l2_event(event)
                 snapshot = self._parse_snapshot(event)
@@ -1581,7 +1821,26 @@ class PaperEngine:
                     )
                     # Track last price for PnL calculation
                     self._last_prices[snapshot.symbol] = snapshot.mid_price
+        else:
+            # Top-K v0: populate TopKSelector with prices for scoring
+            self._topk_selector.reset()
+            for event in events:
+                result.events_processed += 1
+                # M7: Process L2 events to update L2 features
+                self._process_l2_event(event)
+                snapshot = self._parse_snapshot(event)
+                if snapshot:
+                    self._topk_selector.record_price(
+                        snapshot.ts, snapshot.symbol, snapshot.mid_price
+                    )
+
+        if result.events_processed == 0:
+            result.errors.append("No events found in fixture")
+            result.digest = digest.hexdigest()
+            return result
 
+        # Top-K v1 selection (feature-based)
+        if use_topk_v1:
             # Build candidates from cached features + toxicity state
             candidates = self._build_topk_v1_candidates()
 
@@ -1618,7 +1877,6 @@ class PaperEngine:
                     rank_lookup[score.symbol] = score.rank
 
             # Second pass: process all events with Top-K v1 filtering
-            outputs: list[PaperOutput] = []
             for event in events:
                 try:
                     # M7: Process L2 events to update L2 features
@@ -1638,7 +1896,7 @@ class PaperEngine:
                                 feature_snapshot = self._feature_engine.process_snapshot(snapshot)
                                 features_dict = feature_snapshot.to_dict()
 
-                            outputs.append(
+                            emit(
                                 PaperOutput(
                                     ts=snapshot.ts,
                                     symbol=snapshot.symbol,
@@ -1659,25 +1917,14 @@ class PaperEngine:
                             # In Top-K: process normally
                             output = self.process_snapshot(snapshot)
                             output.topk_v1_rank = rank_lookup.get(snapshot.symbol)
-                            outputs.append(output)
+                            emit(output)
                             if output.blocked_by_gating:
                                 result.events_gated += 1
                 except Exception as e:
-                    result.errors.append(f"Error processing event at ts={event.get('ts')}: {e}")
+                    result.errors.append(f"Error processing event at ts={event_ts(event)}: {e}")
 
         else:
             # Top-K v0 selection (volatility-based)
-            # First pass: populate TopKSelector with prices for scoring
-            self._topk_selector.reset()
-            for event in events:
-                # M7: Process L2 events to update L2 features
-                self._process_l2_event(event)
-                snapshot = self._parse_snapshot(event)
-                if snapshot:
-                    self._topk_selector.record_price(
-                        snapshot.ts, snapshot.symbol, snapshot.mid_price
-                    )
-
             # Select Top-K symbols
             topk_result = self._topk_selector.select()
             selected_symbols = set(topk_result.selected)
@@ -1687,31 +1934,31 @@ class PaperEngine:
             result.topk_k = topk_result.k
             result.topk_scores = [s.to_dict() for s in topk_result.scores]
 
-            # Filter events to only include selected symbols
+            # Process events in order, skipping snapshots of non-selected symbols
             # Note: Keep non-SNAPSHOT events (like l2_snapshot) for L2 feature updates
-            filtered_events = [
-                e
-                for e in events
-                if e.get("symbol") in selected_symbols
-                or e.get("type") not in ("SNAPSHOT",)  # Keep L2 and other events
-            ]
-
-            # Process filtered events in order
-            outputs = []
-            for event in filtered_events:
+            for event in events:
+                if isinstance(event, Snapshot):
+                    if event.symbol not in selected_symbols:
+                        continue
+                elif (
+                    event.get("type") == "SNAPSHOT" and event.get("symbol") not in selected_symbols
+                ):
+                    continue
                 try:
                     # M7: Process L2 events to update L2 features
                     self._process_l2_event(event)
                     snapshot = self._parse_snapshot(event)
                     if snapshot:
                         output = self.process_snapshot(snapshot)
-                        outputs.append(output)
+                        emit(output)
                         if output.blocked_by_gating:
                             result.events_gated += 1
                 except Exception as e:
-                    result.errors.append(f"Error processing event at ts={event.get('ts')}: {e}")
+                    result.errors.append(f"Error processing event at ts={event_ts(event)}: {e}")
+
+        # Run any shadow inference rows still queued for the last tick window
+        self._flush_shadow_batch()
 
-        result.outputs = outputs
         result.orders_placed = self._orders_placed
         result.orders_blocked = self._orders_blocked
         result.total_fills = self._total_fills
@@ -1777,29 +2024,9 @@ class PaperEngine:
                 )
                 result.final_drawdown_pct = max(0.0, final_drawdown)
 
-        result.digest = self._compute_digest([o.to_digest_dict() for o in outputs])
+        result.digest = digest.hexdigest()
         return result
 
-    def _load_fixture(self, fixture_path: Path) -> list[dict[str, Any]]:
-        """Load fixture events from directory."""
-        events: list[dict[str, Any]] = []
-
-        jsonl_path = fixture_path / "events.jsonl"
-        json_path = fixture_path / "events.json"
-
-        if jsonl_path.exists():
-            with jsonl_path.open() as f:
-                for line in f:
-                    if line.strip():
-                        events.append(json.loads(line))
-        elif json_path.exists():
-            with json_path.open() as f:
-                events = json.load(f)
-
-        # Sort by timestamp for determinism
-        events.sort(key=lambda e: e.get("ts", 0))
-        return events
-
     def _load_ml_signals(self, fixture_path: Path) -> None:
         """Load ML signals from fixture ml/signal.json.
 
@@ -1843,6 +2070,7 @@ class PaperEngine:
                         "in ml/signal.json (non-deterministic)"
                     )
             self._ml_signals[symbol] = signals
+            self._ml_signal_index[symbol] = MlSignalSeries(signals)
 
     def _get_ml_signal(self, symbol: str, ts_ms: int) -> MlSignalSnapshot | None:
         """Get ML signal for symbol at given timestamp.
@@ -1851,29 +2079,27 @@ class PaperEngine:
         - Return the signal with max(signal.ts_ms) where signal.ts_ms <= ts_ms
         - Return None if no such signal exists (safe-by-default)
 
-        Uses bisect for O(log n) lookup.
+        Uses the per-symbol MlSignalSeries index (O(1) amortized for
+        monotone replay); the index is built on first use if signals were
+        set without _load_ml_signals.
         """
-        if symbol not in self._ml_signals:
-            return None
+        series = self._ml_signal_index.get(symbol)
+        if series is None:
+            signals = self._ml_signals.get(symbol)
+            if not signals:
+                return None
+            series = MlSignalSeries(signals)
+            self._ml_signal_index[symbol] = series
 
-        signals = self._ml_signals[symbol]
-        if not signals:
-            return None
+        return series.at(ts_ms)
 
-        # Build list of ts_ms for bisect (signals already sorted by ts_ms)
-        ts_list = [s.ts_ms for s in signals]
+    def _parse_snapshot(self, event: FixtureEvent) -> Snapshot | None:
+        """Parse event dict into Snapshot if it's a SNAPSHOT type.
 
-        # Find rightmost signal where ts_ms <= target
-        idx = bisect.bisect_right(ts_list, ts_ms) - 1
-
-        if idx < 0:
-            # All signals are in the future
-            return None
-
-        return signals[idx]
-
-    def _parse_snapshot(self, event: dict[str, Any]) -> Snapshot | None:
-        """Parse event dict into Snapshot if it's a SNAPSHOT type."""
+        Columnar fixtures yield ready-made Snapshots, which pass through.
+        """
+        if isinstance(event, Snapshot):
+            return event
         if event.get("type") != "SNAPSHOT":
             return None
 
@@ -1888,29 +2114,21 @@ class PaperEngine:
             last_qty=Decimal(event["last_qty"]),
         )
 
-    def _process_l2_event(self, event: dict[str, Any]) -> None:
+    def _process_l2_event(self, event: FixtureEvent) -> None:
         """Process L2 snapshot event and update L2 features.
 
         M7: L2 execution guards require L2 feature snapshots.
         This method parses l2_snapshot events and updates self._l2_features.
+        Features are computed straight from the decoded event dict (same
+        validation as parse_l2_snapshot_line, no JSON round-trip).
         """
-        if event.get("type") != "l2_snapshot":
+        if isinstance(event, Snapshot) or event.get("type") != "l2_snapshot":
             return
 
-        # Parse the L2 snapshot from event dict
-        line = json.dumps(event)
-        l2_snapshot = parse_l2_snapshot_line(line)
-
-        # Compute L2 features from snapshot
-        l2_features = L2FeatureSnapshot.from_l2_snapshot(l2_snapshot)
+        l2_features = L2FeatureSnapshot.from_l2_dict(event)
 
         # Update the L2 features dict (ExecutionEngine holds reference to this)
-        self._l2_features[l2_snapshot.symbol] = l2_features
-
-    def _compute_digest(self, outputs: list[dict[str, Any]]) -> str:
-        """Compute deterministic digest of outputs."""
-        content = json.dumps(outputs, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        self._l2_features[l2_features.symbol] = l2_features
 
     def flatten_position(
         self,
@@ -2036,6 +2254,7 @@ class PaperEngine:
 
     def reset(self) -> None:
         """Reset all engine state for fresh run."""
+        self.stop_ml_inference()
         self._port.reset()
         self._rate_limiter.reset()
         self._risk_gate.reset()
@@ -2052,6 +2271,9 @@ class PaperEngine:
             self._feature_engine.reset()
         self._topk_v1_result = None
         self._ml_signals.clear()  # M8: Reset ML signals
+        self._ml_signal_index.clear()
+        self._ml_shadow_pending = []
+        self._ml_shadow_pending_symbols = set()
         self._states.clear()
         self._last_prices.clear()
         self._orders_placed = 0
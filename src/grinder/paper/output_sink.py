@@ -0,0 +1,122 @@
+"""Streaming output sinks and incremental digest for PaperEngine.run.
+
+PaperEngine.run keeps every PaperOutput in ``result.outputs`` by default.
+For long runs, pass a sink instead: each output is handed to the sink as
+soon as it is produced and is not retained, so memory stays bounded.
+
+The run digest is computed incrementally by StreamingDigest over exactly
+the bytes ``json.dumps(outputs, sort_keys=True, separators=(",", ":"))``
+would produce for the full list, so digests are identical whether or not
+outputs are retained.
+
+Sinks:
+- DiscardSink: drop outputs (digest and summary only)
+- JsonlSink: one JSON object per line (``PaperOutput.to_dict()``);
+  gzip-compressed when the path ends with ``.gz``
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from typing import IO, TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from grinder.paper.engine import PaperOutput
+
+
+class OutputSink(Protocol):
+    """Receives PaperOutputs as PaperEngine.run produces them."""
+
+    def write(self, output: PaperOutput) -> None:
+        """Consume one output."""
+        ...
+
+
+class DiscardSink:
+    """Sink that drops outputs (counts them only)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, output: PaperOutput) -> None:  # noqa: ARG002 - protocol signature
+        """Drop output."""
+        self.count += 1
+
+
+class JsonlSink:
+    """Sink that writes outputs as JSON lines (gzip if path ends with .gz).
+
+    Lines use the same canonical encoding as digests (sorted keys, compact
+    separators). Use as a context manager or call close().
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._fh: IO[str]
+        # Kept open across write() calls, closed in close()
+        if path.suffix == ".gz":
+            self._fh = gzip.open(path, "wt", encoding="utf-8")  # noqa: SIM115
+        else:
+            self._fh = path.open("w", encoding="utf-8")
+
+    def write(self, output: PaperOutput) -> None:
+        """Append output as one JSON line."""
+        self._fh.write(_canonical_json(output.to_dict()))
+        self._fh.write("\n")
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._fh.close()
+
+    def __enter__(self) -> JsonlSink:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class StreamingDigest:
+    """Incremental digest of a JSON list of output dicts.
+
+    Equivalent to ``sha256(json.dumps(items, sort_keys=True,
+    separators=(",", ":"))).hexdigest()[:16]`` without holding the items.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256(b"[")
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Number of items added."""
+        return self._count
+
+    def update(self, item: dict[str, Any]) -> None:
+        """Add one item (a to_digest_dict() result)."""
+        if self._count:
+            self._hash.update(b",")
+        self._hash.update(_canonical_json(item).encode())
+        self._count += 1
+
+    def hexdigest(self) -> str:
+        """16-char hex digest of the items added so far."""
+        final = self._hash.copy()
+        final.update(b"]")
+        return final.hexdigest()[:16]
+
+
+def _canonical_json(item: dict[str, Any]) -> str:
+    return json.dumps(item, sort_keys=True, separators=(",", ":"))
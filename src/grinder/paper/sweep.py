@@ -0,0 +1,439 @@
+"""Parameter sweep (grid search) over paper backtests.
+
+Evaluates many PaperEngine parameter sets against one fixture:
+
+1. The fixture is read once: SNAPSHOT events are parsed into frozen Snapshot
+   objects and all events are held in a tuple shared by every run
+2. Each parameter set builds a fresh PaperEngine and replays the shared events
+   (serially, or in a process pool where each worker receives the parsed
+   events once via the pool initializer)
+3. Runs are ranked by total PnL (desc), then max drawdown (asc), then sweep
+   order, and reported as a table of PnL, fills, blocked orders and drawdown
+
+Parameter names are PaperEngine keyword arguments. Fields of nested configs
+are addressed with dotted names, e.g. ``adaptive_config.step_alpha`` or
+``topk_v1_config.k``. Values given as JSON numbers/strings are converted to
+Decimal where the engine default is a Decimal.
+
+Each run is identical to ``PaperEngine(**params).run(fixture_path)``: the same
+events reach the engine in the same order, so per-point digests match
+standalone runs.
+
+See: docs/11_BACKTEST_PROTOCOL.md
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from grinder.contracts import Snapshot
+from grinder.paper.engine import PaperEngine
+from grinder.policies.grid.adaptive import AdaptiveGridConfig
+from grinder.replay import open_fixture_events
+from grinder.selection import TopKConfigV1
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grinder.replay import FixtureEvent
+
+# Sweep report schema version
+SWEEP_SCHEMA_VERSION = "v1"
+
+# Nested config objects that can be swept field-by-field ("<name>.<field>")
+NESTED_CONFIGS: dict[str, type[Any]] = {
+    "adaptive_config": AdaptiveGridConfig,
+    "topk_v1_config": TopKConfigV1,
+}
+
+_ENGINE_PARAMS = {
+    name: param
+    for name, param in inspect.signature(PaperEngine.__init__).parameters.items()
+    if name != "self"
+}
+
+
+class SweepConfigError(ValueError):
+    """Raised for unknown sweep parameters or malformed parameter grids."""
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One parameter set of a sweep.
+
+    Attributes:
+        index: Position in the sweep (stable tie-breaker for ranking)
+        params: PaperEngine keyword arguments (dotted names for nested configs)
+    """
+
+    index: int
+    params: dict[str, Any]
+
+
+@dataclass
+class SweepRow:
+    """Outcome of one parameter set."""
+
+    index: int
+    params: dict[str, Any]
+    total_pnl: str
+    total_realized_pnl: str
+    total_unrealized_pnl: str
+    max_drawdown: str
+    total_fills: int
+    orders_placed: int
+    orders_blocked: int
+    events_gated: int
+    paper_digest: str
+    errors: list[str] = field(default_factory=list)
+    rank: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "rank": self.rank,
+            "index": self.index,
+            "params": {k: _json_value(v) for k, v in self.params.items()},
+            "total_pnl": self.total_pnl,
+            "total_realized_pnl": self.total_realized_pnl,
+            "total_unrealized_pnl": self.total_unrealized_pnl,
+            "max_drawdown": self.max_drawdown,
+            "total_fills": self.total_fills,
+            "orders_placed": self.orders_placed,
+            "orders_blocked": self.orders_blocked,
+            "events_gated": self.events_gated,
+            "paper_digest": self.paper_digest,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class SweepReport:
+    """Ranked results of a parameter sweep."""
+
+    fixture_path: str
+    events_loaded: int
+    rows: list[SweepRow] = field(default_factory=list)
+    schema_version: str = SWEEP_SCHEMA_VERSION
+    report_digest: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "schema_version": self.schema_version,
+            "fixture_path": self.fixture_path,
+            "events_loaded": self.events_loaded,
+            "points": len(self.rows),
+            "rows": [r.to_dict() for r in self.rows],
+            "report_digest": self.report_digest,
+        }
+
+    def to_json(self) -> str:
+        """Serialize to deterministic JSON."""
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+
+    def format_table(self, top: int | None = None) -> str:
+        """Render the ranked rows as a fixed-width text table.
+
+        Args:
+            top: Only include the first N rows (default: all)
+        """
+        rows = self.rows if top is None else self.rows[:top]
+        header = (
+            f"{'rank':>4}  {'#':>4}  {'total_pnl':>14}  {'max_dd':>12}  "
+            f"{'fills':>6}  {'placed':>6}  {'blocked':>7}  params"
+        )
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            params = " ".join(f"{k}={_json_value(v)}" for k, v in sorted(row.params.items()))
+            flag = " !" if row.errors else ""
+            lines.append(
+                f"{row.rank:>4}  {row.index:>4}  {row.total_pnl:>14}  {row.max_drawdown:>12}  "
+                f"{row.total_fills:>6}  {row.orders_placed:>6}  {row.orders_blocked:>7}  "
+                f"{params}{flag}"
+            )
+        return "\n".join(lines)
+
+
+def _json_value(value: Any) -> Any:
+    """Render Decimal parameters as strings for JSON/table output."""
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def expand_grid(grid: dict[str, list[Any]]) -> list[SweepPoint]:
+    """Expand a parameter grid into its cartesian product.
+
+    Keys vary in the order given (last key varies fastest), so the point
+    indices are deterministic for a given grid.
+
+    Args:
+        grid: Parameter name -> list of candidate values
+
+    Returns:
+        SweepPoints indexed from 0
+
+    Raises:
+        SweepConfigError: If a parameter is unknown or has no values
+    """
+    for name, values in grid.items():
+        validate_param_name(name)
+        if not isinstance(values, list) or not values:
+            raise SweepConfigError(f"Grid parameter {name!r} needs a non-empty list of values")
+
+    names = list(grid)
+    return [
+        SweepPoint(index=i, params=dict(zip(names, combo, strict=True)))
+        for i, combo in enumerate(itertools.product(*(grid[n] for n in names)))
+    ]
+
+
+def validate_param_name(name: str) -> None:
+    """Check that a sweep parameter maps to a PaperEngine argument.
+
+    Raises:
+        SweepConfigError: If the name is not an engine argument or nested config field
+    """
+    if "." in name:
+        config_name, field_name = name.split(".", 1)
+        config_cls = NESTED_CONFIGS.get(config_name)
+        if config_cls is None:
+            raise SweepConfigError(
+                f"Unknown nested config {config_name!r} (supported: {sorted(NESTED_CONFIGS)})"
+            )
+        if field_name not in {f.name for f in dataclasses.fields(config_cls)}:
+            raise SweepConfigError(f"{config_cls.__name__} has no field {field_name!r}")
+        return
+    if name not in _ENGINE_PARAMS:
+        raise SweepConfigError(f"Unknown PaperEngine parameter {name!r}")
+
+
+def _coerce(value: Any, default: Any) -> Any:
+    """Convert JSON numbers/strings to Decimal where the default is a Decimal."""
+    if isinstance(default, Decimal) and not isinstance(value, Decimal):
+        return Decimal(str(value))
+    return value
+
+
+def build_engine_kwargs(params: dict[str, Any]) -> dict[str, Any]:
+    """Turn sweep parameters into PaperEngine keyword arguments.
+
+    Dotted ``<config>.<field>`` parameters are collected into a config object
+    (e.g. AdaptiveGridConfig) built from its defaults plus the swept fields.
+
+    Args:
+        params: Flat sweep parameters
+
+    Returns:
+        Keyword arguments for PaperEngine
+    """
+    kwargs: dict[str, Any] = {}
+    nested: dict[str, dict[str, Any]] = {}
+    for name, value in params.items():
+        validate_param_name(name)
+        if "." in name:
+            config_name, field_name = name.split(".", 1)
+            nested.setdefault(config_name, {})[field_name] = value
+        else:
+            kwargs[name] = _coerce(value, _ENGINE_PARAMS[name].default)
+
+    for config_name, overrides in nested.items():
+        config_cls = NESTED_CONFIGS[config_name]
+        defaults = config_cls()
+        kwargs[config_name] = dataclasses.replace(
+            defaults,
+            **{k: _coerce(v, getattr(defaults, k)) for k, v in overrides.items()},
+        )
+    return kwargs
+
+
+def load_sweep_events(fixture_path: Path) -> tuple[FixtureEvent, ...]:
+    """Read a fixture once into a shared, ordered event tuple.
+
+    SNAPSHOT dicts are parsed into (frozen) Snapshot objects up front so no
+    run pays for Decimal parsing again. Other events (e.g. l2_snapshot) are
+    kept as dicts; PaperEngine only reads them.
+
+    Args:
+        fixture_path: Path to fixture directory
+
+    Returns:
+        Events in replay order
+    """
+    events: list[FixtureEvent] = []
+    for raw in open_fixture_events(fixture_path):
+        if isinstance(raw, Snapshot) or raw.get("type") != "SNAPSHOT":
+            events.append(raw)
+            continue
+        events.append(
+            Snapshot(
+                ts=raw["ts"],
+                symbol=raw["symbol"],
+                bid_price=Decimal(raw["bid_price"]),
+                ask_price=Decimal(raw["ask_price"]),
+                bid_qty=Decimal(raw["bid_qty"]),
+                ask_qty=Decimal(raw["ask_qty"]),
+                last_price=Decimal(raw["last_price"]),
+                last_qty=Decimal(raw["last_qty"]),
+            )
+        )
+    return tuple(events)
+
+
+def _max_drawdown(outputs: list[Any]) -> Decimal:
+    """Largest peak-to-trough drop of portfolio PnL over the run.
+
+    Portfolio PnL at each output is the sum of the latest per-symbol
+    total_pnl from the outputs' PnL snapshots.
+    """
+    latest: dict[str, Decimal] = {}
+    peak = Decimal("0")
+    max_dd = Decimal("0")
+    for output in outputs:
+        snap = output.pnl_snapshot
+        if snap is None:
+            continue
+        latest[snap["symbol"]] = Decimal(snap["total_pnl"])
+        equity = sum(latest.values(), Decimal("0"))
+        peak = max(peak, equity)
+        max_dd = max(max_dd, peak - equity)
+    return max_dd
+
+
+def run_sweep_point(
+    fixture_path: Path,
+    events: tuple[FixtureEvent, ...],
+    point: SweepPoint,
+    base_params: dict[str, Any] | None = None,
+) -> SweepRow:
+    """Run one parameter set against pre-loaded fixture events.
+
+    Args:
+        fixture_path: Fixture directory (for side inputs such as ML signals)
+        events: Shared events from load_sweep_events
+        point: Parameter set to evaluate
+        base_params: Parameters applied before point.params (e.g. fixture config)
+
+    Returns:
+        SweepRow (rank is assigned later by rank_rows)
+    """
+    params = {**(base_params or {}), **point.params}
+    engine = PaperEngine(**build_engine_kwargs(params))
+    result = engine.run(fixture_path, events=events)
+
+    realized = Decimal(result.total_realized_pnl)
+    unrealized = Decimal(result.total_unrealized_pnl)
+    return SweepRow(
+        index=point.index,
+        params=point.params,
+        total_pnl=str(realized + unrealized),
+        total_realized_pnl=result.total_realized_pnl,
+        total_unrealized_pnl=result.total_unrealized_pnl,
+        max_drawdown=str(_max_drawdown(result.outputs)),
+        total_fills=result.total_fills,
+        orders_placed=result.orders_placed,
+        orders_blocked=result.orders_blocked,
+        events_gated=result.events_gated,
+        paper_digest=result.digest,
+        errors=result.errors,
+    )
+
+
+def rank_rows(rows: list[SweepRow]) -> list[SweepRow]:
+    """Sort rows best-first and assign 1-based ranks.
+
+    Order: total PnL descending, max drawdown ascending, sweep index ascending.
+    """
+    ranked = sorted(
+        rows,
+        key=lambda r: (-Decimal(r.total_pnl), Decimal(r.max_drawdown), r.index),
+    )
+    for rank, row in enumerate(ranked, start=1):
+        row.rank = rank
+    return ranked
+
+
+# Per-worker shared state, set once by the pool initializer
+_worker_fixture_path: Path | None = None
+_worker_events: tuple[FixtureEvent, ...] = ()
+_worker_base_params: dict[str, Any] = {}
+
+
+def _init_worker(
+    fixture_path: Path, events: tuple[FixtureEvent, ...], base_params: dict[str, Any]
+) -> None:
+    """Pool initializer: receive the parsed fixture once per worker."""
+    global _worker_fixture_path, _worker_events, _worker_base_params  # noqa: PLW0603
+    _worker_fixture_path = fixture_path
+    _worker_events = events
+    _worker_base_params = base_params
+
+
+def _run_worker_point(point: SweepPoint) -> SweepRow:
+    """Evaluate a point against the worker's shared events."""
+    assert _worker_fixture_path is not None
+    return run_sweep_point(_worker_fixture_path, _worker_events, point, _worker_base_params)
+
+
+def run_sweep(
+    fixture_path: Path,
+    points: list[SweepPoint],
+    base_params: dict[str, Any] | None = None,
+    jobs: int = 1,
+) -> SweepReport:
+    """Evaluate parameter sets against a fixture and rank the results.
+
+    Args:
+        fixture_path: Fixture directory
+        points: Parameter sets (see expand_grid)
+        base_params: Parameters shared by all points (points override them)
+        jobs: Worker processes (1 = in-process serial run, 0 = one per CPU)
+
+    Returns:
+        SweepReport with rows ranked best-first
+
+    Raises:
+        SweepConfigError: If a parameter is unknown or jobs is negative
+    """
+    if jobs < 0:
+        raise SweepConfigError(f"jobs must be >= 0, got {jobs}")
+    base = dict(base_params or {})
+    # Fail fast on typos before loading the fixture or starting workers
+    for name in itertools.chain(base, *(p.params for p in points)):
+        validate_param_name(name)
+
+    events = load_sweep_events(fixture_path)
+
+    workers = min(jobs or os.cpu_count() or 1, len(points))
+    if workers <= 1:
+        rows = [run_sweep_point(fixture_path, events, p, base) for p in points]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(fixture_path, events, base),
+        ) as pool:
+            rows = list(pool.map(_run_worker_point, points))
+
+    report = SweepReport(
+        fixture_path=str(fixture_path),
+        events_loaded=len(events),
+        rows=rank_rows(rows),
+    )
+    content = json.dumps(
+        {k: v for k, v in report.to_dict().items() if k != "report_digest"},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    report.report_digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+    return report
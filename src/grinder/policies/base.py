@@ -4,6 +4,7 @@ See: docs/07_GRID_POLICY_LIBRARY.md, docs/16_ADAPTIVE_GRID_CONTROLLER_SPEC.md
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from decimal import ROUND_DOWN, Decimal
 from typing import Any
@@ -83,12 +84,12 @@ class GridPolicy(ABC):
     name: str = "BASE"
 
     @abstractmethod
-    def evaluate(self, features: dict[str, Any]) -> GridPlan:
+    def evaluate(self, features: Mapping[str, Any]) -> GridPlan:
         """
         Evaluate features and return grid plan.
 
         Args:
-            features: Dict of computed features for the symbol
+            features: Computed features for the symbol (dict or PolicyFeatures)
 
         Returns:
             GridPlan with mode, spacing, levels, sizes
@@ -96,7 +97,7 @@ class GridPolicy(ABC):
         ...
 
     @abstractmethod
-    def should_activate(self, features: dict[str, Any]) -> bool:
+    def should_activate(self, features: Mapping[str, Any]) -> bool:
         """
         Check if this policy should be active.
 
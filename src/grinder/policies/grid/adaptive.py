@@ -35,6 +35,8 @@ from grinder.policies.base import GridPlan, GridPolicy
 from grinder.sizing import AutoSizer, AutoSizerConfig, GridShape
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from grinder.features.l2_types import L2FeatureSnapshot
     from grinder.features.types import FeatureSnapshot
     from grinder.gating.types import GatingResult
@@ -338,7 +340,7 @@ class AdaptiveGridPolicy(GridPolicy):
 
     def evaluate(
         self,
-        features: dict[str, Any],
+        features: Mapping[str, Any],
         kill_switch_active: bool = False,
         toxicity_result: GatingResult | None = None,
         l2_features: L2FeatureSnapshot | None = None,
@@ -347,7 +349,7 @@ class AdaptiveGridPolicy(GridPolicy):
         """Evaluate features and return adaptive grid plan.
 
         Args:
-            features: Dict containing at least:
+            features: Mapping (dict or PolicyFeatures) containing at least:
                 - mid_price: Current mid price (Decimal)
                 - natr_bps: Normalized ATR in basis points
                 - spread_bps: Bid-ask spread in bps
@@ -489,7 +491,7 @@ class AdaptiveGridPolicy(GridPolicy):
             reason_codes=reason_codes,
         )
 
-    def _build_feature_snapshot(self, features: dict[str, Any]) -> FeatureSnapshot | None:
+    def _build_feature_snapshot(self, features: Mapping[str, Any]) -> FeatureSnapshot | None:
         """Build FeatureSnapshot from features dict if possible."""
         from grinder.features.types import FeatureSnapshot  # noqa: PLC0415
 
@@ -719,7 +721,7 @@ class AdaptiveGridPolicy(GridPolicy):
 
         return schedule.qty_per_level
 
-    def should_activate(self, features: dict[str, Any]) -> bool:
+    def should_activate(self, features: Mapping[str, Any]) -> bool:
         """Check if this policy should be active.
 
         Adaptive policy activates when features are available.
@@ -9,11 +9,14 @@ See: docs/07_GRID_POLICY_LIBRARY.md section 2.1 (simplified for v0)
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from grinder.core import GridMode, MarketRegime, ResetAction
 from grinder.policies.base import GridPlan, GridPolicy
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class StaticGridPolicy(GridPolicy):
     """Static symmetric grid policy.
@@ -60,7 +63,7 @@ class StaticGridPolicy(GridPolicy):
         self.levels = levels
         self.size_per_level = size_per_level
 
-    def evaluate(self, features: dict[str, Any]) -> GridPlan:
+    def evaluate(self, features: Mapping[str, Any]) -> GridPlan:
         """Evaluate features and return static symmetric grid plan.
 
         Args:
@@ -104,7 +107,7 @@ class StaticGridPolicy(GridPolicy):
             reason_codes=["REGIME_RANGE"],
         )
 
-    def should_activate(self, features: dict[str, Any]) -> bool:  # noqa: ARG002
+    def should_activate(self, features: Mapping[str, Any]) -> bool:  # noqa: ARG002
         """Check if this policy should be active.
 
         Static grid is always active (it's the fallback policy).
@@ -27,11 +27,14 @@ from grinder.reconcile.identity import (
     LEGACY_STRATEGY_ID,
     OrderIdentityConfig,
     ParsedOrderId,
+    ParsedOrderIdCache,
     generate_client_order_id,
     get_default_identity_config,
+    get_order_id_cache,
     is_ours,
     parse_client_order_id,
     reset_default_identity_config,
+    reset_order_id_cache,
     set_default_identity_config,
 )
 from grinder.reconcile.metrics import (
@@ -100,6 +103,7 @@ __all__ = [
     "ObservedStateStore",
     "OrderIdentityConfig",
     "ParsedOrderId",
+    "ParsedOrderIdCache",
     "ReconcileConfig",
     "ReconcileEngine",
     "ReconcileMetrics",
@@ -118,10 +122,12 @@ __all__ = [
     "create_remediate_result_event",
     "generate_client_order_id",
     "get_default_identity_config",
+    "get_order_id_cache",
     "get_reconcile_metrics",
     "is_ours",
     "parse_client_order_id",
     "reset_default_identity_config",
+    "reset_order_id_cache",
     "reset_reconcile_metrics",
     "set_default_identity_config",
 ]
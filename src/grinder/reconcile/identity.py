@@ -6,6 +6,7 @@ This module provides:
 - OrderIdentityConfig: Configuration for order identity (prefix, strategy, allowlist)
 - ParsedOrderId: Parsed components of a clientOrderId
 - parse_client_order_id(): Parse clientOrderId into components
+- ParsedOrderIdCache: Bounded LRU of parse results (shared via get_order_id_cache())
 - is_ours(): Check if an order belongs to our allowed strategies
 - generate_client_order_id(): Generate a clientOrderId with identity
 
@@ -20,6 +21,7 @@ from __future__ import annotations
 
 import os
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 # Environment variable for legacy support
@@ -181,6 +183,48 @@ def is_tp_order(client_order_id: str) -> bool:
     return parsed is not None and parsed.strategy_id == TP_STRATEGY_ID
 
 
+class ParsedOrderIdCache:
+    """Bounded LRU of parse_client_order_id() results keyed by clientOrderId.
+
+    Open orders live for many ticks, so the live path (engine, cycle layer,
+    grid planner) parses the same ids over and over; this runs the regexes
+    once per id. Unparseable ids are cached as None.
+
+    Thread-safety: plain OrderedDict updates (GIL protection); a race can
+    only cost a redundant parse.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, ParsedOrderId | None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, client_order_id: str) -> ParsedOrderId | None:
+        """Cached parse_client_order_id()."""
+        entries = self._entries
+        if client_order_id in entries:
+            self.hits += 1
+            entries.move_to_end(client_order_id)
+            return entries[client_order_id]
+        self.misses += 1
+        parsed = parse_client_order_id(client_order_id)
+        entries[client_order_id] = parsed
+        if len(entries) > self._max_entries:
+            entries.popitem(last=False)  # Evict least recently used
+        return parsed
+
+    def is_tp(self, client_order_id: str) -> bool:
+        """Cached is_tp_order()."""
+        parsed = self.parse(client_order_id)
+        return parsed is not None and parsed.strategy_id == TP_STRATEGY_ID
+
+
 def is_ours(
     client_order_id: str,
     config: OrderIdentityConfig,
@@ -276,3 +320,21 @@ def reset_default_identity_config() -> None:
     """Reset the default identity config to None (for testing)."""
     global _default_config  # noqa: PLW0603 - singleton pattern
     _default_config = None
+
+
+# Singleton parse cache shared by the live path
+_order_id_cache: ParsedOrderIdCache | None = None
+
+
+def get_order_id_cache() -> ParsedOrderIdCache:
+    """Get the shared clientOrderId parse cache."""
+    global _order_id_cache  # noqa: PLW0603 - singleton pattern
+    if _order_id_cache is None:
+        _order_id_cache = ParsedOrderIdCache()
+    return _order_id_cache
+
+
+def reset_order_id_cache() -> None:
+    """Reset the shared parse cache to None (for testing)."""
+    global _order_id_cache  # noqa: PLW0603 - singleton pattern
+    _order_id_cache = None
@@ -97,48 +97,61 @@ class ReconcileMetrics:
     budget_notional_remaining_day: Decimal = field(default_factory=lambda: Decimal("0"))
     budget_configured: bool = False  # True when budget tracker is active
 
+    # Changes on every update (cached rendering, see observability/exposition.py)
+    metrics_version: int = field(default=0, repr=False, compare=False)
+
     def record_mismatch(self, mismatch_type: MismatchType) -> None:
         """Record a mismatch event."""
         key = mismatch_type.value
         self.mismatch_counts[key] = self.mismatch_counts.get(key, 0) + 1
+        self.metrics_version += 1
 
     def set_last_snapshot_age(self, age_ms: int) -> None:
         """Set age of last REST snapshot."""
         self.last_snapshot_age_ms = age_ms
+        self.metrics_version += 1
 
     def set_last_snapshot_ts(self, ts_ms: int) -> None:
         """Set timestamp of last REST snapshot (0 = never taken)."""
         self.last_snapshot_ts_ms = ts_ms
+        self.metrics_version += 1
 
     def record_reconcile_run(self) -> None:
         """Record a reconciliation run."""
         self.reconcile_runs += 1
+        self.metrics_version += 1
 
     def record_action_planned(self, action: str) -> None:
         """Record a planned remediation action (dry-run)."""
         self.action_planned_counts[action] = self.action_planned_counts.get(action, 0) + 1
+        self.metrics_version += 1
 
     def record_action_executed(self, action: str) -> None:
         """Record an executed remediation action."""
         self.action_executed_counts[action] = self.action_executed_counts.get(action, 0) + 1
+        self.metrics_version += 1
 
     def record_action_blocked(self, reason: str) -> None:
         """Record a blocked remediation action."""
         self.action_blocked_counts[reason] = self.action_blocked_counts.get(reason, 0) + 1
+        self.metrics_version += 1
 
     def record_run_with_mismatch(self) -> None:
         """Record a run that detected at least one mismatch."""
         self.runs_with_mismatch += 1
+        self.metrics_version += 1
 
     def record_run_with_remediation(self, action: str) -> None:
         """Record a run that executed at least one remediation action."""
         self.runs_with_remediation_counts[action] = (
             self.runs_with_remediation_counts.get(action, 0) + 1
         )
+        self.metrics_version += 1
 
     def set_last_remediation_ts(self, ts_ms: int) -> None:
         """Set timestamp of last remediation action."""
         self.last_remediation_ts_ms = ts_ms
+        self.metrics_version += 1
 
     def set_budget_metrics(
         self,
@@ -162,6 +175,7 @@ class ReconcileMetrics:
         self.budget_calls_remaining_day = calls_remaining
         self.budget_notional_remaining_day = notional_remaining
         self.budget_configured = configured
+        self.metrics_version += 1
 
     def to_prometheus_lines(self) -> list[str]:
         """Generate Prometheus text format lines."""
@@ -329,6 +343,7 @@ class ReconcileMetrics:
         self.budget_calls_remaining_day = 0
         self.budget_notional_remaining_day = Decimal("0")
         self.budget_configured = False
+        self.metrics_version += 1
 
 
 # Global singleton
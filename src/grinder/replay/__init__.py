@@ -3,17 +3,39 @@
 Provides end-to-end replay pipeline:
   fixture -> prefilter -> policy -> execution -> output
 
+Fixture events are streamed (event_source.py) from JSONL or from the
+binary columnar format (columnar.py).
+
 See: docs/11_BACKTEST_PROTOCOL.md
 """
 
+from grinder.replay.columnar import (
+    ColumnarEventSource,
+    ColumnarFormatError,
+    convert_events_to_columnar,
+    convert_fixture_to_columnar,
+)
 from grinder.replay.engine import ReplayEngine, ReplayOutput, ReplayResult
+from grinder.replay.event_source import (
+    FixtureEvent,
+    FixtureEventSource,
+    FixtureOrderError,
+    event_ts,
+    iter_jsonl_events,
+    merge_event_streams,
+    open_fixture_events,
+)
 from grinder.replay.l2_snapshot import (
     IMPACT_INSUFFICIENT_DEPTH_BPS,
     QTY_REF_BASELINE,
     BookLevel,
     L2ParseError,
     L2Snapshot,
+    PriceLevel,
+    RawLevel,
     load_l2_fixtures,
+    parse_l2_levels_dict,
+    parse_l2_snapshot_dict,
     parse_l2_snapshot_line,
 )
 
@@ -21,11 +43,26 @@ __all__ = [
     "IMPACT_INSUFFICIENT_DEPTH_BPS",
     "QTY_REF_BASELINE",
     "BookLevel",
+    "ColumnarEventSource",
+    "ColumnarFormatError",
+    "FixtureEvent",
+    "FixtureEventSource",
+    "FixtureOrderError",
     "L2ParseError",
     "L2Snapshot",
+    "PriceLevel",
+    "RawLevel",
     "ReplayEngine",
     "ReplayOutput",
     "ReplayResult",
+    "convert_events_to_columnar",
+    "convert_fixture_to_columnar",
+    "event_ts",
+    "iter_jsonl_events",
     "load_l2_fixtures",
+    "merge_event_streams",
+    "open_fixture_events",
+    "parse_l2_levels_dict",
+    "parse_l2_snapshot_dict",
     "parse_l2_snapshot_line",
 ]
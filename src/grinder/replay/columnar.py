@@ -0,0 +1,408 @@
+"""Binary columnar fixture format for replay and paper runs.
+
+Stores SNAPSHOT events as fixed-width NumPy columns so replays skip JSON
+parsing. Files are opened with ``np.load(mmap_mode="r")`` and read in
+blocks, so startup cost is independent of fixture size.
+
+Layout (``<fixture>/columns/``)::
+
+    manifest.json              format, symbols, row counts, source fingerprint
+    index_ts.npy      int64    global time index (event order)
+    index_sym.npy     int32    symbol id per event (-1 = extra event)
+    index_row.npy     int64    row in the symbol's columns (or extra.jsonl line)
+    extra.jsonl                non-SNAPSHOT events (l2_snapshot, ...) verbatim
+    <SYMBOL>/<field>.npy       int64 scaled value (Decimal coefficient)
+    <SYMBOL>/<field>.exp.npy   int8 decimal exponent
+
+Each Decimal is stored as (coefficient, exponent), so reconstruction is
+exact, including trailing zeros ("50000.00" stays "50000.00"). Digests of
+runs over a converted fixture are therefore identical to the JSONL run.
+
+SNAPSHOT events that cannot be encoded (missing fields, values outside
+int64) are kept verbatim in extra.jsonl, preserving engine behaviour.
+
+The manifest records size, mtime_ns and sha256 of each source file
+(events.jsonl, events/*.jsonl or legacy events.json); see sources_match().
+
+See: docs/11_BACKTEST_PROTOCOL.md
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from array import array
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from grinder.contracts import Snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from grinder.replay.event_source import FixtureEvent
+
+COLUMNAR_FORMAT = "grinder-columnar-v1"
+COLUMNS_DIRNAME = "columns"
+
+# Decimal fields of Snapshot, in column order
+PRICE_FIELDS = ("bid_price", "ask_price", "bid_qty", "ask_qty", "last_price", "last_qty")
+
+# Rows decoded per block when streaming from the memory-mapped columns
+BLOCK_ROWS = 8192
+
+# Max distinct (coefficient, exponent) pairs cached per symbol reader
+DECIMAL_CACHE_SIZE = 65536
+
+_INT64_MAX = 2**63 - 1
+_INT8_MIN, _INT8_MAX = -128, 127
+
+
+class ColumnarFormatError(ValueError):
+    """Raised when a columnar fixture is missing or malformed."""
+
+
+def _encode_decimal(value: Any) -> tuple[int, int]:
+    """Encode a fixture value as (coefficient, exponent).
+
+    Uses the same Decimal() conversion as the JSONL snapshot parser.
+
+    Raises:
+        ValueError: If the value is not finite or does not fit int64/int8.
+    """
+    d = Decimal(value)
+    sign, digits, exponent = d.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"non-finite value: {value!r}")
+    coeff = int("".join(map(str, digits)))
+    if sign:
+        if coeff == 0:
+            raise ValueError(f"negative zero not representable: {value!r}")
+        coeff = -coeff
+    if abs(coeff) > _INT64_MAX or not _INT8_MIN <= exponent <= _INT8_MAX:
+        raise ValueError(f"value out of columnar range: {value!r}")
+    return coeff, exponent
+
+
+class _SymbolColumnsBuilder:
+    """Accumulates one symbol's columns during conversion."""
+
+    def __init__(self) -> None:
+        self.ts = array("q")
+        self.coeffs = {name: array("q") for name in PRICE_FIELDS}
+        self.exps = {name: array("b") for name in PRICE_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def append(self, ts: int, encoded: list[tuple[int, int]]) -> None:
+        self.ts.append(ts)
+        for name, (coeff, exp) in zip(PRICE_FIELDS, encoded, strict=True):
+            self.coeffs[name].append(coeff)
+            self.exps[name].append(exp)
+
+    def save(self, out_dir: Path) -> None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        np.save(out_dir / "ts.npy", np.frombuffer(self.ts, dtype=np.int64))
+        for name in PRICE_FIELDS:
+            np.save(out_dir / f"{name}.npy", np.frombuffer(self.coeffs[name], dtype=np.int64))
+            np.save(out_dir / f"{name}.exp.npy", np.frombuffer(self.exps[name], dtype=np.int8))
+
+
+def _encode_snapshot(event: dict[str, Any]) -> tuple[int, str, list[tuple[int, int]]] | None:
+    """Encode a SNAPSHOT event, or None if it must be kept verbatim."""
+    if event.get("type") != "SNAPSHOT":
+        return None
+    try:
+        ts = event["ts"]
+        symbol = event["symbol"]
+        encoded = [_encode_decimal(event[name]) for name in PRICE_FIELDS]
+    except (KeyError, ValueError, ArithmeticError):
+        return None
+    if not isinstance(ts, int) or not isinstance(symbol, str):
+        return None
+    return ts, symbol, encoded
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_sources(paths: Iterable[Path], root: Path) -> list[dict[str, Any]]:
+    """Fingerprint fixture source files for the manifest.
+
+    Args:
+        paths: Source event files
+        root: Fixture directory (names are stored relative to it)
+
+    Returns:
+        One {"name", "size", "mtime_ns", "sha256"} entry per file
+    """
+    sources: list[dict[str, Any]] = []
+    for path in paths:
+        st = path.stat()
+        sources.append(
+            {
+                "name": path.relative_to(root).as_posix(),
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": _sha256_file(path),
+            }
+        )
+    return sources
+
+
+def sources_match(recorded: list[dict[str, Any]], paths: Iterable[Path], root: Path) -> bool:
+    """True if source files are unchanged since they were fingerprinted.
+
+    Same file set, size and mtime_ns is a match without reading the files.
+    If only mtime_ns differs (touch, checkout), the sha256 decides, so a
+    same-size edit is still detected.
+
+    Args:
+        recorded: Manifest ``sources`` entries (see fingerprint_sources)
+        paths: Current source event files
+        root: Fixture directory
+    """
+    current = {p.relative_to(root).as_posix(): p for p in paths}
+    if set(current) != {entry.get("name") for entry in recorded}:
+        return False
+    for entry in recorded:
+        path = current[entry["name"]]
+        st = path.stat()
+        if st.st_size != entry.get("size"):
+            return False
+        if st.st_mtime_ns != entry.get("mtime_ns") and _sha256_file(path) != entry.get("sha256"):
+            return False
+    return True
+
+
+def convert_events_to_columnar(
+    events: Iterable[dict[str, Any]],
+    out_dir: Path,
+    sources: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Write a ts-ordered event stream as a columnar fixture.
+
+    Args:
+        events: Fixture events in replay order (e.g. FixtureEventSource)
+        out_dir: Target directory (usually ``<fixture>/columns``)
+        sources: Source file fingerprints (staleness check, see fingerprint_sources)
+
+    Returns:
+        The manifest dict written to out_dir/manifest.json
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    symbol_ids: dict[str, int] = {}
+    builders: list[_SymbolColumnsBuilder] = []
+    index_ts = array("q")
+    index_sym = array("i")
+    index_row = array("q")
+    extra_count = 0
+
+    with (out_dir / "extra.jsonl").open("w") as extra:
+        for event in events:
+            encoded = _encode_snapshot(event)
+            if encoded is None:
+                index_ts.append(int(event.get("ts", 0)))
+                index_sym.append(-1)
+                index_row.append(extra_count)
+                extra.write(json.dumps(event, separators=(",", ":")) + "\n")
+                extra_count += 1
+                continue
+
+            ts, symbol, values = encoded
+            sym_id = symbol_ids.get(symbol)
+            if sym_id is None:
+                sym_id = len(builders)
+                symbol_ids[symbol] = sym_id
+                builders.append(_SymbolColumnsBuilder())
+            builder = builders[sym_id]
+            index_ts.append(ts)
+            index_sym.append(sym_id)
+            index_row.append(len(builder))
+            builder.append(ts, values)
+
+    np.save(out_dir / "index_ts.npy", np.frombuffer(index_ts, dtype=np.int64))
+    np.save(out_dir / "index_sym.npy", np.frombuffer(index_sym, dtype=np.int32))
+    np.save(out_dir / "index_row.npy", np.frombuffer(index_row, dtype=np.int64))
+
+    symbols = list(symbol_ids)
+    for symbol, builder in zip(symbols, builders, strict=True):
+        builder.save(out_dir / symbol)
+
+    manifest: dict[str, Any] = {
+        "format": COLUMNAR_FORMAT,
+        "symbols": symbols,
+        "fields": list(PRICE_FIELDS),
+        "rows": len(index_ts),
+        "symbol_rows": {s: len(b) for s, b in zip(symbols, builders, strict=True)},
+        "extra_events": extra_count,
+        "sources": sources,
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return manifest
+
+
+def convert_fixture_to_columnar(fixture_path: Path) -> dict[str, Any]:
+    """Convert a fixture's JSONL events into ``<fixture>/columns``.
+
+    Args:
+        fixture_path: Fixture directory with events.jsonl, events/*.jsonl or events.json
+
+    Returns:
+        The written manifest dict
+
+    Raises:
+        ColumnarFormatError: If the fixture has no events to convert
+    """
+    # Local import: event_source imports this module for discovery
+    from grinder.replay.event_source import FixtureEventSource  # noqa: PLC0415
+
+    source = FixtureEventSource.from_fixture(fixture_path)
+    if not source.paths:
+        raise ColumnarFormatError(f"No events to convert in {fixture_path}")
+    # Fingerprint before reading so an edit during conversion reads as stale
+    sources = fingerprint_sources(source.paths, fixture_path)
+    return convert_events_to_columnar(source, fixture_path / COLUMNS_DIRNAME, sources=sources)
+
+
+class _BlockReader:
+    """Sequential block reader over memory-mapped columns of one symbol.
+
+    Decoded Decimals are shared through a small (coefficient, exponent)
+    cache: prices and quantities repeat heavily within a symbol, and
+    Decimal objects are immutable.
+    """
+
+    def __init__(self, sym_dir: Path) -> None:
+        self._ts = np.load(sym_dir / "ts.npy", mmap_mode="r")
+        self._cols = [
+            (
+                np.load(sym_dir / f"{name}.npy", mmap_mode="r"),
+                np.load(sym_dir / f"{name}.exp.npy", mmap_mode="r"),
+            )
+            for name in PRICE_FIELDS
+        ]
+        self._start = 0
+        self._stop = 0
+        self._block: list[tuple[Any, ...]] = []
+        self._cache: dict[tuple[int, int], Decimal] = {}
+
+    def _decode(self, coeffs: list[int], exps: list[int]) -> list[Decimal]:
+        cache = self._cache
+        if len(cache) > DECIMAL_CACHE_SIZE:
+            cache.clear()
+        out: list[Decimal] = []
+        for key in zip(coeffs, exps, strict=True):
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = Decimal(key[0]).scaleb(key[1])
+            out.append(value)
+        return out
+
+    def _load_block(self, row: int) -> None:
+        start = row - row % BLOCK_ROWS
+        stop = min(start + BLOCK_ROWS, len(self._ts))
+        decoded = [
+            self._decode(coeffs[start:stop].tolist(), exps[start:stop].tolist())
+            for coeffs, exps in self._cols
+        ]
+        self._block = list(zip(self._ts[start:stop].tolist(), *decoded, strict=True))
+        self._start, self._stop = start, stop
+
+    def row(self, row: int) -> tuple[Any, ...]:
+        """Return (ts, *PRICE_FIELDS values) for a row of this symbol."""
+        if not self._start <= row < self._stop:
+            self._load_block(row)
+        return self._block[row - self._start]
+
+
+class ColumnarEventSource:
+    """Re-iterable event stream over a columnar fixture.
+
+    Yields Snapshot objects for columnar rows and dicts for extra events,
+    in the original replay order.
+
+    Usage:
+        source = ColumnarEventSource(fixture_path / "columns")
+        for event in source:
+            ...
+    """
+
+    def __init__(self, columns_dir: Path) -> None:
+        """Open a columnar fixture and validate its manifest.
+
+        Args:
+            columns_dir: Directory written by convert_events_to_columnar
+
+        Raises:
+            ColumnarFormatError: If the manifest is missing or unsupported
+        """
+        manifest_path = columns_dir / "manifest.json"
+        if not manifest_path.exists():
+            raise ColumnarFormatError(f"Missing columnar manifest: {manifest_path}")
+        manifest: dict[str, Any] = json.loads(manifest_path.read_text())
+        if manifest.get("format") != COLUMNAR_FORMAT:
+            raise ColumnarFormatError(
+                f"Unsupported columnar format {manifest.get('format')!r} in {manifest_path}"
+            )
+        if tuple(manifest.get("fields", ())) != PRICE_FIELDS:
+            raise ColumnarFormatError(f"Unexpected columnar fields in {manifest_path}")
+        self._dir = columns_dir
+        self._manifest = manifest
+
+    @property
+    def manifest(self) -> dict[str, Any]:
+        """Parsed manifest.json."""
+        return dict(self._manifest)
+
+    @property
+    def sources(self) -> list[dict[str, Any]] | None:
+        """Source file fingerprints at conversion time (None if not recorded)."""
+        sources: list[dict[str, Any]] | None = self._manifest.get("sources")
+        return sources
+
+    def __len__(self) -> int:
+        """Total number of events (snapshots + extra events)."""
+        rows: int = self._manifest["rows"]
+        return rows
+
+    def __iter__(self) -> Iterator[FixtureEvent]:
+        """Yield events in replay order."""
+        symbols: list[str] = self._manifest["symbols"]
+        readers = [_BlockReader(self._dir / s) for s in symbols]
+        index_sym = np.load(self._dir / "index_sym.npy", mmap_mode="r")
+        index_row = np.load(self._dir / "index_row.npy", mmap_mode="r")
+
+        with (self._dir / "extra.jsonl").open() as extra:
+            for start in range(0, len(index_sym), BLOCK_ROWS):
+                stop = start + BLOCK_ROWS
+                for sym_id, row in zip(
+                    index_sym[start:stop].tolist(), index_row[start:stop].tolist(), strict=True
+                ):
+                    if sym_id < 0:
+                        event: dict[str, Any] = json.loads(extra.readline())
+                        yield event
+                        continue
+                    ts, bid_price, ask_price, bid_qty, ask_qty, last_price, last_qty = readers[
+                        sym_id
+                    ].row(row)
+                    yield Snapshot(
+                        ts=ts,
+                        symbol=symbols[sym_id],
+                        bid_price=bid_price,
+                        ask_price=ask_price,
+                        bid_qty=bid_qty,
+                        ask_qty=ask_qty,
+                        last_price=last_price,
+                        last_qty=last_qty,
+                    )
@@ -1,7 +1,7 @@
 """Replay engine for end-to-end deterministic backtesting.
 
 This module provides the core replay loop that:
-1. Loads fixture events (Snapshots)
+1. Streams fixture events (Snapshots)
 2. Applies prefilter gates
 3. Evaluates policy to get GridPlan
 4. Executes via ExecutionEngine
@@ -17,13 +17,19 @@ import json
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path  # noqa: TC003 - used at runtime (fixture_path / ...)
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from grinder.contracts import Snapshot
 from grinder.execution import ExecutionEngine, ExecutionState, NoOpExchangePort
 from grinder.policies.base import GridPlan  # noqa: TC001 - used at runtime (.value)
 from grinder.policies.grid.static import StaticGridPolicy
 from grinder.prefilter import hard_filter
+from grinder.replay.event_source import event_ts, open_fixture_events
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from grinder.replay.event_source import FixtureEvent
 
 
 @dataclass
@@ -188,63 +194,51 @@ class ReplayEngine:
             events=[e.to_dict() for e in result.events],
         )
 
-    def run(self, fixture_path: Path) -> ReplayResult:
+    def run(self, fixture_path: Path, events: Iterable[FixtureEvent] | None = None) -> ReplayResult:
         """Run full replay on fixture.
 
         Args:
             fixture_path: Path to fixture directory
+            events: Event source to use instead of the fixture's own event
+                files (default: open_fixture_events(fixture_path))
 
         Returns:
             ReplayResult with all outputs and digest
         """
         result = ReplayResult(fixture_path=str(fixture_path))
 
-        # Load events
-        events = self._load_fixture(fixture_path)
-        result.events_processed = len(events)
-
-        if not events:
-            result.errors.append("No events found in fixture")
-            result.digest = self._compute_digest([])
-            return result
+        # Stream events in ts order (bounded memory)
+        if events is None:
+            events = open_fixture_events(fixture_path)
 
         # Process events in order
         outputs: list[ReplayOutput] = []
         for event in events:
+            result.events_processed += 1
             try:
                 snapshot = self._parse_snapshot(event)
                 if snapshot:
                     output = self.process_snapshot(snapshot)
                     outputs.append(output)
             except Exception as e:
-                result.errors.append(f"Error processing event at ts={event.get('ts')}: {e}")
+                result.errors.append(f"Error processing event at ts={event_ts(event)}: {e}")
+
+        if result.events_processed == 0:
+            result.errors.append("No events found in fixture")
+            result.digest = self._compute_digest([])
+            return result
 
         result.outputs = outputs
         result.digest = self._compute_digest([o.to_dict() for o in outputs])
         return result
 
-    def _load_fixture(self, fixture_path: Path) -> list[dict[str, Any]]:
-        """Load fixture events from directory."""
-        events: list[dict[str, Any]] = []
-
-        jsonl_path = fixture_path / "events.jsonl"
-        json_path = fixture_path / "events.json"
+    def _parse_snapshot(self, event: FixtureEvent) -> Snapshot | None:
+        """Parse event dict into Snapshot if it's a SNAPSHOT type.
 
-        if jsonl_path.exists():
-            with jsonl_path.open() as f:
-                for line in f:
-                    if line.strip():
-                        events.append(json.loads(line))
-        elif json_path.exists():
-            with json_path.open() as f:
-                events = json.load(f)
-
-        # Sort by timestamp for determinism
-        events.sort(key=lambda e: e.get("ts", 0))
-        return events
-
-    def _parse_snapshot(self, event: dict[str, Any]) -> Snapshot | None:
-        """Parse event dict into Snapshot if it's a SNAPSHOT type."""
+        Columnar fixtures yield ready-made Snapshots, which pass through.
+        """
+        if isinstance(event, Snapshot):
+            return event
         if event.get("type") != "SNAPSHOT":
             return None
 
@@ -0,0 +1,208 @@
+"""Streaming fixture event source for replay and paper runs.
+
+Yields fixture events lazily in timestamp order instead of loading and
+sorting the whole file in memory:
+
+- events.jsonl: single file, must already be ordered by ts (checked while streaming)
+- events/*.jsonl: per-symbol files, each ordered by ts, k-way merged with a heap
+- events.json: legacy JSON array, loaded and stably sorted (small fixtures only)
+- columns/: binary columnar format (see columnar.py), preferred when present
+
+Consumers iterate ``FixtureEvent`` items: raw event dicts, or already-built
+Snapshot objects when reading the columnar format.
+
+Ordering contract matches the former in-memory loader: events are ordered by
+``event.get("ts", 0)`` and ties keep file order. For per-symbol files, ties
+across files are broken by file name (sorted), then line order.
+
+The source is re-iterable: each iteration reopens the files, so multi-pass
+consumers (PaperEngine Top-K selection) never hold more than one line per
+file in memory.
+
+See: docs/11_BACKTEST_PROTOCOL.md
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from grinder.contracts import Snapshot
+from grinder.replay.columnar import COLUMNS_DIRNAME, ColumnarEventSource, sources_match
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Item yielded by fixture event sources
+FixtureEvent = dict[str, Any] | Snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureOrderError(ValueError):
+    """Raised when a streamed events file is not ordered by timestamp.
+
+    Streaming cannot reorder events without buffering the whole file, so an
+    out-of-order file is rejected rather than silently replayed in a
+    different order (which would change the digest).
+    """
+
+
+def _event_ts(event: dict[str, Any]) -> int:
+    """Ordering key for fixture events (missing ts sorts first)."""
+    ts: int = event.get("ts", 0)
+    return ts
+
+
+def iter_jsonl_events(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield events from a JSONL file one line at a time.
+
+    Blank lines are skipped. Raises FixtureOrderError if a line's ts is
+    lower than the previous line's ts.
+
+    Args:
+        path: Path to a JSONL events file
+
+    Yields:
+        Parsed event dicts in file order
+    """
+    prev_ts: int | None = None
+    with path.open() as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            event: dict[str, Any] = json.loads(line)
+            ts = _event_ts(event)
+            if prev_ts is not None and ts < prev_ts:
+                raise FixtureOrderError(
+                    f"{path}:{line_no}: ts={ts} is before previous ts={prev_ts} "
+                    "(streamed fixtures must be ordered by ts)"
+                )
+            prev_ts = ts
+            yield event
+
+
+def merge_event_streams(
+    streams: list[Iterator[dict[str, Any]]],
+) -> Iterator[dict[str, Any]]:
+    """K-way merge of ts-ordered event streams.
+
+    heapq.merge is stable: on equal ts, events from earlier streams come
+    first, and order within a stream is preserved.
+
+    Args:
+        streams: Event iterators, each ordered by ts
+
+    Yields:
+        Events from all streams in global ts order
+    """
+    return heapq.merge(*streams, key=_event_ts)
+
+
+class FixtureEventSource:
+    """Re-iterable, lazily-read event stream for a fixture directory.
+
+    Usage:
+        source = FixtureEventSource.from_fixture(fixture_path)
+        for event in source:
+            ...
+    """
+
+    def __init__(self, paths: list[Path], *, legacy_json: bool = False) -> None:
+        """Initialize event source.
+
+        Args:
+            paths: JSONL files to stream (merged if more than one)
+            legacy_json: If True, paths holds a single events.json array file
+        """
+        self._paths = paths
+        self._legacy_json = legacy_json
+
+    @classmethod
+    def from_fixture(cls, fixture_path: Path) -> FixtureEventSource:
+        """Discover the event files of a fixture directory.
+
+        Lookup order: events.jsonl, events/*.jsonl, events.json.
+        A fixture without any of these yields no events.
+
+        Args:
+            fixture_path: Path to fixture directory
+
+        Returns:
+            FixtureEventSource over the discovered files
+        """
+        jsonl_path = fixture_path / "events.jsonl"
+        shard_dir = fixture_path / "events"
+        json_path = fixture_path / "events.json"
+
+        if jsonl_path.exists():
+            return cls([jsonl_path])
+        if shard_dir.is_dir():
+            return cls(sorted(shard_dir.glob("*.jsonl")))
+        if json_path.exists():
+            return cls([json_path], legacy_json=True)
+        return cls([])
+
+    @property
+    def paths(self) -> list[Path]:
+        """Event files backing this source."""
+        return list(self._paths)
+
+    @property
+    def is_legacy_json(self) -> bool:
+        """True if backed by a legacy events.json array."""
+        return self._legacy_json
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Open the fixture files and yield events in ts order."""
+        if self._legacy_json:
+            with self._paths[0].open() as f:
+                events: list[dict[str, Any]] = json.load(f)
+            events.sort(key=_event_ts)
+            return iter(events)
+        if len(self._paths) == 1:
+            return iter_jsonl_events(self._paths[0])
+        return merge_event_streams([iter_jsonl_events(p) for p in self._paths])
+
+
+def open_fixture_events(fixture_path: Path) -> FixtureEventSource | ColumnarEventSource:
+    """Open the fastest available event source for a fixture.
+
+    Uses ``<fixture>/columns`` when it exists and is not stale (its recorded
+    source fingerprint matches the event files, see columnar.sources_match),
+    otherwise logs a warning and falls back to FixtureEventSource.from_fixture.
+    Columns without a recorded fingerprint count as stale.
+
+    Args:
+        fixture_path: Path to fixture directory
+
+    Returns:
+        Re-iterable event source
+    """
+    columns_dir = fixture_path / COLUMNS_DIRNAME
+    jsonl_source = FixtureEventSource.from_fixture(fixture_path)
+    if not (columns_dir / "manifest.json").exists():
+        return jsonl_source
+
+    columnar = ColumnarEventSource(columns_dir)
+    if jsonl_source.paths:
+        recorded = columnar.sources
+        if recorded is None or not sources_match(recorded, jsonl_source.paths, fixture_path):
+            logger.warning(
+                "COLUMNAR_STALE: %s does not match the fixture events, using %s "
+                "(re-run scripts/convert_fixture_columnar.py)",
+                columns_dir,
+                ", ".join(p.name for p in jsonl_source.paths),
+            )
+            return jsonl_source
+    return columnar
+
+
+def event_ts(event: FixtureEvent) -> Any:
+    """Timestamp of a fixture event (None if a raw dict has no ts)."""
+    if isinstance(event, Snapshot):
+        return event.ts
+    return event.get("ts")
@@ -7,6 +7,9 @@ Design:
 - Frozen dataclass for immutability
 - Decimal parsing for determinism (no float drift)
 - Strict invariant validation with non-retryable errors
+- Dict-native parsing (parse_l2_snapshot_dict) for events already decoded
+  from JSON; parse_l2_levels_dict skips BookLevel/L2Snapshot construction
+  when only the levels are needed (feature computation)
 """
 
 from __future__ import annotations
@@ -15,7 +18,10 @@ import json
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 # === Constants (from SPEC B.2) ===
 
@@ -57,6 +63,26 @@ class BookLevel:
         return (str(self.price), str(self.qty))
 
 
+class PriceLevel(Protocol):
+    """Read-only (price, qty) level: BookLevel or RawLevel."""
+
+    @property
+    def price(self) -> Decimal: ...
+
+    @property
+    def qty(self) -> Decimal: ...
+
+
+class RawLevel(NamedTuple):
+    """Lightweight parsed level (no frozen dataclass overhead)."""
+
+    price: Decimal
+    qty: Decimal
+
+
+_LevelT = TypeVar("_LevelT", BookLevel, RawLevel)
+
+
 # === L2Snapshot dataclass ===
 
 
@@ -133,15 +159,20 @@ class L2Snapshot:
 # === Parser ===
 
 
-def _parse_levels(raw_levels: list[list[str]], side: str) -> tuple[BookLevel, ...]:
-    """Parse raw [[price, qty], ...] into BookLevel tuple.
+def _parse_levels(
+    raw_levels: list[list[str]],
+    side: str,
+    level_type: Callable[[Decimal, Decimal], _LevelT],
+) -> tuple[_LevelT, ...]:
+    """Parse raw [[price, qty], ...] into a level tuple.
 
     Args:
         raw_levels: List of [price_str, qty_str] pairs
         side: "bids" or "asks" (for error messages)
+        level_type: BookLevel or RawLevel
 
     Returns:
-        Tuple of BookLevel objects
+        Tuple of level_type objects
 
     Raises:
         L2ParseError: If parsing fails
@@ -165,11 +196,11 @@ def _parse_levels(raw_levels: list[list[str]], side: str) -> tuple[BookLevel, ..
             raise L2ParseError(
                 f"{side}[{i}]: invalid decimal - price={price_str!r}, qty={qty_str!r}: {e}"
             ) from e
-        levels.append(BookLevel(price=price, qty=qty))
+        levels.append(level_type(price, qty))
     return tuple(levels)
 
 
-def _validate_sorting(levels: tuple[BookLevel, ...], side: str) -> None:
+def _validate_sorting(levels: Sequence[PriceLevel], side: str) -> None:
     """Validate that levels are properly sorted.
 
     Args:
@@ -201,7 +232,7 @@ def _validate_sorting(levels: tuple[BookLevel, ...], side: str) -> None:
             )
 
 
-def _validate_quantities(levels: tuple[BookLevel, ...], side: str) -> None:
+def _validate_quantities(levels: Sequence[PriceLevel], side: str) -> None:
     """Validate that all quantities are positive.
 
     Args:
@@ -252,26 +283,18 @@ def _validate_field_types(data: dict[str, Any]) -> None:
             )
 
 
-def parse_l2_snapshot_line(line: str) -> L2Snapshot:
-    """Parse a single JSONL line into L2Snapshot.
-
-    Performs full schema validation and invariant checks.
-
-    Args:
-        line: JSON string (single line, no newline)
+def _parse_and_validate(
+    data: dict[str, Any],
+    level_type: Callable[[Decimal, Decimal], _LevelT],
+) -> tuple[tuple[_LevelT, ...], tuple[_LevelT, ...]]:
+    """Validate a decoded snapshot dict and parse its levels.
 
     Returns:
-        Validated L2Snapshot
+        (bids, asks) as level_type tuples
 
     Raises:
-        L2ParseError: If parsing or validation fails
+        L2ParseError: If validation fails
     """
-    # Parse JSON
-    try:
-        data = json.loads(line)
-    except json.JSONDecodeError as e:
-        raise L2ParseError(f"Invalid JSON: {e}") from e
-
     if not isinstance(data, dict):
         raise L2ParseError(f"Expected JSON object, got {type(data).__name__}")
 
@@ -288,8 +311,8 @@ def parse_l2_snapshot_line(line: str) -> L2Snapshot:
     _validate_field_types(data)
 
     # Parse levels
-    bids = _parse_levels(data["bids"], "bids")
-    asks = _parse_levels(data["asks"], "asks")
+    bids = _parse_levels(data["bids"], "bids", level_type)
+    asks = _parse_levels(data["asks"], "asks", level_type)
     depth = data["depth"]
 
     # Validate depth consistency
@@ -311,22 +334,82 @@ def parse_l2_snapshot_line(line: str) -> L2Snapshot:
         if best_bid >= best_ask:
             raise L2ParseError(f"crossed/locked book: best_bid={best_bid} >= best_ask={best_ask}")
 
-    # Extract optional meta
+    # Validate optional meta
     meta = data.get("meta", {})
     if not isinstance(meta, dict):
         raise L2ParseError(f"meta must be dict, got {type(meta).__name__}")
 
+    return bids, asks
+
+
+def parse_l2_snapshot_dict(data: dict[str, Any]) -> L2Snapshot:
+    """Parse an already-decoded JSONL record into L2Snapshot.
+
+    Same validation as parse_l2_snapshot_line, without a JSON round-trip.
+
+    Args:
+        data: Decoded JSON object
+
+    Returns:
+        Validated L2Snapshot
+
+    Raises:
+        L2ParseError: If validation fails
+    """
+    bids, asks = _parse_and_validate(data, BookLevel)
     return L2Snapshot(
         ts_ms=data["ts_ms"],
         symbol=data["symbol"],
         venue=data["venue"],
-        depth=depth,
+        depth=data["depth"],
         bids=bids,
         asks=asks,
-        meta=meta,
+        meta=data.get("meta", {}),
     )
 
 
+def parse_l2_levels_dict(
+    data: dict[str, Any],
+) -> tuple[tuple[RawLevel, ...], tuple[RawLevel, ...]]:
+    """Validate a decoded JSONL record and return its levels only.
+
+    Same validation as parse_l2_snapshot_dict, but levels are RawLevel
+    named tuples and no L2Snapshot is built. Header fields (ts_ms, symbol,
+    venue, depth) are valid in ``data`` once this returns.
+
+    Args:
+        data: Decoded JSON object
+
+    Returns:
+        (bids, asks) as RawLevel tuples
+
+    Raises:
+        L2ParseError: If validation fails
+    """
+    return _parse_and_validate(data, RawLevel)
+
+
+def parse_l2_snapshot_line(line: str) -> L2Snapshot:
+    """Parse a single JSONL line into L2Snapshot.
+
+    Performs full schema validation and invariant checks.
+
+    Args:
+        line: JSON string (single line, no newline)
+
+    Returns:
+        Validated L2Snapshot
+
+    Raises:
+        L2ParseError: If parsing or validation fails
+    """
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise L2ParseError(f"Invalid JSON: {e}") from e
+    return parse_l2_snapshot_dict(data)
+
+
 def load_l2_fixtures(path: str) -> list[L2Snapshot]:
     """Load L2 snapshots from a JSONL file.
 
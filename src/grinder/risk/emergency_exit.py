@@ -6,6 +6,11 @@ Sequence:
 3. Bounded verify loop (retry until positions closed or timeout)
 4. Return result (success / partial)
 
+Concurrent mode (max_workers > 1): each symbol runs its own
+cancel → flatten → verify chain in a bounded thread pool, so total time is
+roughly the slowest symbol instead of the sum over symbols. Per-symbol
+ordering (cancel before flatten) is kept in both modes.
+
 Safe-by-default: gated behind GRINDER_EMERGENCY_EXIT_ENABLED=false.
 Runs at most once per engine lifetime (latch in engine.py).
 All market orders use reduce_only=True — cannot open new positions.
@@ -15,6 +20,7 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -26,6 +32,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SymbolExitTiming:
+    """Wall-clock timings of one symbol's emergency exit (milliseconds).
+
+    Attributes:
+        symbol: Trading symbol.
+        cancel_ms: Time spent in cancel_all_orders.
+        flatten_ms: Time spent reading positions and placing MARKET orders.
+        verify_ms: Time spent in verify get_positions calls (incl. waits in
+            concurrent mode).
+        positions_remaining: Open positions for this symbol after verify.
+    """
+
+    symbol: str
+    cancel_ms: float
+    flatten_ms: float
+    verify_ms: float
+    positions_remaining: int
+
+    @property
+    def total_ms(self) -> float:
+        """Total time attributed to this symbol."""
+        return self.cancel_ms + self.flatten_ms + self.verify_ms
+
+
 @dataclass(frozen=True)
 class EmergencyExitResult:
     """Result of emergency exit execution.
@@ -37,6 +68,8 @@ class EmergencyExitResult:
         market_orders_placed: Count of MARKET reduce_only orders placed.
         positions_remaining: Positions still open after verify.
         success: True if all positions closed (remaining == 0).
+        duration_ms: Wall-clock duration of the whole exit.
+        symbol_timings: Per-symbol timings, in input symbol order.
     """
 
     triggered_at_ms: int
@@ -45,6 +78,8 @@ class EmergencyExitResult:
     market_orders_placed: int
     positions_remaining: int
     success: bool
+    duration_ms: float = 0.0
+    symbol_timings: tuple[SymbolExitTiming, ...] = ()
 
 
 # Default verify: 10 attempts x 200ms = 2s total
@@ -52,12 +87,19 @@ _DEFAULT_VERIFY_ATTEMPTS = 10
 _DEFAULT_VERIFY_INTERVAL_S = 0.2
 
 
+def _elapsed_ms(start: float) -> float:
+    return (time.monotonic() - start) * 1000.0
+
+
 class EmergencyExitExecutor:
     """Executes § 10.6 emergency exit sequence.
 
     Designed to be stateless — all state tracking lives in the engine.
     Uses EmergencyExitPort protocol (narrow interface, no full ExchangePort dependency).
 
+    With max_workers > 1 the port is called from several threads at once;
+    the port must tolerate concurrent calls for different symbols.
+
     Thread safety: Not thread-safe. Use one instance per engine.
     """
 
@@ -67,10 +109,12 @@ class EmergencyExitExecutor:
         *,
         verify_attempts: int = _DEFAULT_VERIFY_ATTEMPTS,
         verify_interval_s: float = _DEFAULT_VERIFY_INTERVAL_S,
+        max_workers: int = 1,
     ) -> None:
         self._port = port
         self._verify_attempts = verify_attempts
         self._verify_interval_s = verify_interval_s
+        self._max_workers = max(1, max_workers)
 
     def execute(
         self,
@@ -89,58 +133,34 @@ class EmergencyExitExecutor:
             EmergencyExitResult with outcome details.
         """
         logger.critical("EMERGENCY EXIT START: reason=%s symbols=%s", reason, symbols)
+        start = time.monotonic()
 
-        orders_cancelled = 0
-        market_orders_placed = 0
+        if self._max_workers > 1 and len(symbols) > 1:
+            orders_cancelled, market_orders_placed, timings = self._execute_concurrent(symbols)
+        else:
+            orders_cancelled, market_orders_placed, timings = self._execute_serial(symbols)
+        positions_remaining = sum(t.positions_remaining for t in timings)
+        duration_ms = _elapsed_ms(start)
 
-        # Phase 1: Cancel all pending orders
-        for symbol in symbols:
-            try:
-                result = self._port.cancel_all_orders(symbol)
-                orders_cancelled += result
-                logger.info("cancel_all_orders(%s) → %d", symbol, result)
-            except Exception:
-                logger.exception("cancel_all_orders(%s) failed, continuing", symbol)
-
-        # Phase 2: Close positions with MARKET reduce_only
-        for symbol in symbols:
-            try:
-                positions = self._port.get_positions(symbol)
-                for pos in positions:
-                    pos_amt = pos.position_amt
-                    if pos_amt == 0:
-                        continue
-                    # Opposite side to close
-                    close_side = OrderSide.SELL if pos_amt > 0 else OrderSide.BUY
-                    close_qty = abs(pos_amt)
-                    order_id = self._port.place_market_order(
-                        symbol=symbol,
-                        side=close_side,
-                        quantity=close_qty,
-                        reduce_only=True,
-                    )
-                    market_orders_placed += 1
-                    logger.info(
-                        "place_market_order(%s, %s, qty=%s, reduce_only=True) → %s",
-                        symbol,
-                        close_side.value,
-                        close_qty,
-                        order_id,
-                    )
-            except Exception:
-                logger.exception("close_position(%s) failed, continuing", symbol)
-
-        # Phase 3: Bounded verify loop
-        positions_remaining = self._verify_positions_closed(symbols)
+        for t in timings:
+            logger.info(
+                "EMERGENCY EXIT SYMBOL %s: cancel=%.0fms flatten=%.0fms verify=%.0fms remaining=%d",
+                t.symbol,
+                t.cancel_ms,
+                t.flatten_ms,
+                t.verify_ms,
+                t.positions_remaining,
+            )
 
         success = positions_remaining == 0
         level = "INFO" if success else "CRITICAL"
         getattr(logger, level.lower())(
-            "EMERGENCY EXIT %s: cancelled=%d market=%d remaining=%d",
+            "EMERGENCY EXIT %s: cancelled=%d market=%d remaining=%d duration=%.0fms",
             "COMPLETE" if success else "PARTIAL",
             orders_cancelled,
             market_orders_placed,
             positions_remaining,
+            duration_ms,
         )
 
         return EmergencyExitResult(
@@ -150,41 +170,169 @@ class EmergencyExitExecutor:
             market_orders_placed=market_orders_placed,
             positions_remaining=positions_remaining,
             success=success,
+            duration_ms=duration_ms,
+            symbol_timings=tuple(timings),
         )
 
-    def _verify_positions_closed(self, symbols: list[str]) -> int:
+    def _execute_serial(self, symbols: list[str]) -> tuple[int, int, list[SymbolExitTiming]]:
+        """Phase-by-phase over all symbols (cancel all, flatten all, verify all)."""
+        orders_cancelled = 0
+        market_orders_placed = 0
+        cancel_ms: dict[str, float] = {}
+        flatten_ms: dict[str, float] = {}
+
+        # Phase 1: Cancel all pending orders
+        for symbol in symbols:
+            t0 = time.monotonic()
+            orders_cancelled += self._cancel_symbol(symbol)
+            cancel_ms[symbol] = _elapsed_ms(t0)
+
+        # Phase 2: Close positions with MARKET reduce_only
+        for symbol in symbols:
+            t0 = time.monotonic()
+            market_orders_placed += self._flatten_symbol(symbol)
+            flatten_ms[symbol] = _elapsed_ms(t0)
+
+        # Phase 3: Bounded verify loop
+        verify_ms: dict[str, float] = dict.fromkeys(symbols, 0.0)
+        remaining = self._verify_positions_closed(symbols, verify_ms)
+
+        timings = [
+            SymbolExitTiming(
+                symbol=symbol,
+                cancel_ms=cancel_ms[symbol],
+                flatten_ms=flatten_ms[symbol],
+                verify_ms=verify_ms[symbol],
+                positions_remaining=remaining.get(symbol, 0),
+            )
+            for symbol in symbols
+        ]
+        return orders_cancelled, market_orders_placed, timings
+
+    def _execute_concurrent(self, symbols: list[str]) -> tuple[int, int, list[SymbolExitTiming]]:
+        """Per-symbol cancel → flatten → verify chains in a bounded thread pool."""
+        workers = min(self._max_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grinder-ee") as pool:
+            futures = [pool.submit(self._exit_symbol, symbol) for symbol in symbols]
+
+        orders_cancelled = 0
+        market_orders_placed = 0
+        timings: list[SymbolExitTiming] = []
+        for symbol, future in zip(symbols, futures, strict=True):
+            try:
+                cancelled, placed, timing = future.result()
+            except Exception:
+                logger.exception("emergency exit worker for %s failed", symbol)
+                cancelled, placed = 0, 0
+                timing = SymbolExitTiming(symbol, 0.0, 0.0, 0.0, positions_remaining=1)
+            orders_cancelled += cancelled
+            market_orders_placed += placed
+            timings.append(timing)
+        return orders_cancelled, market_orders_placed, timings
+
+    def _exit_symbol(self, symbol: str) -> tuple[int, int, SymbolExitTiming]:
+        """Full exit chain for one symbol: cancel, then flatten, then verify."""
+        t0 = time.monotonic()
+        cancelled = self._cancel_symbol(symbol)
+        t1 = time.monotonic()
+        placed = self._flatten_symbol(symbol)
+        t2 = time.monotonic()
+        remaining = self._verify_positions_closed([symbol]).get(symbol, 0)
+        t3 = time.monotonic()
+        timing = SymbolExitTiming(
+            symbol=symbol,
+            cancel_ms=(t1 - t0) * 1000.0,
+            flatten_ms=(t2 - t1) * 1000.0,
+            verify_ms=(t3 - t2) * 1000.0,
+            positions_remaining=remaining,
+        )
+        return cancelled, placed, timing
+
+    def _cancel_symbol(self, symbol: str) -> int:
+        """cancel_all_orders for one symbol; errors are logged, not raised."""
+        try:
+            result = self._port.cancel_all_orders(symbol)
+            logger.info("cancel_all_orders(%s) → %d", symbol, result)
+            return result
+        except Exception:
+            logger.exception("cancel_all_orders(%s) failed, continuing", symbol)
+            return 0
+
+    def _flatten_symbol(self, symbol: str) -> int:
+        """MARKET reduce_only for each open position of one symbol.
+
+        Returns count of market orders placed; errors are logged, not raised.
+        """
+        placed = 0
+        try:
+            positions = self._port.get_positions(symbol)
+            for pos in positions:
+                pos_amt = pos.position_amt
+                if pos_amt == 0:
+                    continue
+                # Opposite side to close
+                close_side = OrderSide.SELL if pos_amt > 0 else OrderSide.BUY
+                close_qty = abs(pos_amt)
+                order_id = self._port.place_market_order(
+                    symbol=symbol,
+                    side=close_side,
+                    quantity=close_qty,
+                    reduce_only=True,
+                )
+                placed += 1
+                logger.info(
+                    "place_market_order(%s, %s, qty=%s, reduce_only=True) → %s",
+                    symbol,
+                    close_side.value,
+                    close_qty,
+                    order_id,
+                )
+        except Exception:
+            logger.exception("close_position(%s) failed, continuing", symbol)
+        return placed
+
+    def _verify_positions_closed(
+        self, symbols: list[str], verify_ms: dict[str, float] | None = None
+    ) -> dict[str, int]:
         """Bounded retry loop checking if all positions are closed.
 
-        Returns count of remaining non-zero positions.
+        Returns remaining non-zero position count per symbol. If verify_ms is
+        given, time spent in get_positions is accumulated into it per symbol.
         """
         for attempt in range(self._verify_attempts):
-            remaining = self._count_open_positions(symbols)
-            if remaining == 0:
+            remaining = self._count_open_positions(symbols, verify_ms)
+            total = sum(remaining.values())
+            if total == 0:
                 logger.info(
                     "verify attempt %d/%d: all positions closed", attempt + 1, self._verify_attempts
                 )
-                return 0
+                return remaining
             logger.info(
                 "verify attempt %d/%d: %d positions remaining, waiting %.1fs",
                 attempt + 1,
                 self._verify_attempts,
-                remaining,
+                total,
                 self._verify_interval_s,
             )
             if attempt < self._verify_attempts - 1:
                 time.sleep(self._verify_interval_s)
 
         # Final count after all retries
-        return self._count_open_positions(symbols)
+        return self._count_open_positions(symbols, verify_ms)
 
-    def _count_open_positions(self, symbols: list[str]) -> int:
-        """Count non-zero positions across all symbols."""
-        count = 0
+    def _count_open_positions(
+        self, symbols: list[str], verify_ms: dict[str, float] | None = None
+    ) -> dict[str, int]:
+        """Count non-zero positions per symbol."""
+        counts: dict[str, int] = {}
         for symbol in symbols:
+            t0 = time.monotonic()
             try:
                 positions = self._port.get_positions(symbol)
-                count += sum(1 for p in positions if p.position_amt != 0)
+                counts[symbol] = sum(1 for p in positions if p.position_amt != 0)
             except Exception:
                 logger.exception("get_positions(%s) failed during verify", symbol)
-                count += 1  # Assume still open if we can't check
-        return count
+                counts[symbol] = 1  # Assume still open if we can't check
+            if verify_ms is not None:
+                verify_ms[symbol] = verify_ms.get(symbol, 0.0) + _elapsed_ms(t0)
+        return counts
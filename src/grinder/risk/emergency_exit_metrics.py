@@ -9,13 +9,27 @@ Counters (emitted only after first exit):
 - grinder_emergency_exit_total{result}: count of exits by result
 - grinder_emergency_exit_orders_cancelled_total: cumulative cancelled
 - grinder_emergency_exit_positions_closed_total: cumulative closed
+
+Gauges (emitted only after first exit, describe the last exit):
+- grinder_emergency_exit_last_duration_ms: wall-clock duration
+- grinder_emergency_exit_last_symbols: symbols processed
+- grinder_emergency_exit_last_symbol_max_ms{phase}: slowest symbol per phase
+  (cancel / flatten / verify / total)
+
+Per-symbol timings are kept in ``last_symbol_timings`` (logs, debugging) and
+not exported: ``symbol=`` labels are forbidden in /metrics.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from grinder.risk.emergency_exit import EmergencyExitResult  # noqa: TC001 - used at runtime
+from grinder.risk.emergency_exit import (  # noqa: TC001 - used at runtime
+    EmergencyExitResult,
+    SymbolExitTiming,
+)
+
+_PHASES = ("cancel", "flatten", "verify", "total")
 
 
 @dataclass
@@ -26,6 +40,8 @@ class EmergencyExitMetrics:
     _exits: dict[str, int] = field(default_factory=dict)  # result -> count
     _orders_cancelled: int = 0
     _positions_closed: int = 0
+    _last_duration_ms: float = 0.0
+    _last_symbol_timings: tuple[SymbolExitTiming, ...] = ()
 
     def set_enabled(self, enabled: bool) -> None:
         """Set the enabled gauge value."""
@@ -37,6 +53,21 @@ class EmergencyExitMetrics:
         self._exits[key] = self._exits.get(key, 0) + 1
         self._orders_cancelled += result.orders_cancelled
         self._positions_closed += result.market_orders_placed
+        self._last_duration_ms = result.duration_ms
+        self._last_symbol_timings = result.symbol_timings
+
+    @property
+    def last_symbol_timings(self) -> tuple[SymbolExitTiming, ...]:
+        """Per-symbol timings of the most recent exit (empty before first exit)."""
+        return self._last_symbol_timings
+
+    def _last_phase_max_ms(self, phase: str) -> float:
+        """Slowest symbol's time for a phase in the most recent exit."""
+        values = [
+            t.total_ms if phase == "total" else getattr(t, f"{phase}_ms")
+            for t in self._last_symbol_timings
+        ]
+        return max(values, default=0.0)
 
     def to_prometheus_lines(self) -> list[str]:
         """Render Prometheus exposition lines."""
@@ -68,6 +99,29 @@ class EmergencyExitMetrics:
             lines.append("# TYPE grinder_emergency_exit_positions_closed_total counter")
             lines.append(f"grinder_emergency_exit_positions_closed_total {self._positions_closed}")
 
+            lines.append(
+                "# HELP grinder_emergency_exit_last_duration_ms Wall-clock duration of last exit"
+            )
+            lines.append("# TYPE grinder_emergency_exit_last_duration_ms gauge")
+            lines.append(f"grinder_emergency_exit_last_duration_ms {self._last_duration_ms:.1f}")
+
+            lines.append(
+                "# HELP grinder_emergency_exit_last_symbols Symbols processed in last exit"
+            )
+            lines.append("# TYPE grinder_emergency_exit_last_symbols gauge")
+            lines.append(f"grinder_emergency_exit_last_symbols {len(self._last_symbol_timings)}")
+
+            lines.append(
+                "# HELP grinder_emergency_exit_last_symbol_max_ms "
+                "Slowest symbol per phase in last exit"
+            )
+            lines.append("# TYPE grinder_emergency_exit_last_symbol_max_ms gauge")
+            for phase in _PHASES:
+                lines.append(
+                    f'grinder_emergency_exit_last_symbol_max_ms{{phase="{phase}"}} '
+                    f"{self._last_phase_max_ms(phase):.1f}"
+                )
+
         return lines
 
 
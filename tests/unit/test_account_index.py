@@ -0,0 +1,153 @@
+"""Tests for the per-symbol AccountIndex.
+
+Validates:
+- Orders / grid orders (TP excluded) / position qty grouped per symbol
+- Canonical order preserved within a symbol
+- LiveEngineV0 builds the index once per account snapshot
+- Cycle layer and grid planner parse through the shared cache
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from grinder.account.contracts import (
+    OpenOrderSnap,
+    PositionSnap,
+    build_account_snapshot,
+)
+from grinder.account.index import build_account_index
+from grinder.live import LiveEngineConfig, LiveEngineV0
+from grinder.live.cycle_layer import LiveCycleConfig, LiveCycleLayerV1
+from grinder.live.grid_planner import LiveGridConfig, LiveGridPlannerV1
+from grinder.reconcile.identity import (
+    ParsedOrderIdCache,
+    get_order_id_cache,
+    reset_order_id_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from grinder.account.contracts import AccountSnapshot
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache() -> Iterator[None]:
+    reset_order_id_cache()
+    yield
+    reset_order_id_cache()
+
+
+def _order(order_id: str, symbol: str = "BTCUSDT", price: str = "49000") -> OpenOrderSnap:
+    return OpenOrderSnap(
+        order_id=order_id,
+        symbol=symbol,
+        side="BUY",
+        order_type="LIMIT",
+        price=Decimal(price),
+        qty=Decimal("0.01"),
+        filled_qty=Decimal("0"),
+        reduce_only=False,
+        status="NEW",
+        ts=1000,
+    )
+
+
+def _pos(symbol: str, side: str, qty: str) -> PositionSnap:
+    return PositionSnap(
+        symbol=symbol,
+        side=side,
+        qty=Decimal(qty),
+        entry_price=Decimal("50000"),
+        mark_price=Decimal("50000"),
+        unrealized_pnl=Decimal("0"),
+        leverage=10,
+        ts=1000,
+    )
+
+
+GRID_1 = "grinder_d_BTCUSDT_1_1000_1"
+GRID_2 = "grinder_d_BTCUSDT_2_1000_2"
+TP_1 = "grinder_tp_BTCUSDT_1_1000_3"
+ETH_1 = "grinder_d_ETHUSDT_1_1000_4"
+
+
+def _snapshot() -> AccountSnapshot:
+    return build_account_snapshot(
+        positions=[_pos("BTCUSDT", "LONG", "0.5"), _pos("BTCUSDT", "SHORT", "0.2")],
+        open_orders=[
+            _order(GRID_2, price="48000"),
+            _order(TP_1, price="51000"),
+            _order(ETH_1, symbol="ETHUSDT", price="3000"),
+            _order(GRID_1, price="49000"),
+        ],
+    )
+
+
+class TestAccountIndex:
+    def test_groups_by_symbol(self) -> None:
+        snap = _snapshot()
+        index = build_account_index(snap)
+
+        assert index.orders("BTCUSDT") == tuple(
+            o for o in snap.open_orders if o.symbol == "BTCUSDT"
+        )
+        assert [o.order_id for o in index.grid_orders("BTCUSDT")] == [GRID_2, GRID_1]
+        assert [o.order_id for o in index.orders("ETHUSDT")] == [ETH_1]
+        assert index.orders("SOLUSDT") == ()
+        assert index.grid_orders("SOLUSDT") == ()
+
+    def test_position_qty_first_canonical_entry(self) -> None:
+        index = build_account_index(_snapshot())
+        assert index.position_qty("BTCUSDT") == Decimal("0.5")  # LONG sorts before SHORT
+        assert index.position_qty("ETHUSDT") == Decimal("0")
+
+    def test_uses_given_cache(self) -> None:
+        cache = ParsedOrderIdCache()
+        build_account_index(_snapshot(), cache)
+        assert len(cache) == 4
+        assert len(get_order_id_cache()) == 0
+
+
+class TestEngineAccountView:
+    def test_built_once_per_snapshot(self) -> None:
+        engine = LiveEngineV0(MagicMock(), MagicMock(), LiveEngineConfig())
+        assert engine._account_view() is None
+        assert engine._get_position_qty("BTCUSDT") is None
+
+        engine._last_account_snapshot = _snapshot()
+        view = engine._account_view()
+        assert view is not None
+        assert engine._account_view() is view
+        assert engine._get_position_qty("BTCUSDT") == Decimal("0.5")
+
+        engine._last_account_snapshot = _snapshot()
+        assert engine._account_view() is not view
+
+
+class TestSharedCache:
+    def test_consumers_share_parses(self) -> None:
+        cache = get_order_id_cache()
+        index = build_account_index(_snapshot())
+        misses = cache.misses
+
+        LiveCycleLayerV1(LiveCycleConfig()).on_snapshot(
+            symbol="BTCUSDT",
+            open_orders=index.orders("BTCUSDT"),
+            mid_price=Decimal("50000"),
+            ts_ms=2000,
+        )
+        LiveGridPlannerV1(LiveGridConfig(levels=2)).plan(
+            symbol="BTCUSDT",
+            mid_price=Decimal("50000"),
+            ts_ms=2000,
+            open_orders=index.grid_orders("BTCUSDT"),
+        )
+
+        assert cache.misses == misses
+        assert cache.hits > 0
@@ -0,0 +1,378 @@
+"""Tests for StreamAccountState (user-data stream driven AccountSnapshot).
+
+Covers:
+- Seeding from REST, applying ORDER_TRADE_UPDATE / ACCOUNT_UPDATE events
+- Out-of-order events are dropped; pre-seed and in-flight events are replayed
+- Drift check against REST (diff + re-seed), disconnect drops the seed
+- LiveEngineV0 wiring: stream state replaces 5s REST polling while live
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from grinder.account.contracts import (
+    AccountSnapshot,
+    OpenOrderSnap,
+    PositionSnap,
+    build_account_snapshot,
+)
+from grinder.account.stream_state import StreamAccountState
+from grinder.account.syncer import AccountSyncer
+from grinder.connectors.live_connector import SafeMode
+from grinder.contracts import Snapshot
+from grinder.execution.futures_events import UserDataEvent
+from grinder.execution.port import NoOpExchangePort
+from grinder.execution.sor_metrics import reset_sor_metrics
+from grinder.live.config import LiveEngineConfig
+from grinder.live.engine import LiveEngineV0
+
+CID = "grinder_d_BTCUSDT_1_1000_1"
+
+
+def _order_update(cid: str, status: str, ts: int, filled: str = "0") -> UserDataEvent:
+    return UserDataEvent.from_binance(
+        {
+            "e": "ORDER_TRADE_UPDATE",
+            "E": ts,
+            "o": {
+                "s": "BTCUSDT",
+                "c": cid,
+                "S": "BUY",
+                "o": "LIMIT",
+                "X": status,
+                "i": 42,
+                "p": "50000",
+                "q": "0.010",
+                "z": filled,
+                "ap": "50000" if filled != "0" else "0",
+                "R": False,
+            },
+        }
+    )
+
+
+def _account_update(ts: int, *positions: tuple[str, str, str]) -> UserDataEvent:
+    return UserDataEvent.from_binance(
+        {
+            "e": "ACCOUNT_UPDATE",
+            "E": ts,
+            "a": {
+                "m": "ORDER",
+                "B": [],
+                "P": [
+                    {"s": sym, "pa": amt, "ep": "50000", "up": "0", "ps": ps}
+                    for sym, amt, ps in positions
+                ],
+            },
+        }
+    )
+
+
+def _position(symbol: str, qty: str, ts: int = 500) -> PositionSnap:
+    return PositionSnap(
+        symbol=symbol,
+        side="BOTH",
+        qty=Decimal(qty),
+        entry_price=Decimal("50000"),
+        mark_price=Decimal("50100"),
+        unrealized_pnl=Decimal("0"),
+        leverage=3,
+        ts=ts,
+    )
+
+
+def _order(order_id: str, ts: int = 500) -> OpenOrderSnap:
+    return OpenOrderSnap(
+        order_id=order_id,
+        symbol="BTCUSDT",
+        side="BUY",
+        order_type="LIMIT",
+        price=Decimal("49000"),
+        qty=Decimal("0.010"),
+        filled_qty=Decimal("0"),
+        reduce_only=False,
+        status="NEW",
+        ts=ts,
+    )
+
+
+def _seeded(**kw: Any) -> StreamAccountState:
+    state = StreamAccountState()
+    state.set_connected(True)
+    state.seed(build_account_snapshot(kw.get("positions", []), kw.get("orders", [])))
+    return state
+
+
+class TestStreamAccountState:
+    def test_not_live_until_seeded_and_connected(self) -> None:
+        state = StreamAccountState()
+        assert state.snapshot() is None
+        assert not state.apply(_order_update(CID, "NEW", 1000))
+        assert state.events_pending == 1
+
+        state.seed(build_account_snapshot([], []))
+        assert not state.live
+        state.set_connected(True)
+        assert state.live
+
+    def test_order_lifecycle(self) -> None:
+        state = _seeded()
+
+        assert state.apply(_order_update(CID, "NEW", 1000))
+        snap = state.snapshot()
+        assert snap is not None and snap.source == "stream"
+        assert [o.order_id for o in snap.open_orders] == [CID]
+        assert snap.open_orders[0].status == "NEW"
+
+        state.apply(_order_update(CID, "PARTIALLY_FILLED", 1100, filled="0.004"))
+        snap = state.snapshot()
+        assert snap is not None
+        assert snap.open_orders[0].filled_qty == Decimal("0.004")
+        assert snap.open_orders[0].status == "PARTIALLY_FILLED"
+
+        state.apply(_order_update(CID, "FILLED", 1200, filled="0.010"))
+        snap = state.snapshot()
+        assert snap is not None and snap.open_orders == ()
+
+    def test_stale_order_event_ignored(self) -> None:
+        state = _seeded()
+        state.apply(_order_update(CID, "PARTIALLY_FILLED", 2000, filled="0.004"))
+
+        assert not state.apply(_order_update(CID, "NEW", 1500))
+        snap = state.snapshot()
+        assert snap is not None and snap.open_orders[0].status == "PARTIALLY_FILLED"
+
+    def test_account_update_all_positions(self) -> None:
+        """Multi-symbol ACCOUNT_UPDATE updates every position; pa=0 removes it."""
+        state = _seeded(positions=[_position("ETHUSDT", "1.0")])
+
+        state.apply(_account_update(1000, ("BTCUSDT", "-0.010", "BOTH"), ("ETHUSDT", "0", "BOTH")))
+
+        snap = state.snapshot()
+        assert snap is not None
+        assert [(p.symbol, p.qty) for p in snap.positions] == [("BTCUSDT", Decimal("0.010"))]
+
+    def test_position_keeps_mark_and_leverage_from_seed(self) -> None:
+        state = _seeded(positions=[_position("BTCUSDT", "0.010")])
+
+        state.apply(_account_update(1000, ("BTCUSDT", "0.020", "BOTH")))
+
+        snap = state.snapshot()
+        assert snap is not None
+        pos = snap.positions[0]
+        assert pos.qty == Decimal("0.020")
+        assert pos.mark_price == Decimal("50100")
+        assert pos.leverage == 3
+
+    def test_snapshot_cached_until_change(self) -> None:
+        state = _seeded()
+        first = state.snapshot()
+        assert state.snapshot() is first
+        state.apply(_order_update(CID, "NEW", 1000))
+        assert state.snapshot() is not first
+
+    def test_check_drift_reports_and_reseeds(self) -> None:
+        state = _seeded(orders=[_order("a")])
+        state.apply(_order_update(CID, "NEW", 1000))
+        rest = build_account_snapshot([_position("BTCUSDT", "0.010")], [_order("b")])
+
+        diffs = state.check_drift(rest)
+
+        assert any("position BTCUSDT/BOTH" in d for d in diffs)
+        assert any("order a open in stream" in d for d in diffs)
+        assert any(f"order {CID} open in stream" in d for d in diffs)
+        assert any("order b open on exchange" in d for d in diffs)
+        snap = state.snapshot()
+        assert snap is not None
+        assert [o.order_id for o in snap.open_orders] == ["b"]
+
+    def test_check_drift_clean(self) -> None:
+        rest = build_account_snapshot([_position("BTCUSDT", "0.010")], [_order("a")])
+        state = _seeded(positions=list(rest.positions), orders=list(rest.open_orders))
+        assert state.check_drift(rest) == []
+
+    def test_pre_seed_events_replayed(self) -> None:
+        """Events before the first seed are replayed on top of it, not lost."""
+        state = StreamAccountState()
+        state.set_connected(True)
+        state.apply(_order_update(CID, "NEW", 1000))
+        state.apply(_account_update(1000, ("BTCUSDT", "0.010", "BOTH")))
+
+        state.seed(build_account_snapshot([], []))
+
+        snap = state.snapshot()
+        assert snap is not None
+        assert [o.order_id for o in snap.open_orders] == [CID]
+        assert [p.qty for p in snap.positions] == [Decimal("0.010")]
+        assert state.events_pending == 0
+
+    def test_fill_during_rest_call_not_reverted(self) -> None:
+        """A REST snapshot requested before a fill does not undo the fill."""
+        state = _seeded(orders=[_order(CID)])
+        state.begin_sync()
+        # Fill arrives while REST is in flight; REST still shows the order open
+        state.apply(_order_update(CID, "FILLED", 1000, filled="0.010"))
+        state.apply(_account_update(1000, ("BTCUSDT", "0.010", "BOTH")))
+        rest = build_account_snapshot([], [_order(CID)])
+
+        assert state.check_drift(rest) == []
+
+        snap = state.snapshot()
+        assert snap is not None
+        assert snap.open_orders == ()
+        assert [p.qty for p in snap.positions] == [Decimal("0.010")]
+
+    def test_replay_respects_newer_rest_entry(self) -> None:
+        """Buffered events older than the REST entry are ignored on replay."""
+        state = _seeded()
+        state.begin_sync()
+        state.apply(_order_update(CID, "NEW", 1000))
+
+        state.seed(build_account_snapshot([], [_order(CID, ts=2000)]))
+
+        snap = state.snapshot()
+        assert snap is not None
+        assert snap.open_orders[0].price == Decimal("49000")
+
+    def test_abort_sync_stops_buffering(self) -> None:
+        state = _seeded()
+        state.begin_sync()
+        state.apply(_order_update(CID, "NEW", 1000))
+        state.abort_sync()
+
+        state.seed(build_account_snapshot([], []))
+
+        snap = state.snapshot()
+        assert snap is not None and snap.open_orders == ()
+
+    def test_disconnect_drops_seed(self) -> None:
+        state = _seeded()
+        state.set_connected(False)
+        assert not state.live
+        assert state.snapshot() is None
+
+
+# --- Engine wiring ---
+
+
+@pytest.fixture
+def _engine_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    reset_sor_metrics()
+    monkeypatch.setenv("GRINDER_ACCOUNT_SYNC_ENABLED", "1")
+    monkeypatch.delenv("GRINDER_EMERGENCY_EXIT_ENABLED", raising=False)
+    monkeypatch.delenv("GRINDER_ACCOUNT_STREAM_DRIFT_CHECK_MS", raising=False)
+
+
+def _snapshot(ts: int) -> Snapshot:
+    return Snapshot(
+        ts=ts,
+        symbol="BTCUSDT",
+        bid_price=Decimal("50000"),
+        ask_price=Decimal("50001"),
+        bid_qty=Decimal("1.0"),
+        ask_qty=Decimal("1.0"),
+        last_price=Decimal("50000.5"),
+        last_qty=Decimal("0.5"),
+    )
+
+
+def _engine(rest: AccountSnapshot, stream: StreamAccountState) -> tuple[LiveEngineV0, MagicMock]:
+    sync_port = MagicMock()
+    sync_port.fetch_account_snapshot.return_value = rest
+    paper_engine = MagicMock()
+    paper_engine.process_snapshot.return_value = MagicMock(actions=[])
+    engine = LiveEngineV0(
+        paper_engine=paper_engine,
+        exchange_port=NoOpExchangePort(),
+        config=LiveEngineConfig(armed=False, mode=SafeMode.READ_ONLY),
+        account_syncer=AccountSyncer(sync_port),
+        account_stream=stream,
+    )
+    return engine, sync_port
+
+
+@pytest.mark.usefixtures("_engine_env")
+class TestEngineAccountStream:
+    def test_rest_seeds_then_stream_drives_snapshot(self) -> None:
+        stream = StreamAccountState()
+        stream.set_connected(True)
+        engine, sync_port = _engine(build_account_snapshot([], []), stream)
+
+        engine.process_snapshot(_snapshot(10_000))  # REST seed
+        assert stream.live
+        stream.apply(_order_update(CID, "NEW", 10_500))
+        engine.process_snapshot(_snapshot(11_000))
+
+        snap = engine.last_account_snapshot
+        assert snap is not None and snap.source == "stream"
+        assert [o.order_id for o in snap.open_orders] == [CID]
+        assert sync_port.fetch_account_snapshot.call_count == 1
+
+    def test_event_during_rest_sync_survives_seed(self) -> None:
+        stream = StreamAccountState()
+        stream.set_connected(True)
+        engine, sync_port = _engine(build_account_snapshot([], []), stream)
+
+        def fetch() -> AccountSnapshot:
+            stream.apply(_order_update(CID, "NEW", 9_500))  # lands mid-request
+            return build_account_snapshot([], [])
+
+        sync_port.fetch_account_snapshot.side_effect = fetch
+        engine.process_snapshot(_snapshot(10_000))
+
+        snap = stream.snapshot()
+        assert snap is not None
+        assert [o.order_id for o in snap.open_orders] == [CID]
+
+    def test_event_during_rest_sync_reaches_engine(self) -> None:
+        """The engine uses the merged state after a sync, not the raw REST snapshot."""
+        stream = StreamAccountState()
+        stream.set_connected(True)
+        engine, sync_port = _engine(build_account_snapshot([], []), stream)
+        engine.process_snapshot(_snapshot(10_000))  # REST seed
+
+        def fetch() -> AccountSnapshot:
+            stream.apply(_order_update(CID, "NEW", 70_500))  # lands mid-request
+            return build_account_snapshot([], [])
+
+        sync_port.fetch_account_snapshot.side_effect = fetch
+        engine.process_snapshot(_snapshot(71_000))  # drift check
+
+        snap = engine.last_account_snapshot
+        assert sync_port.fetch_account_snapshot.call_count == 2
+        assert snap is not None and snap.source == "stream"
+        assert [o.order_id for o in snap.open_orders] == [CID]
+
+        # An event after the sync is still picked up on the next tick
+        stream.apply(_order_update(CID, "CANCELED", 71_500))
+        engine.process_snapshot(_snapshot(72_000))
+        snap = engine.last_account_snapshot
+        assert snap is not None and snap.open_orders == ()
+
+    def test_live_stream_stretches_rest_interval(self) -> None:
+        stream = StreamAccountState()
+        stream.set_connected(True)
+        engine, _ = _engine(build_account_snapshot([], []), stream)
+
+        with patch.object(engine, "_tick_account_sync", wraps=engine._tick_account_sync) as sync:
+            engine.process_snapshot(_snapshot(10_000))
+            engine.process_snapshot(_snapshot(16_000))  # +6s: REST poll would fire
+            assert sync.call_count == 1
+            engine.process_snapshot(_snapshot(71_000))  # +61s: drift check
+            assert sync.call_count == 2
+
+    def test_disconnected_stream_falls_back_to_polling(self) -> None:
+        stream = StreamAccountState()  # never connected
+        engine, _ = _engine(build_account_snapshot([], []), stream)
+
+        with patch.object(engine, "_tick_account_sync", wraps=engine._tick_account_sync) as sync:
+            engine.process_snapshot(_snapshot(10_000))
+            engine.process_snapshot(_snapshot(16_000))
+            assert sync.call_count == 2
+        snap = engine.last_account_snapshot
+        assert snap is not None and snap.source == "exchange"
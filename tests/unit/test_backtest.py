@@ -12,6 +12,7 @@ Contract guarantees:
 - Digest matching is deterministic (same fixtures -> same report_digest)
 - All monetary values are strings (Decimal serialization)
 - Top-K selection is deterministic and included in results (ADR-010)
+- Process-pool runs (--jobs) produce the same report as serial runs
 """
 
 from __future__ import annotations
@@ -21,6 +22,8 @@ import sys
 from pathlib import Path
 from typing import ClassVar
 
+import pytest
+
 # Add project root to path for scripts import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -30,6 +33,7 @@ from scripts.run_backtest import (
     BacktestReport,
     FixtureResult,
     load_fixture_config,
+    resolve_jobs,
     run_backtest,
     run_fixture,
 )
@@ -217,6 +221,31 @@ class TestDeterminism:
 
         assert outputs[0] == outputs[1], "JSON outputs differ between runs"
 
+    def test_parallel_run_matches_serial(self) -> None:
+        """Verify --jobs run yields the same results order and report digest."""
+        serial = run_backtest()
+        parallel = run_backtest(jobs=2)
+
+        assert parallel.to_json() == serial.to_json()
+        assert [r.fixture_path for r in parallel.results] == [str(p) for p in FIXTURES]
+
+    def test_parallel_run_keeps_missing_fixture_position(self) -> None:
+        """Verify missing fixtures stay in place when others run in a pool."""
+        fixtures = [FIXTURES[0], Path("tests/fixtures/does_not_exist"), FIXTURES[1]]
+
+        report = run_backtest(fixtures, jobs=2)
+
+        assert [r.fixture_path for r in report.results] == [str(p) for p in fixtures]
+        assert report.results[1].errors == [f"Fixture not found: {fixtures[1]}"]
+        assert report.report_digest == run_backtest(fixtures).report_digest
+
+    def test_resolve_jobs(self) -> None:
+        """Verify jobs=0 maps to CPU count and negatives are rejected."""
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) >= 1
+        with pytest.raises(ValueError):
+            resolve_jobs(-1)
+
     def test_json_is_deterministic_sorted(self) -> None:
         """Verify JSON output uses sorted keys."""
         report = run_backtest()
@@ -0,0 +1,246 @@
+"""Tests for BinanceDepthWsConnector (local L2 books from depth diff stream)."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from grinder.connectors.binance_depth_ws import (
+    BinanceDepthSnapshotFetcher,
+    BinanceDepthWsConnector,
+    DepthWsConfig,
+)
+from grinder.connectors.binance_ws import FakeWsTransport
+from grinder.connectors.data_connector import ConnectorState
+from grinder.connectors.errors import ConnectorClosedError, ConnectorTransientError
+from grinder.execution.binance_port import HttpResponse
+from grinder.features.l2_book import DepthSnapshot
+
+
+def _depth_msg(first: int, final: int, prev: int, bids: list[list[str]] | None = None) -> str:
+    return json.dumps(
+        {
+            "e": "depthUpdate",
+            "E": final * 10,
+            "s": "BTCUSDT",
+            "U": first,
+            "u": final,
+            "pu": prev,
+            "b": bids or [],
+            "a": [],
+        }
+    )
+
+
+class FakeFetcher:
+    """Returns queued snapshots; records calls."""
+
+    def __init__(self, *last_update_ids: int) -> None:
+        self._ids = list(last_update_ids)
+        self.calls: list[str] = []
+
+    def __call__(self, symbol: str) -> DepthSnapshot:
+        self.calls.append(symbol)
+        last_update_id = self._ids.pop(0)
+        return DepthSnapshot(
+            symbol=symbol,
+            last_update_id=last_update_id,
+            bids=((Decimal("50000"), Decimal("1")),),
+            asks=((Decimal("50001"), Decimal("1")),),
+        )
+
+
+async def _collect(ws: BinanceDepthWsConnector) -> list[tuple[int, Decimal]]:
+    seen = []
+    async for book in ws.iter_books():
+        best = book.best_bid()
+        assert best is not None
+        seen.append((book.last_update_id, best.qty))
+    return seen
+
+
+@pytest.fixture
+def config() -> DepthWsConfig:
+    return DepthWsConfig(symbols=["BTCUSDT"])
+
+
+class TestDepthWsConnector:
+    async def test_buffers_until_snapshot_then_applies(self, config: DepthWsConfig) -> None:
+        transport = FakeWsTransport(
+            messages=[
+                json.dumps({"result": None, "id": 1}),
+                _depth_msg(90, 95, 89),  # buffered, then stale vs snapshot 100
+                _depth_msg(96, 105, 95, bids=[["50000", "2"]]),
+                _depth_msg(106, 110, 105, bids=[["50000", "3"]]),
+            ]
+        )
+        fetcher = FakeFetcher(100)
+        ws = BinanceDepthWsConnector(config, fetcher, transport=transport)
+        await ws.connect()
+
+        seen = await _collect(ws)
+
+        # First diff triggers the resync; it is older than the snapshot
+        assert fetcher.calls == ["BTCUSDT"]
+        assert seen == [(100, Decimal("1")), (105, Decimal("2")), (110, Decimal("3"))]
+        assert ws.stats.resyncs == 1
+        assert ws.stats.diffs_stale == 1
+        assert ws.stats.diffs_applied == 2
+
+    async def test_gap_triggers_resync(self, config: DepthWsConfig) -> None:
+        transport = FakeWsTransport(
+            messages=[
+                _depth_msg(96, 105, 95),
+                _depth_msg(106, 110, 105),
+                _depth_msg(121, 125, 120, bids=[["50000", "7"]]),  # gap
+            ]
+        )
+        fetcher = FakeFetcher(100, 124)
+        ws = BinanceDepthWsConnector(config, fetcher, transport=transport)
+        await ws.connect()
+
+        seen = await _collect(ws)
+
+        assert ws.stats.gaps == 1
+        assert ws.stats.resyncs == 2
+        assert seen[-1] == (125, Decimal("7"))
+        book = ws.book("BTCUSDT")
+        assert book is not None and book.synced
+
+    async def test_failed_snapshot_keeps_book_unsynced(self, config: DepthWsConfig) -> None:
+        def failing(_symbol: str) -> DepthSnapshot:
+            raise ConnectorTransientError("boom")
+
+        transport = FakeWsTransport(messages=[_depth_msg(96, 105, 95)])
+        ws = BinanceDepthWsConnector(config, failing, transport=transport)
+        await ws.connect()
+
+        assert await _collect(ws) == []
+        assert ws.stats.errors == 1
+        book = ws.book("BTCUSDT")
+        assert book is not None and not book.synced
+
+    async def test_failed_resync_backs_off(self, config: DepthWsConfig) -> None:
+        calls: list[str] = []
+
+        def failing(symbol: str) -> DepthSnapshot:
+            calls.append(symbol)
+            raise ConnectorTransientError("boom")
+
+        now = [0.0]
+        transport = FakeWsTransport(
+            messages=[_depth_msg(96, 105, 95), _depth_msg(106, 110, 105), _depth_msg(111, 115, 110)]
+        )
+        ws = BinanceDepthWsConnector(config, failing, transport=transport, clock=lambda: now[0])
+
+        # Backoff 500 ms after the first failure: one fetch, later diffs only buffered
+        await ws.connect()
+        assert await _collect(ws) == []
+        assert len(calls) == 1
+        assert ws.stats.resyncs_throttled == 2
+
+        # After the delay the next diff retries; backoff doubles to 1000 ms
+        now[0] = 0.6
+        await ws.connect()
+        assert await _collect(ws) == []
+        assert len(calls) == 2
+
+        now[0] = 1.2
+        await ws.connect()
+        assert await _collect(ws) == []
+        assert len(calls) == 2
+        assert ws.stats.resyncs_throttled == 7
+
+    async def test_resync_after_backoff_replays_buffer(self, config: DepthWsConfig) -> None:
+        fetcher = FakeFetcher(100)
+        attempts = [0]
+
+        def flaky(symbol: str) -> DepthSnapshot:
+            attempts[0] += 1
+            if attempts[0] == 1:
+                raise ConnectorTransientError("boom")
+            return fetcher(symbol)
+
+        now = [0.0]
+        transport = FakeWsTransport(
+            messages=[
+                _depth_msg(96, 105, 95),
+                _depth_msg(106, 110, 105, bids=[["50000", "3"]]),
+            ]
+        )
+        ws = BinanceDepthWsConnector(config, flaky, transport=transport, clock=lambda: now[0])
+        await ws.connect()
+        assert await _collect(ws) == []
+
+        # Replayed stream: the first diff resyncs and the buffered diffs are applied
+        now[0] = 1.0
+        await ws.connect()
+        seen = await _collect(ws)
+
+        assert attempts[0] == 2
+        assert seen[0] == (110, Decimal("3"))
+        book = ws.book("BTCUSDT")
+        assert book is not None and book.synced
+
+    async def test_ignores_other_symbols_and_messages(self, config: DepthWsConfig) -> None:
+        other = json.loads(_depth_msg(1, 2, 0))
+        other["s"] = "ETHUSDT"
+        transport = FakeWsTransport(messages=[json.dumps(other), json.dumps({"e": "trade"})])
+        fetcher = FakeFetcher()
+        ws = BinanceDepthWsConnector(config, fetcher, transport=transport)
+        await ws.connect()
+
+        assert await _collect(ws) == []
+        assert fetcher.calls == []
+
+    async def test_raises_if_not_connected(self, config: DepthWsConfig) -> None:
+        ws = BinanceDepthWsConnector(config, FakeFetcher(), transport=FakeWsTransport())
+        with pytest.raises(ConnectorClosedError):
+            async for _ in ws.iter_books():
+                pass
+
+    async def test_context_manager(self, config: DepthWsConfig) -> None:
+        ws = BinanceDepthWsConnector(config, FakeFetcher(), transport=FakeWsTransport())
+        async with ws:
+            assert ws.state == ConnectorState.CONNECTED
+        assert ws.stats.reconnects == 0
+        assert json.loads(config.get_subscribe_message())["params"] == ["btcusdt@depth@100ms"]
+
+
+def _depth_http_client(status: int = 200) -> MagicMock:
+    client = MagicMock()
+    client.request.return_value = HttpResponse(
+        status_code=status,
+        json_data={"lastUpdateId": 42, "E": 7, "bids": [["1", "2"]], "asks": [["3", "4"]]},
+    )
+    return client
+
+
+class TestSnapshotFetcher:
+    def test_fetches_and_parses(self) -> None:
+        client = _depth_http_client()
+        fetcher = BinanceDepthSnapshotFetcher(client, base_url="https://x", limit=50)
+
+        snap = fetcher("BTCUSDT")
+
+        assert snap.last_update_id == 42
+        assert snap.bids == ((Decimal("1"), Decimal("2")),)
+        client.request.assert_called_once_with(
+            method="GET",
+            url="https://x/fapi/v1/depth",
+            params={"symbol": "BTCUSDT", "limit": 50},
+            timeout_ms=5000,
+            op="get_depth",
+        )
+
+    def test_error_status_is_transient(self) -> None:
+        fetcher = BinanceDepthSnapshotFetcher(_depth_http_client(status=503))
+        with pytest.raises(ConnectorTransientError):
+            fetcher("BTCUSDT")
+
+    def test_rejects_invalid_limit(self) -> None:
+        with pytest.raises(ValueError, match="limit"):
+            BinanceDepthSnapshotFetcher(_depth_http_client(), limit=7)
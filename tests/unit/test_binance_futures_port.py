@@ -8,20 +8,26 @@ Tests cover:
 - Symbol whitelist: Only allowed symbols can trade
 - Error mapping: Binance errors → Connector*Error types
 - Futures-specific: leverage, position mode, position cleanup
+- Batch place/cancel: /fapi/v1/batchOrders chunking and per-order results
+- Amend: replace_order via PUT /fapi/v1/order, side from tracked state, fallback
 
 See ADR-040 for design decisions.
 """
 
 from __future__ import annotations
 
+import json
 import os
+from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from grinder.connectors.errors import (
     ConnectorNonRetryableError,
+    ConnectorTransientError,
 )
 from grinder.connectors.live_connector import SafeMode
 from grinder.core import OrderSide
@@ -31,7 +37,9 @@ from grinder.execution.binance_futures_port import (
     BinanceFuturesPort,
     BinanceFuturesPortConfig,
 )
-from grinder.execution.binance_port import NoopHttpClient
+from grinder.execution.binance_port import HttpResponse, NoopHttpClient
+from grinder.execution.port import BatchAmendRequest, BatchPlaceRequest
+from grinder.execution.port_metrics import get_port_metrics, reset_port_metrics
 
 # --- Fixtures ---
 
@@ -953,3 +961,402 @@ class TestFetchAccountSnapshot:
 
         assert len(snap.open_orders) == 1
         assert snap.open_orders[0].reduce_only is False
+
+
+# --- Batch Orders ---
+
+
+@dataclass
+class BatchHttpClient:
+    """Fake exchange for /fapi/v1/batchOrders: echoes orders, fails chosen client IDs."""
+
+    reject: dict[str, dict[str, Any]] = field(default_factory=dict)
+    status_code: int = 200
+    raise_exception: Exception | None = None
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+        timeout_ms: int = 5000,  # noqa: ARG002
+        op: str = "",
+    ) -> HttpResponse:
+        assert params is not None
+        self.calls.append({"method": method, "url": url, "params": params, "op": op})
+        if self.raise_exception is not None:
+            raise self.raise_exception
+        if self.status_code != 200:
+            return HttpResponse(self.status_code, {"code": -1001, "msg": "Disconnected"})
+
+        items: list[dict[str, Any]] = []
+        if method == "POST":
+            for n, order in enumerate(json.loads(params["batchOrders"])):
+                cid = order["newClientOrderId"]
+                items.append(
+                    self.reject.get(cid) or {"orderId": n, "clientOrderId": cid, "status": "NEW"}
+                )
+        elif method == "PUT":
+            for n, order in enumerate(json.loads(params["batchOrders"])):
+                cid = order["origClientOrderId"]
+                items.append(
+                    self.reject.get(cid) or {"orderId": n, "clientOrderId": cid, "status": "NEW"}
+                )
+        else:
+            for n, cid in enumerate(json.loads(params["origClientOrderIdList"])):
+                items.append(
+                    self.reject.get(cid)
+                    or {"orderId": n, "clientOrderId": cid, "status": "CANCELED"}
+                )
+        return HttpResponse(200, items)
+
+
+def _batch_place(n: int, symbol: str = "BTCUSDT") -> list[BatchPlaceRequest]:
+    return [
+        BatchPlaceRequest(
+            symbol=symbol,
+            side=OrderSide.BUY,
+            price=Decimal("50000") - i,
+            quantity=Decimal("0.001"),
+            level_id=i,
+            ts=1000,
+            client_order_id=f"grinder_d_{symbol}_{i}_1000_{i + 1}",
+        )
+        for i in range(n)
+    ]
+
+
+class TestBatchOrders:
+    """Tests for place_orders_batch / cancel_orders_batch."""
+
+    def test_place_batch_chunks_of_five(self, live_trade_config: BinanceFuturesPortConfig) -> None:
+        """12 orders → 3 POST /fapi/v1/batchOrders requests (5 + 5 + 2)."""
+        client = BatchHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        orders = _batch_place(12)
+        results = port.place_orders_batch(orders)
+
+        assert [len(json.loads(c["params"]["batchOrders"])) for c in client.calls] == [5, 5, 2]
+        assert all(c["url"].endswith("/fapi/v1/batchOrders") for c in client.calls)
+        assert all(c["method"] == "POST" and c["op"] == "place_batch" for c in client.calls)
+        assert all("signature" in c["params"] for c in client.calls)
+        assert [r.order_id for r in results] == [o.client_order_id for o in orders]
+        assert all(r.ok for r in results)
+
+    def test_place_batch_item_error_is_per_order(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """A rejected item maps to its own error; siblings still succeed."""
+        orders = _batch_place(3)
+        client = BatchHttpClient(
+            reject={
+                orders[1].client_order_id or "": {"code": -2019, "msg": "Margin is insufficient."}
+            }
+        )
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        results = port.place_orders_batch(orders)
+
+        assert results[0].ok and results[2].ok
+        assert isinstance(results[1].error, ConnectorNonRetryableError)
+        assert "-2019" in str(results[1].error)
+        # Sent clientOrderId is kept on failure so a retry reuses it
+        assert results[1].client_order_id == orders[1].client_order_id
+
+    def test_place_batch_validation_skips_bad_symbol(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Non-whitelisted order gets an error and is not sent."""
+        client = BatchHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        orders = _batch_place(2) + _batch_place(1, symbol="XRPUSDT")
+        results = port.place_orders_batch(orders)
+
+        assert len(json.loads(client.calls[0]["params"]["batchOrders"])) == 2
+        assert results[0].ok and results[1].ok
+        assert isinstance(results[2].error, ConnectorNonRetryableError)
+
+    def test_place_batch_request_failure_marks_chunk(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Transport error is returned per order, not raised."""
+        client = BatchHttpClient(raise_exception=ConnectorTransientError("timeout"))
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        results = port.place_orders_batch(_batch_place(3))
+
+        assert len(results) == 3
+        assert all(isinstance(r.error, ConnectorTransientError) for r in results)
+
+    def test_place_batch_dry_run_zero_http_calls(
+        self, dry_run_config: BinanceFuturesPortConfig
+    ) -> None:
+        dry_run_config.max_orders_per_run = 10
+        client = BatchHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=dry_run_config)
+
+        results = port.place_orders_batch(_batch_place(4))
+
+        assert client.calls == []
+        assert all(r.ok for r in results)
+
+    def test_place_batch_read_only_raises(self, read_only_config: BinanceFuturesPortConfig) -> None:
+        port = BinanceFuturesPort(http_client=BatchHttpClient(), config=read_only_config)
+        with pytest.raises(ConnectorNonRetryableError, match="LIVE_TRADE"):
+            port.place_orders_batch(_batch_place(1))
+
+    def test_cancel_batch_groups_by_symbol(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Cancels are sent per symbol via DELETE /fapi/v1/batchOrders."""
+        client = BatchHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        ids = [
+            "grinder_d_BTCUSDT_0_1000_1",
+            "grinder_d_ETHUSDT_0_1000_2",
+            "grinder_d_BTCUSDT_1_1000_3",
+        ]
+        results = port.cancel_orders_batch(ids)
+
+        assert len(client.calls) == 2
+        by_symbol = {
+            c["params"]["symbol"]: json.loads(c["params"]["origClientOrderIdList"])
+            for c in client.calls
+        }
+        assert by_symbol == {"BTCUSDT": [ids[0], ids[2]], "ETHUSDT": [ids[1]]}
+        assert all(c["method"] == "DELETE" for c in client.calls)
+        assert [r.order_id for r in results] == ids
+
+    def test_cancel_batch_unknown_order(self, live_trade_config: BinanceFuturesPortConfig) -> None:
+        reset_port_metrics()
+        ids = ["grinder_d_BTCUSDT_0_1000_1", "grinder_d_BTCUSDT_1_1000_2"]
+        client = BatchHttpClient(reject={ids[0]: {"code": -2011, "msg": "Unknown order sent."}})
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        results = port.cancel_orders_batch([*ids, "not_a_grinder_id"])
+
+        assert isinstance(results[0].error, ConnectorNonRetryableError)
+        assert results[1].order_id == ids[1]
+        assert isinstance(results[2].error, ConnectorNonRetryableError)
+        assert len(client.calls) == 1
+        assert get_port_metrics().cancel_unknown == {"futures": 1}
+
+    def test_cancel_batch_unknown_by_code_only(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """-2011 in another error's message is not counted as an unknown-order cancel."""
+        reset_port_metrics()
+        order_id = "grinder_d_BTCUSDT_0_1000_1"
+        client = BatchHttpClient(
+            reject={order_id: {"code": -1102, "msg": "Param -2011 was malformed."}}
+        )
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        results = port.cancel_orders_batch([order_id])
+
+        assert results[0].error is not None
+        assert get_port_metrics().cancel_unknown == {}
+
+
+# --- Amend (replace_order) ---
+
+
+@dataclass
+class AmendHttpClient:
+    """Fake exchange for /fapi/v1/order: place, cancel, amend and order lookup."""
+
+    amend_error: dict[str, Any] | None = None
+    cancel_error: dict[str, Any] | None = None
+    lookup_side: str | None = None
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+        timeout_ms: int = 5000,  # noqa: ARG002
+        op: str = "",
+    ) -> HttpResponse:
+        assert params is not None
+        self.calls.append({"method": method, "url": url, "params": params, "op": op})
+        error = {"PUT": self.amend_error, "DELETE": self.cancel_error}.get(method)
+        if error is not None:
+            return HttpResponse(400, error)
+        if method == "PUT":
+            return HttpResponse(
+                200, {"clientOrderId": params["origClientOrderId"], "status": "NEW"}
+            )
+        if method == "GET":
+            if self.lookup_side is None:
+                return HttpResponse(400, {"code": -2013, "msg": "Order does not exist."})
+            return HttpResponse(200, {"status": "NEW", "side": self.lookup_side})
+        if method == "DELETE":
+            return HttpResponse(200, {"status": "CANCELED"})
+        return HttpResponse(200, {"clientOrderId": params["newClientOrderId"], "status": "NEW"})
+
+    def methods(self) -> list[str]:
+        return [c["method"] for c in self.calls]
+
+
+class TestAmendOrder:
+    """Tests for replace_order (PUT /fapi/v1/order) and amend_orders_batch."""
+
+    def _place_sell(self, port: BinanceFuturesPort) -> str:
+        return port.place_order(
+            symbol="BTCUSDT",
+            side=OrderSide.SELL,
+            price=Decimal("51000"),
+            quantity=Decimal("0.001"),
+            level_id=3,
+            ts=1000,
+        )
+
+    def test_replace_amends_in_place_with_tracked_side(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Single PUT, tracked SELL side, same clientOrderId back."""
+        client = AmendHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+        client.calls.clear()
+
+        new_id = port.replace_order(order_id, Decimal("51100"), Decimal("0.002"), ts=2000)
+
+        assert new_id == order_id
+        assert client.methods() == ["PUT"]
+        call = client.calls[0]
+        assert call["url"].endswith("/fapi/v1/order")
+        assert call["op"] == "amend_order"
+        assert call["params"]["side"] == "SELL"
+        assert call["params"]["origClientOrderId"] == order_id
+        assert call["params"]["price"] == "51100"
+        assert call["params"]["quantity"] == "0.002"
+
+    def test_replace_untracked_order_looks_up_side(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Order not placed via this port: side comes from GET /fapi/v1/order."""
+        client = AmendHttpClient(lookup_side="SELL")
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        port.replace_order("grinder_d_BTCUSDT_2_1000_7", Decimal("51100"), Decimal("0.001"), 2000)
+
+        assert client.methods() == ["GET", "PUT"]
+        assert client.calls[1]["params"]["side"] == "SELL"
+
+    def test_replace_unknown_side_raises(self, live_trade_config: BinanceFuturesPortConfig) -> None:
+        client = AmendHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+
+        with pytest.raises(ConnectorNonRetryableError, match="side unknown"):
+            port.replace_order("grinder_d_BTCUSDT_2_1000_7", Decimal("51100"), Decimal("0.001"), 0)
+        assert "PUT" not in client.methods()
+
+    def test_replace_rejected_amend_falls_back_to_cancel_place(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Amend not supported for the order → cancel + new place with the same side."""
+        client = AmendHttpClient(
+            amend_error={"code": -5026, "msg": "Exceed maximum modify order limit."}
+        )
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+        client.calls.clear()
+
+        new_id = port.replace_order(order_id, Decimal("51100"), Decimal("0.001"), ts=2000)
+
+        assert new_id != order_id
+        assert client.methods() == ["PUT", "DELETE", "POST"]
+        assert client.calls[2]["params"]["side"] == "SELL"
+        assert "_BTCUSDT_3_" in new_id
+
+    def test_replace_no_change_is_success(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """-5027 (no need to modify) keeps the order; nothing is cancelled."""
+        client = AmendHttpClient(amend_error={"code": -5027, "msg": "No need to modify the order."})
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+        client.calls.clear()
+
+        assert port.replace_order(order_id, Decimal("51000"), Decimal("0.001"), ts=2000) == order_id
+        assert client.methods() == ["PUT"]
+
+    def test_replace_other_reject_raises_without_fallback(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Amend of a filled/gone order (-2013) is raised, not cancel+placed."""
+        client = AmendHttpClient(amend_error={"code": -2013, "msg": "Order does not exist."})
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+        client.calls.clear()
+
+        with pytest.raises(ConnectorNonRetryableError, match="-2013"):
+            port.replace_order(order_id, Decimal("51100"), Decimal("0.001"), ts=2000)
+        assert client.methods() == ["PUT"]
+
+    def test_replace_fallback_cancel_unknown_does_not_place(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """Cancel reports -2011 (filled or unknown) → no new order."""
+        client = AmendHttpClient(
+            amend_error={"code": -5026, "msg": "Exceed maximum modify order limit."},
+            cancel_error={"code": -2011, "msg": "Unknown order sent."},
+        )
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+        client.calls.clear()
+
+        with pytest.raises(ConnectorNonRetryableError, match="not re-placed"):
+            port.replace_order(order_id, Decimal("51100"), Decimal("0.001"), ts=2000)
+        assert client.methods() == ["PUT", "DELETE"]
+
+    def test_replace_transient_error_propagates(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        client = AmendHttpClient(amend_error={"code": -1001, "msg": "Disconnected"})
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        order_id = self._place_sell(port)
+
+        with pytest.raises(ConnectorTransientError):
+            port.replace_order(order_id, Decimal("51100"), Decimal("0.001"), ts=2000)
+        assert "DELETE" not in client.methods()
+
+    def test_replace_dry_run_zero_http_calls(
+        self, dry_run_config: BinanceFuturesPortConfig
+    ) -> None:
+        client = AmendHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=dry_run_config)
+
+        order_id = "grinder_d_BTCUSDT_2_1000_7"
+        assert port.replace_order(order_id, Decimal("51100"), Decimal("0.001"), 0) == order_id
+        assert client.calls == []
+
+    def test_amend_batch_chunks_and_per_order_errors(
+        self, live_trade_config: BinanceFuturesPortConfig
+    ) -> None:
+        """7 amends → PUT batches of 5 + 2; untracked order fails locally."""
+        client = BatchHttpClient()
+        port = BinanceFuturesPort(http_client=client, config=live_trade_config)
+        placed = [r.order_id or "" for r in port.place_orders_batch(_batch_place(7))]
+        client.calls.clear()
+
+        amends = [BatchAmendRequest(oid, Decimal("49000"), Decimal("0.002")) for oid in placed]
+        results = port.amend_orders_batch(
+            [*amends, BatchAmendRequest("not_a_grinder_id", Decimal("1"), Decimal("1"))]
+        )
+
+        assert [c["method"] for c in client.calls] == ["PUT", "PUT"]
+        assert all(c["op"] == "amend_batch" for c in client.calls)
+        sent = [json.loads(c["params"]["batchOrders"]) for c in client.calls]
+        assert [len(b) for b in sent] == [5, 2]
+        assert all(item["side"] == "BUY" for b in sent for item in b)
+        assert [r.order_id for r in results[:7]] == placed
+        assert isinstance(results[7].error, ConnectorNonRetryableError)
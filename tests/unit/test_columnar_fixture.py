@@ -0,0 +1,239 @@
+"""Tests for the binary columnar fixture format (columnar.py).
+
+Tests verify:
+- Exact Decimal round-trip (coefficient + exponent)
+- Paper/replay digests identical to the JSONL source
+- Extra (non-SNAPSHOT) events preserved in order
+- Discovery prefers fresh columns and ignores stale ones (size, mtime, sha256)
+- Manifest validation
+
+See: docs/11_BACKTEST_PROTOCOL.md
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from grinder.contracts import Snapshot
+from grinder.paper import PaperEngine
+from grinder.replay import (
+    ColumnarEventSource,
+    ColumnarFormatError,
+    FixtureEventSource,
+    ReplayEngine,
+    convert_fixture_to_columnar,
+    open_fixture_events,
+)
+from grinder.replay import columnar as columnar_module
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def fixture_copy(tmp_path: Path) -> Path:
+    """Copy of sample_day_multisymbol in a writable location."""
+    dst = tmp_path / "fixture"
+    shutil.copytree(FIXTURES_DIR / "sample_day_multisymbol", dst)
+    return dst
+
+
+class TestEncoding:
+    """Tests for Decimal encoding."""
+
+    @pytest.mark.parametrize("value", ["50000.00", "0.001", "1E+2", "-12.5", "100", "0"])
+    def test_roundtrip_preserves_repr(self, value: str) -> None:
+        """Decoded Decimal has the same str() as the source."""
+        coeff, exp = columnar_module._encode_decimal(value)
+        assert str(Decimal(coeff).scaleb(exp)) == str(Decimal(value))
+
+    @pytest.mark.parametrize("value", ["NaN", "Infinity", "-0.0", "1" * 25])
+    def test_unrepresentable_raises(self, value: str) -> None:
+        """Non-finite, negative zero and oversized values are rejected."""
+        with pytest.raises(ValueError):
+            columnar_module._encode_decimal(value)
+
+
+class TestConversion:
+    """Tests for convert_fixture_to_columnar and ColumnarEventSource."""
+
+    def test_events_match_jsonl(self, fixture_copy: Path) -> None:
+        """Columnar events equal the parsed JSONL snapshots in order."""
+        manifest = convert_fixture_to_columnar(fixture_copy)
+        jsonl_events = list(FixtureEventSource.from_fixture(fixture_copy))
+
+        columnar_events = list(ColumnarEventSource(fixture_copy / "columns"))
+
+        assert manifest["rows"] == len(jsonl_events) == len(columnar_events)
+        assert columnar_events == [Snapshot.from_dict(e) for e in jsonl_events]
+        for got, src in zip(columnar_events, jsonl_events, strict=True):
+            assert isinstance(got, Snapshot)
+            assert got.to_dict()["bid_price"] == str(Decimal(src["bid_price"]))
+
+    def test_block_boundaries(self, fixture_copy: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Small blocks decode the same events as one large block."""
+        convert_fixture_to_columnar(fixture_copy)
+        expected = list(ColumnarEventSource(fixture_copy / "columns"))
+
+        monkeypatch.setattr(columnar_module, "BLOCK_ROWS", 3)
+
+        assert list(ColumnarEventSource(fixture_copy / "columns")) == expected
+
+    def test_extra_events_kept_in_order(self, tmp_path: Path) -> None:
+        """l2_snapshot and malformed SNAPSHOT events survive verbatim."""
+        shutil.copytree(FIXTURES_DIR / "sample_day_l2_exec_guard", tmp_path / "fx")
+        with (tmp_path / "fx" / "events.jsonl").open("a") as f:
+            f.write(json.dumps({"type": "SNAPSHOT", "ts": 10**13, "symbol": "BTCUSDT"}) + "\n")
+        fixture = tmp_path / "fx"
+
+        manifest = convert_fixture_to_columnar(fixture)
+        jsonl_events = list(FixtureEventSource.from_fixture(fixture))
+        columnar_events = list(ColumnarEventSource(fixture / "columns"))
+
+        assert manifest["extra_events"] == 2
+        for got, src in zip(columnar_events, jsonl_events, strict=True):
+            if isinstance(got, Snapshot):
+                assert got == Snapshot.from_dict(src)
+            else:
+                assert got == src
+
+    def test_no_events_raises(self, tmp_path: Path) -> None:
+        """Converting a fixture without JSONL events fails loudly."""
+        with pytest.raises(ColumnarFormatError):
+            convert_fixture_to_columnar(tmp_path)
+
+    def test_bad_manifest_format(self, fixture_copy: Path) -> None:
+        """Unknown format string is rejected."""
+        convert_fixture_to_columnar(fixture_copy)
+        manifest_path = fixture_copy / "columns" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["format"] = "other"
+        manifest_path.write_text(json.dumps(manifest))
+
+        with pytest.raises(ColumnarFormatError, match="Unsupported"):
+            ColumnarEventSource(fixture_copy / "columns")
+
+
+class TestDiscovery:
+    """Tests for open_fixture_events."""
+
+    def test_prefers_columns(self, fixture_copy: Path) -> None:
+        """Fresh columns are used instead of JSONL."""
+        convert_fixture_to_columnar(fixture_copy)
+
+        assert isinstance(open_fixture_events(fixture_copy), ColumnarEventSource)
+
+    def test_stale_columns_ignored(self, fixture_copy: Path) -> None:
+        """If events.jsonl changed size since conversion, JSONL is used."""
+        convert_fixture_to_columnar(fixture_copy)
+        with (fixture_copy / "events.jsonl").open("a") as f:
+            f.write("\n")
+
+        assert isinstance(open_fixture_events(fixture_copy), FixtureEventSource)
+
+    def test_same_size_edit_is_stale(
+        self, fixture_copy: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """An edit that keeps the byte size is detected via mtime + sha256."""
+        convert_fixture_to_columnar(fixture_copy)
+        path = fixture_copy / "events.jsonl"
+        data = path.read_bytes()
+        edited = data.replace(b'"bid_price": "1.0000"', b'"bid_price": "1.0002"', 1)
+        assert len(edited) == len(data) and edited != data
+        path.write_bytes(edited)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with caplog.at_level(logging.WARNING):
+            source = open_fixture_events(fixture_copy)
+
+        assert isinstance(source, FixtureEventSource)
+        assert "COLUMNAR_STALE" in caplog.text
+
+    def test_touch_keeps_columns(self, fixture_copy: Path) -> None:
+        """A new mtime with identical content still uses the columns."""
+        convert_fixture_to_columnar(fixture_copy)
+        path = fixture_copy / "events.jsonl"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert isinstance(open_fixture_events(fixture_copy), ColumnarEventSource)
+
+    def test_legacy_json_checked(self, tmp_path: Path) -> None:
+        """Columns converted from a legacy events.json go stale on edit."""
+        fixture = tmp_path / "legacy"
+        fixture.mkdir()
+        events = list(FixtureEventSource.from_fixture(FIXTURES_DIR / "sample_day_multisymbol"))
+        (fixture / "events.json").write_text(json.dumps(events))
+        convert_fixture_to_columnar(fixture)
+        assert isinstance(open_fixture_events(fixture), ColumnarEventSource)
+
+        (fixture / "events.json").write_text(json.dumps(events[:-1]))
+
+        source = open_fixture_events(fixture)
+        assert isinstance(source, FixtureEventSource)
+        assert source.is_legacy_json
+
+    def test_manifest_without_fingerprint_is_stale(self, fixture_copy: Path) -> None:
+        """Columns from before source fingerprints were recorded are not trusted."""
+        convert_fixture_to_columnar(fixture_copy)
+        manifest_path = fixture_copy / "columns" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        del manifest["sources"]
+        manifest["source_size"] = (fixture_copy / "events.jsonl").stat().st_size
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert isinstance(open_fixture_events(fixture_copy), FixtureEventSource)
+
+
+class TestColumnarDigests:
+    """Runs over columnar fixtures reproduce the JSONL digests."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "sample_day",
+            "sample_day_multisymbol",
+            "sample_day_controller",
+            "sample_day_topk_v1",
+            "sample_day_l2_exec_guard",
+        ],
+    )
+    def test_paper_digest_identical(self, tmp_path: Path, name: str) -> None:
+        """PaperEngine digest is identical for JSONL and columnar runs."""
+        fixture = tmp_path / name
+        shutil.copytree(FIXTURES_DIR / name, fixture)
+        config = json.loads((fixture / "config.json").read_text())
+        topk_v1 = config.get("topk_v1_enabled", False)
+
+        def make_engine() -> PaperEngine:
+            return PaperEngine(
+                controller_enabled=config.get("controller_enabled", False),
+                feature_engine_enabled=config.get("feature_engine_enabled", False) or topk_v1,
+                topk_v1_enabled=topk_v1,
+            )
+
+        expected = make_engine().run(fixture)
+        convert_fixture_to_columnar(fixture)
+        assert isinstance(open_fixture_events(fixture), ColumnarEventSource)
+        got = make_engine().run(fixture)
+
+        assert got.digest == expected.digest
+        assert got.events_processed == expected.events_processed
+        assert got.errors == expected.errors
+
+    def test_replay_digest_identical(self, fixture_copy: Path) -> None:
+        """ReplayEngine digest is identical for JSONL and columnar runs."""
+        expected = ReplayEngine().run(fixture_copy)
+        convert_fixture_to_columnar(fixture_copy)
+
+        got = ReplayEngine().run(fixture_copy)
+
+        assert got.digest == expected.digest
+        assert got.events_processed == expected.events_processed
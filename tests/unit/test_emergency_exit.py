@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from decimal import Decimal
 
 from grinder.core import OrderSide  # noqa: TC001 - used at runtime
-from grinder.risk.emergency_exit import EmergencyExitExecutor, EmergencyExitResult
+from grinder.risk.emergency_exit import (
+    EmergencyExitExecutor,
+    EmergencyExitResult,
+    SymbolExitTiming,
+)
+from grinder.risk.emergency_exit_metrics import EmergencyExitMetrics
 
 # ---------------------------------------------------------------------------
 # Fake port for testing (satisfies EmergencyExitPort protocol)
@@ -35,9 +41,13 @@ class FakeEmergencyExitPort:
     get_positions_raise: bool = False
     # If True, positions are NOT removed after place_market_order (simulates partial fill)
     partial_fill: bool = False
+    # If set, cancel_all_orders waits here (proves calls run concurrently)
+    cancel_barrier: threading.Barrier | None = None
 
     def cancel_all_orders(self, symbol: str) -> int:
         self.calls.append(("cancel_all_orders", symbol))
+        if self.cancel_barrier is not None:
+            self.cancel_barrier.wait(timeout=5)
         if self.cancel_all_raise:
             raise RuntimeError("cancel_all_orders failed")
         return 1
@@ -252,3 +262,108 @@ class TestEmergencyExitAllReduceOnly:
         market_calls = [c for c in port.calls if c[0] == "place_market_order"]
         for call in market_calls:
             assert call[4] == "True", f"reduce_only must be True, got {call[4]}"
+
+
+class TestEmergencyExitConcurrent:
+    """max_workers > 1: per-symbol cancel → flatten → verify in a thread pool."""
+
+    def _port(self, n: int) -> FakeEmergencyExitPort:
+        return FakeEmergencyExitPort(
+            positions={
+                f"SYM{i}USDT": [FakePosition(f"SYM{i}USDT", Decimal("0.010") * (i + 1))]
+                for i in range(n)
+            }
+        )
+
+    def test_symbols_run_in_parallel(self) -> None:
+        """All 4 cancels must be in flight at once to pass the barrier."""
+        port = self._port(4)
+        port.cancel_barrier = threading.Barrier(4)
+        executor = EmergencyExitExecutor(
+            port, verify_attempts=1, verify_interval_s=0, max_workers=4
+        )
+
+        result = executor.execute(ts_ms=1, reason="test", symbols=list(port.positions))
+
+        assert result.success is True
+        assert result.orders_cancelled == 4
+        assert result.market_orders_placed == 4
+
+    def test_cancel_before_flatten_per_symbol(self) -> None:
+        port = self._port(6)
+        executor = EmergencyExitExecutor(
+            port, verify_attempts=1, verify_interval_s=0, max_workers=3
+        )
+
+        executor.execute(ts_ms=1, reason="test", symbols=list(port.positions))
+
+        for symbol in port.positions:
+            sym_calls = [c[0] for c in port.calls if c[1] == symbol]
+            assert sym_calls.index("cancel_all_orders") < sym_calls.index("place_market_order")
+
+    def test_symbol_timings_in_input_order(self) -> None:
+        port = self._port(3)
+        executor = EmergencyExitExecutor(
+            port, verify_attempts=1, verify_interval_s=0, max_workers=2
+        )
+        symbols = list(port.positions)
+
+        result = executor.execute(ts_ms=1, reason="test", symbols=symbols)
+
+        assert [t.symbol for t in result.symbol_timings] == symbols
+        assert all(t.cancel_ms >= 0 and t.verify_ms >= 0 for t in result.symbol_timings)
+        assert result.duration_ms >= max(t.total_ms for t in result.symbol_timings)
+
+    def test_partial_counted_per_symbol(self) -> None:
+        port = self._port(2)
+        port.partial_fill = True
+        executor = EmergencyExitExecutor(
+            port, verify_attempts=2, verify_interval_s=0, max_workers=2
+        )
+
+        result = executor.execute(ts_ms=1, reason="test", symbols=list(port.positions))
+
+        assert result.success is False
+        assert result.positions_remaining == 2
+        assert [t.positions_remaining for t in result.symbol_timings] == [1, 1]
+
+    def test_serial_mode_also_reports_timings(self) -> None:
+        port = self._port(2)
+        executor = EmergencyExitExecutor(port, verify_attempts=1, verify_interval_s=0)
+
+        result = executor.execute(ts_ms=1, reason="test", symbols=list(port.positions))
+
+        assert [t.symbol for t in result.symbol_timings] == list(port.positions)
+        assert [t.positions_remaining for t in result.symbol_timings] == [0, 0]
+
+
+class TestEmergencyExitTimingMetrics:
+    """Last-exit timing gauges aggregate over symbols (no symbol= labels)."""
+
+    def test_slowest_symbol_per_phase(self) -> None:
+        metrics = EmergencyExitMetrics()
+        metrics.record_exit(
+            EmergencyExitResult(
+                triggered_at_ms=1,
+                reason="test",
+                orders_cancelled=2,
+                market_orders_placed=2,
+                positions_remaining=0,
+                success=True,
+                duration_ms=120.0,
+                symbol_timings=(
+                    SymbolExitTiming("BTCUSDT", 10.0, 50.0, 5.0, 0),
+                    SymbolExitTiming("ETHUSDT", 30.0, 20.0, 40.0, 0),
+                ),
+            )
+        )
+
+        lines = "\n".join(metrics.to_prometheus_lines())
+
+        assert "grinder_emergency_exit_last_duration_ms 120.0" in lines
+        assert "grinder_emergency_exit_last_symbols 2" in lines
+        assert 'grinder_emergency_exit_last_symbol_max_ms{phase="cancel"} 30.0' in lines
+        assert 'grinder_emergency_exit_last_symbol_max_ms{phase="flatten"} 50.0' in lines
+        assert 'grinder_emergency_exit_last_symbol_max_ms{phase="total"} 90.0' in lines
+        assert "symbol=" not in lines
+        assert len(metrics.last_symbol_timings) == 2
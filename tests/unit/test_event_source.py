@@ -0,0 +1,149 @@
+"""Tests for streaming fixture event source (event_source.py).
+
+Tests verify:
+- Lazy JSONL streaming and out-of-order detection
+- K-way merge of per-symbol files (stable on equal ts)
+- Fixture discovery order (events.jsonl, events/, events.json)
+- Paper/replay digests unchanged vs in-memory loading
+
+See: docs/11_BACKTEST_PROTOCOL.md
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from grinder.paper import PaperEngine
+from grinder.replay import (
+    FixtureEventSource,
+    FixtureOrderError,
+    ReplayEngine,
+    iter_jsonl_events,
+    merge_event_streams,
+)
+
+FIXTURE_MULTISYMBOL_DIR = Path(__file__).parent.parent / "fixtures" / "sample_day_multisymbol"
+
+
+def write_jsonl(path: Path, events: list[dict[str, Any]]) -> None:
+    """Write events as JSONL."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+
+def load_events(path: Path) -> list[dict[str, Any]]:
+    """Load all events from JSONL into memory."""
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestIterJsonlEvents:
+    """Tests for iter_jsonl_events."""
+
+    def test_yields_in_file_order_and_skips_blank_lines(self, tmp_path: Path) -> None:
+        """Events are yielded lazily in order; blank lines ignored."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"ts": 1}\n\n{"ts": 2}\n{"ts": 2, "x": 1}\n')
+
+        events = list(iter_jsonl_events(path))
+
+        assert events == [{"ts": 1}, {"ts": 2}, {"ts": 2, "x": 1}]
+
+    def test_out_of_order_raises(self, tmp_path: Path) -> None:
+        """A ts regression is rejected with the offending line number."""
+        path = tmp_path / "events.jsonl"
+        write_jsonl(path, [{"ts": 5}, {"ts": 3}])
+
+        with pytest.raises(FixtureOrderError, match=":2: ts=3"):
+            list(iter_jsonl_events(path))
+
+
+class TestMergeEventStreams:
+    """Tests for merge_event_streams."""
+
+    def test_merge_is_stable_on_equal_ts(self) -> None:
+        """Equal ts: earlier stream first, then within-stream order."""
+        a = iter([{"ts": 1, "s": "a1"}, {"ts": 3, "s": "a3"}])
+        b = iter([{"ts": 1, "s": "b1"}, {"ts": 2, "s": "b2"}, {"ts": 3, "s": "b3"}])
+
+        merged = [e["s"] for e in merge_event_streams([a, b])]
+
+        assert merged == ["a1", "b1", "b2", "a3", "b3"]
+
+
+class TestFixtureEventSource:
+    """Tests for FixtureEventSource discovery and iteration."""
+
+    def test_missing_fixture_yields_nothing(self, tmp_path: Path) -> None:
+        """No event files -> empty stream."""
+        assert list(FixtureEventSource.from_fixture(tmp_path)) == []
+
+    def test_reiterable(self, tmp_path: Path) -> None:
+        """Each iteration reopens the file."""
+        write_jsonl(tmp_path / "events.jsonl", [{"ts": 1}, {"ts": 2}])
+        source = FixtureEventSource.from_fixture(tmp_path)
+
+        assert list(source) == list(source) == [{"ts": 1}, {"ts": 2}]
+
+    def test_sharded_matches_stable_sort(self, tmp_path: Path) -> None:
+        """Per-symbol shards merge to the same order as a stable ts sort."""
+        events = load_events(FIXTURE_MULTISYMBOL_DIR / "events.jsonl")
+        by_symbol: dict[str, list[dict[str, Any]]] = {}
+        for event in events:
+            by_symbol.setdefault(event["symbol"], []).append(event)
+        for symbol, symbol_events in by_symbol.items():
+            write_jsonl(tmp_path / "events" / f"{symbol}.jsonl", symbol_events)
+
+        merged = list(FixtureEventSource.from_fixture(tmp_path))
+
+        # Stable sort of the concatenated shards in file-name order
+        expected = [e for symbol in sorted(by_symbol) for e in by_symbol[symbol]]
+        expected.sort(key=lambda e: e.get("ts", 0))
+        assert merged == expected
+
+    def test_legacy_json_is_sorted(self, tmp_path: Path) -> None:
+        """events.json arrays are loaded and stably sorted."""
+        (tmp_path / "events.json").write_text(json.dumps([{"ts": 2}, {"ts": 1}]))
+
+        assert list(FixtureEventSource.from_fixture(tmp_path)) == [{"ts": 1}, {"ts": 2}]
+
+    def test_jsonl_takes_precedence(self, tmp_path: Path) -> None:
+        """events.jsonl wins over events/ and events.json."""
+        write_jsonl(tmp_path / "events.jsonl", [{"ts": 1, "src": "jsonl"}])
+        write_jsonl(tmp_path / "events" / "A.jsonl", [{"ts": 1, "src": "shard"}])
+
+        assert [e["src"] for e in FixtureEventSource.from_fixture(tmp_path)] == ["jsonl"]
+
+
+class TestStreamingDigests:
+    """Streaming runs produce the same digests as before."""
+
+    def test_paper_digest_sharded_equals_single_file(self, tmp_path: Path) -> None:
+        """Splitting a ts-ordered fixture per symbol preserves the paper digest."""
+        events = load_events(FIXTURE_MULTISYMBOL_DIR / "events.jsonl")
+        # Shard names chosen so file order matches original order on ts ties
+        symbols: list[str] = []
+        for event in events:
+            if event["symbol"] not in symbols:
+                symbols.append(event["symbol"])
+        for idx, symbol in enumerate(symbols):
+            write_jsonl(
+                tmp_path / "events" / f"{idx:02d}_{symbol}.jsonl",
+                [e for e in events if e["symbol"] == symbol],
+            )
+
+        expected = PaperEngine().run(FIXTURE_MULTISYMBOL_DIR)
+        sharded = PaperEngine().run(tmp_path)
+
+        assert sharded.events_processed == expected.events_processed == len(events)
+        assert sharded.digest == expected.digest
+
+    def test_replay_empty_fixture(self, tmp_path: Path) -> None:
+        """Empty fixture still reports the 'No events' error."""
+        result = ReplayEngine().run(tmp_path)
+
+        assert result.events_processed == 0
+        assert result.errors == ["No events found in fixture"]
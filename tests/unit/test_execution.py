@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -23,6 +24,7 @@ from grinder.execution import (
     ExecutionState,
     NoOpExchangePort,
     OrderRecord,
+    OrderStore,
 )
 from grinder.execution.constraint_provider import ConstraintProvider
 from grinder.execution.engine import ExecutionEngineConfig, SymbolConstraints, floor_to_step
@@ -819,6 +821,103 @@ class TestStateUpdates:
         assert result.state.last_plan_digest != ""
         assert result.state.last_plan_digest == result.plan_digest
 
+    def test_cancelled_orders_compacted_next_tick(
+        self,
+        engine: ExecutionEngine,
+        bilateral_plan: GridPlan,
+        pause_plan: GridPlan,
+        empty_state: ExecutionState,
+    ) -> None:
+        """Terminal orders are visible for one tick, then dropped from state."""
+        placed = engine.evaluate(bilateral_plan, "BTCUSDT", empty_state, ts=1000)
+        paused = engine.evaluate(pause_plan, "BTCUSDT", placed.state, ts=2000)
+        assert all(o.state == OrderState.CANCELLED for o in paused.state.open_orders.values())
+
+        replaced = engine.evaluate(bilateral_plan, "BTCUSDT", paused.state, ts=3000)
+
+        assert len(replaced.state.open_orders) == len(placed.state.open_orders)
+        assert all(o.state == OrderState.OPEN for o in replaced.state.open_orders.values())
+        # Previous state is not mutated
+        assert len(paused.state.open_orders) == len(placed.state.open_orders)
+
+    def test_state_dict_roundtrip(
+        self,
+        engine: ExecutionEngine,
+        bilateral_plan: GridPlan,
+        empty_state: ExecutionState,
+    ) -> None:
+        """to_dict/from_dict keep records and rebuild the live index."""
+        result = engine.evaluate(bilateral_plan, "BTCUSDT", empty_state, ts=1000)
+
+        restored = ExecutionState.from_dict(result.state.to_dict())
+
+        assert restored == result.state
+        assert restored.orders.live_orders("BTCUSDT") == result.state.orders.live_orders("BTCUSDT")
+
+
+def _record(order_id: str, level_id: int, state: OrderState = OrderState.OPEN) -> OrderRecord:
+    return OrderRecord(
+        order_id=order_id,
+        symbol="BTCUSDT",
+        side=OrderSide.BUY,
+        price=Decimal("49000"),
+        quantity=Decimal("0.1"),
+        state=state,
+        level_id=level_id,
+        created_ts=1000,
+    )
+
+
+class TestOrderStore:
+    """Tests for OrderStore live index and compaction."""
+
+    def test_live_index_in_placement_order(self) -> None:
+        store = OrderStore({"b": _record("b", 2), "a": _record("a", 1)})
+        store["c"] = _record("c", 3, OrderState.CANCELLED)
+
+        assert [o.order_id for o in store.live_orders("BTCUSDT")] == ["b", "a"]
+        assert store.live_orders("ETHUSDT") == []
+
+    def test_rewrite_live_order_keeps_placement_order(self) -> None:
+        """Updating a live order (e.g. partial fill) does not move it to the end."""
+        store = OrderStore({"a": _record("a", 1), "b": _record("b", 2)})
+
+        store.transition("a", OrderState.PARTIALLY_FILLED)
+
+        assert [o.order_id for o in store.live_orders("BTCUSDT")] == ["a", "b"]
+        assert store.live_orders("BTCUSDT")[0].state == OrderState.PARTIALLY_FILLED
+
+    def test_transition_updates_index(self) -> None:
+        store = OrderStore({"a": _record("a", 1)})
+
+        updated = store.transition("a", OrderState.FILLED)
+
+        assert updated is not None and updated.state == OrderState.FILLED
+        assert store["a"].state == OrderState.FILLED
+        assert store.live_orders("BTCUSDT") == []
+        assert store.transition("missing", OrderState.FILLED) is None
+
+    def test_compact_drops_terminal_only(self) -> None:
+        store = OrderStore({"a": _record("a", 1), "b": _record("b", 2)})
+        store.transition("a", OrderState.CANCELLED)
+
+        assert store.compact() == 1
+        assert list(store) == ["b"]
+        assert store.compact() == 0
+
+    def test_copy_is_independent(self) -> None:
+        store = OrderStore({"a": _record("a", 1)})
+        copy = store.copy()
+        copy.transition("a", OrderState.CANCELLED)
+
+        assert store["a"].state == OrderState.OPEN
+        assert [o.order_id for o in store.live_orders("BTCUSDT")] == ["a"]
+        assert copy.live_orders("BTCUSDT") == []
+
+    def test_compares_equal_to_dict(self) -> None:
+        records = {"a": _record("a", 1)}
+        assert OrderStore(records) == records
+
 
 # --- Tests: Metrics ---
 
@@ -1587,3 +1686,106 @@ class TestRoundPriceTickSize:
         )
         result = engine._round_price(Decimal("85123.45"), "XYZUSDT")
         assert result == Decimal("85123.45")  # price_precision=2 fallback
+
+
+class TestPlanMemoization:
+    """Plan cache and no-change short-circuit produce uncached output."""
+
+    @staticmethod
+    def _uncached(engine: ExecutionEngine, plan: GridPlan, state: ExecutionState, ts: int) -> Any:
+        engine._plan_cache.clear()
+        return engine.evaluate(plan, "BTCUSDT", state, ts)
+
+    @staticmethod
+    def _dump(result: Any) -> tuple[Any, ...]:
+        return (
+            [a.to_dict() for a in result.actions],
+            [e.to_dict() for e in result.events],
+            result.state.to_dict(),
+            result.plan_digest,
+        )
+
+    def test_levels_match_repeated_power(self, engine: ExecutionEngine) -> None:
+        """Running-product prices equal the per-level power loop, digit for digit."""
+        plan = GridPlan(
+            mode=GridMode.BILATERAL,
+            center_price=Decimal("50000.123"),
+            spacing_bps=7.5,
+            levels_up=40,
+            levels_down=40,
+            size_schedule=[Decimal("0.1")],
+            skew_bps=3.0,
+        )
+        skewed = plan.center_price * Decimal(str(1 + plan.skew_bps / 10000))
+        expected: list[str] = []
+        for factor, count in (
+            (Decimal(str(1 + plan.spacing_bps / 10000)), plan.levels_up),
+            (Decimal(str(1 - plan.spacing_bps / 10000)), plan.levels_down),
+        ):
+            for i in range(1, count + 1):
+                price = skewed
+                for _ in range(i):
+                    price = price * factor
+                expected.append(str(engine._round_price(price)))
+
+        levels = engine._compute_grid_levels(plan, "BTCUSDT")
+        assert [str(lv.price) for lv in levels] == expected
+
+    def test_ticks_identical_to_uncached(
+        self, bilateral_plan: GridPlan, soft_reset_plan: GridPlan
+    ) -> None:
+        cached = ExecutionEngine(port=NoOpExchangePort())
+        reference = ExecutionEngine(port=NoOpExchangePort())
+        moved = GridPlan(
+            mode=GridMode.BILATERAL,
+            center_price=Decimal("50100.0"),
+            spacing_bps=10.0,
+            levels_up=3,
+            levels_down=3,
+            size_schedule=[Decimal("0.1"), Decimal("0.2"), Decimal("0.3")],
+        )
+        plans = [bilateral_plan] * 3 + [soft_reset_plan, moved, moved, bilateral_plan]
+
+        state_c, state_r = ExecutionState(), ExecutionState()
+        for ts, plan in enumerate(plans, start=1000):
+            result_c = cached.evaluate(plan, "BTCUSDT", state_c, ts)
+            result_r = self._uncached(reference, plan, state_r, ts)
+            assert self._dump(result_c) == self._dump(result_r)
+            state_c, state_r = result_c.state, result_r.state
+
+    def test_digest_distinguishes_equal_decimals(self, bilateral_plan: GridPlan) -> None:
+        """50000 and 50000.0 are equal Decimals but digest differently."""
+        engine = ExecutionEngine(port=NoOpExchangePort())
+        first = engine.evaluate(bilateral_plan, "BTCUSDT", ExecutionState(), 1000)
+        bilateral_plan.center_price = Decimal("50000.0")
+        second = engine.evaluate(bilateral_plan, "BTCUSDT", ExecutionState(), 1000)
+        assert first.plan_digest != second.plan_digest
+        assert second.plan_digest == engine._compute_plan_digest(bilateral_plan)
+
+    def test_quiet_tick_skips_reconcile(self, bilateral_plan: GridPlan) -> None:
+        engine = ExecutionEngine(port=NoOpExchangePort())
+        state = engine.evaluate(bilateral_plan, "BTCUSDT", ExecutionState(), 1000).state
+        state = engine.evaluate(bilateral_plan, "BTCUSDT", state, 1001).state
+        assert engine._plan_cache["BTCUSDT"].quiet_orders is not None
+
+        result = engine.evaluate(bilateral_plan, "BTCUSDT", state, 1002)
+        assert result.actions == []
+        assert result.events[0].details == {
+            "placed_count": 0,
+            "cancelled_count": 0,
+            "reset_action": "NONE",
+        }
+
+    def test_fill_breaks_short_circuit(self, bilateral_plan: GridPlan) -> None:
+        """A changed live order set reconciles again (filled level is re-placed)."""
+        engine = ExecutionEngine(port=NoOpExchangePort())
+        state = engine.evaluate(bilateral_plan, "BTCUSDT", ExecutionState(), 1000).state
+        state = engine.evaluate(bilateral_plan, "BTCUSDT", state, 1001).state
+
+        filled = state.orders.live_orders("BTCUSDT")[0]
+        state.orders.transition(filled.order_id, OrderState.FILLED)
+        result = engine.evaluate(bilateral_plan, "BTCUSDT", state, 1002)
+
+        assert [(a.action_type, a.level_id, a.side) for a in result.actions] == [
+            (ActionType.PLACE, filled.level_id, filled.side)
+        ]
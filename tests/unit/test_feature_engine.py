@@ -11,12 +11,14 @@ See: docs/17_ADAPTIVE_SMART_GRID_V1.md §17.5
 
 from __future__ import annotations
 
+import pickle
 from decimal import Decimal
 
 import pytest
 
 from grinder.contracts import Snapshot
-from grinder.features import FeatureEngine, FeatureEngineConfig, FeatureSnapshot
+from grinder.features import FeatureEngine, FeatureEngineConfig, FeatureSnapshot, PolicyFeatures
+from grinder.policies.grid.adaptive import AdaptiveGridPolicy
 
 
 def make_snapshot(
@@ -380,6 +382,67 @@ class TestFeatureSnapshotSerialization:
         assert policy_features["imbalance_l1_bps"] == 3333  # (2-1)/(2+1) ≈ 0.333
 
 
+class TestPolicyFeatures:
+    """Tests for the PolicyFeatures view over FeatureSnapshot."""
+
+    def _feature_snapshot(self) -> FeatureSnapshot:
+        return FeatureEngine().process_snapshot(make_snapshot(bid_qty="2", ask_qty="1"))
+
+    def test_matches_policy_features_dict(self) -> None:
+        """View equals the dict the policy path used to build."""
+        fs = self._feature_snapshot()
+        view = PolicyFeatures(Decimal("1"), fs)
+
+        expected = {"mid_price": fs.mid_price, **fs.to_policy_features()}
+        assert dict(view) == expected
+        assert view == expected
+        assert len(view) == len(expected)
+        assert view["imbalance_l1_bps"] == 3333
+        assert view.get("atr") is None
+        assert "ts" not in view
+
+    def test_mid_price_only_without_snapshot(self) -> None:
+        view = PolicyFeatures(Decimal("50000"))
+        assert dict(view) == {"mid_price": Decimal("50000")}
+        with pytest.raises(KeyError):
+            view["natr_bps"]
+
+    def test_writes_go_to_overlay(self) -> None:
+        """ML/regime fields written by the engine shadow the snapshot."""
+        fs = self._feature_snapshot()
+        view = PolicyFeatures(fs.mid_price, fs)
+        view.update({"regime_probs_bps": {"RANGE": 10000}, "spread_bps": 99})
+
+        assert view["regime_probs_bps"] == {"RANGE": 10000}
+        assert view["spread_bps"] == 99
+        assert fs.spread_bps != 99
+        assert list(view).count("spread_bps") == 1
+
+        del view["spread_bps"]
+        assert view["spread_bps"] == fs.spread_bps
+        with pytest.raises(KeyError):
+            del view["natr_bps"]
+
+    def test_copy_and_pickle(self) -> None:
+        fs = self._feature_snapshot()
+        view = PolicyFeatures(fs.mid_price, fs)
+        view["extra"] = 1
+
+        assert isinstance(view.copy(), dict)
+        assert view.copy() == dict(view)
+        assert pickle.loads(pickle.dumps(view)) == view
+        assert not hasattr(view, "__dict__")
+
+    def test_adaptive_policy_same_plan_as_dict(self) -> None:
+        """Plan matches the dict PaperEngine used to build (mid_price + policy features)."""
+        fs = self._feature_snapshot()
+        view = PolicyFeatures(fs.mid_price, fs)
+        as_dict = {"mid_price": fs.mid_price, **fs.to_policy_features()}
+
+        policy = AdaptiveGridPolicy()
+        assert policy.evaluate(view) == policy.evaluate(as_dict)
+
+
 class TestDeterminism:
     """Tests for deterministic feature computation."""
 
@@ -196,6 +196,25 @@ class TestFuturesOrderEvent:
         assert event.status == OrderState.CANCELLED
         assert event.executed_qty == Decimal("0")
 
+    def test_from_binance_parses_type_and_reduce_only(self) -> None:
+        binance_msg = {
+            "e": "ORDER_TRADE_UPDATE",
+            "E": 1568879469000,
+            "o": {
+                "s": "BTCUSDT",
+                "c": "grinder_BTCUSDT_1_1000000_1",
+                "S": "SELL",
+                "o": "MARKET",
+                "X": "NEW",
+                "R": True,
+            },
+        }
+        event = FuturesOrderEvent.from_binance(binance_msg)
+
+        assert event.order_type == "MARKET"
+        assert event.reduce_only is True
+        assert FuturesOrderEvent.from_dict(event.to_dict()) == event
+
     def test_from_binance_handles_missing_fields(self) -> None:
         """Should not crash on minimal/incomplete messages."""
         minimal_msg = {
@@ -495,6 +514,31 @@ class TestUserDataEvent:
         assert event.position_event.symbol == "ETHUSDT"
         assert event.position_event.position_amt == Decimal("1.0")
 
+    def test_from_binance_account_update_all_positions(self) -> None:
+        """position_events carries every position (hedge-mode sides included)."""
+        binance_msg = {
+            "e": "ACCOUNT_UPDATE",
+            "E": 1000000,
+            "a": {
+                "P": [
+                    {"s": "BTCUSDT", "pa": "0.001", "ep": "50000", "up": "5", "ps": "LONG"},
+                    {"s": "BTCUSDT", "pa": "-0.002", "ep": "51000", "up": "1", "ps": "SHORT"},
+                    {"s": "ETHUSDT", "pa": "1.0", "ep": "3000", "up": "100", "ps": "BOTH"},
+                ]
+            },
+        }
+        event = UserDataEvent.from_binance(binance_msg)
+
+        assert [(p.symbol, p.position_side) for p in event.position_events] == [
+            ("BTCUSDT", "LONG"),
+            ("BTCUSDT", "SHORT"),
+            ("ETHUSDT", "BOTH"),
+        ]
+        assert UserDataEvent.from_dict(event.to_dict()) == event
+
+        filtered = UserDataEvent.from_binance(binance_msg, symbol_filter="ETHUSDT")
+        assert [p.symbol for p in filtered.position_events] == ["ETHUSDT"]
+
     def test_from_binance_unknown_event(self) -> None:
         binance_msg = {
             "e": "MARGIN_CALL",
@@ -82,6 +82,12 @@ class TestBuildMeasuredClientEnabled:
             client = build_measured_client(FakeInnerClient())
         assert client._deadline.deadlines["ping_time"] == 500
 
+    def test_weight_budget_opt_in(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            assert build_measured_client(FakeInnerClient())._weight_budget is None
+        with patch.dict(os.environ, {"HTTP_WEIGHT_BUDGET_ENABLED": "1"}, clear=True):
+            assert build_measured_client(FakeInnerClient())._weight_budget is not None
+
 
 class TestBuildMeasuredClientBadEnv:
     """Invalid env vars raise ConfigError."""
@@ -20,12 +20,15 @@ from grinder.reconcile.identity import (
     ENV_ALLOW_LEGACY_ORDER_ID,
     LEGACY_STRATEGY_ID,
     OrderIdentityConfig,
+    ParsedOrderIdCache,
     generate_client_order_id,
     get_default_identity_config,
+    get_order_id_cache,
     is_ours,
     is_tp_order,
     parse_client_order_id,
     reset_default_identity_config,
+    reset_order_id_cache,
     set_default_identity_config,
 )
 
@@ -515,3 +518,51 @@ class TestIsTpOrder:
     def test_empty_string_not_tp(self) -> None:
         """Empty string returns False."""
         assert is_tp_order("") is False
+
+
+class TestParsedOrderIdCache:
+    """Tests for the bounded LRU parse cache."""
+
+    def test_matches_uncached_parse(self) -> None:
+        """Cached results equal parse_client_order_id(), including None."""
+        cache = ParsedOrderIdCache()
+        for oid in ["grinder_d_BTCUSDT_1_1000_1", "grinder_BTCUSDT_1_1000_1", "manual_1", ""]:
+            assert cache.parse(oid) == parse_client_order_id(oid)
+            assert cache.parse(oid) == parse_client_order_id(oid)
+        assert cache.misses == 4
+        assert cache.hits == 4
+
+    def test_is_tp(self) -> None:
+        """is_tp() agrees with is_tp_order()."""
+        cache = ParsedOrderIdCache()
+        assert cache.is_tp("grinder_tp_BTCUSDT_3_1000_1") is True
+        assert cache.is_tp("grinder_d_BTCUSDT_3_1000_1") is False
+        assert cache.is_tp("manual_123") is False
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Oldest untouched entry is evicted at capacity."""
+        cache = ParsedOrderIdCache(max_entries=2)
+        cache.parse("grinder_d_BTCUSDT_1_1000_1")
+        cache.parse("grinder_d_BTCUSDT_2_1000_1")
+        cache.parse("grinder_d_BTCUSDT_1_1000_1")  # Refresh level 1
+        cache.parse("grinder_d_BTCUSDT_3_1000_1")  # Evicts level 2
+        assert len(cache) == 2
+        misses = cache.misses
+        cache.parse("grinder_d_BTCUSDT_1_1000_1")
+        assert cache.misses == misses
+        cache.parse("grinder_d_BTCUSDT_2_1000_1")
+        assert cache.misses == misses + 1
+
+    def test_rejects_zero_capacity(self) -> None:
+        """max_entries must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ParsedOrderIdCache(max_entries=0)
+
+    def test_shared_singleton(self) -> None:
+        """get_order_id_cache() returns one instance until reset."""
+        reset_order_id_cache()
+        cache = get_order_id_cache()
+        assert get_order_id_cache() is cache
+        reset_order_id_cache()
+        assert get_order_id_cache() is not cache
+        reset_order_id_cache()
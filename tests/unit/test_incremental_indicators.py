@@ -0,0 +1,163 @@
+"""Tests for incremental indicator state (incremental.py).
+
+Tests verify:
+- Cached ATR/NATR and range/trend match the batch indicator functions exactly
+- Warmup behaviour and max_bars capping
+- Zero-price edge cases
+- FeatureEngine output is unchanged vs full-history recompute
+
+See: docs/17_ADAPTIVE_SMART_GRID_V1.md §17.5.2, §17.5.5
+"""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from grinder.contracts import Snapshot
+from grinder.features import FeatureEngine, FeatureEngineConfig, IncrementalIndicators
+from grinder.features.bar import MidBar
+from grinder.features.indicators import compute_atr, compute_natr_bps, compute_range_trend
+
+
+def make_random_bars(count: int, seed: int = 42, start: str = "50000") -> list[MidBar]:
+    """Build a deterministic random walk of bars."""
+    rng = random.Random(seed)
+    close = Decimal(start)
+    bars: list[MidBar] = []
+    for i in range(count):
+        open_ = close
+        close = (close * (Decimal(1) + Decimal(rng.randint(-50, 50)) / Decimal(10000))).quantize(
+            Decimal("0.01")
+        )
+        high = max(open_, close) + Decimal(rng.randint(0, 500)) / Decimal(100)
+        low = min(open_, close) - Decimal(rng.randint(0, 500)) / Decimal(100)
+        bars.append(
+            MidBar(bar_ts=i * 60_000, open=open_, high=high, low=low, close=close, tick_count=3)
+        )
+    return bars
+
+
+class TestIncrementalMatchesBatch:
+    """Incremental state must be bit-identical to batch recompute."""
+
+    @pytest.mark.parametrize(
+        ("atr_period", "range_horizon", "max_bars"),
+        [(14, 14, 1000), (5, 20, 1000), (14, 14, 16), (3, 7, 8)],
+    )
+    def test_every_bar_matches(self, atr_period: int, range_horizon: int, max_bars: int) -> None:
+        """After each bar, cached values equal batch functions on the capped history."""
+        ind = IncrementalIndicators(
+            atr_period=atr_period, range_horizon=range_horizon, max_bars=max_bars
+        )
+        history: list[MidBar] = []
+        for bar in make_random_bars(60):
+            ind.update(bar)
+            history.append(bar)
+            bars = history[-max_bars:]
+
+            assert ind.bar_count == len(bars)
+            atr = compute_atr(bars, atr_period)
+            assert ind.atr == atr
+            assert str(ind.atr) == str(atr)
+            assert ind.natr_bps == compute_natr_bps(bars, atr_period)
+            assert ind.range_trend == compute_range_trend(bars, range_horizon)
+
+    def test_warmup_defaults(self) -> None:
+        """Before period+1 bars, values match warmup defaults."""
+        ind = IncrementalIndicators(atr_period=3, range_horizon=3)
+        for bar in make_random_bars(3):
+            ind.update(bar)
+            assert ind.atr is None
+            assert ind.natr_bps == 0
+            assert ind.range_trend == (0, 0, 0)
+
+    def test_max_bars_below_period_never_warms_up(self) -> None:
+        """If max_bars < period+1, indicators stay in warmup (like batch)."""
+        ind = IncrementalIndicators(atr_period=14, range_horizon=14, max_bars=10)
+        for bar in make_random_bars(30):
+            ind.update(bar)
+        assert ind.bar_count == 10
+        assert ind.atr is None
+        assert ind.range_trend == (0, 0, 0)
+
+    def test_zero_close_matches_batch(self) -> None:
+        """Zero closes are skipped in returns and zero NATR, like batch."""
+        closes = ["100", "0", "0", "101", "102", "0", "103"]
+        bars = [
+            MidBar(
+                bar_ts=i,
+                open=Decimal(c),
+                high=Decimal(c),
+                low=Decimal(c),
+                close=Decimal(c),
+                tick_count=1,
+            )
+            for i, c in enumerate(closes)
+        ]
+        ind = IncrementalIndicators(atr_period=2, range_horizon=3)
+        for i, bar in enumerate(bars):
+            ind.update(bar)
+            history = bars[: i + 1]
+            assert ind.atr == compute_atr(history, 2)
+            assert ind.natr_bps == compute_natr_bps(history, 2)
+            assert ind.range_trend == compute_range_trend(history, 3)
+
+
+class TestFeatureEngineIncremental:
+    """FeatureEngine output matches the batch functions on its bar history."""
+
+    def test_engine_matches_batch_recompute(self) -> None:
+        """Every FeatureSnapshot equals a full recompute over completed bars."""
+        config = FeatureEngineConfig(bar_interval_ms=1000, atr_period=5, range_horizon=6)
+        engine = FeatureEngine(config)
+        rng = random.Random(7)
+        bid = Decimal("50000")
+        completed: list[MidBar] = []
+
+        for i in range(400):
+            bid += Decimal(rng.randint(-20, 20)) / Decimal(10)
+            snapshot = Snapshot(
+                ts=i * 250,
+                symbol="BTCUSDT",
+                bid_price=bid,
+                ask_price=bid + Decimal("0.5"),
+                bid_qty=Decimal("1"),
+                ask_qty=Decimal("2"),
+                last_price=bid,
+                last_qty=Decimal("0.1"),
+            )
+            features = engine.process_snapshot(snapshot)
+            completed = list(engine._bars["BTCUSDT"])
+
+            assert features.atr == compute_atr(completed, 5)
+            assert features.natr_bps == compute_natr_bps(completed, 5)
+            assert (
+                features.sum_abs_returns_bps,
+                features.net_return_bps,
+                features.range_score,
+            ) == compute_range_trend(completed, 6)
+
+        assert len(completed) > 10
+
+    def test_reset_symbol_clears_indicators(self) -> None:
+        """reset_symbol drops rolling indicator state."""
+        engine = FeatureEngine(FeatureEngineConfig(bar_interval_ms=1000, atr_period=2))
+        for i in range(10):
+            engine.process_snapshot(
+                Snapshot(
+                    ts=i * 1000,
+                    symbol="ETHUSDT",
+                    bid_price=Decimal(3000 + i),
+                    ask_price=Decimal(3001 + i),
+                    bid_qty=Decimal("1"),
+                    ask_qty=Decimal("1"),
+                    last_price=Decimal(3000 + i),
+                    last_qty=Decimal("1"),
+                )
+            )
+        assert engine.get_latest_snapshot("ETHUSDT") is not None
+        engine.reset_symbol("ETHUSDT")
+        assert "ETHUSDT" not in engine._indicators
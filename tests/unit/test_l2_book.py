@@ -0,0 +1,172 @@
+"""Unit tests for L2OrderBook (local book from depth diffs).
+
+Tests:
+- Snapshot + diff application, level removal, best-N ordering
+- Update id sequencing: stale drop, first-diff straddle, pu / U continuity, gaps
+- Features match L2FeatureSnapshot.from_l2_snapshot on the same levels
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from grinder.features import DepthDiff, DepthSnapshot, DiffResult, L2OrderBook
+from grinder.features.l2_types import L2FeatureSnapshot
+
+
+def _snapshot(last_update_id: int = 100) -> DepthSnapshot:
+    return DepthSnapshot.from_binance(
+        "BTCUSDT",
+        {
+            "lastUpdateId": last_update_id,
+            "E": 1000,
+            "bids": [["50000", "1.0"], ["49999", "2.0"], ["49998", "0.5"]],
+            "asks": [["50001", "0.002"], ["50002", "0.003"], ["50003", "4.0"]],
+        },
+    )
+
+
+def _diff(
+    first: int,
+    final: int,
+    prev: int | None = None,
+    *,
+    bids: list[list[str]] | None = None,
+    asks: list[list[str]] | None = None,
+    ts: int = 2000,
+) -> DepthDiff:
+    data: dict[str, object] = {
+        "e": "depthUpdate",
+        "E": ts,
+        "s": "BTCUSDT",
+        "U": first,
+        "u": final,
+        "b": bids or [],
+        "a": asks or [],
+    }
+    if prev is not None:
+        data["pu"] = prev
+    return DepthDiff.from_binance(data)
+
+
+def _synced_book() -> L2OrderBook:
+    book = L2OrderBook("BTCUSDT")
+    book.apply_snapshot(_snapshot())
+    return book
+
+
+class TestBookLevels:
+    def test_snapshot_sorted_best_first(self) -> None:
+        book = _synced_book()
+
+        assert book.synced
+        assert [lv.price for lv in book.bids(2)] == [Decimal("50000"), Decimal("49999")]
+        assert [lv.price for lv in book.asks(2)] == [Decimal("50001"), Decimal("50002")]
+        best_bid, best_ask = book.best_bid(), book.best_ask()
+        assert best_bid is not None and best_bid.qty == Decimal("1.0")
+        assert best_ask is not None and best_ask.price == Decimal("50001")
+
+    def test_diff_updates_inserts_and_removes(self) -> None:
+        book = _synced_book()
+
+        result = book.apply_diff(
+            _diff(
+                95,
+                105,
+                prev=90,
+                bids=[["50000.5", "3"], ["49999", "0"]],
+                asks=[["50001", "0"], ["50002", "1.5"]],
+            )
+        )
+
+        assert result == DiffResult.APPLIED
+        assert book.last_update_id == 105
+        assert [(lv.price, lv.qty) for lv in book.bids(3)] == [
+            (Decimal("50000.5"), Decimal("3")),
+            (Decimal("50000"), Decimal("1.0")),
+            (Decimal("49998"), Decimal("0.5")),
+        ]
+        assert [(lv.price, lv.qty) for lv in book.asks(2)] == [
+            (Decimal("50002"), Decimal("1.5")),
+            (Decimal("50003"), Decimal("4.0")),
+        ]
+        assert book.level_counts() == (3, 2)
+
+    def test_removing_unknown_level_is_noop(self) -> None:
+        book = _synced_book()
+        book.apply_diff(_diff(95, 105, prev=90, bids=[["1", "0"]]))
+        assert book.level_counts() == (3, 3)
+
+
+class TestSequencing:
+    def test_not_synced_before_snapshot(self) -> None:
+        book = L2OrderBook("BTCUSDT")
+        assert book.apply_diff(_diff(1, 2)) == DiffResult.NOT_SYNCED
+
+    def test_diff_before_snapshot_is_stale(self) -> None:
+        book = _synced_book()
+        assert book.apply_diff(_diff(80, 99, prev=79)) == DiffResult.STALE
+        assert book.last_update_id == 100
+
+    def test_first_diff_must_straddle_snapshot(self) -> None:
+        book = _synced_book()
+        assert book.apply_diff(_diff(102, 110, prev=101)) == DiffResult.GAP
+        assert not book.synced
+
+    def test_futures_pu_continuity(self) -> None:
+        book = _synced_book()
+        assert book.apply_diff(_diff(95, 105, prev=90)) == DiffResult.APPLIED
+        assert book.apply_diff(_diff(106, 110, prev=105)) == DiffResult.APPLIED
+        assert book.apply_diff(_diff(111, 115, prev=110)) == DiffResult.APPLIED
+        # Missed event 116..120
+        assert book.apply_diff(_diff(121, 125, prev=120)) == DiffResult.GAP
+        assert not book.synced
+        assert book.apply_diff(_diff(126, 130, prev=125)) == DiffResult.NOT_SYNCED
+
+    def test_spot_u_continuity(self) -> None:
+        book = _synced_book()
+        assert book.apply_diff(_diff(101, 105)) == DiffResult.APPLIED
+        assert book.apply_diff(_diff(106, 108)) == DiffResult.APPLIED
+        assert book.apply_diff(_diff(110, 112)) == DiffResult.GAP
+
+    def test_resync_after_gap(self) -> None:
+        book = _synced_book()
+        book.apply_diff(_diff(121, 125, prev=120))
+        book.apply_snapshot(_snapshot(last_update_id=130))
+        assert book.apply_diff(_diff(128, 135, prev=127)) == DiffResult.APPLIED
+        assert book.synced
+
+    def test_invalidate(self) -> None:
+        book = _synced_book()
+        book.invalidate()
+        assert not book.synced
+
+
+class TestFeatures:
+    def test_features_match_l2_snapshot_path(self) -> None:
+        book = _synced_book()
+        book.apply_diff(_diff(95, 105, prev=90, asks=[["50001", "0.001"]]))
+
+        from_book = book.feature_snapshot(depth=3)
+        from_snapshot = L2FeatureSnapshot.from_l2_snapshot(book.to_l2_snapshot(depth=3))
+
+        assert from_book == from_snapshot
+        assert from_book.ts_ms == 2000
+        assert from_book.depth_bid_qty_topN == Decimal("3.5")
+
+    def test_features_cached_until_change(self) -> None:
+        book = _synced_book()
+        first = book.feature_snapshot(depth=2)
+        assert book.feature_snapshot(depth=2) is first
+        assert book.feature_snapshot(depth=3) is not first
+
+        book.apply_diff(_diff(95, 105, prev=90, bids=[["50000", "5"]]))
+        updated = book.feature_snapshot(depth=3)
+        assert updated.depth_bid_qty_topN == Decimal("7.5")
+
+    def test_to_l2_snapshot_caps_depth(self) -> None:
+        book = _synced_book()
+        book.apply_diff(_diff(95, 105, prev=90, asks=[["50001", "0"], ["50002", "0"]]))
+        snap = book.to_l2_snapshot(depth=3)
+        assert snap.depth == 1
+        assert len(snap.bids) == len(snap.asks) == 1
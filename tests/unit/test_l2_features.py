@@ -14,6 +14,7 @@ See: docs/smart_grid/SPEC_V2_0.md, Addendum B
 from __future__ import annotations
 
 import hashlib
+import json
 from decimal import Decimal
 from pathlib import Path
 
@@ -31,8 +32,10 @@ from grinder.replay.l2_snapshot import (
     IMPACT_INSUFFICIENT_DEPTH_BPS,
     QTY_REF_BASELINE,
     BookLevel,
+    L2ParseError,
     L2Snapshot,
     load_l2_fixtures,
+    parse_l2_snapshot_line,
 )
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "l2"
@@ -258,6 +261,20 @@ class TestL2FeatureSnapshot:
         assert restored == snapshot
 
 
+class TestFromL2Dict:
+    """L2FeatureSnapshot.from_l2_dict fast path."""
+
+    def test_matches_from_l2_snapshot(self) -> None:
+        path = FIXTURES_DIR / "l2_scenarios.jsonl"
+        for line in path.read_text().splitlines():
+            expected = L2FeatureSnapshot.from_l2_snapshot(parse_l2_snapshot_line(line))
+            assert L2FeatureSnapshot.from_l2_dict(json.loads(line)) == expected
+
+    def test_validates(self) -> None:
+        with pytest.raises(L2ParseError, match="Missing required field"):
+            L2FeatureSnapshot.from_l2_dict({"type": "l2_snapshot", "v": 0})
+
+
 class TestFixtureScenarios:
     """Tests for 4 canonical fixture scenarios per SPEC B.5."""
 
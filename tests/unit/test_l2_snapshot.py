@@ -16,6 +16,7 @@ import json
 import tempfile
 from decimal import Decimal
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -24,10 +25,16 @@ from grinder.replay.l2_snapshot import (
     QTY_REF_BASELINE,
     BookLevel,
     L2ParseError,
+    RawLevel,
     load_l2_fixtures,
+    parse_l2_levels_dict,
+    parse_l2_snapshot_dict,
     parse_l2_snapshot_line,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "l2"
 
 
@@ -416,6 +423,41 @@ class TestL2SnapshotNegativePaths:
             )
 
 
+class TestDictParsing:
+    """parse_l2_snapshot_dict / parse_l2_levels_dict match the line parser."""
+
+    def test_dict_matches_line(self) -> None:
+        for line in (FIXTURES_DIR / "l2_scenarios.jsonl").read_text().splitlines():
+            assert parse_l2_snapshot_dict(json.loads(line)) == parse_l2_snapshot_line(line)
+
+    def test_levels_dict_returns_raw_levels(self) -> None:
+        line = (FIXTURES_DIR / "l2_scenarios.jsonl").read_text().splitlines()[0]
+        snapshot = parse_l2_snapshot_line(line)
+
+        bids, asks = parse_l2_levels_dict(json.loads(line))
+
+        assert all(type(level) is RawLevel for level in bids + asks)
+        assert [(lv.price, lv.qty) for lv in bids] == [(lv.price, lv.qty) for lv in snapshot.bids]
+        assert [(lv.price, lv.qty) for lv in asks] == [(lv.price, lv.qty) for lv in snapshot.asks]
+
+    @pytest.mark.parametrize("parse", [parse_l2_snapshot_dict, parse_l2_levels_dict])
+    def test_dict_paths_validate(self, parse: Callable[[Any], object]) -> None:
+        data = {
+            "type": "l2_snapshot",
+            "v": 0,
+            "ts_ms": 0,
+            "symbol": "X",
+            "venue": "x",
+            "depth": 1,
+            "bids": [["101", "1"]],
+            "asks": [["100", "1"]],
+        }
+        with pytest.raises(L2ParseError, match="crossed/locked"):
+            parse(data)
+        with pytest.raises(L2ParseError, match="Expected JSON object"):
+            parse([])
+
+
 class TestLoadL2Fixtures:
     """Tests for load_l2_fixtures function."""
 
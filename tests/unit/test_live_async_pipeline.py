@@ -0,0 +1,248 @@
+"""Tests for AsyncExecutionPipeline (non-blocking engine execution).
+
+Covers:
+- submit() returns immediately while the engine blocks on a worker thread
+- FIFO order (per-symbol order preserved) and single engine thread
+- Overflow evicts the stalest snapshot and records back-pressure metrics
+- Conflation keeps the latest waiting snapshot per symbol (optionally feeding
+  superseded ones to bar building)
+- Engine exceptions surface on submit()/stop() (fail-closed)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from grinder.contracts import Snapshot
+from grinder.live.async_pipeline import AsyncExecutionPipeline, AsyncPipelineConfig
+from grinder.live.live_metrics import get_live_engine_metrics, reset_live_engine_metrics
+
+
+def _snap(symbol: str, ts: int) -> Snapshot:
+    return Snapshot(
+        ts=ts,
+        symbol=symbol,
+        bid_price=Decimal("100"),
+        ask_price=Decimal("101"),
+        bid_qty=Decimal("1"),
+        ask_qty=Decimal("1"),
+        last_price=Decimal("100.5"),
+        last_qty=Decimal("1"),
+    )
+
+
+class RecordingEngine:
+    """Stand-in for LiveEngineV0 that records calls and can block."""
+
+    def __init__(self, delay_s: float = 0.0, fail_on_ts: int | None = None) -> None:
+        self.delay_s = delay_s
+        self.fail_on_ts = fail_on_ts
+        self.seen: list[tuple[str, int]] = []
+        self.superseded: list[tuple[str, int]] = []
+        self.threads: set[str] = set()
+        self.release = threading.Event()
+        self.release.set()
+
+    def process_snapshot(self, snapshot: Snapshot) -> None:
+        self.release.wait(timeout=5)
+        time.sleep(self.delay_s)
+        self.threads.add(threading.current_thread().name)
+        if snapshot.ts == self.fail_on_ts:
+            raise RuntimeError("exchange exploded")
+        self.seen.append((snapshot.symbol, snapshot.ts))
+
+    def observe_superseded(self, snapshots: list[Snapshot]) -> None:
+        self.superseded.extend((s.symbol, s.ts) for s in snapshots)
+
+
+class TestAsyncExecutionPipeline:
+    def setup_method(self) -> None:
+        reset_live_engine_metrics()
+
+    def teardown_method(self) -> None:
+        reset_live_engine_metrics()
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_block_on_engine(self) -> None:
+        engine = RecordingEngine(delay_s=0.05)
+        pipeline = AsyncExecutionPipeline(engine)  # type: ignore[arg-type]
+        pipeline.start()
+
+        t0 = time.monotonic()
+        for ts in range(5):
+            pipeline.submit(_snap("BTCUSDT", ts))
+        assert time.monotonic() - t0 < 0.05
+
+        await pipeline.stop()
+        assert [ts for _, ts in engine.seen] == [0, 1, 2, 3, 4]
+        assert pipeline.stats.processed == 5
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_on_single_engine_thread(self) -> None:
+        engine = RecordingEngine()
+        pipeline = AsyncExecutionPipeline(engine)  # type: ignore[arg-type]
+        pipeline.start()
+        expected = []
+        for ts in range(20):
+            symbol = "BTCUSDT" if ts % 3 else "ETHUSDT"
+            expected.append((symbol, ts))
+            pipeline.submit(_snap(symbol, ts))
+            if ts % 4 == 0:
+                await asyncio.sleep(0)
+        await pipeline.stop()
+
+        assert engine.seen == expected
+        assert len(engine.threads) == 1
+        assert next(iter(engine.threads)).startswith("grinder-engine")
+
+    @pytest.mark.asyncio
+    async def test_overflow_evicts_stalest_and_records_metrics(self) -> None:
+        engine = RecordingEngine()
+        engine.release.clear()  # hold the engine thread on the first snapshot
+        pipeline = AsyncExecutionPipeline(engine, AsyncPipelineConfig(max_queue=2))  # type: ignore[arg-type]
+        pipeline.start()
+
+        pipeline.submit(_snap("BTCUSDT", 1))
+        await asyncio.sleep(0.05)  # worker takes ts=1 and blocks
+        pipeline.submit(_snap("ETHUSDT", 2))
+        pipeline.submit(_snap("BTCUSDT", 3))
+        pipeline.submit(_snap("BTCUSDT", 4))  # evicts ETHUSDT ts=2
+
+        metrics = get_live_engine_metrics()
+        assert pipeline.stats.dropped == 1
+        assert metrics.exec_dropped == {"ETHUSDT": 1}
+        assert metrics.exec_queue_depth_max == 2
+
+        engine.release.set()
+        await pipeline.stop()
+        assert [ts for _, ts in engine.seen] == [1, 3, 4]
+        assert metrics.exec_submitted == 4
+        assert metrics.exec_queue_depth == 0
+
+        text = "\n".join(metrics.format_metrics())
+        assert 'grinder_live_exec_dropped_total{sym="ETHUSDT"} 1' in text
+        assert "grinder_live_exec_queue_depth_max 2" in text
+
+    @pytest.mark.asyncio
+    async def test_engine_error_surfaces(self) -> None:
+        engine = RecordingEngine(fail_on_ts=1)
+        pipeline = AsyncExecutionPipeline(engine)  # type: ignore[arg-type]
+        pipeline.start()
+        pipeline.submit(_snap("BTCUSDT", 1))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(RuntimeError, match="exchange exploded"):
+            pipeline.submit(_snap("BTCUSDT", 2))
+        with pytest.raises(RuntimeError, match="exchange exploded"):
+            await pipeline.stop()
+
+    def test_config_validation(self) -> None:
+        with pytest.raises(ValueError, match="max_queue"):
+            AsyncPipelineConfig(max_queue=0)
+        with pytest.raises(ValueError, match="conflate"):
+            AsyncPipelineConfig(conflate_bars=True)
+
+
+class TestConflation:
+    def setup_method(self) -> None:
+        reset_live_engine_metrics()
+
+    def teardown_method(self) -> None:
+        reset_live_engine_metrics()
+
+    async def _run_burst(
+        self, config: AsyncPipelineConfig
+    ) -> tuple[RecordingEngine, AsyncExecutionPipeline]:
+        engine = RecordingEngine()
+        engine.release.clear()  # hold the engine thread on the first snapshot
+        now = [0.0]
+        pipeline = AsyncExecutionPipeline(engine, config, clock=lambda: now[0])  # type: ignore[arg-type]
+        pipeline.start()
+
+        pipeline.submit(_snap("BTCUSDT", 1))
+        await asyncio.sleep(0.05)  # worker takes ts=1 and blocks
+        pipeline.submit(_snap("BTCUSDT", 2))
+        pipeline.submit(_snap("ETHUSDT", 3))
+        now[0] = 0.010
+        pipeline.submit(_snap("BTCUSDT", 4))  # replaces ts=2, keeps its queue position
+        pipeline.submit(_snap("BTCUSDT", 5))  # replaces ts=4
+        assert pipeline.depth == 2
+
+        now[0] = 0.030
+        engine.release.set()
+        await pipeline.stop()
+        return engine, pipeline
+
+    @pytest.mark.asyncio
+    async def test_keeps_latest_per_symbol(self) -> None:
+        engine, pipeline = await self._run_burst(AsyncPipelineConfig(conflate=True))
+
+        assert engine.seen == [("BTCUSDT", 1), ("BTCUSDT", 5), ("ETHUSDT", 3)]
+        assert engine.superseded == []
+        assert pipeline.stats.conflated == 2
+        assert pipeline.stats.dropped == 0
+
+        metrics = get_live_engine_metrics()
+        assert metrics.exec_conflated == {"BTCUSDT": 2}
+        assert metrics.exec_submitted == 5
+        text = "\n".join(metrics.format_metrics())
+        assert 'grinder_live_exec_conflated_total{sym="BTCUSDT"} 2' in text
+        assert "grinder_live_exec_snapshot_age_ms" in text
+
+    @pytest.mark.asyncio
+    async def test_snapshot_age_counts_from_first_pending_update(self) -> None:
+        engine = RecordingEngine()
+        engine.release.clear()
+        now = [0.0]
+        pipeline = AsyncExecutionPipeline(
+            engine,  # type: ignore[arg-type]
+            AsyncPipelineConfig(conflate=True),
+            clock=lambda: now[0],
+        )
+        pipeline.start()
+        pipeline.submit(_snap("BTCUSDT", 1))
+        await asyncio.sleep(0.05)
+        pipeline.submit(_snap("BTCUSDT", 2))  # pending since t=0
+        now[0] = 0.020
+        pipeline.submit(_snap("BTCUSDT", 3))  # replaces ts=2 at t=20ms
+        now[0] = 0.050
+        engine.release.set()
+        await pipeline.stop()
+
+        metrics = get_live_engine_metrics()
+        assert metrics.exec_queue_wait_ms == pytest.approx(30.0)
+        assert metrics.exec_snapshot_age_ms == pytest.approx(50.0)
+
+    @pytest.mark.asyncio
+    async def test_conflate_bars_feeds_superseded_snapshots(self) -> None:
+        engine, _ = await self._run_burst(AsyncPipelineConfig(conflate=True, conflate_bars=True))
+
+        assert engine.seen == [("BTCUSDT", 1), ("BTCUSDT", 5), ("ETHUSDT", 3)]
+        assert engine.superseded == [("BTCUSDT", 2), ("BTCUSDT", 4)]
+
+    @pytest.mark.asyncio
+    async def test_overflow_still_evicts_oldest_symbol(self) -> None:
+        engine = RecordingEngine()
+        engine.release.clear()
+        pipeline = AsyncExecutionPipeline(
+            engine,  # type: ignore[arg-type]
+            AsyncPipelineConfig(max_queue=2, conflate=True),
+        )
+        pipeline.start()
+        pipeline.submit(_snap("BTCUSDT", 1))
+        await asyncio.sleep(0.05)
+        pipeline.submit(_snap("ETHUSDT", 2))
+        pipeline.submit(_snap("SOLUSDT", 3))
+        pipeline.submit(_snap("XRPUSDT", 4))  # evicts ETHUSDT
+        pipeline.submit(_snap("ETHUSDT", 5))  # evicts SOLUSDT; ETHUSDT slot is gone
+
+        engine.release.set()
+        await pipeline.stop()
+        assert engine.seen == [("BTCUSDT", 1), ("XRPUSDT", 4), ("ETHUSDT", 5)]
+        assert pipeline.stats.dropped == 2
+        assert pipeline.stats.conflated == 0
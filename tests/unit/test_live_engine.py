@@ -40,6 +40,7 @@ from grinder.connectors.circuit_breaker import (
     CircuitState,
 )
 from grinder.connectors.errors import (
+    CircuitOpenError,
     ConnectorNonRetryableError,
     ConnectorTransientError,
 )
@@ -49,7 +50,7 @@ from grinder.contracts import Snapshot
 from grinder.core import OrderSide, SystemState
 from grinder.execution.binance_port import map_binance_error
 from grinder.execution.idempotent_port import IdempotentExchangePort
-from grinder.execution.port import NoOpExchangePort
+from grinder.execution.port import BatchOrderResult, BatchPlaceRequest, NoOpExchangePort
 from grinder.execution.types import ActionType, ExecutionAction
 from grinder.features.engine import FeatureEngine, FeatureEngineConfig
 from grinder.live import (
@@ -1282,6 +1283,25 @@ class TestFeatureEngine:
         assert snap.symbol == "BTCUSDT"
         assert hasattr(snap, "natr_bps")
 
+    def test_observe_superseded_feeds_features_only(
+        self,
+        mock_paper_engine: MagicMock,
+        tracking_port: MagicMock,
+        sample_snapshot: Snapshot,
+    ) -> None:
+        """Conflated-away snapshots reach FeatureEngine, never the planner or port."""
+        feature_engine = MagicMock()
+        config = LiveEngineConfig(armed=True, mode=SafeMode.LIVE_TRADE)
+        engine = LiveEngineV0(
+            mock_paper_engine, tracking_port, config, feature_engine=feature_engine
+        )
+
+        engine.observe_superseded([sample_snapshot, sample_snapshot])
+
+        assert feature_engine.process_snapshot.call_count == 2
+        mock_paper_engine.process_snapshot.assert_not_called()
+        assert tracking_port.calls == []
+
     def test_feature_engine_runs_during_fsm_defer(
         self,
         mock_paper_engine: MagicMock,
@@ -5226,3 +5246,256 @@ class TestTPCloseAtomicity:
         results = engine._process_tp_close_retries("BTCUSDT", 45000)
         assert len(results) == 0  # No retry attempt, just cleanup
         assert corr not in engine._tp_close_retries  # Cleared
+
+
+class TestBatchCoalescing:
+    """GRINDER_LIVE_BATCH_ORDERS: same-symbol PLACE/CANCEL per tick go out as batches."""
+
+    @staticmethod
+    def _make_port() -> MagicMock:
+        port = MagicMock()
+        port.calls = []
+
+        def place_batch(orders: list[BatchPlaceRequest]) -> list[BatchOrderResult]:
+            port.calls.append(("place_orders_batch", [o.level_id for o in orders]))
+            return [BatchOrderResult(order_id=f"P{o.level_id}") for o in orders]
+
+        def cancel_batch(order_ids: list[str]) -> list[BatchOrderResult]:
+            port.calls.append(("cancel_orders_batch", list(order_ids)))
+            return [BatchOrderResult(order_id=oid) for oid in order_ids]
+
+        def place(**kwargs: Any) -> str:
+            port.calls.append(("place_order", kwargs["level_id"]))
+            return f"P{kwargs['level_id']}"
+
+        def cancel(order_id: str) -> bool:
+            port.calls.append(("cancel_order", order_id))
+            return True
+
+        port.place_orders_batch.side_effect = place_batch
+        port.cancel_orders_batch.side_effect = cancel_batch
+        port.place_order.side_effect = place
+        port.cancel_order.side_effect = cancel
+        return port
+
+    @staticmethod
+    def _place(level: int, reason: str = "SOFT_RESET_REPLACE") -> ExecutionAction:
+        return ExecutionAction(
+            action_type=ActionType.PLACE,
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            price=Decimal("49000") - level,
+            quantity=Decimal("0.01"),
+            level_id=level,
+            reason=reason,
+        )
+
+    @staticmethod
+    def _cancel(order_id: str, reason: str = "SOFT_RESET_REPLACE") -> ExecutionAction:
+        return ExecutionAction(
+            action_type=ActionType.CANCEL,
+            order_id=order_id,
+            symbol="BTCUSDT",
+            reason=reason,
+        )
+
+    @staticmethod
+    def _make_engine(
+        mock_paper_engine: MagicMock,
+        port: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        enabled: bool = True,
+    ) -> LiveEngineV0:
+        monkeypatch.setenv("GRINDER_LIVE_BATCH_ORDERS", "1" if enabled else "0")
+        config = LiveEngineConfig(armed=True, mode=SafeMode.LIVE_TRADE)
+        retry_policy = RetryPolicy(max_attempts=3, base_delay_ms=1)
+        return LiveEngineV0(mock_paper_engine, port, config, retry_policy=retry_policy)
+
+    def test_interleaved_actions_coalesced_cancels_first(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        port = self._make_port()
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        actions = [
+            self._cancel("A"),
+            self._place(1),
+            self._cancel("B"),
+            self._place(2),
+        ]
+        mock_paper_engine.process_snapshot.return_value = MagicMock(actions=actions)
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        assert port.calls == [
+            ("cancel_orders_batch", ["A", "B"]),
+            ("place_orders_batch", [1, 2]),
+        ]
+        # Results stay in original action order
+        assert [la.action for la in output.live_actions] == actions
+        assert all(la.status == LiveActionStatus.EXECUTED for la in output.live_actions)
+        assert [la.order_id for la in output.live_actions] == ["A", "P1", "B", "P2"]
+
+    def test_disabled_by_default_uses_single_calls(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        port = self._make_port()
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch, enabled=False)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._place(2)]
+        )
+
+        engine.process_snapshot(sample_snapshot)
+
+        assert port.calls == [("place_order", 1), ("place_order", 2)]
+
+    def test_tp_pair_flushes_batch_and_runs_sequentially(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        port = self._make_port()
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._place(2), self._cancel("T", reason="TP_RENEW")]
+        )
+
+        engine.process_snapshot(sample_snapshot)
+
+        assert port.calls == [("place_orders_batch", [1, 2]), ("cancel_order", "T")]
+
+    def test_item_errors_mapped_and_transient_retried(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        port = self._make_port()
+        port.place_orders_batch.side_effect = lambda _orders: [
+            BatchOrderResult(order_id="P1"),
+            BatchOrderResult(error=ConnectorNonRetryableError("Binance error -2019: margin")),
+            BatchOrderResult(error=ConnectorTransientError("Binance transient error -1001")),
+        ]
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._place(2), self._place(3)]
+        )
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        statuses = [la.status for la in output.live_actions]
+        assert statuses == [
+            LiveActionStatus.EXECUTED,
+            LiveActionStatus.FAILED,
+            LiveActionStatus.EXECUTED,
+        ]
+        assert output.live_actions[1].block_reason == BlockReason.NON_RETRYABLE_ERROR
+        # Transient item retried through the single-order path
+        assert port.calls == [("place_order", 3)]
+
+    def test_transient_retry_reuses_batch_client_id(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The retry sends the batch's clientOrderId and counts the batch as attempt 1."""
+        port = self._make_port()
+        port.place_orders_batch.side_effect = lambda orders: [
+            BatchOrderResult(
+                error=ConnectorTransientError("timeout"), client_order_id=f"cid_{o.level_id}"
+            )
+            for o in orders
+        ]
+        port.place_order.side_effect = lambda **kw: kw["client_order_id"]
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._place(2)]
+        )
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        sent = [c.kwargs["client_order_id"] for c in port.place_order.call_args_list]
+        assert sent == ["cid_1", "cid_2"]
+        assert [la.order_id for la in output.live_actions] == ["cid_1", "cid_2"]
+        assert [la.attempts for la in output.live_actions] == [2, 2]
+
+    def test_transient_retry_within_attempt_budget(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Batch + single-order retries together stay within max_attempts."""
+        port = self._make_port()
+        port.place_orders_batch.side_effect = ConnectorTransientError("batch timeout")
+        port.place_order.side_effect = ConnectorTransientError("timeout")
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._place(2)]
+        )
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        # max_attempts=3: batch (1) + two single-order attempts per action
+        assert port.place_order.call_count == 4
+        assert all(la.attempts == 3 for la in output.live_actions)
+        assert all(
+            la.block_reason == BlockReason.MAX_RETRIES_EXCEEDED for la in output.live_actions
+        )
+
+    def test_circuit_open_item_not_retried(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        port = self._make_port()
+        port.cancel_orders_batch.side_effect = lambda ids: [
+            BatchOrderResult(error=CircuitOpenError("cancel")) for _ in ids
+        ]
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._cancel("A"), self._cancel("B")]
+        )
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        assert port.calls == []
+        assert all(
+            la.block_reason == BlockReason.CIRCUIT_BREAKER_OPEN for la in output.live_actions
+        )
+
+    def test_blocked_actions_not_sent(
+        self,
+        mock_paper_engine: MagicMock,
+        sample_snapshot: Snapshot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Gates run per action before batching (kill-switch blocks PLACE, allows CANCEL)."""
+        port = self._make_port()
+        engine = self._make_engine(mock_paper_engine, port, monkeypatch)
+        engine._config.kill_switch_active = True
+        mock_paper_engine.process_snapshot.return_value = MagicMock(
+            actions=[self._place(1), self._cancel("A"), self._cancel("B")]
+        )
+
+        output = engine.process_snapshot(sample_snapshot)
+
+        assert port.calls == [("cancel_orders_batch", ["A", "B"])]
+        assert output.live_actions[0].block_reason == BlockReason.KILL_SWITCH_ACTIVE
+
+    def test_port_without_batch_support_disables_batching(
+        self,
+        mock_paper_engine: MagicMock,
+        noop_port: NoOpExchangePort,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        engine = self._make_engine(mock_paper_engine, noop_port, monkeypatch)  # type: ignore[arg-type]
+        assert engine._batch_orders_enabled is False
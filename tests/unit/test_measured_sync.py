@@ -6,6 +6,7 @@ Covers:
 - Retry matrix: transient errors retried, non-retryable errors immediate
 - Label safety: no symbol= in metrics output
 - Metrics recording: requests, retries, fails, latency
+- Weight budget: admission waits via sleep_func, usage synced from headers
 """
 
 from __future__ import annotations
@@ -21,9 +22,11 @@ from grinder.net.measured_sync import MeasuredSyncHttpClient
 from grinder.net.retry_policy import (
     OP_CANCEL_ORDER,
     OP_GET_POSITIONS,
+    OP_PLACE_ORDER,
     DeadlinePolicy,
     HttpRetryPolicy,
 )
+from grinder.net.weight_budget import WeightBudget, WeightBudgetConfig
 from grinder.observability.latency_metrics import HttpMetrics
 
 # ---------------------------------------------------------------------------
@@ -438,6 +441,47 @@ class TestMetricsRecording:
         assert metrics.fails[(OP_GET_POSITIONS, "4xx")] == 1
 
 
+# ---------------------------------------------------------------------------
+# Weight budget
+# ---------------------------------------------------------------------------
+
+
+class TestWeightBudget:
+    """Budget applies per attempt, in both pass-through and measured modes."""
+
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_waits_for_next_window_and_syncs_headers(self, enabled: bool) -> None:
+        clock = FakeClock(start=1000.0)  # 1m window resets at t=1020
+        sleep = FakeSleep(clock)
+        budget = WeightBudget(
+            WeightBudgetConfig(weight_limits={"1m": 10}, max_wait_ms=60_000), clock=clock
+        )
+        inner = MockInnerClient(
+            responses=[
+                HttpResponse(status_code=200, json_data={}, headers={"X-MBX-USED-WEIGHT-1M": "8"}),
+                HttpResponse(status_code=200, json_data={}),
+            ]
+        )
+        client = MeasuredSyncHttpClient(
+            inner=inner, enabled=enabled, clock=clock, sleep_func=sleep, weight_budget=budget
+        )
+
+        client.request(method="POST", url="/test", op=OP_PLACE_ORDER)
+        assert budget.used("1m") == 8  # Header (8) overrides local booking (1)
+        assert sleep.calls == []
+
+        client.request(method="POST", url="/test", op=OP_PLACE_ORDER)  # LOW cap = 8
+        assert sleep.calls == [pytest.approx(20.0)]
+        assert budget.used("1m") == 1
+        assert len(inner.calls) == 2
+
+    def test_no_op_bypasses_budget(self) -> None:
+        budget = WeightBudget(WeightBudgetConfig(weight_limits={"1m": 1}))
+        client = MeasuredSyncHttpClient(inner=MockInnerClient(), weight_budget=budget)
+        client.request(method="GET", url="/test")
+        assert budget.used("1m") == 0
+
+
 # ---------------------------------------------------------------------------
 # Label safety
 # ---------------------------------------------------------------------------
@@ -0,0 +1,195 @@
+"""Tests for cached /metrics rendering (observability/exposition.py).
+
+Tests:
+- Body is byte-identical to MetricsBuilder.build()
+- Versioned sections reused until their registry changes or is replaced
+- gzip negotiation and round trip
+- Render-time histogram and fragment counters
+- Concurrent renders share the cache
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grinder.observability import build_metrics_response
+from grinder.observability.exposition import (
+    MetricsExposition,
+    accepts_gzip,
+    reset_metrics_exposition,
+)
+from grinder.observability.exposition_metrics import (
+    get_exposition_metrics,
+    reset_exposition_metrics,
+)
+from grinder.observability.latency_metrics import get_http_metrics, reset_http_metrics
+from grinder.observability.metrics_builder import MetricsBuilder
+from grinder.observability.stage_latency import Stage, get_latency_tracer, reset_latency_tracer
+from grinder.reconcile.metrics import get_reconcile_metrics, reset_reconcile_metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+_RESETS = (
+    reset_http_metrics,
+    reset_reconcile_metrics,
+    reset_latency_tracer,
+    reset_exposition_metrics,
+    reset_metrics_exposition,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    for reset in _RESETS:
+        reset()
+    yield
+    for reset in _RESETS:
+        reset()
+
+
+@pytest.fixture
+def builder(monkeypatch: pytest.MonkeyPatch) -> MetricsBuilder:
+    """Builder with frozen uptime so two renders can be compared."""
+    monkeypatch.setattr(time, "time", lambda: 1000.0)
+    return MetricsBuilder(start_time=900.0)
+
+
+class TestRender:
+    def test_body_matches_build(self, builder: MetricsBuilder) -> None:
+        get_http_metrics().record_latency("place_order", 120.0)
+        exposition = MetricsExposition(builder)
+
+        # Exposition metrics change between renders; compare with that section excluded
+        body = exposition.render().decode()
+        reset_exposition_metrics()
+        expected = builder.build()
+        marker = "# HELP grinder_metrics_render_ms"
+        assert body.split(marker)[0] == expected.split(marker)[0]
+
+    def test_versioned_sections_reused(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        exposition.render()
+        metrics = get_exposition_metrics()
+        rendered_first = metrics.fragments_rendered
+        assert metrics.fragments_reused == 0
+
+        exposition.render()
+        assert metrics.fragments_reused == 3  # reconcile, http, stage_latency
+        assert metrics.fragments_rendered == 2 * rendered_first - 3
+
+    def test_update_invalidates_fragment(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        exposition.render()
+
+        get_http_metrics().record_request("place_order", "2xx")
+        get_reconcile_metrics().record_reconcile_run()
+        get_latency_tracer().observe_ns(Stage.TICK, 300_000)
+        body = exposition.render().decode()
+
+        assert 'grinder_http_requests_total{op="place_order",status_class="2xx"} 1' in body
+        assert "grinder_reconcile_runs_total 1" in body
+        assert 'grinder_latency_stage_ms_count{stage="tick"} 1' in body
+
+    def test_replaced_registry_rerendered(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        get_http_metrics().record_request("place_order", "2xx")
+        exposition.render()
+
+        reset_http_metrics()
+        body = exposition.render().decode()
+        assert 'grinder_http_requests_total{op="none",status_class="none"} 0' in body
+
+    def test_invalid_gzip_level(self) -> None:
+        with pytest.raises(ValueError, match="gzip_level"):
+            MetricsExposition(gzip_level=0)
+
+
+class TestGzip:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, False),
+            ("", False),
+            ("identity", False),
+            ("gzip", True),
+            ("deflate, gzip;q=0.5", True),
+            ("GZIP", True),
+            ("gzip;q=0", False),
+            ("*", True),
+        ],
+    )
+    def test_accepts_gzip(self, header: str | None, expected: bool) -> None:
+        assert accepts_gzip(header) is expected
+
+    def test_gzip_round_trip(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        plain = exposition.render()
+        compressed = exposition.render(use_gzip=True)
+        decoded = gzip.decompress(compressed).decode()
+        # Only the exposition histogram moved between the two renders
+        marker = "# HELP grinder_metrics_render_ms"
+        assert decoded.split(marker)[0] == plain.decode().split(marker)[0]
+        assert len(compressed) < len(plain)
+
+    def test_build_metrics_response(self) -> None:
+        body, encoding = build_metrics_response("gzip")
+        assert encoding == "gzip"
+        assert b"grinder_up 1" in gzip.decompress(body)
+
+        body, encoding = build_metrics_response(None)
+        assert encoding is None
+        assert b"grinder_up 1" in body
+
+
+class TestRenderMetrics:
+    def test_histogram_per_encoding(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        exposition.render()
+        exposition.render(use_gzip=True)
+        body = exposition.render().decode()
+
+        assert 'grinder_metrics_render_ms_count{encoding="identity"} 1' in body
+        assert 'grinder_metrics_render_ms_count{encoding="gzip"} 1' in body
+        assert 'grinder_metrics_render_ms_bucket{encoding="gzip",le="+Inf"} 1' in body
+        assert 'grinder_metrics_fragments_total{result="reused"}' in body
+
+    def test_buckets_from_clock(self) -> None:
+        ticks = iter([0.0, 0.0004])
+        exposition = MetricsExposition(MetricsBuilder(), clock=lambda: next(ticks))
+        exposition.render()
+
+        lines = get_exposition_metrics().to_prometheus_lines()
+        assert 'grinder_metrics_render_ms_bucket{encoding="identity",le="0.25"} 0' in lines
+        assert 'grinder_metrics_render_ms_bucket{encoding="identity",le="0.5"} 1' in lines
+
+    def test_builder_includes_section(self) -> None:
+        assert "# TYPE grinder_metrics_render_ms histogram" in MetricsBuilder().build()
+
+
+class TestConcurrency:
+    def test_concurrent_renders(self, builder: MetricsBuilder) -> None:
+        exposition = MetricsExposition(builder)
+        get_http_metrics().record_request("place_order", "2xx")
+        bodies: list[bytes] = []
+
+        def scrape() -> None:
+            for _ in range(20):
+                bodies.append(exposition.render())
+
+        threads = [threading.Thread(target=scrape) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        marker = b"# HELP grinder_metrics_render_ms"
+        assert len(bodies) == 80
+        assert len({b.split(marker)[0] for b in bodies}) == 1
+        assert get_exposition_metrics().render_count["identity"] == 80
@@ -0,0 +1,219 @@
+"""Tests for MlInferenceService (off-thread inference, bounded queue, deadlines).
+
+Tests:
+- Batched worker results and freshest-prediction lookup with staleness budget
+- Queue-full eviction and deadline drops (with metrics)
+- PaperEngine ACTIVE mode: never waits, fails closed without a fresh prediction
+- PaperEngine.run() stops its worker (no thread outlives the run)
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from grinder.ml import MlSignalSnapshot
+from grinder.ml.metrics import (
+    MlInferenceMode,
+    get_ml_metrics_state,
+    ml_metrics_to_prometheus_lines,
+    reset_ml_metrics_state,
+)
+from grinder.ml.onnx import MlInferenceRequest, MlInferenceService, OnnxMlModel
+from grinder.paper.engine import PaperEngine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "sample_day"
+
+
+def _signal(ts_ms: int, symbol: str = "BTCUSDT") -> MlSignalSnapshot:
+    return MlSignalSnapshot(
+        ts_ms=ts_ms,
+        symbol=symbol,
+        regime_probs_bps={"LOW": 6000, "MID": 3000, "HIGH": 1000},
+        predicted_regime="LOW",
+        spacing_multiplier_x1000=900,
+    )
+
+
+class FakeModel:
+    """predict_batch echoes one signal per request; optionally blocks."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def predict_batch(
+        self, requests: Sequence[MlInferenceRequest]
+    ) -> list[MlSignalSnapshot | None]:
+        self.entered.set()
+        self.gate.wait(timeout=5.0)
+        self.batches.append([r.symbol for r in requests])
+        return [None if r.symbol == "BAD" else _signal(r.ts_ms, r.symbol) for r in requests]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> Iterator[None]:
+    reset_ml_metrics_state()
+    yield
+    reset_ml_metrics_state()
+
+
+@pytest.fixture
+def model() -> FakeModel:
+    return FakeModel()
+
+
+def _service(model: FakeModel, **kwargs: Any) -> MlInferenceService:
+    service = MlInferenceService(model, mode=MlInferenceMode.SHADOW, **kwargs)
+    service.start()
+    return service
+
+
+class TestInferenceService:
+    def test_results_and_freshest(self, model: FakeModel) -> None:
+        results: list[tuple[str, bool]] = []
+        service = _service(model, on_result=lambda r, s, _ms: results.append((r.symbol, s is None)))
+        try:
+            service.submit(MlInferenceRequest(1000, "BTCUSDT", {}))
+            service.submit(MlInferenceRequest(1000, "BAD", {}))
+            assert service.wait_idle()
+        finally:
+            service.stop()
+
+        assert sorted(results) == [("BAD", True), ("BTCUSDT", False)]
+        assert service.latest("BTCUSDT") == _signal(1000)
+        assert service.latest("BAD") is None
+        assert service.freshest("BTCUSDT", 1500, max_staleness_ms=500) == _signal(1000)
+        assert service.freshest("BTCUSDT", 1501, max_staleness_ms=500) is None
+        assert service.freshest("BTCUSDT", 999, max_staleness_ms=500) is None  # From the future
+        assert get_ml_metrics_state().latency_count["shadow"] >= 1
+
+    def test_older_result_does_not_replace_newer(self, model: FakeModel) -> None:
+        service = _service(model)
+        try:
+            service.submit(MlInferenceRequest(2000, "BTCUSDT", {}))
+            assert service.wait_idle()
+            service.submit(MlInferenceRequest(1000, "BTCUSDT", {}))
+            assert service.wait_idle()
+        finally:
+            service.stop()
+        assert service.latest("BTCUSDT") == _signal(2000)
+
+    def test_queue_full_evicts_oldest(self, model: FakeModel) -> None:
+        model.gate.clear()
+        service = _service(model, max_queue=2)
+        try:
+            service.submit(MlInferenceRequest(1, "BLOCKER", {}))
+            assert model.entered.wait(timeout=5.0)  # Worker busy on BLOCKER
+            for symbol in ("A", "B", "C"):
+                service.submit(MlInferenceRequest(2, symbol, {}))
+            assert get_ml_metrics_state().inference_queue_depth == 2
+            model.gate.set()
+            assert service.wait_idle()
+        finally:
+            service.stop()
+
+        assert model.batches == [["BLOCKER"], ["B", "C"]]
+        assert get_ml_metrics_state().inference_drops == {"queue_full": 1}
+
+    def test_deadline_drops_waiting_requests(self, model: FakeModel) -> None:
+        now = [0.0]
+        model.gate.clear()
+        service = _service(model, deadline_ms=50, clock=lambda: now[0])
+        try:
+            service.submit(MlInferenceRequest(1, "BLOCKER", {}))
+            assert model.entered.wait(timeout=5.0)
+            service.submit(MlInferenceRequest(2, "LATE", {}))
+            now[0] = 0.051
+            service.submit(MlInferenceRequest(3, "ONTIME", {}))
+            model.gate.set()
+            assert service.wait_idle()
+        finally:
+            service.stop()
+
+        assert model.batches == [["BLOCKER"], ["ONTIME"]]
+        assert get_ml_metrics_state().inference_drops == {"deadline": 1}
+
+    def test_stop_is_idempotent(self, model: FakeModel) -> None:
+        service = _service(model)
+        assert service.is_running
+        service.stop()
+        service.stop()
+        assert not service.is_running
+
+    def test_prometheus_lines(self) -> None:
+        lines = ml_metrics_to_prometheus_lines()
+        assert "grinder_ml_inference_queue_depth 0" in lines
+        assert 'grinder_ml_inference_dropped_total{reason="queue_full"} 0' in lines
+        assert 'grinder_ml_inference_dropped_total{reason="deadline"} 0' in lines
+        assert "grinder_ml_signal_staleness_ms 0" in lines
+        assert "grinder_ml_signal_stale_total 0" in lines
+
+
+def _inference_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "ml-inference" and t.is_alive()]
+
+
+class TestEngineAsyncShadowRun:
+    def test_worker_does_not_outlive_run(
+        self, model: FakeModel, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("grinder.paper.engine.ONNX_AVAILABLE", True)
+        monkeypatch.setattr(OnnxMlModel, "load_from_dir", staticmethod(lambda _path: model))
+        engine = PaperEngine(
+            ml_shadow_mode=True,
+            ml_infer_enabled=True,
+            onnx_artifact_dir="unused",
+            ml_async_inference=True,
+        )
+        before = len(_inference_threads())
+
+        for _ in range(2):
+            engine.reset()
+            result = engine.run(FIXTURE_DIR)
+            assert result.errors == []
+            assert len(_inference_threads()) == before
+            assert engine._ml_inference_service is None
+
+        assert model.batches  # Shadow rows were run, not dropped at shutdown
+
+
+class TestEngineAsyncActive:
+    def test_uses_freshest_prediction_or_fails_closed(self, model: FakeModel) -> None:
+        engine = PaperEngine(ml_async_inference=True, ml_signal_max_staleness_ms=500)
+        onnx_model = MagicMock()
+        engine._onnx_model = onnx_model
+        engine._ml_inference_service = _service(model)
+        try:
+            # No completed prediction yet: fail closed, model not awaited
+            features: dict[str, Any] = {"mid_price": 1}
+            assert engine._run_active_inference(1000, "BTCUSDT", features) is False
+            assert features == {"mid_price": 1}
+
+            service = engine._ml_inference_service
+            assert service is not None
+            assert service.wait_idle()
+
+            # Prediction from ts=1000 is 400ms old: injected
+            assert engine._run_active_inference(1400, "BTCUSDT", features) is True
+            assert features["ml_regime_prob_low_bps"] == 6000
+            assert get_ml_metrics_state().signal_staleness_ms == 400
+
+            # Latest prediction (ts=1000 or 1400) is too old at ts=3000
+            model.gate.clear()
+            assert engine._run_active_inference(3000, "BTCUSDT", {}) is False
+            assert get_ml_metrics_state().signal_stale_count == 2
+            onnx_model.predict.assert_not_called()
+        finally:
+            model.gate.set()
+            engine.stop_ml_inference()
+        assert engine._ml_inference_service is None
@@ -166,6 +166,58 @@ class TestShadowModeWiring:
         # If we got here without exception, soft-fail worked
 
 
+class TestShadowBatching:
+    """Shadow inference batched across symbols within a tick window."""
+
+    def _engine(self) -> tuple[PaperEngine, MagicMock]:
+        engine = PaperEngine(ml_shadow_batch_window_ms=100)
+        model = MagicMock()
+        model.predict_batch.side_effect = lambda rows: [None] * len(rows)
+        engine._onnx_model = model
+        return engine, model
+
+    def _batches(self, model: MagicMock) -> list[list[tuple[int, str]]]:
+        return [
+            [(r.ts_ms, r.symbol) for r in call.args[0]]
+            for call in model.predict_batch.call_args_list
+        ]
+
+    @patch("grinder.paper.engine.record_ml_inference_latency")
+    def test_window_and_repeat_symbol_flush(self, record_latency: MagicMock) -> None:
+        engine, model = self._engine()
+
+        engine._queue_shadow_inference(1000, "BTCUSDT", {"price_mid": 1.0})
+        engine._queue_shadow_inference(1010, "ETHUSDT", {"price_mid": 2.0})
+        engine._queue_shadow_inference(1020, "BTCUSDT", {"price_mid": 3.0})  # Repeat symbol
+        engine._queue_shadow_inference(1200, "ETHUSDT", {"price_mid": 4.0})  # Window elapsed
+        engine._flush_shadow_batch()
+
+        assert self._batches(model) == [
+            [(1000, "BTCUSDT"), (1010, "ETHUSDT")],
+            [(1020, "BTCUSDT")],
+            [(1200, "ETHUSDT")],
+        ]
+        # One latency observation per batched call
+        assert record_latency.call_count == 3
+
+    def test_queued_features_are_copied(self) -> None:
+        engine, model = self._engine()
+        features = {"price_mid": 1.0}
+
+        engine._queue_shadow_inference(1000, "BTCUSDT", features)
+        features["price_mid"] = 2.0
+        engine._flush_shadow_batch()
+
+        assert model.predict_batch.call_args.args[0][0].policy_features == {"price_mid": 1.0}
+
+    def test_reset_drops_pending(self) -> None:
+        engine, model = self._engine()
+        engine._queue_shadow_inference(1000, "BTCUSDT", {})
+        engine.reset()
+        engine._flush_shadow_batch()
+        model.predict_batch.assert_not_called()
+
+
 class TestDeterminismUnchanged:
     """Tests to verify shadow mode doesn't affect determinism."""
 
@@ -9,6 +9,7 @@ These tests verify:
 2. Safe-by-default when no signal available
 3. Duplicate ts_ms validation
 4. Multi-symbol independence
+5. MlSignalSeries cursor lookup matches bisect for forward and backward queries
 """
 
 from __future__ import annotations
@@ -19,7 +20,7 @@ from pathlib import Path
 
 import pytest
 
-from grinder.ml import MlSignalSnapshot
+from grinder.ml import MlSignalSeries, MlSignalSnapshot
 from grinder.paper import PaperEngine
 
 
@@ -218,6 +219,7 @@ class TestMlSignalLoading:
             assert loaded[0].ts_ms == 1000
             assert loaded[1].ts_ms == 2000
             assert loaded[2].ts_ms == 3000
+            assert len(engine._ml_signal_index["BTCUSDT"]) == 3
 
     def test_rejects_duplicate_ts_ms(self) -> None:
         """Test that duplicate ts_ms for same symbol raises error."""
@@ -358,3 +360,55 @@ class TestMlSignalLoading:
 
             assert len(engine._ml_signals["BTCUSDT"]) == 1
             assert engine._ml_signals["BTCUSDT"][0].ts_ms == 1000
+
+
+def _signal(ts_ms: int) -> MlSignalSnapshot:
+    return MlSignalSnapshot(
+        ts_ms=ts_ms,
+        symbol="BTCUSDT",
+        regime_probs_bps={"LOW": 3333, "MID": 3333, "HIGH": 3334},
+        predicted_regime="MID",
+        spacing_multiplier_x1000=1000,
+    )
+
+
+class TestMlSignalSeries:
+    """Tests for MlSignalSeries cursor lookup."""
+
+    def test_forward_replay(self) -> None:
+        series = MlSignalSeries([_signal(1000), _signal(2000), _signal(3000)])
+
+        selected = [series.at(ts) for ts in (500, 1000, 1500, 2999, 3000, 9000, 9000)]
+
+        assert [s.ts_ms if s else None for s in selected] == [
+            None,
+            1000,
+            1000,
+            2000,
+            3000,
+            3000,
+            3000,
+        ]
+
+    def test_backward_query_restarts(self) -> None:
+        """Second replay pass (e.g. Top-K v1) goes back in time."""
+        series = MlSignalSeries([_signal(1000), _signal(2000), _signal(3000)])
+        assert series.at(5000) == _signal(3000)
+
+        assert series.at(1500) == _signal(1000)
+        assert series.at(500) is None
+        assert series.at(2000) == _signal(2000)
+
+    def test_empty(self) -> None:
+        series = MlSignalSeries([])
+        assert len(series) == 0
+        assert series.at(1000) is None
+
+    def test_engine_index_reset(self) -> None:
+        engine = PaperEngine(ml_enabled=True)
+        engine._ml_signals = {"BTCUSDT": [_signal(1000)]}
+        assert engine._get_ml_signal("BTCUSDT", 1000) == _signal(1000)
+
+        engine.reset()
+        engine._ml_signals = {"BTCUSDT": [_signal(2000)]}
+        assert engine._get_ml_signal("BTCUSDT", 1000) is None
@@ -7,15 +7,18 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, ClassVar
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
 from grinder.ml.onnx import (
     ONNX_AVAILABLE,
+    MlInferenceRequest,
     OnnxMlModel,
     OnnxRuntimeError,
     vectorize,
+    vectorize_batch,
 )
 from grinder.ml.onnx.features import FEATURE_ORDER
 
@@ -141,6 +144,131 @@ class TestVectorize:
         result2 = vectorize(features)
         assert np.array_equal(result1, result2)
 
+    def test_vectorize_batch_matches_rows(self) -> None:
+        """Each batch row equals vectorize() of the same features."""
+        rows: list[dict[str, Any]] = [
+            {"price_mid": 50000.0, "spread_bps": 5},
+            {},
+            {"momentum_1h": 2, "x": "ignored"},
+        ]
+        batch = vectorize_batch(rows)
+        assert batch.shape == (3, len(FEATURE_ORDER))
+        assert batch.dtype == np.float32
+        for i, row in enumerate(rows):
+            assert np.array_equal(batch[i], vectorize(row))
+
+    def test_vectorize_batch_empty(self) -> None:
+        assert vectorize_batch([]).shape == (0, len(FEATURE_ORDER))
+
+
+class _BatchSession:
+    """Fake session: probs favour LOW unless price_mid (column 0) is negative.
+
+    fixed_batch=True behaves like onnxruntime with an input of shape (1, n):
+    any other batch size raises (INVALID_ARGUMENT). batch_size is what
+    OnnxSession reports; None hides the fixed dimension.
+    """
+
+    def __init__(self, fixed_batch: bool = False, batch_size: int | None = None) -> None:
+        self.fixed_batch = fixed_batch
+        self.batch_size = batch_size
+        self.batch_sizes: list[int] = []
+
+    def run(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        x = inputs["input"]
+        self.batch_sizes.append(x.shape[0])
+        if self.fixed_batch and x.shape[0] != 1:
+            raise OnnxRuntimeError(
+                "Inference failed: [ONNXRuntimeError] : 2 : INVALID_ARGUMENT : "
+                f"Got invalid dimensions for input: input index: 0 Got: {x.shape[0]} Expected: 1"
+            )
+        probs = np.tile(np.array([0.7, 0.2, 0.1], dtype=np.float32), (x.shape[0], 1))
+        probs[x[:, 0] < 0] = 0.0  # Unparseable row (probs sum 0)
+        spacing = np.full((x.shape[0], 1), 1.5, dtype=np.float32)
+        return {"regime_probs": probs, "spacing_multiplier": spacing}
+
+
+def _model(session: Any) -> OnnxMlModel:
+    return OnnxMlModel(artifact=MagicMock(), session=session)
+
+
+class TestPredictBatch:
+    """Tests for OnnxMlModel.predict_batch (fake session, no onnxruntime needed)."""
+
+    def test_single_session_call_fans_out(self) -> None:
+        session = _BatchSession()
+        model = _model(session)
+        requests = [
+            MlInferenceRequest(1000, "BTCUSDT", {"price_mid": 50000.0}),
+            MlInferenceRequest(1001, "ETHUSDT", {"price_mid": 3000.0}),
+        ]
+
+        results = model.predict_batch(requests)
+
+        assert session.batch_sizes == [2]
+        assert [r.symbol if r else None for r in results] == ["BTCUSDT", "ETHUSDT"]
+        assert results[1] is not None
+        assert results[1].ts_ms == 1001
+        assert results[1].predicted_regime == "LOW"
+        assert results[1].spacing_multiplier_x1000 == 1500
+        assert results[0] == model.predict(1000, "BTCUSDT", {"price_mid": 50000.0})
+
+    def test_per_row_soft_fail(self) -> None:
+        model = _model(_BatchSession())
+
+        results = model.predict_batch(
+            [
+                MlInferenceRequest(1, "BTCUSDT", {"price_mid": -1.0}),
+                MlInferenceRequest(1, "ETHUSDT", {"price_mid": 1.0}),
+            ]
+        )
+
+        assert results[0] is None
+        assert results[1] is not None
+        assert model.stats == {"predict_count": 2, "predict_errors": 1}
+
+    def test_session_error_fails_all_rows(self) -> None:
+        session = MagicMock()
+        session.run.side_effect = RuntimeError("boom")
+        model = _model(session)
+
+        results = model.predict_batch(
+            [MlInferenceRequest(1, "A", {}), MlInferenceRequest(1, "B", {})]
+        )
+
+        assert results == [None, None]
+        assert model.stats["predict_errors"] == 2
+
+    def test_fixed_batch_model_falls_back_to_rows(self) -> None:
+        """Batch call rejected by the runtime → one call per row, no lost rows."""
+        session = _BatchSession(fixed_batch=True)
+        model = _model(session)
+
+        results = model.predict_batch(
+            [MlInferenceRequest(1, "A", {}), MlInferenceRequest(1, "B", {})]
+        )
+
+        assert session.batch_sizes == [2, 1, 1]
+        assert [r.symbol if r else None for r in results] == ["A", "B"]
+        assert model.stats == {"predict_count": 2, "predict_errors": 0}
+
+    def test_fixed_batch_size_checked_up_front(self) -> None:
+        """Session reporting batch_size=1 is never called with more rows."""
+        session = _BatchSession(fixed_batch=True, batch_size=1)
+        model = _model(session)
+
+        results = model.predict_batch(
+            [MlInferenceRequest(1, "A", {}), MlInferenceRequest(1, "B", {})]
+        )
+
+        assert session.batch_sizes == [1, 1]
+        assert all(r is not None for r in results)
+
+    def test_empty(self) -> None:
+        session = _BatchSession()
+        assert _model(session).predict_batch([]) == []
+        assert session.batch_sizes == []
+
 
 class TestOnnxAvailability:
     """Tests for ONNX availability detection."""
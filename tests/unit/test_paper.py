@@ -10,6 +10,9 @@ Tests:
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import subprocess
 import sys
 from decimal import Decimal
@@ -18,7 +21,14 @@ from typing import Any
 from unittest.mock import patch
 
 from grinder.contracts import Snapshot
-from grinder.paper import PaperEngine, PaperOutput, PaperResult
+from grinder.paper import (
+    DiscardSink,
+    JsonlSink,
+    PaperEngine,
+    PaperOutput,
+    PaperResult,
+    StreamingDigest,
+)
 from grinder.policies.grid.static import StaticGridPolicy
 
 FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "sample_day"
@@ -350,6 +360,45 @@ class TestAllowedOrdersFixture:
             assert output.blocked_by_gating is False
 
 
+class TestStreamingOutputs:
+    """Test streaming output sinks and incremental digest."""
+
+    def test_streaming_digest_matches_full_dump(self) -> None:
+        """StreamingDigest hashes the same bytes as json.dumps of the full list."""
+        items: list[dict[str, Any]] = [{"b": 1, "a": "x"}, {"n": None}, {"u": "\u00e9"}]
+        for n in range(len(items) + 1):
+            content = json.dumps(items[:n], sort_keys=True, separators=(",", ":"))
+            expected = hashlib.sha256(content.encode()).hexdigest()[:16]
+            digest = StreamingDigest()
+            for item in items[:n]:
+                digest.update(item)
+            assert digest.hexdigest() == expected
+
+    def test_discard_sink_keeps_canonical_digest(self) -> None:
+        """Outputs are not retained, digest is unchanged."""
+        sink = DiscardSink()
+        result = PaperEngine().run(FIXTURE_ALLOWED_DIR, sink=sink)
+
+        assert result.digest == EXPECTED_PAPER_DIGEST_ALLOWED
+        assert result.outputs == []
+        assert sink.count > 0
+
+    def test_jsonl_sink_writes_outputs(self, tmp_path: Path) -> None:
+        """JSONL sink writes one line per output, same as retained outputs."""
+        retained = PaperEngine().run(FIXTURE_ALLOWED_DIR)
+
+        for name, opener in (("out.jsonl", open), ("out.jsonl.gz", gzip.open)):
+            path = tmp_path / name
+            with JsonlSink(path) as sink:
+                streamed = PaperEngine().run(FIXTURE_ALLOWED_DIR, sink=sink)
+
+            with opener(path, "rt") as f:
+                lines = [json.loads(line) for line in f]
+            assert lines == [o.to_dict() for o in retained.outputs]
+            assert streamed.digest == retained.digest
+            assert streamed.orders_placed == retained.orders_placed
+
+
 class TestSampleDayFixture:
     """Tests for sample_day fixture (orders blocked by gating)."""
 
@@ -700,6 +749,17 @@ class TestPolicyFeaturesPlumbing:
         assert features["mid_price"] == snapshot.mid_price
         assert features["mid_price"] == Decimal("50005")
 
+    def test_adaptive_features_digests_unchanged(self) -> None:
+        """Feature view keeps adaptive-policy paper runs on their canonical digests."""
+        fixtures = Path(__file__).parent.parent / "fixtures"
+        expected = {
+            "sample_day_l2_gating": "fe7379da2193d6e3",
+            "sample_day_topk_v1": "160c024b3de1055a",
+        }
+        for name, digest in expected.items():
+            engine = PaperEngine(feature_engine_enabled=True, adaptive_policy_enabled=True)
+            assert engine.run(fixtures / name).digest == digest, name
+
 
 class TestM7SafeByDefault:
     """Test M7 safe-by-default contract: new flags OFF preserves baseline behavior.
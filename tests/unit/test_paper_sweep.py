@@ -0,0 +1,121 @@
+"""Tests for the paper parameter sweep (grinder.paper.sweep).
+
+Covers:
+- Grid expansion order and parameter validation
+- Decimal coercion and dotted nested-config parameters
+- Sweep points match standalone PaperEngine runs (same digest)
+- Ranking and process-pool runs produce the same report as serial runs
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from grinder.contracts import Snapshot
+from grinder.paper import PaperEngine, SweepConfigError, SweepPoint, expand_grid, run_sweep
+from grinder.paper.sweep import SweepRow, build_engine_kwargs, load_sweep_events, rank_rows
+from grinder.policies.grid.adaptive import AdaptiveGridConfig
+
+FIXTURE = Path("tests/fixtures/sample_day_multisymbol")
+
+
+def _row(index: int, total_pnl: str, max_drawdown: str) -> SweepRow:
+    return SweepRow(
+        index=index,
+        params={},
+        total_pnl=total_pnl,
+        total_realized_pnl=total_pnl,
+        total_unrealized_pnl="0",
+        max_drawdown=max_drawdown,
+        total_fills=0,
+        orders_placed=0,
+        orders_blocked=0,
+        events_gated=0,
+        paper_digest="",
+    )
+
+
+class TestGrid:
+    """Grid expansion and parameter handling."""
+
+    def test_expand_grid_last_key_fastest(self) -> None:
+        points = expand_grid({"spacing_bps": [5, 10], "levels": [3, 5]})
+        assert [p.params for p in points] == [
+            {"spacing_bps": 5, "levels": 3},
+            {"spacing_bps": 5, "levels": 5},
+            {"spacing_bps": 10, "levels": 3},
+            {"spacing_bps": 10, "levels": 5},
+        ]
+        assert [p.index for p in points] == [0, 1, 2, 3]
+
+    def test_unknown_parameter_rejected(self) -> None:
+        with pytest.raises(SweepConfigError, match="spacing"):
+            expand_grid({"spacing": [5]})
+        with pytest.raises(SweepConfigError, match="AdaptiveGridConfig"):
+            expand_grid({"adaptive_config.nope": [1]})
+        with pytest.raises(SweepConfigError, match="non-empty"):
+            expand_grid({"levels": []})
+
+    def test_build_engine_kwargs_coerces_decimals_and_nested(self) -> None:
+        kwargs = build_engine_kwargs(
+            {
+                "size_per_level": 0.5,
+                "levels": 4,
+                "adaptive_config.step_alpha": 20,
+                "adaptive_config.size_per_level": "0.02",
+            }
+        )
+        assert kwargs["size_per_level"] == Decimal("0.5")
+        assert kwargs["levels"] == 4
+        config = kwargs["adaptive_config"]
+        assert isinstance(config, AdaptiveGridConfig)
+        assert config.step_alpha == 20
+        assert config.size_per_level == Decimal("0.02")
+        assert config.x_min_bps == AdaptiveGridConfig().x_min_bps
+
+
+class TestSweep:
+    """Sweep execution and ranking."""
+
+    def test_events_loaded_as_snapshots(self) -> None:
+        events = load_sweep_events(FIXTURE)
+        assert isinstance(events, tuple)
+        assert events
+        assert all(isinstance(e, Snapshot) for e in events)
+
+    def test_point_matches_standalone_run(self) -> None:
+        report = run_sweep(FIXTURE, expand_grid({"spacing_bps": [2.0, 10.0]}))
+        for row in report.rows:
+            standalone = PaperEngine(spacing_bps=row.params["spacing_bps"]).run(FIXTURE)
+            assert row.paper_digest == standalone.digest
+            assert row.total_fills == standalone.total_fills
+            assert row.orders_blocked == standalone.orders_blocked
+
+    def test_rank_rows_orders_by_pnl_then_drawdown(self) -> None:
+        ranked = rank_rows(
+            [_row(0, "5", "1"), _row(1, "10", "3"), _row(2, "10", "2"), _row(3, "5", "1")]
+        )
+        assert [r.index for r in ranked] == [2, 1, 0, 3]
+        assert [r.rank for r in ranked] == [1, 2, 3, 4]
+
+    def test_parallel_sweep_matches_serial(self) -> None:
+        points = expand_grid({"spacing_bps": [2.0, 10.0, 20.0], "fill_mode": ["instant"]})
+        serial = run_sweep(FIXTURE, points, jobs=1)
+        parallel = run_sweep(FIXTURE, points, jobs=2)
+        assert parallel.to_json() == serial.to_json()
+
+    def test_base_params_overridden_by_point(self) -> None:
+        report = run_sweep(
+            FIXTURE,
+            [SweepPoint(index=0, params={"levels": 2})],
+            base_params={"levels": 7, "spacing_bps": 10.0},
+        )
+        standalone = PaperEngine(levels=2, spacing_bps=10.0).run(FIXTURE)
+        assert report.rows[0].paper_digest == standalone.digest
+
+    def test_negative_jobs_rejected(self) -> None:
+        with pytest.raises(SweepConfigError, match="jobs"):
+            run_sweep(FIXTURE, expand_grid({"levels": [3]}), jobs=-1)
@@ -0,0 +1,177 @@
+"""Tests for grinder.net.pooled_client (keep-alive pooled HttpClient).
+
+Covers:
+- PooledHttpClientConfig validation
+- request() maps httpx responses to HttpResponse
+- One httpx.Client is reused across requests (no per-call session)
+- httpx errors mapped to ConnectorTransientError / ConnectorNonRetryableError
+- Port metrics recorded on success and on failure
+- http2 falls back to HTTP/1.1 when h2 is missing
+- build_pool_config() reads HTTP_POOL_* env vars
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+from scripts.http_measured_client import ConfigError, build_pool_config
+
+from grinder.connectors.errors import ConnectorNonRetryableError, ConnectorTransientError
+from grinder.execution.port_metrics import get_port_metrics, reset_port_metrics
+from grinder.net import pooled_client
+from grinder.net.pooled_client import PooledHttpClient, PooledHttpClientConfig
+
+
+def _client(handler: object, port_name: str = "") -> PooledHttpClient:
+    return PooledHttpClient(
+        port_name=port_name,
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+
+
+class TestPooledHttpClientConfig:
+    def test_defaults_valid(self) -> None:
+        cfg = PooledHttpClientConfig()
+        assert cfg.max_connections == 20
+        assert cfg.max_keepalive_connections == 10
+        assert cfg.http2 is False
+
+    def test_rejects_zero_connections(self) -> None:
+        with pytest.raises(ValueError, match="max_connections"):
+            PooledHttpClientConfig(max_connections=0)
+
+    def test_rejects_keepalive_above_max(self) -> None:
+        with pytest.raises(ValueError, match="max_keepalive_connections"):
+            PooledHttpClientConfig(max_connections=2, max_keepalive_connections=3)
+
+    def test_rejects_negative_expiry(self) -> None:
+        with pytest.raises(ValueError, match="keepalive_expiry_s"):
+            PooledHttpClientConfig(keepalive_expiry_s=-1.0)
+
+
+class TestPooledHttpClientRequest:
+    def test_maps_response(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["symbol"] == "BTCUSDT"
+            assert request.headers["X-MBX-APIKEY"] == "k"
+            return httpx.Response(200, json={"orderId": 1})
+
+        with _client(handler) as client:
+            resp = client.request(
+                "POST",
+                "https://fapi.binance.com/fapi/v1/order",
+                params={"symbol": "BTCUSDT"},
+                headers={"X-MBX-APIKEY": "k"},
+            )
+        assert resp.status_code == 200
+        assert resp.json_data == {"orderId": 1}
+
+    def test_empty_body_maps_to_empty_dict(self) -> None:
+        with _client(lambda _req: httpx.Response(200)) as client:
+            resp = client.request("DELETE", "https://fapi.binance.com/fapi/v1/order")
+        assert resp.json_data == {}
+
+    def test_reuses_one_session(self) -> None:
+        client = _client(lambda _req: httpx.Response(200, json={}))
+        session = client._client
+        for _ in range(3):
+            client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+        assert client._client is session
+        client.close()
+        assert session.is_closed
+
+    def test_timeout_is_transient(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        with _client(handler) as client, pytest.raises(ConnectorTransientError, match="timeout"):
+            client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+
+    def test_connect_error_is_transient(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with (
+            _client(handler) as client,
+            pytest.raises(ConnectorTransientError, match="Connection error"),
+        ):
+            client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+
+    def test_protocol_error_is_non_retryable(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.RemoteProtocolError("bad frame", request=request)
+
+        with _client(handler) as client, pytest.raises(ConnectorNonRetryableError):
+            client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+
+
+class TestPooledHttpClientMetrics:
+    def setup_method(self) -> None:
+        reset_port_metrics()
+
+    def teardown_method(self) -> None:
+        reset_port_metrics()
+
+    def test_records_success_and_failure(self) -> None:
+        calls = iter([httpx.Response(200, json={}), None])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            resp = next(calls)
+            if resp is None:
+                raise httpx.ConnectError("refused", request=request)
+            return resp
+
+        with _client(handler, port_name="futures") as client:
+            client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+            with pytest.raises(ConnectorTransientError):
+                client.request("GET", "https://fapi.binance.com/fapi/v1/time")
+
+        assert get_port_metrics().http_requests[("futures", "GET", "/fapi/v1/time")] == 2
+
+
+class TestPooledHttpClientHttp2:
+    def test_http2_falls_back_without_h2(self) -> None:
+        with patch.object(pooled_client, "H2_AVAILABLE", False):
+            client = PooledHttpClient(PooledHttpClientConfig(http2=True))
+        assert client.http2_enabled is False
+        client.close()
+
+
+class TestBuildPoolConfig:
+    def test_defaults(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            cfg = build_pool_config()
+        assert cfg == PooledHttpClientConfig()
+
+    def test_env_overrides(self) -> None:
+        env = {
+            "HTTP_POOL_MAX_CONNECTIONS": "4",
+            "HTTP_POOL_MAX_KEEPALIVE": "2",
+            "HTTP_POOL_KEEPALIVE_EXPIRY_S": "30",
+            "HTTP2_ENABLED": "1",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            cfg = build_pool_config()
+        assert cfg.max_connections == 4
+        assert cfg.max_keepalive_connections == 2
+        assert cfg.keepalive_expiry_s == 30.0
+        assert cfg.http2 is True
+
+    def test_invalid_int_raises(self) -> None:
+        env = {"HTTP_POOL_MAX_CONNECTIONS": "many"}
+        with (
+            patch.dict(os.environ, env, clear=True),
+            pytest.raises(ConfigError, match="HTTP_POOL_MAX_CONNECTIONS"),
+        ):
+            build_pool_config()
+
+    def test_inconsistent_sizes_raise(self) -> None:
+        env = {"HTTP_POOL_MAX_CONNECTIONS": "2", "HTTP_POOL_MAX_KEEPALIVE": "5"}
+        with (
+            patch.dict(os.environ, env, clear=True),
+            pytest.raises(ConfigError, match="pool config"),
+        ):
+            build_pool_config()
@@ -0,0 +1,259 @@
+"""Tests for tick-to-order stage latency tracing.
+
+Tests:
+- Histogram bucketing, sampling, receipt -> tick correlation
+- BinanceWsConnector records ws_parse and puts the receipt marks on the Snapshot
+- LiveEngineV0 laps stages and records tick_to_ack on the first exchange ack
+- MetricsBuilder output contains the histogram for every stage
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from grinder.connectors.binance_ws import BinanceWsConfig, BinanceWsConnector, FakeWsTransport
+from grinder.connectors.live_connector import SafeMode
+from grinder.contracts import Snapshot
+from grinder.core import OrderSide
+from grinder.execution.types import ActionType, ExecutionAction
+from grinder.live import LiveActionStatus, LiveEngineConfig, LiveEngineV0
+from grinder.observability.metrics_builder import MetricsBuilder
+from grinder.observability.stage_latency import (
+    LatencyTracer,
+    Stage,
+    get_latency_tracer,
+    reset_latency_tracer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeClockNs:
+    """Monotonic ns clock advancing by a fixed step per call."""
+
+    def __init__(self, step_ns: int = 1_000_000) -> None:
+        self.now = 0
+        self.step_ns = step_ns
+
+    def __call__(self) -> int:
+        self.now += self.step_ns
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer() -> Iterator[None]:
+    reset_latency_tracer()
+    yield
+    reset_latency_tracer()
+
+
+def _snapshot(
+    symbol: str = "BTCUSDT", recv_ns: int | None = None, parsed_ns: int | None = None
+) -> Snapshot:
+    return Snapshot(
+        ts=1000,
+        symbol=symbol,
+        bid_price=Decimal("50000"),
+        ask_price=Decimal("50001"),
+        bid_qty=Decimal("1"),
+        ask_qty=Decimal("1"),
+        last_price=Decimal("50000.5"),
+        last_qty=Decimal("0"),
+        recv_ns=recv_ns,
+        parsed_ns=parsed_ns,
+    )
+
+
+class TestLatencyTracer:
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("GRINDER_LATENCY_TRACE_SAMPLE", raising=False)
+        tracer = LatencyTracer()
+        assert not tracer.enabled
+        assert tracer.receipt_ns() is None
+        assert tracer.begin_tick() is None
+
+    def test_sample_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GRINDER_LATENCY_TRACE_SAMPLE", "10")
+        assert get_latency_tracer().sample_every == 10
+
+    def test_rejects_negative_sample(self) -> None:
+        with pytest.raises(ValueError, match="sample_every"):
+            LatencyTracer(sample_every=-1)
+
+    def test_samples_every_nth_tick(self) -> None:
+        tracer = LatencyTracer(sample_every=3)
+        traces = [tracer.begin_tick() for _ in range(6)]
+        assert [t is not None for t in traces] == [False, False, True, False, False, True]
+
+    def test_tick_laps_and_ack(self) -> None:
+        tracer = LatencyTracer(sample_every=1, clock_ns=FakeClockNs())
+        recv_ns = tracer.receipt_ns()  # t=1ms
+        parsed_ns = tracer.on_received(recv_ns)  # t=2ms: ws_parse=1ms
+
+        trace = tracer.begin_tick(recv_ns, parsed_ns)  # t=3ms: queue=1ms
+        assert trace is not None
+        trace.lap(Stage.FEATURES)  # t=4ms
+        trace.ack()  # t=5ms: tick_to_ack=4ms
+        trace.ack()  # second ack ignored
+        trace.finish()  # t=6ms: tick=3ms
+
+        lines = tracer.to_prometheus_lines()
+        assert 'grinder_latency_stage_ms_sum{stage="ws_parse"} 1.0' in lines
+        assert 'grinder_latency_stage_ms_sum{stage="queue"} 1.0' in lines
+        assert 'grinder_latency_stage_ms_sum{stage="features"} 1.0' in lines
+        assert 'grinder_latency_stage_ms_sum{stage="tick_to_ack"} 4.0' in lines
+        assert 'grinder_latency_stage_ms_sum{stage="tick"} 3.0' in lines
+        assert tracer.stage_count(Stage.TICK_TO_ACK) == 1
+
+    def test_backlog_measured_per_message(self) -> None:
+        """Two queued messages: each tick is measured against its own receipt."""
+        tracer = LatencyTracer(sample_every=1, clock_ns=FakeClockNs())
+        recv_1 = tracer.receipt_ns()  # t=1ms
+        parsed_1 = tracer.on_received(recv_1)  # t=2ms
+        recv_2 = tracer.receipt_ns()  # t=3ms
+        parsed_2 = tracer.on_received(recv_2)  # t=4ms
+
+        trace = tracer.begin_tick(recv_1, parsed_1)  # t=5ms: queue=3ms
+        assert trace is not None
+        trace.ack()  # t=6ms: tick_to_ack=5ms
+        trace = tracer.begin_tick(recv_2, parsed_2)  # t=7ms: queue=3ms
+        assert trace is not None
+        trace.ack()  # t=8ms: tick_to_ack=5ms
+
+        lines = tracer.to_prometheus_lines()
+        assert tracer.stage_count(Stage.QUEUE) == 2
+        assert tracer.stage_count(Stage.TICK_TO_ACK) == 2
+        assert 'grinder_latency_stage_ms_sum{stage="queue"} 6.0' in lines
+        assert 'grinder_latency_stage_ms_sum{stage="tick_to_ack"} 10.0' in lines
+
+    def test_tick_without_receipt_skips_queue_and_ack(self) -> None:
+        tracer = LatencyTracer(sample_every=1, clock_ns=FakeClockNs())
+        trace = tracer.begin_tick()
+        assert trace is not None
+        trace.ack()
+        trace.finish()
+        assert tracer.stage_count(Stage.QUEUE) == 0
+        assert tracer.stage_count(Stage.TICK_TO_ACK) == 0
+        assert tracer.stage_count(Stage.TICK) == 1
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        tracer = LatencyTracer(sample_every=1)
+        tracer.observe_ns(Stage.GATE, 40_000)  # 0.04ms
+        tracer.observe_ns(Stage.GATE, 100_000)  # 0.1ms (le is inclusive)
+        tracer.observe_ns(Stage.GATE, 5_000_000_000)  # 5s (+Inf only)
+
+        lines = tracer.to_prometheus_lines()
+        assert 'grinder_latency_stage_ms_bucket{stage="gate",le="0.05"} 1' in lines
+        assert 'grinder_latency_stage_ms_bucket{stage="gate",le="0.1"} 2' in lines
+        assert 'grinder_latency_stage_ms_bucket{stage="gate",le="2500.0"} 2' in lines
+        assert 'grinder_latency_stage_ms_bucket{stage="gate",le="+Inf"} 3' in lines
+        assert 'grinder_latency_stage_ms_count{stage="gate"} 3' in lines
+
+
+class TestConnectorReceipt:
+    def test_parse_records_ws_parse_and_receipt(self) -> None:
+        tracer = LatencyTracer(sample_every=1, clock_ns=FakeClockNs())
+        ws = BinanceWsConnector(
+            BinanceWsConfig(symbols=["BTCUSDT"]),
+            transport=FakeWsTransport(),
+            latency_tracer=tracer,
+        )
+        msg = json.dumps({"s": "BTCUSDT", "b": "1", "B": "2", "a": "3", "A": "4"})
+
+        snapshot = ws._parse_message(msg)
+        assert snapshot is not None
+        assert ws._parse_message(json.dumps({"result": None, "id": 1})) is None
+
+        assert tracer.stage_count(Stage.WS_PARSE) == 1
+        assert snapshot.recv_ns is not None and snapshot.parsed_ns is not None
+        assert snapshot.parsed_ns > snapshot.recv_ns
+        # Marks do not change equality with a replayed snapshot
+        assert snapshot == Snapshot.from_dict(snapshot.to_dict())
+        trace = tracer.begin_tick(snapshot.recv_ns, snapshot.parsed_ns)
+        assert trace is not None
+        assert tracer.stage_count(Stage.QUEUE) == 1
+
+
+class TestEngineStages:
+    @staticmethod
+    def _place(level: int) -> ExecutionAction:
+        return ExecutionAction(
+            action_type=ActionType.PLACE,
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            price=Decimal("49000") - level,
+            quantity=Decimal("0.01"),
+            level_id=level,
+            reason="GRID_ENTRY",
+        )
+
+    def _engine(self, actions: list[ExecutionAction], tracer: LatencyTracer) -> LiveEngineV0:
+        paper_engine = MagicMock()
+        paper_engine.process_snapshot.return_value = MagicMock(actions=actions)
+        port = MagicMock()
+        port.place_order.return_value = "ORDER_1"
+        engine = LiveEngineV0(
+            paper_engine, port, LiveEngineConfig(armed=True, mode=SafeMode.LIVE_TRADE)
+        )
+        engine._latency_tracer = tracer
+        return engine
+
+    def test_sampled_tick_records_stages(self) -> None:
+        tracer = LatencyTracer(sample_every=1)
+        engine = self._engine([self._place(1), self._place(2)], tracer)
+        recv_ns = tracer.receipt_ns()
+
+        output = engine.process_snapshot(_snapshot(recv_ns=recv_ns, parsed_ns=recv_ns))
+
+        assert all(la.status == LiveActionStatus.EXECUTED for la in output.live_actions)
+        assert tracer.stage_count(Stage.PLAN) == 1
+        assert tracer.stage_count(Stage.SYNC) == 1
+        assert tracer.stage_count(Stage.GATE) == 2
+        assert tracer.stage_count(Stage.EXECUTE) == 2
+        assert tracer.stage_count(Stage.TICK_TO_ACK) == 1
+        assert tracer.stage_count(Stage.TICK) == 1
+        assert engine._tick_trace is None
+
+    def test_blocked_actions_have_no_ack(self) -> None:
+        tracer = LatencyTracer(sample_every=1)
+        engine = self._engine([self._place(1)], tracer)
+        engine._config = LiveEngineConfig(armed=False, mode=SafeMode.LIVE_TRADE)
+        recv_ns = tracer.receipt_ns()
+
+        engine.process_snapshot(_snapshot(recv_ns=recv_ns, parsed_ns=recv_ns))
+
+        assert tracer.stage_count(Stage.GATE) == 1
+        assert tracer.stage_count(Stage.EXECUTE) == 0
+        assert tracer.stage_count(Stage.TICK_TO_ACK) == 0
+
+    def test_batch_flush_is_one_execute_span(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GRINDER_LIVE_BATCH_ORDERS", "1")
+        tracer = LatencyTracer(sample_every=1)
+        engine = self._engine([self._place(1)], tracer)
+
+        engine.process_snapshot(_snapshot())
+
+        assert tracer.stage_count(Stage.GATE) == 1
+        assert tracer.stage_count(Stage.EXECUTE) == 1
+
+    def test_unsampled_tick_records_nothing(self) -> None:
+        tracer = LatencyTracer(sample_every=0)
+        engine = self._engine([self._place(1)], tracer)
+
+        engine.process_snapshot(_snapshot())
+
+        assert all(tracer.stage_count(stage) == 0 for stage in Stage)
+
+
+class TestMetricsBuilder:
+    def test_all_stages_exported(self) -> None:
+        output = MetricsBuilder().build()
+        assert "grinder_latency_trace_sample_every" in output
+        for stage in Stage:
+            assert f'grinder_latency_stage_ms_count{{stage="{stage.value}"}}' in output
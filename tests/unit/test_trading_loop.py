@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import threading
 import time as time_module
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -37,6 +38,8 @@ from scripts.run_trading import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from grinder.contracts import Snapshot
+
 from grinder.connectors.binance_ws import BINANCE_WS_MAINNET, FakeWsTransport
 from grinder.connectors.live_connector import (
     LiveConnectorConfig,
@@ -48,7 +51,7 @@ from grinder.execution.port import NoOpExchangePort
 from grinder.execution.sor_metrics import get_sor_metrics, reset_sor_metrics
 from grinder.ha.role import HARole, reset_ha_state, set_ha_state
 from grinder.live.config import LiveEngineConfig
-from grinder.live.engine import LiveEngineV0
+from grinder.live.engine import LiveEngineOutput, LiveEngineV0
 from grinder.paper.engine import PaperEngine
 
 
@@ -269,6 +272,42 @@ class TestTradingLoop:
         assert ticks == 3
         assert get_sor_metrics().engine_initialized is True
 
+    @pytest.mark.asyncio
+    async def test_loop_runs_engine_off_event_loop(self) -> None:
+        """trading_loop hands snapshots to the engine thread, not the event loop."""
+        messages = [
+            json.dumps({"s": "BTCUSDT", "b": "50000.00", "B": "1.5", "a": "50001.00", "A": "2.0"}),
+            json.dumps({"s": "BTCUSDT", "b": "50002.00", "B": "1.2", "a": "50003.00", "A": "1.8"}),
+        ]
+        transport = FakeWsTransport(messages=messages, delay_ms=2)
+        connector = LiveConnectorV0(
+            config=LiveConnectorConfig(symbols=["BTCUSDT"], ws_transport=transport),
+            clock=time_module,
+            sleep_func=FakeSleep(),
+        )
+        engine = LiveEngineV0(
+            paper_engine=PaperEngine(),
+            exchange_port=NoOpExchangePort(),
+            config=LiveEngineConfig(mode=SafeMode.READ_ONLY),
+        )
+        engine_threads: list[str] = []
+        process = engine.process_snapshot
+
+        def recording_process(snapshot: Snapshot) -> LiveEngineOutput:
+            engine_threads.append(threading.current_thread().name)
+            return process(snapshot)
+
+        engine.process_snapshot = recording_process  # type: ignore[method-assign]
+
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(trading_loop(connector, engine, shutdown, duration_s=0))
+        await asyncio.sleep(0.3)
+        shutdown.set()
+        await task
+
+        assert len(engine_threads) == 2
+        assert all(name.startswith("grinder-engine") for name in engine_threads)
+
 
 class TestValidateRealPortGates:
     """Test validate_real_port_gates() 5-gate validation."""
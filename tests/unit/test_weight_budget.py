@@ -0,0 +1,200 @@
+"""Tests for grinder.net.weight_budget.
+
+Tests:
+- Per-op weight table, batch order counts, priority classification
+- Priority headroom: cancels admitted when new placements wait
+- Header sync (case-insensitive, max of local/exchange), window reset
+- 429 / 418 backoff from Retry-After; rejection beyond max_wait_ms
+- Prometheus output and MetricsBuilder wiring
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grinder.connectors.errors import ConnectorNonRetryableError
+from grinder.net.retry_policy import (
+    OP_AMEND_ORDER,
+    OP_CANCEL_ORDER,
+    OP_GET_DEPTH,
+    OP_GET_OPEN_ORDERS,
+    OP_GET_POSITIONS,
+    OP_PLACE_BATCH,
+    OP_PLACE_ORDER,
+)
+from grinder.net.weight_budget import (
+    RequestPriority,
+    WeightBudget,
+    WeightBudgetConfig,
+    WeightBudgetExceededError,
+    get_weight_budget,
+    reset_weight_budget,
+)
+from grinder.observability.metrics_builder import MetricsBuilder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self, now: float = 1200.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_budget() -> Iterator[None]:
+    reset_weight_budget()
+    yield
+    reset_weight_budget()
+
+
+def _budget(clock: FakeClock, **kwargs: object) -> WeightBudget:
+    return WeightBudget(WeightBudgetConfig(**kwargs), clock=clock)  # type: ignore[arg-type]
+
+
+class TestClassification:
+    def test_weights(self) -> None:
+        budget = WeightBudget()
+        assert budget.weight_of(OP_PLACE_ORDER) == 1
+        assert budget.weight_of(OP_GET_POSITIONS) == 5
+        assert budget.weight_of(OP_GET_OPEN_ORDERS, {"symbol": "BTCUSDT"}) == 1
+        assert budget.weight_of(OP_GET_OPEN_ORDERS) == 40
+        assert budget.weight_of(OP_GET_DEPTH, {"limit": 20}) == 2
+        assert budget.weight_of(OP_GET_DEPTH, {"limit": 1000}) == 20
+        assert budget.weight_of("unknown_op") == 1
+
+    def test_weight_override(self) -> None:
+        budget = WeightBudget(WeightBudgetConfig(op_weights={OP_GET_POSITIONS: 10}))
+        assert budget.weight_of(OP_GET_POSITIONS) == 10
+
+    def test_order_counts(self) -> None:
+        batch = {"batchOrders": json.dumps([{}, {}, {}])}
+        assert WeightBudget.order_count_of(OP_PLACE_BATCH, batch) == 3
+        assert WeightBudget.order_count_of(OP_PLACE_ORDER) == 1
+        assert WeightBudget.order_count_of(OP_CANCEL_ORDER) == 0
+
+    def test_priorities(self) -> None:
+        assert WeightBudget.priority_of(OP_CANCEL_ORDER) == RequestPriority.CRITICAL
+        assert (
+            WeightBudget.priority_of(OP_PLACE_ORDER, {"reduceOnly": "true"})
+            == RequestPriority.CRITICAL
+        )
+        assert WeightBudget.priority_of(OP_PLACE_ORDER, {}) == RequestPriority.LOW
+        assert WeightBudget.priority_of(OP_AMEND_ORDER) == RequestPriority.NORMAL
+        assert WeightBudget.priority_of(OP_GET_POSITIONS) == RequestPriority.NORMAL
+
+    def test_invalid_config(self) -> None:
+        with pytest.raises(ValueError, match="reserve"):
+            WeightBudgetConfig(reserve_normal_pct=30, reserve_low_pct=20)
+        with pytest.raises(ValueError, match="interval"):
+            WeightBudgetConfig(weight_limits={"1x": 10})
+
+    def test_exceeded_error_is_non_retryable(self) -> None:
+        assert issubclass(WeightBudgetExceededError, ConnectorNonRetryableError)
+
+
+class TestAdmission:
+    def test_cancels_use_headroom_new_orders_cannot(self) -> None:
+        clock = FakeClock(1210.0)  # 1m window [1200, 1260)
+        budget = _budget(clock, weight_limits={"1m": 10}, max_wait_ms=60_000)
+        for _ in range(8):
+            assert budget.admit(OP_PLACE_ORDER) == 0.0
+
+        assert budget.admit(OP_PLACE_ORDER) == pytest.approx(50.0)  # LOW cap = 8
+        assert budget.admit(OP_AMEND_ORDER) == 0.0  # NORMAL cap = 9
+        assert budget.admit(OP_CANCEL_ORDER) == 0.0  # CRITICAL cap = 10
+        assert budget.admit(OP_CANCEL_ORDER) > 0
+        assert budget.used("1m") == 10
+
+        clock.now = 1260.0
+        assert budget.admit(OP_PLACE_ORDER) == 0.0
+        assert budget.used("1m") == 1
+
+    def test_order_limit_applies_to_orders_only(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(
+            clock,
+            order_limits={"10s": 2},
+            reserve_normal_pct=0,
+            reserve_low_pct=0,
+            max_wait_ms=10_000,
+        )
+        assert budget.admit(OP_PLACE_ORDER) == 0.0
+        assert budget.admit(OP_PLACE_ORDER) == 0.0
+        assert budget.admit(OP_PLACE_ORDER) == pytest.approx(10.0)
+        assert budget.admit(OP_GET_POSITIONS) == 0.0
+        assert budget.order_count("10s") == 2
+
+    def test_rejects_beyond_max_wait(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(clock, weight_limits={"1m": 10}, max_wait_ms=1000)
+        budget.observe_response(200, {"X-MBX-USED-WEIGHT-1M": "10"})
+        with pytest.raises(WeightBudgetExceededError) as exc_info:
+            budget.admit(OP_CANCEL_ORDER)
+        assert exc_info.value.priority == RequestPriority.CRITICAL
+        assert exc_info.value.wait_ms == 60_000
+
+
+class TestHeaders:
+    def test_headers_sync_usage(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(clock)
+        budget.admit(OP_GET_POSITIONS)
+        budget.observe_response(
+            200,
+            {"x-mbx-used-weight-1m": "100", "X-MBX-ORDER-COUNT-10S": "7", "X-Other": "1"},
+        )
+        assert budget.used("1m") == 100
+        assert budget.order_count("10s") == 7
+
+        # Stale (lower) header does not undo local bookings
+        budget.admit(OP_GET_POSITIONS)
+        budget.observe_response(200, {"x-mbx-used-weight-1m": "50"})
+        assert budget.used("1m") == 105
+
+    def test_429_blocks_until_retry_after(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(clock, max_wait_ms=60_000)
+        budget.observe_response(429, {"Retry-After": "5"})
+        assert budget.admit(OP_CANCEL_ORDER) == pytest.approx(5.0)
+        clock.now = 1205.0
+        assert budget.admit(OP_CANCEL_ORDER) == 0.0
+
+    def test_418_without_retry_after_uses_default(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(clock, default_retry_after_s=120)
+        budget.observe_response(418, {})
+        with pytest.raises(WeightBudgetExceededError):
+            budget.admit(OP_CANCEL_ORDER)
+
+
+class TestMetrics:
+    def test_prometheus_lines(self) -> None:
+        clock = FakeClock(1200.0)
+        budget = _budget(clock, weight_limits={"1m": 10}, max_wait_ms=60_000)
+        for _ in range(8):
+            budget.admit(OP_PLACE_ORDER)
+        budget.admit(OP_PLACE_ORDER)
+        budget.observe_response(429, {})
+
+        lines = budget.to_prometheus_lines()
+        assert 'grinder_exchange_weight_used{interval="1m"} 8' in lines
+        assert 'grinder_exchange_order_count{interval="10s"} 8' in lines
+        assert 'grinder_weight_budget_throttled_total{priority="low"} 1' in lines
+        assert 'grinder_weight_budget_rejected_total{priority="critical"} 0' in lines
+        assert 'grinder_exchange_rate_limited_total{status="429"} 1' in lines
+        assert all("symbol=" not in line for line in lines)
+
+    def test_metrics_builder_includes_budget(self) -> None:
+        get_weight_budget().admit(OP_GET_POSITIONS)
+        output = MetricsBuilder().build()
+        assert 'grinder_exchange_weight_used{interval="1m"}' in output
+        assert 'grinder_weight_budget_throttled_total{priority="critical"} 0' in output